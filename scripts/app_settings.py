@@ -106,12 +106,46 @@ OLLAMA_MAX_RETRIES = 2
 # --- Local OpenAI-compatible providers -----------------------------------
 LOCAL_LLM_CHUNK_SIZE = 10
 
+# --- 批次 token 预算 ----------------------------------------------------
+# 批次按源文本的估算 token 数装箱，上面的 *_CHUNK_SIZE 只作为条数上限；
+# 上下文溢出或返回条数不符时预算自动减半，之后每个成功批次逐步恢复。
+BATCH_TOKEN_BUDGET = int(os.getenv("REMIS_BATCH_TOKEN_BUDGET", "1800"))
+OLLAMA_BATCH_TOKEN_BUDGET = 900
+LOCAL_LLM_BATCH_TOKEN_BUDGET = 500
+
 # --- 智能线程池配置 ----------------------------------------------------
 def get_smart_max_workers():
     cpu_count = multiprocessing.cpu_count() or 1
     return min(32, cpu_count * 2)
 
 RECOMMENDED_MAX_WORKERS = get_smart_max_workers()
+
+# --- 后处理验证进程池 ----------------------------------------------------
+# 验证是纯 CPU 的正则工作；输出文件数达到阈值时按文件分块交给进程池。
+# REMIS_VALIDATION_WORKERS=1 关闭并行，0 表示按 CPU 核数自动选择。
+VALIDATION_WORKERS = int(os.getenv("REMIS_VALIDATION_WORKERS", "0"))
+PARALLEL_VALIDATION_MIN_FILES = 200
+
+# --- 新词挖掘并发 ----------------------------------------------------
+# 分块抽取与复核批次同时在途的 LLM 调用数上限；实际速率仍受 (provider, model) 令牌桶约束。
+NEOLOGISM_MINING_WORKERS = int(os.getenv("REMIS_NEOLOGISM_MINING_WORKERS", "4"))
+
+# --- 模型竞技场执行 ----------------------------------------------------
+# 各参赛模型通常来自不同的 provider，限速互不影响，因此并行请求；结果仍按执行顺序落库。
+# 超时按参赛者单独计时，超时的请求记为 provider_timeout。
+MODEL_ARENA_PARALLEL_CONTESTANTS = int(os.getenv("REMIS_MODEL_ARENA_PARALLEL_CONTESTANTS", "3"))
+MODEL_ARENA_CONTESTANT_TIMEOUT = float(os.getenv("REMIS_MODEL_ARENA_CONTESTANT_TIMEOUT", "600"))
+
+# --- 批次执行引擎 ----------------------------------------------------
+# "threads"：ThreadPoolExecutor（默认）；"asyncio"：事件循环 + 信号量，适合高并发的 OpenAI 兼容端点。
+# 可被用户配置中的 "translation_engine" 覆盖。
+TRANSLATION_ENGINES = ("threads", "asyncio")
+TRANSLATION_ENGINE = os.getenv("REMIS_TRANSLATION_ENGINE", "threads")
+
+# --- 翻译记忆 ----------------------------------------------------
+# 已翻译字符串在批次切分前命中即直接回填。默认关闭（命中会跳过模型调用），
+# REMIS_TRANSLATION_MEMORY=1 或用户配置 "translation_memory_enabled": true 开启。
+TRANSLATION_MEMORY_ENABLED = os.getenv("REMIS_TRANSLATION_MEMORY", "0").strip().lower() in ("1", "true", "on", "yes")
 BATCH_SIZE = CHUNK_SIZE
 
 # --- 路径配置 ----------------------------------------------------
@@ -240,6 +274,9 @@ REMIS_DB_PATH = os.path.join(APP_DATA_DIR, "remis.sqlite")
 PROJECTS_DB_PATH = REMIS_DB_PATH
 MODS_CACHE_DB_PATH = os.path.join(APP_DATA_DIR, "mods_cache.sqlite") # Keep separate? Yes, cache is cache.
 TRANSLATION_PROGRESS_DB_PATH = os.path.join(APP_DATA_DIR, "translation_progress.sqlite")
+TRANSLATION_MEMORY_DB_PATH = os.path.join(APP_DATA_DIR, "translation_memory.sqlite")
+# Indexed stores behind project .remis_errors.json sidecars; kept here so project/output folders only get the JSON
+VALIDATION_ISSUES_DB_DIR = os.path.join(APP_DATA_DIR, "validation_issues")
 # The main glossary database
 DATABASE_PATH = REMIS_DB_PATH
 
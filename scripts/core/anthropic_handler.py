@@ -72,13 +72,31 @@ class AnthropicHandler(BaseApiHandler):
             timeout=300,
         )
         response.raise_for_status()
-        return self._extract_text(response.json())
+        body = response.json()
+        usage = body.get("usage") or {}
+        cached = usage.get("cache_read_input_tokens") or 0
+        self._record_prompt_cache_usage(
+            (usage.get("input_tokens") or 0) + cached + (usage.get("cache_creation_input_tokens") or 0),
+            cached,
+            usage.get("cache_creation_input_tokens"),
+        )
+        return self._extract_text(body)
+
+    def _user_content(self, prompt: str):
+        """Mark the batch-independent prompt prefix as a cache breakpoint; the batch texts follow it uncached."""
+        prefix, rest = self._split_cacheable_prompt(prompt)
+        if not prefix:
+            return str(prompt)
+        return [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": rest},
+        ]
 
     def _call_api(self, client: requests.Session, prompt: str) -> str:
         return self._create_message(
             client,
             system=self.DEFAULT_SYSTEM_PROMPT,
-            messages=[{"role": "user", "content": prompt}],
+            messages=[{"role": "user", "content": self._user_content(prompt)}],
         )
 
     def generate_with_messages(
@@ -0,0 +1,215 @@
+# scripts/core/archive_bulk_writer.py
+"""
+Buffered writer for translated archive entries.
+
+``BulkTranslationArchiver`` loads the ``(file_path, entry_key) -> source_entry_id``
+map of one source version in a single query, resolves translated files through a
+dict keyed by normalized path, and writes upserts in large ``executemany``
+transactions. A translation run keeps one archiver per target language and flushes
+it when the run ends, instead of issuing two SELECTs per translated line and one
+commit per file. Work that must not happen before a file's rows are durable (the
+checkpoint that lets a resumed run skip the file) is passed as ``on_archived`` and
+runs only after the flush that commits those rows. Because a crash loses every file
+whose checkpoint is still waiting, the buffer is also flushed once
+``checkpoint_files`` files or ``checkpoint_interval`` seconds of checkpoints are
+pending, whichever comes first: a crashed run re-translates at most that much on
+resume, while small files still share one transaction.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from scripts.utils import i18n
+
+UPSERT_TRANSLATED_ENTRY_SQL = """
+    INSERT INTO translated_entries (source_entry_id, language_code, translated_text)
+    VALUES (?, ?, ?)
+    ON CONFLICT(source_entry_id, language_code) DO UPDATE SET
+    translated_text = excluded.translated_text,
+    last_translated_at = CURRENT_TIMESTAMP
+"""
+
+DEFAULT_FLUSH_THRESHOLD = 5000
+DEFAULT_CHECKPOINT_FILES = 8
+DEFAULT_CHECKPOINT_INTERVAL = 5.0
+
+# Archivers of concurrently translated languages share one SQLite connection; reads take it too.
+_CONNECTION_WRITE_LOCK = threading.Lock()
+
+
+def archive_entry_key(key_map: Any, index: int) -> str:
+    """Resolve the archive entry key for the ``index``-th translatable text of a file."""
+    if isinstance(key_map, dict):
+        key_info = key_map.get(index)
+    elif isinstance(key_map, list) and index < len(key_map):
+        key_info = key_map[index]
+    else:
+        key_info = None
+
+    if isinstance(key_info, dict):
+        entry_key = key_info.get('key_part', '').strip()
+    else:
+        entry_key = str(key_info if key_info is not None else index)
+
+    # Normalize: ensure no trailing colon (consistency)
+    if entry_key.endswith(":"):
+        entry_key = entry_key[:-1].strip()
+    return entry_key
+
+
+class BulkTranslationArchiver:
+    """Buffers translated-entry upserts for one source version and target language."""
+
+    def __init__(
+        self,
+        archive_manager: Any,
+        version_id: int,
+        all_files_data: List[Dict],
+        target_lang_code: str,
+        flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+        checkpoint_files: int = DEFAULT_CHECKPOINT_FILES,
+        checkpoint_interval: float = DEFAULT_CHECKPOINT_INTERVAL,
+    ):
+        self.archive_manager = archive_manager
+        self.version_id = version_id
+        self.all_files_data = all_files_data
+        self.target_lang_code = target_lang_code
+        self.flush_threshold = max(1, flush_threshold)
+        self.checkpoint_files = max(1, checkpoint_files)
+        self.checkpoint_interval = checkpoint_interval
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[int, str, str]] = []
+        self._on_archived: List[Callable[[], None]] = []
+        self._oldest_checkpoint_at = 0.0
+        self._files_by_path: Optional[Dict[str, Dict]] = None
+        self._entries_by_path_key: Optional[Dict[Tuple[str, str], int]] = None
+        self._entries_without_path: Dict[str, int] = {}
+        self.archived_count = 0
+
+    def __enter__(self) -> "BulkTranslationArchiver":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.flush()
+        return False
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _normalize(self, file_path: Optional[str]) -> str:
+        return self.archive_manager._normalize_archive_file_path(file_path)
+
+    def _file_index(self) -> Dict[str, Dict]:
+        if self._files_by_path is None:
+            files_by_path: Dict[str, Dict] = {}
+            # First file wins for a path, matching the previous linear scan.
+            for file_data in self.all_files_data:
+                files_by_path.setdefault(self._normalize(file_data.get('file_path') or file_data.get('filename')), file_data)
+                files_by_path.setdefault(self._normalize(file_data.get('filename')), file_data)
+            self._files_by_path = files_by_path
+        return self._files_by_path
+
+    def _load_source_entries(self) -> bool:
+        if self._entries_by_path_key is not None:
+            return True
+        connection = self.archive_manager.connection
+        if not connection:
+            return False
+        # Other languages' archivers may be writing on the same connection.
+        with _CONNECTION_WRITE_LOCK:
+            cursor = connection.cursor()
+            cursor.execute(
+                "SELECT source_entry_id, file_path, entry_key FROM source_entries WHERE version_id = ? ORDER BY source_entry_id",
+                (self.version_id,),
+            )
+            rows = cursor.fetchall()
+        entries_by_path_key: Dict[Tuple[str, str], int] = {}
+        for row in rows:
+            if row['file_path'] is None:
+                self._entries_without_path.setdefault(row['entry_key'], row['source_entry_id'])
+            else:
+                entries_by_path_key.setdefault((row['file_path'], row['entry_key']), row['source_entry_id'])
+        self._entries_by_path_key = entries_by_path_key
+        return True
+
+    def _find_source_entry_id(self, entry_key: str, file_path_candidates: List[str]) -> Optional[int]:
+        for candidate in file_path_candidates:
+            source_entry_id = self._entries_by_path_key.get((candidate, entry_key))
+            if source_entry_id is not None:
+                return source_entry_id
+        return self._entries_without_path.get(entry_key)
+
+    def add_file_results(self, file_results: Dict[str, Any], on_archived: Optional[Callable[[], None]] = None) -> int:
+        """
+        Resolve and buffer upserts for ``{file_path: translated_texts}``; returns rows buffered.
+        ``on_archived`` runs once the buffered rows are committed, and never if that flush fails.
+        """
+        with self._lock:
+            if not self._load_source_entries():
+                if on_archived is not None:
+                    on_archived()
+                return 0
+            files_by_path = self._file_index()
+            buffered = 0
+            for filename, translated_texts in file_results.items():
+                file_data = files_by_path.get(self._normalize(filename))
+                if not file_data or not translated_texts:
+                    continue
+
+                key_map = file_data.get('key_map', {})
+                archive_file_path = self._normalize(file_data.get('file_path') or file_data.get('filename', ''))
+                file_path_candidates = self.archive_manager._build_file_path_candidates(archive_file_path)
+                for index, translated_text in enumerate(translated_texts):
+                    entry_key = archive_entry_key(key_map, index)
+                    source_entry_id = self._find_source_entry_id(entry_key, file_path_candidates)
+                    # [FALLBACK] If not found and key has :version, try without version (for legacy compatibility)
+                    if source_entry_id is None and ":" in entry_key:
+                        source_entry_id = self._find_source_entry_id(entry_key.split(':')[0], file_path_candidates)
+                    if source_entry_id is not None:
+                        self._pending.append((source_entry_id, self.target_lang_code, translated_text))
+                        buffered += 1
+
+            if on_archived is not None:
+                if not self._on_archived:
+                    self._oldest_checkpoint_at = time.monotonic()
+                self._on_archived.append(on_archived)
+            if len(self._pending) >= self.flush_threshold or self._checkpoints_due():
+                self._flush_locked()
+            return buffered
+
+    def _checkpoints_due(self) -> bool:
+        if not self._on_archived:
+            return False
+        return (
+            len(self._on_archived) >= self.checkpoint_files
+            or time.monotonic() - self._oldest_checkpoint_at >= self.checkpoint_interval
+        )
+
+    def flush(self) -> int:
+        """Write buffered upserts in one transaction; returns rows written."""
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        connection = self.archive_manager.connection
+        if self._pending and not connection:
+            return 0
+        upsert_data, self._pending = self._pending, []
+        on_archived, self._on_archived = self._on_archived, []
+        if upsert_data:
+            with _CONNECTION_WRITE_LOCK:
+                try:
+                    connection.cursor().executemany(UPSERT_TRANSLATED_ENTRY_SQL, upsert_data)
+                    connection.commit()
+                except Exception as e:
+                    logging.error(i18n.t("log_error_db_archive_results", lang_code=self.target_lang_code, error=e))
+                    connection.rollback()
+                    return 0
+            self.archived_count += len(upsert_data)
+            logging.info(i18n.t("log_info_archived_updated_translations", count=len(upsert_data), lang_code=self.target_lang_code))
+        for callback in on_archived:
+            callback()
+        return len(upsert_data)
@@ -6,6 +6,7 @@ import hashlib
 from typing import Dict, List, Optional, Tuple, Any
 import json
 
+from scripts.core.archive_bulk_writer import BulkTranslationArchiver
 from scripts.utils import i18n
 from scripts.app_settings import PROJECT_ROOT, MODS_CACHE_DB_PATH
 
@@ -425,72 +426,17 @@ class ArchiveManager:
         """阶段三: 将指定语言的翻译结果存入或更新到数据库"""
         if not self.connection or not version_id: return
 
-        cursor = self.connection.cursor()
         try:
-            upsert_data = []
-
-            for filename, translated_texts in file_results.items():
-                normalized_filename = self._normalize_archive_file_path(filename)
-                file_data = next(
-                    (
-                        fd for fd in all_files_data
-                        if self._normalize_archive_file_path(fd.get('file_path') or fd.get('filename')) == normalized_filename
-                        or self._normalize_archive_file_path(fd.get('filename')) == normalized_filename
-                    ),
-                    None
-                )
-                if not file_data or not translated_texts: continue
-
-                km = file_data.get('key_map', {})
-                archive_file_path = self._normalize_archive_file_path(
-                    file_data.get('file_path') or file_data.get('filename', '')
-                )
-                for idx, translated_text in enumerate(translated_texts):
-                    if isinstance(km, dict):
-                        key_info = km.get(idx)
-                    elif isinstance(km, list) and idx < len(km):
-                        key_info = km[idx]
-                    else:
-                        key_info = None
-                    
-                    # Extract the actual key string
-                    entry_key = key_info.get('key_part', '').strip() if isinstance(key_info, dict) else str(key_info if key_info is not None else idx)
-                    
-                    # Normalize: ensure no trailing colon (consistency)
-                    if entry_key.endswith(":"):
-                        entry_key = entry_key[:-1].strip()
-                
-                    # Find source entry
-                    file_path_candidates = self._build_file_path_candidates(archive_file_path)
-                    row = self._find_source_entry_id(cursor, version_id, entry_key, file_path_candidates)
-                    
-                    # [FALLBACK] If not found and key has :version, try without version (for legacy compatibility)
-                    if not row and ":" in entry_key:
-                        pure_key = entry_key.split(':')[0]
-                        row = self._find_source_entry_id(cursor, version_id, pure_key, file_path_candidates)
-
-                    if row:
-                        source_entry_id = row['source_entry_id']
-                        upsert_data.append((source_entry_id, target_lang_code, translated_text))
-
-            if not upsert_data:
-                return
-
-            cursor.executemany("""
-                INSERT INTO translated_entries (source_entry_id, language_code, translated_text)
-                VALUES (?, ?, ?)
-                ON CONFLICT(source_entry_id, language_code) DO UPDATE SET
-                translated_text = excluded.translated_text,
-                last_translated_at = CURRENT_TIMESTAMP
-            """, upsert_data)
-
-            self.connection.commit()
-            logging.info(i18n.t("log_info_archived_updated_translations", count=len(upsert_data), lang_code=target_lang_code))
-
+            with self.open_translation_archiver(version_id, all_files_data, target_lang_code) as archiver:
+                archiver.add_file_results(file_results)
         except Exception as e:
             logging.error(i18n.t("log_error_db_archive_results", lang_code=target_lang_code, error=e))
             self.connection.rollback()
 
+    def open_translation_archiver(self, version_id: int, all_files_data: List[Dict], target_lang_code: str) -> BulkTranslationArchiver:
+        """为整次翻译运行创建批量归档器：源条目映射只加载一次，写入缓冲后批量提交，调用方在运行结束时 flush。"""
+        return BulkTranslationArchiver(self, version_id, all_files_data, target_lang_code)
+
     # --- New Methods for Project/Proofreading Flow ---
 
     def get_all_mod_names(self) -> List[str]:
@@ -0,0 +1,136 @@
+# scripts/core/async_parallel_processor.py
+"""
+基于 asyncio 的批次执行引擎
+与 ParallelProcessor.process_files_stream 的流式契约相同，但批次作为协程在同一个
+事件循环中并发执行，并发上限由信号量而不是线程数决定，适合 vLLM、OpenRouter 等
+高并发的 OpenAI 兼容端点。
+"""
+
+import asyncio
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from scripts.core.openai_handler import close_async_clients
+from scripts.core.parallel_processor import FileStreamAssembler, ParallelProcessor
+from scripts.core.parallel_types import BatchTask
+
+_STREAM_DONE = object()
+
+
+class _StreamFailure:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class AsyncParallelProcessor(ParallelProcessor):
+    """批次级协程调度器；``max_workers`` 表示同时在途的批次数。"""
+
+    is_async = True
+
+    def process_files_stream(
+        self,
+        file_tasks_generator: Any, # Iterator[FileTask]
+        translation_function: Callable
+    ) -> Iterator[Tuple[Any, List[str], List[Dict[str, Any]], bool]]:
+        """
+        Yields ``(file_task, translated_texts, warnings, failed)`` as soon as a file is completed.
+
+        ``translation_function`` may be a coroutine function (e.g. ``handler.translate_batch_async``);
+        plain callables run in worker threads. The event loop lives in a background thread so the
+        caller consumes results synchronously, exactly like ``ParallelProcessor``.
+        """
+        results: "queue.Queue[Any]" = queue.Queue()
+        stop = threading.Event()
+        loop = asyncio.new_event_loop()
+
+        def run_loop():
+            try:
+                loop.run_until_complete(
+                    self._schedule(iter(file_tasks_generator), translation_function, results, stop)
+                )
+            except BaseException as e:  # surface scheduler crashes to the consuming thread
+                results.put(_StreamFailure(e))
+            finally:
+                loop.run_until_complete(close_async_clients())
+                loop.run_until_complete(loop.shutdown_default_executor())
+                loop.close()
+                results.put(_STREAM_DONE)
+
+        worker = threading.Thread(target=run_loop, name="async-batch-engine", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = results.get()
+                if item is _STREAM_DONE:
+                    break
+                if isinstance(item, _StreamFailure):
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+            worker.join()
+
+    async def _schedule(self, iterator, translation_function: Callable, results: queue.Queue, stop: threading.Event):
+        semaphore = asyncio.Semaphore(self.max_workers)
+        assembler = FileStreamAssembler(self.logger)
+        pending: Dict[asyncio.Task, BatchTask] = {}
+        # Same memory bound as the thread engine: only a window of files is held at a time,
+        # and finished files wait for the consumer before more are read.
+        max_pending_batches = self.max_workers * 4
+        max_ready_files = max(4, self.max_workers)
+        done_consuming = False
+
+        try:
+            while (not done_consuming or pending) and not stop.is_set():
+                while not done_consuming and len(pending) < max_pending_batches and results.qsize() < max_ready_files:
+                    try:
+                        file_task = next(iterator)
+                    except StopIteration:
+                        done_consuming = True
+                        break
+                    batch_tasks, memory_plan = self._prepare_file_batches(file_task)
+                    if not batch_tasks:
+                        results.put(assembler.complete_without_batches(file_task, memory_plan))
+                        continue
+                    assembler.register(file_task, len(batch_tasks), memory_plan)
+                    for batch_task in batch_tasks:
+                        task = asyncio.ensure_future(
+                            self._process_single_batch_async(batch_task, translation_function, semaphore)
+                        )
+                        pending[task] = batch_task
+
+                if not pending:
+                    # The consumer is behind; give it time to drain finished files.
+                    await asyncio.sleep(0.05)
+                    continue
+
+                done, _ = await asyncio.wait(pending.keys(), timeout=0.5, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    batch_task = pending.pop(task)
+                    try:
+                        processed_task, warnings = task.result()
+                    except Exception as e:
+                        processed_task, warnings = assembler.crashed_batch(batch_task, e), []
+
+                    file_result = assembler.add(batch_task, processed_task, warnings)
+                    if file_result is not None:
+                        results.put(file_result)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _process_single_batch_async(
+        self,
+        batch_task: BatchTask,
+        translation_function: Callable,
+        semaphore: asyncio.Semaphore,
+    ) -> Tuple[BatchTask, List[Dict[str, Any]]]:
+        async with semaphore:
+            if asyncio.iscoroutinefunction(translation_function):
+                processed_task = await translation_function(batch_task)
+            else:
+                processed_task = await asyncio.to_thread(translation_function, batch_task)
+        return self._validate_processed_batch(processed_task)
@@ -3,17 +3,61 @@ import asyncio
 import time
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
 
 from scripts.utils import i18n
-from scripts.app_settings import MAX_RETRIES, FALLBACK_FORMAT_PROMPT, APP_DATA_DIR
+from scripts.app_settings import MAX_RETRIES, FALLBACK_FORMAT_PROMPT, APP_DATA_DIR, config_manager
+from scripts.core.batch_recovery import BisectionRecovery, aligned_prefix
 from scripts.core.parallel_types import BatchTask
 from scripts.utils.punctuation_handler import generate_punctuation_prompt
 from scripts.core.glossary_manager import glossary_manager
 from scripts.utils.structured_parser import parse_response
 from scripts.utils.text_clean import mask_special_tokens
+from scripts.utils.rate_limiter import estimate_prompt_tokens, is_rate_limit_error, rate_limiter, retry_after_seconds
 from scripts.core.prompt_manager import prompt_manager
 
 
+# A handler lives for one run; the plan cache only needs room for its language pairs.
+MAX_PROMPT_PLANS = 16
+# Provider usage of the API call in flight; a dict shared with worker threads started by asyncio.to_thread.
+_PROMPT_CACHE_USAGE: ContextVar[Optional[dict]] = ContextVar("prompt_cache_usage", default=None)
+
+
+class BatchCountMismatch(ValueError):
+    """模型返回的译文无法解析或条数与批次不符（通常是批次过大、输出被截断）；``aligned`` 为可对齐的前缀译文。"""
+
+    def __init__(self, message: str, aligned: Optional[list] = None):
+        super().__init__(message)
+        self.aligned = aligned or []
+
+
+class PlannedPrompt(str):
+    """提示词文本，并记住其中批次无关的前缀（``cache_prefix``），供提供商的提示词缓存使用。"""
+
+    def __new__(cls, text: str, cache_prefix: str = ""):
+        prompt = super().__new__(cls, text)
+        prompt.cache_prefix = cache_prefix
+        return prompt
+
+
+@dataclass(frozen=True)
+class PromptPlan:
+    """
+    批次无关的提示词部分：同一 (游戏, 语言对, 模组上下文, 配置版本) 下只构建一次。
+    ``prefix`` 已经过模型/提供商适配且位于提示词最前，便于支持前缀缓存的提供商复用。
+    """
+    prefix: str
+    format_template: str
+    suffix: str
+
+    def render(self, glossary_prompt_part: str, chunk_size: int, numbered_list: str) -> str:
+        format_prompt_part = self.format_template.format(chunk_size=chunk_size, numbered_list=numbered_list)
+        return PlannedPrompt(self.prefix + glossary_prompt_part + format_prompt_part + self.suffix, self.prefix)
+
+
 class BaseApiHandler(ABC):
     NEMOTRON_CASCADE_MODELS = {"nemotron-cascade-2-30b-a3b"}
 
@@ -122,6 +166,55 @@ class BaseApiHandler(ABC):
             "override required output formatting or protected-token rules.\n"
         )
 
+    @staticmethod
+    def _split_cacheable_prompt(prompt: str) -> tuple[str, str]:
+        """Split a planned prompt into (stable prefix, batch part); ("", prompt) when there is no usable prefix."""
+        prefix = getattr(prompt, "cache_prefix", "")
+        if prefix and len(prompt) > len(prefix) and prompt.startswith(prefix):
+            return prefix, prompt[len(prefix):]
+        return "", str(prompt)
+
+    @staticmethod
+    def _record_prompt_cache_usage(prompt_tokens: Optional[int], cached_tokens: Optional[int], cache_write_tokens: Optional[int] = 0) -> None:
+        """Called by provider handlers with the usage block of a response; a no-op outside translate_batch."""
+        usage = _PROMPT_CACHE_USAGE.get()
+        if usage is not None and (cached_tokens or cache_write_tokens):
+            usage.update(
+                prompt_tokens=int(prompt_tokens or 0),
+                cached_tokens=int(cached_tokens or 0),
+                cache_write_tokens=int(cache_write_tokens or 0),
+            )
+
+    @classmethod
+    def _record_chat_completion_usage(cls, response) -> None:
+        """Read cached prompt tokens from an OpenAI-compatible chat completion (DeepSeek reports prompt_cache_hit_tokens)."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or getattr(usage, "prompt_cache_hit_tokens", None)
+        cls._record_prompt_cache_usage(getattr(usage, "prompt_tokens", 0), cached)
+
+    @contextmanager
+    def _capture_prompt_cache_usage(self, task: BatchTask, attempt: int):
+        """Collect the provider's prompt-cache usage of one call into an informational batch warning."""
+        usage: dict = {}
+        token = _PROMPT_CACHE_USAGE.set(usage)
+        try:
+            yield
+        finally:
+            _PROMPT_CACHE_USAGE.reset(token)
+            if usage:
+                task.warnings.append({
+                    "type": "prompt_cache",
+                    "level": "info",
+                    "batch_num": task.batch_index + 1,
+                    "attempt": attempt + 1,
+                    "provider": self.provider_name,
+                    **usage,
+                    "message": f"Provider prompt cache served {usage['cached_tokens']} of {usage['prompt_tokens']} prompt tokens.",
+                })
+
     @abstractmethod
     def initialize_client(self):
         """【必须由子类实现】初始化并返回特定于该Provider的API客户端。"""
@@ -136,26 +229,34 @@ class BaseApiHandler(ABC):
         """Provide a unified async single-response API for workshop/fixer flows."""
         return await asyncio.to_thread(self._call_api, self.client, prompt)
 
-    def _build_prompt(self, task: BatchTask) -> str:
-        """
-        【通用逻辑】根据任务构建完整的翻译提示。
-        """
-        chunk = task.texts
-        source_lang = task.file_task.source_lang
-        target_lang = task.file_task.target_lang
-        game_profile = task.file_task.game_profile
-        mod_context = task.file_task.mod_context
-        batch_num = task.batch_index + 1
-
-
-
-        # Apply Token Masking (Newlines & Quotes)
-        masked_chunk = [mask_special_tokens(txt) for txt in chunk]
-        numbered_list = "\n".join(f'{j + 1}. "{txt}"' for j, txt in enumerate(masked_chunk))
-
-        effective_target_lang_name = target_lang.get("custom_name", target_lang["name"]) if target_lang.get("is_shell") else target_lang["name"]
-
+    def _prompt_plan(self, file_task) -> PromptPlan:
+        """Return the cached batch-invariant prompt parts for ``file_task``'s run scope."""
+        target_lang = file_task.target_lang
         effective_target_lang_name = target_lang.get("custom_name", target_lang["name"]) if target_lang.get("is_shell") else target_lang["name"]
+        key = (
+            file_task.game_profile["id"],
+            file_task.source_lang["code"],
+            file_task.source_lang["name"],
+            target_lang["code"],
+            effective_target_lang_name,
+            file_task.mod_context,
+            config_manager.revision(),
+        )
+        # Set lazily: prompt builders such as the arena's reuse this method without __init__.
+        plans = self.__dict__.setdefault("_prompt_plans", {})
+        plan = plans.get(key)
+        if plan is None:
+            plan = self._build_prompt_plan(file_task, effective_target_lang_name)
+            if len(plans) >= MAX_PROMPT_PLANS:
+                plans.clear()
+            plans[key] = plan
+        return plan
+
+    def _build_prompt_plan(self, file_task, effective_target_lang_name: str) -> PromptPlan:
+        source_lang = file_task.source_lang
+        target_lang = file_task.target_lang
+        game_profile = file_task.game_profile
+        mod_context = file_task.mod_context
 
         # Use PromptManager to get the effective prompt (handling overrides)
         prompt_template = prompt_manager.get_effective_prompt(game_profile["id"])
@@ -173,6 +274,44 @@ class BaseApiHandler(ABC):
         )
         custom_global_prompt_part = self._build_custom_global_prompt_part(mod_context)
 
+        punctuation_prompt = generate_punctuation_prompt(
+            source_lang["code"],
+            target_lang["code"]
+        )
+        punctuation_prompt_part = f"\nPUNCTUATION CONVERSION:\n{punctuation_prompt}\n" if punctuation_prompt else ""
+
+        # Add a "Final Warning" section for Victoria 3 specifically
+        final_warning = ""
+        if game_profile["id"] == "victoria3":
+            final_warning = (
+                "\n🚨 FINAL MANDATORY REMINDER FOR VICTORIA 3:\n"
+                "- DO NOT translate the label inside [Concept('key', 'Label')]. Keep it English.\n"
+                "- DO NOT translate anything inside [SCOPE...].\n"
+                "- Ensure the JSON format is strictly followed.\n"
+            )
+
+        # Model/provider adapters only prepend, so adapting the prefix once equals adapting every prompt.
+        return PromptPlan(
+            prefix=self._apply_model_prompt_adapter(base_prompt + context_prompt_part + custom_global_prompt_part),
+            format_template=prompt_manager.get_effective_format_prompt(game_profile["id"]) or FALLBACK_FORMAT_PROMPT,
+            suffix=punctuation_prompt_part + final_warning,
+        )
+
+    def _build_prompt(self, task: BatchTask) -> str:
+        """
+        【通用逻辑】根据任务构建完整的翻译提示。
+        不变部分来自 ``_prompt_plan``，每个批次只生成编号列表与术语表部分。
+        """
+        chunk = task.texts
+        source_lang = task.file_task.source_lang
+        target_lang = task.file_task.target_lang
+        batch_num = task.batch_index + 1
+        plan = self._prompt_plan(task.file_task)
+
+        # Apply Token Masking (Newlines & Quotes)
+        masked_chunk = [mask_special_tokens(txt) for txt in chunk]
+        numbered_list = "\n".join(f'{j + 1}. "{txt}"' for j, txt in enumerate(masked_chunk))
+
         glossary_prompt_part = ""
         # [DEBUG] Check glossary state before extraction
         loaded_glossary = glossary_manager.get_glossary_for_translation()
@@ -194,46 +333,7 @@ class BaseApiHandler(ABC):
                 ) + "\n\n"
                 self.logger.info(i18n.t("batch_translation_glossary_injected", batch_num=batch_num, count=len(relevant_terms)))
 
-        punctuation_prompt = generate_punctuation_prompt(
-            source_lang["code"],
-            target_lang["code"]
-        )
-
-        effective_format_prompt = prompt_manager.get_effective_format_prompt(game_profile["id"])
-        
-        if effective_format_prompt:
-             format_prompt_part = effective_format_prompt.format(
-                chunk_size=len(chunk),
-                numbered_list=numbered_list
-            )
-        else:
-            format_prompt_part = FALLBACK_FORMAT_PROMPT.format(
-                chunk_size=len(chunk),
-                numbered_list=numbered_list
-            )
-
-        punctuation_prompt_part = f"\nPUNCTUATION CONVERSION:\n{punctuation_prompt}\n" if punctuation_prompt else ""
-        
-        # Add a "Final Warning" section for Victoria 3 specifically
-        final_warning = ""
-        if game_profile["id"] == "victoria3":
-            final_warning = (
-                "\n🚨 FINAL MANDATORY REMINDER FOR VICTORIA 3:\n"
-                "- DO NOT translate the label inside [Concept('key', 'Label')]. Keep it English.\n"
-                "- DO NOT translate anything inside [SCOPE...].\n"
-                "- Ensure the JSON format is strictly followed.\n"
-            )
-
-        prompt = (
-            base_prompt
-            + context_prompt_part
-            + custom_global_prompt_part
-            + glossary_prompt_part
-            + format_prompt_part
-            + punctuation_prompt_part
-            + final_warning
-        )
-        return self._apply_model_prompt_adapter(prompt)
+        return plan.render(glossary_prompt_part, len(chunk), numbered_list)
 
     def _parse_response(self, response: str, original_texts: list[str], target_lang_code: str) -> list[str] | None:
         """
@@ -247,64 +347,90 @@ class BaseApiHandler(ABC):
             return parsed_model.translations
         return None
 
-    def translate_batch(self, task: BatchTask) -> BatchTask:
+    def _reserve_rate_limit(self, prompt: str, lane: Optional[str] = None) -> float:
         """
-        【核心工作流】处理单个批次的翻译任务，包含重试逻辑。
+        按 (provider, model) 令牌桶预约调用并返回需等待的秒数；配置了 tpm_limit 时同时按提示词长度计入 TPM。
+        lane 为批次的目标语言：多语言并发翻译时各语言在各自的公平通道中排队。
         """
-        prompt = self._build_prompt(task)
-        batch_num = task.batch_index + 1
-        start_time = time.time() # <--- 添加时间记录
+        tpm_limit = self.get_provider_config().get("tpm_limit")
+        if tpm_limit:
+            rate_limiter.configure(self.provider_name, self.model_id, tpm=int(tpm_limit))
+        return rate_limiter.reserve(self.provider_name, self.model_id, tokens=estimate_prompt_tokens(prompt), lane=lane)
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                # Apply global rate limiting
-                from scripts.utils.rate_limiter import rate_limiter
-                rate_limiter.wait()
+    def _wait_for_rate_limit(self, prompt: str, lane: Optional[str] = None) -> None:
+        rate_limiter.sleep(self._reserve_rate_limit(prompt, lane))
 
-                raw_response = self._call_api(self.client, prompt)
-                translated_texts = self._parse_response(raw_response, task.texts, task.file_task.target_lang["code"])
-
-                # Check for success: must not be None, must not be the original list, and length must match.
-                if translated_texts is not None and translated_texts is not task.texts and len(translated_texts) == len(task.texts):
-                    task.translated_texts = translated_texts
-                    elapsed_time = time.time() - start_time # <--- 计算耗时
-                    self.logger.info(i18n.t("batch_success", batch_num=batch_num, attempt=attempt + 1, elapsed_time=elapsed_time)) # <--- 传递参数
-                    return task
-                else:
-                    self.logger.warning(
-                        f"Response parsing failed for batch {batch_num} on attempt {attempt + 1}. "
-                        f"Expected {len(task.texts)} items, got {len(translated_texts) if translated_texts else 0}."
-                    )
-                    raise ValueError("Response parsing failed, triggering retry.")
+    async def _call_api_async(self, client: any, prompt: str) -> str:
+        """
+        异步执行 API 调用。默认在线程中运行同步的 _call_api；
+        SDK 自带异步客户端的子类可覆盖此方法，使批次不再占用线程。
+        """
+        return await asyncio.to_thread(self._call_api, client, prompt)
+
+    def _align_response(self, texts: list[str], raw_response: str, target_lang_code: str) -> tuple[list[str] | None, list[str]]:
+        """返回 (完整译文或 None, 可对齐的前缀译文)。"""
+        translated_texts = self._parse_response(raw_response, texts, target_lang_code)
+        # Check for success: must not be None, must not be the original list, and length must match.
+        if translated_texts is not None and translated_texts is not texts and len(translated_texts) == len(texts):
+            return translated_texts, []
+        if translated_texts is texts:
+            return None, []
+        return None, aligned_prefix(raw_response, translated_texts, len(texts))
+
+    def _apply_batch_response(self, task: BatchTask, raw_response: str, attempt: int, start_time: float) -> None:
+        """解析响应并写回批次；解析失败时抛出 BatchCountMismatch。"""
+        batch_num = task.batch_index + 1
+        translated_texts, aligned = self._align_response(task.texts, raw_response, task.file_task.target_lang["code"])
+        if translated_texts is not None:
+            rate_limiter.report_success(self.provider_name, self.model_id)
+            task.translated_texts = translated_texts
+            elapsed_time = time.time() - start_time # <--- 计算耗时
+            self.logger.info(i18n.t("batch_success", batch_num=batch_num, attempt=attempt + 1, elapsed_time=elapsed_time)) # <--- 传递参数
+            return
+
+        self.logger.warning(
+            f"Response parsing failed for batch {batch_num} on attempt {attempt + 1}. "
+            f"Expected {len(task.texts)} items, {len(aligned)} could be aligned."
+        )
+        raise BatchCountMismatch("Response parsing failed, triggering retry.", aligned)
 
-            except Exception as e:
-                self.logger.exception(f"API call failed for batch {batch_num} on attempt {attempt + 1}: {e}")
-                error_text = str(e)
-                warning_code = "api_error"
-                if "context size has been exceeded" in error_text.lower() or "context length" in error_text.lower():
-                    warning_code = "context_exceeded"
-                task.warnings.append({
-                    "type": warning_code,
-                    "batch_num": batch_num,
-                    "attempt": attempt + 1,
-                    "provider": self.provider_name,
-                    "message": error_text,
-                })
+    def _record_batch_failure(self, task: BatchTask, e: Exception, attempt: int) -> float:
+        """记录一次失败尝试，返回重试前需要额外等待的秒数。"""
+        batch_num = task.batch_index + 1
+        self.logger.exception(f"API call failed for batch {batch_num} on attempt {attempt + 1}: {e}")
+        error_text = str(e)
+        warning_code = "api_error"
+        if "context size has been exceeded" in error_text.lower() or "context length" in error_text.lower():
+            warning_code = "context_exceeded"
+        elif isinstance(e, BatchCountMismatch):
+            warning_code = "count_mismatch"
+        task.warnings.append({
+            "type": warning_code,
+            "batch_num": batch_num,
+            "attempt": attempt + 1,
+            "provider": self.provider_name,
+            "message": error_text,
+        })
 
-                if attempt < MAX_RETRIES - 1:
-                    # 429 速率限制：使用指数退避（等待时间远长于普通错误）
-                    error_str = str(e).lower()
-                    if "429" in error_str or "rate limit" in error_str or "too many requests" in error_str:
-                        delay = 30 * (2 ** attempt)  # 30s, 60s, 120s ...
-                        self.logger.warning(
-                            f"Rate limit (429) hit for batch {batch_num}. "
-                            f"Waiting {delay}s before retry {attempt + 1}/{MAX_RETRIES}..."
-                        )
-                    else:
-                        delay = (attempt + 1) * 2  # 普通错误：2s, 4s, ...
-                        self.logger.warning(i18n.t("retrying_batch", batch_num=batch_num, attempt=attempt + 1, max_retries=MAX_RETRIES, delay=delay))
-                    time.sleep(delay)
+        # 429 速率限制：由该 provider/model 的限速桶降速并统一冷却，同一桶的其它批次也会一起放缓
+        rate_limited = is_rate_limit_error(e)
+        if rate_limited:
+            delay = rate_limiter.report_rate_limited(self.provider_name, self.model_id, retry_after_seconds(e))
 
+        if attempt >= MAX_RETRIES - 1:
+            return 0
+        if rate_limited:
+            self.logger.warning(
+                f"Rate limit (429) hit for batch {batch_num}. "
+                f"Waiting {delay:.1f}s before retry {attempt + 1}/{MAX_RETRIES}..."
+            )
+            return 0
+        delay = (attempt + 1) * 2  # 普通错误：2s, 4s, ...
+        self.logger.warning(i18n.t("retrying_batch", batch_num=batch_num, attempt=attempt + 1, max_retries=MAX_RETRIES, delay=delay))
+        return delay
+
+    def _fall_back_to_source(self, task: BatchTask) -> BatchTask:
+        batch_num = task.batch_index + 1
         self.logger.error(f"Batch {batch_num} failed after {MAX_RETRIES} attempts. Falling back to original texts.")
         task.failed = True
         task.fell_back_to_source = True
@@ -318,6 +444,146 @@ class BaseApiHandler(ABC):
         # We still return the task object so the aggregator can see it failed but has text
         return task
 
+    def _bisection_request(self, task: BatchTask, piece: tuple[int, int]) -> tuple[BatchTask, str]:
+        start, end = piece
+        sub_task = BatchTask(
+            file_task=task.file_task,
+            batch_index=task.batch_index,
+            start_index=task.start_index + start,
+            end_index=task.start_index + end,
+            texts=task.texts[start:end],
+        )
+        return sub_task, self._build_prompt(sub_task)
+
+    def _bisection_api_failure(self, task: BatchTask, recovery: BisectionRecovery, piece: tuple[int, int], e: Exception, failures: int) -> float:
+        """
+        拆分重试时出现接口错误（而不是条数不符）：按整批重试的延迟与次数重发该段；
+        连续 MAX_RETRIES 次失败后放弃，已恢复的条目保留，只有未解决的条目回退原文。
+        """
+        delay = self._record_batch_failure(task, e, failures - 1)
+        if failures >= MAX_RETRIES:
+            recovery.abandon()
+        else:
+            recovery.retry(piece)
+        return delay
+
+    def _finish_recovery(self, task: BatchTask, recovery: BisectionRecovery, batch_prompt: str) -> BatchTask:
+        """
+        写回拆分重试的结果，并与“整批重发直至回退”的原有做法对比调用次数与 token。
+        仍有条目保留原文时批次记为回退（fell_back_to_source），并在 fallback_indices 中给出这些位置，
+        使文件不会被当作成功写入检查点、归档或翻译记忆。
+        """
+        batch_num = task.batch_index + 1
+        baseline_calls = MAX_RETRIES - 1
+        baseline_tokens = baseline_calls * estimate_prompt_tokens(batch_prompt)
+        task.translated_texts = recovery.merged()
+        task.warnings.append({
+            "type": "bisection_recovery",
+            "batch_num": batch_num,
+            "provider": self.provider_name,
+            "api_calls": recovery.api_calls,
+            "prompt_tokens": recovery.prompt_tokens,
+            "baseline_api_calls": baseline_calls,
+            "baseline_prompt_tokens": baseline_tokens,
+            "saved_prompt_tokens": baseline_tokens - recovery.prompt_tokens,
+            "recovered_items": recovery.recovered_items,
+            "fallback_items": recovery.fallback_items,
+            "message": (
+                f"Recovered {recovery.recovered_items}/{len(task.texts)} items with {recovery.api_calls} sub-batch call(s) "
+                f"(~{recovery.prompt_tokens} prompt tokens); whole-batch retries would have sent ~{baseline_tokens} tokens "
+                f"in {baseline_calls} call(s) and kept no item if they failed."
+            ),
+        })
+        if recovery.fallback_items:
+            task.fell_back_to_source = True
+            task.fallback_indices = recovery.fallback_indices
+            self.logger.warning(f"Batch {batch_num}: {recovery.fallback_items} item(s) kept their source text after bisection.")
+        return task
+
+    def _recover_by_bisection(self, task: BatchTask, mismatch: BatchCountMismatch, batch_prompt: str) -> BatchTask:
+        recovery = BisectionRecovery(task.texts, mismatch.aligned)
+        target_lang_code = task.file_task.target_lang["code"]
+        failures = 0
+        while (piece := recovery.next_piece()) is not None:
+            sub_task, prompt = self._bisection_request(task, piece)
+            self._wait_for_rate_limit(prompt, task.rate_lane)
+            try:
+                raw_response = self._call_api(self.client, prompt)
+            except Exception as e:
+                failures += 1
+                time.sleep(self._bisection_api_failure(task, recovery, piece, e, failures))
+                continue
+            failures = 0
+            translations, aligned = self._align_response(sub_task.texts, raw_response, target_lang_code)
+            recovery.resolve(piece, translations, aligned, estimate_prompt_tokens(prompt))
+        return self._finish_recovery(task, recovery, batch_prompt)
+
+    async def _recover_by_bisection_async(self, task: BatchTask, mismatch: BatchCountMismatch, batch_prompt: str) -> BatchTask:
+        recovery = BisectionRecovery(task.texts, mismatch.aligned)
+        target_lang_code = task.file_task.target_lang["code"]
+        failures = 0
+        while (piece := recovery.next_piece()) is not None:
+            sub_task, prompt = self._bisection_request(task, piece)
+            await asyncio.sleep(self._reserve_rate_limit(prompt, task.rate_lane))
+            try:
+                raw_response = await self._call_api_async(self.client, prompt)
+            except Exception as e:
+                failures += 1
+                await asyncio.sleep(self._bisection_api_failure(task, recovery, piece, e, failures))
+                continue
+            failures = 0
+            translations, aligned = self._align_response(sub_task.texts, raw_response, target_lang_code)
+            recovery.resolve(piece, translations, aligned, estimate_prompt_tokens(prompt))
+        return self._finish_recovery(task, recovery, batch_prompt)
+
+    def translate_batch(self, task: BatchTask) -> BatchTask:
+        """
+        【核心工作流】处理单个批次的翻译任务，包含重试逻辑。
+        条数不符或无法解析时不整批重发，而是二分拆分重试（见 batch_recovery）。
+        """
+        prompt = self._build_prompt(task)
+        start_time = time.time() # <--- 添加时间记录
+
+        for attempt in range(MAX_RETRIES):
+            try:
+                # Apply per-provider/model rate limiting
+                self._wait_for_rate_limit(prompt, task.rate_lane)
+
+                with self._capture_prompt_cache_usage(task, attempt):
+                    raw_response = self._call_api(self.client, prompt)
+                self._apply_batch_response(task, raw_response, attempt, start_time)
+                return task
+            except Exception as e:
+                delay = self._record_batch_failure(task, e, attempt)
+                if isinstance(e, BatchCountMismatch) and len(task.texts) > 1:
+                    return self._recover_by_bisection(task, e, prompt)
+                if delay:
+                    time.sleep(delay)
+
+        return self._fall_back_to_source(task)
+
+    async def translate_batch_async(self, task: BatchTask) -> BatchTask:
+        """translate_batch 的协程版本，供 asyncio 批次引擎使用；重试与回退语义相同。"""
+        prompt = self._build_prompt(task)
+        start_time = time.time()
+
+        for attempt in range(MAX_RETRIES):
+            try:
+                await asyncio.sleep(self._reserve_rate_limit(prompt, task.rate_lane))
+
+                with self._capture_prompt_cache_usage(task, attempt):
+                    raw_response = await self._call_api_async(self.client, prompt)
+                self._apply_batch_response(task, raw_response, attempt, start_time)
+                return task
+            except Exception as e:
+                delay = self._record_batch_failure(task, e, attempt)
+                if isinstance(e, BatchCountMismatch) and len(task.texts) > 1:
+                    return await self._recover_by_bisection_async(task, e, prompt)
+                if delay:
+                    await asyncio.sleep(delay)
+
+        return self._fall_back_to_source(task)
+
     def _build_single_text_prompt(self, text: str, task_description: str, mod_name: str, source_lang: dict, target_lang: dict, mod_context: str, game_profile: dict) -> str:
         """【通用逻辑】为单条文本构建专用的翻译提示。"""
         base_prompt = game_profile["single_prompt_template"].format(
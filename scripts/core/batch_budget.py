@@ -0,0 +1,126 @@
+# scripts/core/batch_budget.py
+"""
+按 token 预算切分翻译批次
+每个批次按源文本的估算 token 数装箱，直到达到该 provider/模型的预算或条数上限。
+预算在上下文溢出、返回条数不符时减半，在后续成功批次中逐步恢复到名义值。
+进度总数按名义预算预先计算；实际切分与之的差额记在 BatchPlanStats 中。
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from scripts.app_settings import (
+    BATCH_TOKEN_BUDGET,
+    CHUNK_SIZE,
+    LOCAL_LLM_BATCH_TOKEN_BUDGET,
+    LOCAL_LLM_CHUNK_SIZE,
+    OLLAMA_BATCH_TOKEN_BUDGET,
+    OLLAMA_CHUNK_SIZE,
+)
+from scripts.core.copilot.context_budget import estimate_tokens
+
+LOCAL_PROVIDERS = {"ollama", "lm_studio", "vllm", "koboldcpp", "oobabooga", "text-generation-webui", "hunyuan"}
+# Batch warnings that mean the batch was too large for the model.
+OVERFLOW_WARNINGS = {"context_exceeded", "count_mismatch"}
+GROWTH_FACTOR = 1.25
+
+
+def resolve_chunk_size(provider_name: str, chunk_size_override: Optional[int] = None) -> int:
+    """Item cap of one batch."""
+    if chunk_size_override:
+        return max(1, int(chunk_size_override))
+    if provider_name == "ollama":
+        return OLLAMA_CHUNK_SIZE
+    if provider_name in LOCAL_PROVIDERS:
+        return LOCAL_LLM_CHUNK_SIZE
+    return CHUNK_SIZE
+
+
+def nominal_token_budget(provider_name: str) -> int:
+    """Source-text token budget of one batch before any adaptation."""
+    if provider_name == "ollama":
+        return OLLAMA_BATCH_TOKEN_BUDGET
+    if provider_name in LOCAL_PROVIDERS:
+        return LOCAL_LLM_BATCH_TOKEN_BUDGET
+    return BATCH_TOKEN_BUDGET
+
+
+def text_costs(texts: Sequence[str]) -> List[int]:
+    return [estimate_tokens(text) for text in texts]
+
+
+def pack_slices(costs: Sequence[int], max_items: int, token_budget: Optional[int]) -> List[Tuple[int, int]]:
+    """Greedy ``(start, end)`` slices; a string larger than the budget gets a batch of its own."""
+    slices = []
+    start, used = 0, 0
+    for index, cost in enumerate(costs):
+        count = index - start
+        if count and (count >= max_items or (token_budget and used + cost > token_budget)):
+            slices.append((start, index))
+            start, used = index, 0
+        used += cost
+    if start < len(costs):
+        slices.append((start, len(costs)))
+    return slices
+
+
+def count_batches(texts: Sequence[str], max_items: int, token_budget: Optional[int] = None) -> int:
+    if not token_budget:
+        return (len(texts) + max_items - 1) // max_items
+    return len(pack_slices(text_costs(texts), max_items, token_budget))
+
+
+class TokenBudget:
+    """Adaptive budget of one provider/model; shared by every run in the process."""
+
+    def __init__(self, nominal: int):
+        self.nominal = max(1, int(nominal))
+        self.floor = max(64, self.nominal // 8)
+        self._current = self.nominal
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> int:
+        return self._current
+
+    def observe(self, warnings: Sequence[dict], failed: bool = False) -> None:
+        """Halve after an overflow, grow back towards the nominal budget after a clean batch."""
+        overflowed = any(isinstance(warning, dict) and warning.get("type") in OVERFLOW_WARNINGS for warning in warnings)
+        with self._lock:
+            if overflowed:
+                self._current = max(self.floor, self._current // 2)
+            elif not failed and self._current < self.nominal:
+                self._current = min(self.nominal, int(self._current * GROWTH_FACTOR) + 1)
+
+
+class BatchBudgetRegistry:
+    def __init__(self):
+        self._budgets: Dict[Tuple[str, str], TokenBudget] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider_name: str, model_name: str = "") -> TokenBudget:
+        key = (provider_name or "", model_name or "")
+        with self._lock:
+            budget = self._budgets.get(key)
+            if budget is None:
+                budget = self._budgets[key] = TokenBudget(nominal_token_budget(provider_name))
+            return budget
+
+    def clear(self) -> None:
+        with self._lock:
+            self._budgets.clear()
+
+
+batch_budgets = BatchBudgetRegistry()
+
+
+@dataclass
+class BatchPlanStats:
+    """Batches planned beyond the nominal estimate (negative when fewer); shared by one language run."""
+    extra_batches: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, extra_batches: int) -> None:
+        with self._lock:
+            self.extra_batches += extra_batches
@@ -0,0 +1,101 @@
+# scripts/core/batch_recovery.py
+"""
+批次二分恢复
+整批响应无法解析或条数不符时，不再整批重发、最终整批回退原文，而是保留能对齐的译文，
+把剩余部分对半拆分重试，直到单条；单条重试仍失败时只有这一条保留原文。
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+SINGLE_ITEM_ATTEMPTS = 2
+
+
+def aligned_prefix(raw_response: str, translations: Optional[Sequence[str]], expected: int) -> List[str]:
+    """Leading translations of a short response that can be placed against the batch.
+
+    Only a truncated response (cut off before its closing bracket) is trusted: its items are the first
+    items of the batch, minus the last one, which may have been cut mid-string. A complete array of the
+    wrong length means lines were merged or dropped somewhere, so none of it can be placed.
+    """
+    if not translations or len(translations) >= expected:
+        return []
+    tail = (raw_response or "").rstrip().rstrip("`").rstrip()
+    if tail.endswith(("]", "}")):
+        return []
+    return list(translations[:-1])
+
+
+class BisectionRecovery:
+    """Plans the sub-batch requests of one failed batch and merges their translations."""
+
+    def __init__(self, texts: Sequence[str], aligned: Sequence[str] = ()):
+        self.texts = list(texts)
+        self.results: List[Optional[str]] = [None] * len(self.texts)
+        self.results[:len(aligned)] = list(aligned)
+        self.pending: Deque[Tuple[int, int]] = deque()
+        self.single_attempts: Dict[int, int] = {}
+        self.api_calls = 0
+        self.prompt_tokens = 0
+        self.fallback_items = 0
+        # The whole batch has just failed: retry the unaligned rest as-is only if the response made progress.
+        self._queue(len(aligned), len(self.texts), split=not aligned)
+
+    def _queue(self, start: int, end: int, split: bool) -> None:
+        if start >= end:
+            return
+        if split and end - start > 1:
+            middle = (start + end) // 2
+            self.pending.appendleft((middle, end))
+            self.pending.appendleft((start, middle))
+        else:
+            self.pending.appendleft((start, end))
+
+    def next_piece(self) -> Optional[Tuple[int, int]]:
+        return self.pending.popleft() if self.pending else None
+
+    def resolve(
+        self,
+        piece: Tuple[int, int],
+        translations: Optional[Sequence[str]],
+        aligned: Sequence[str] = (),
+        prompt_tokens: int = 0,
+    ) -> None:
+        """Record the response to ``piece``: a full translation, or the aligned part of a failed one."""
+        start, end = piece
+        self.api_calls += 1
+        self.prompt_tokens += prompt_tokens
+        if translations is not None:
+            self.results[start:end] = list(translations)
+            return
+        if end - start == 1:
+            tries = self.single_attempts[start] = self.single_attempts.get(start, 0) + 1
+            if tries < SINGLE_ITEM_ATTEMPTS:
+                self.pending.appendleft(piece)
+            else:
+                self.fallback_items += 1
+            return
+        self.results[start:start + len(aligned)] = list(aligned)
+        self._queue(start + len(aligned), end, split=not aligned)
+
+    def retry(self, piece: Tuple[int, int]) -> None:
+        """Send ``piece`` again after an API error; the error says nothing about its content."""
+        self.pending.appendleft(piece)
+
+    def abandon(self) -> None:
+        """Stop after API errors: recovered items are kept, every unresolved one keeps its source text."""
+        self.pending.clear()
+        self.fallback_items = len(self.fallback_indices)
+
+    @property
+    def fallback_indices(self) -> List[int]:
+        """Batch positions that never translated and keep their source text."""
+        return [index for index, result in enumerate(self.results) if result is None]
+
+    @property
+    def recovered_items(self) -> int:
+        return sum(result is not None for result in self.results)
+
+    def merged(self) -> List[str]:
+        """Translations in batch order; items that never translated keep their source text."""
+        return [source if result is None else result for source, result in zip(self.texts, self.results)]
@@ -10,16 +10,23 @@ from typing import List, Set, Dict, Any, Optional
 class CheckpointManager:
     """
     Manages translation checkpoints to support resume functionality.
-    Stores progress in a JSON file in the output directory.
+    Stores progress in a JSON snapshot in the output directory plus an append-only
+    journal (one JSON line per completed file) next to it. The journal is folded
+    back into the snapshot every ``JOURNAL_COMPACT_EVERY`` files.
     Thread-safe and metadata-aware.
     """
 
     CHECKPOINT_FILENAME = ".remis_checkpoint.json"
+    JOURNAL_SUFFIX = ".journal"
+    JOURNAL_COMPACT_EVERY = 200
+    RECENT_FILES_LIMIT = 10
 
     def __init__(self, output_dir: str, current_config: Optional[Dict[str, Any]] = None, checkpoint_filename: str = ".remis_checkpoint.json"):
         self.output_dir = output_dir
         self.CHECKPOINT_FILENAME = checkpoint_filename
         self.checkpoint_path = os.path.join(output_dir, self.CHECKPOINT_FILENAME)
+        self.journal_path = self.checkpoint_path + self.JOURNAL_SUFFIX
+        self._journal_entries = 0
         self.completed_files: Set[str] = set()
         self.metadata: Dict[str, Any] = {}
         self.current_config = current_config or {}
@@ -28,27 +35,83 @@ class CheckpointManager:
         self._load_checkpoint()
 
     def _load_checkpoint(self):
-        """Loads existing checkpoint if available."""
-        if os.path.exists(self.checkpoint_path):
-            try:
+        """Loads the snapshot (current or legacy JSON format) and replays the journal on top of it."""
+        has_snapshot = os.path.exists(self.checkpoint_path)
+        if not has_snapshot and not os.path.exists(self.journal_path):
+            self.completed_files = set()
+            self.metadata = self.current_config
+            return
+
+        try:
+            self.completed_files = set()
+            self.metadata = {}
+            if has_snapshot:
                 with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self.completed_files = set(data.get("completed_files", []))
                     self.metadata = data.get("metadata", {})
-                
-                self.logger.info(f"Loaded checkpoint. {len(self.completed_files)} files already completed.")
-                
-                # Validate metadata if config is provided
-                if self.current_config:
-                    self._validate_config()
-                    
-            except Exception as e:
-                self.logger.warning(f"Failed to load checkpoint: {e}. Starting fresh.")
-                self.completed_files = set()
-                self.metadata = {}
-        else:
+            if not self.metadata:
+                self.metadata = dict(self.current_config)
+            replayed = self._replay_journal()
+
+            self.logger.info(
+                f"Loaded checkpoint. {len(self.completed_files)} files already completed "
+                f"({replayed} replayed from journal)."
+            )
+
+            # Validate metadata if config is provided
+            if self.current_config:
+                self._validate_config()
+
+        except Exception as e:
+            self.logger.warning(f"Failed to load checkpoint: {e}. Starting fresh.")
             self.completed_files = set()
-            self.metadata = self.current_config
+            self.metadata = {}
+
+    def _replay_journal(self) -> int:
+        """
+        Applies journal records in order. A torn last line (crash mid-append) is cut off the
+        file first, so the next append starts on a fresh line instead of joining onto it.
+        """
+        if not os.path.exists(self.journal_path):
+            return 0
+        self._truncate_torn_tail()
+        replayed = 0
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(f"Skipping unreadable checkpoint journal line in {self.journal_path}")
+                    continue
+                filename = record.get("file")
+                if filename:
+                    self._apply_completion(filename, record.get("saved_at"), record.get("progress"))
+                    replayed += 1
+        self._journal_entries = replayed
+        return replayed
+
+    def _truncate_torn_tail(self):
+        """Truncates the journal back to its last complete (newline-terminated) record."""
+        with open(self.journal_path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                self.logger.warning(f"Dropping torn last line of checkpoint journal {self.journal_path}")
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def _apply_completion(self, filename: str, saved_at: Optional[str], progress_metadata: Optional[Dict[str, Any]]):
+        """Records one completed file in memory. Caller holds the lock (or is still in __init__)."""
+        self.completed_files.add(filename)
+        self.metadata = dict(self.metadata if self.metadata else self.current_config)
+        self.metadata["last_completed_file"] = filename
+        self.metadata["last_saved_at"] = saved_at
+        self.metadata["completed_count"] = len(self.completed_files)
+        if progress_metadata:
+            self.metadata.update(progress_metadata)
+
+        recent_files = list(self.metadata.get("recent_completed_files", []))
+        recent_files.append(filename)
+        self.metadata["recent_completed_files"] = recent_files[-self.RECENT_FILES_LIMIT:]
 
     def _validate_config(self):
         """Validates if the current config matches the checkpoint metadata."""
@@ -75,24 +138,42 @@ class CheckpointManager:
             pass
 
     def save_checkpoint(self):
-        """Saves current progress to checkpoint file atomically."""
+        """Saves current progress to checkpoint file atomically and empties the journal."""
         with self._lock:
-            metadata = dict(self.metadata if self.metadata else self.current_config)
-            metadata["completed_count"] = len(self.completed_files)
-            data = {
-                "metadata": metadata,
-                "completed_files": list(self.completed_files)
-            }
-            
-            try:
-                # Write to temp file first then rename to ensure atomicity
-                with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8', dir=self.output_dir) as tmp:
-                    json.dump(data, tmp, ensure_ascii=False, indent=2)
-                    tmp_path = tmp.name
-                
-                shutil.move(tmp_path, self.checkpoint_path)
-            except Exception as e:
-                self.logger.error(f"Failed to save checkpoint: {e}")
+            self._write_snapshot()
+
+    def _write_snapshot(self):
+        """Compaction: writes the full snapshot, then truncates the journal. Caller holds the lock."""
+        metadata = dict(self.metadata if self.metadata else self.current_config)
+        metadata["completed_count"] = len(self.completed_files)
+        data = {
+            "metadata": metadata,
+            "completed_files": list(self.completed_files)
+        }
+
+        try:
+            # Write to temp file first then rename to ensure atomicity
+            with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8', dir=self.output_dir) as tmp:
+                json.dump(data, tmp, ensure_ascii=False, indent=2)
+                tmp_path = tmp.name
+
+            shutil.move(tmp_path, self.checkpoint_path)
+            # Every journal line is now part of the snapshot. A crash before this
+            # point only means those lines are replayed again, which is idempotent.
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._journal_entries = 0
+        except Exception as e:
+            self.logger.error(f"Failed to save checkpoint: {e}")
+
+    def _append_journal(self, record: Dict[str, Any]):
+        """Appends one completion record to the journal. Caller holds the lock."""
+        try:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._journal_entries += 1
+        except Exception as e:
+            self.logger.error(f"Failed to append checkpoint journal: {e}")
 
     def is_file_completed(self, filename: str) -> bool:
         """Checks if a file has been successfully processed."""
@@ -100,33 +181,19 @@ class CheckpointManager:
             return filename in self.completed_files
 
     def mark_file_completed(self, filename: str, progress_metadata: Optional[Dict[str, Any]] = None):
-        """Marks a file as completed and saves checkpoint."""
+        """Marks a file as completed and records it in the checkpoint journal."""
+        saved_at = datetime.now().isoformat(timespec="seconds")
         with self._lock:
-            self.completed_files.add(filename)
-            self.metadata = dict(self.metadata if self.metadata else self.current_config)
-            self.metadata["last_completed_file"] = filename
-            self.metadata["last_saved_at"] = datetime.now().isoformat(timespec="seconds")
-            self.metadata["completed_count"] = len(self.completed_files)
+            self._apply_completion(filename, saved_at, progress_metadata)
+            # The snapshot carries the run's config metadata, so it must exist before
+            # the first journal line; after that only compaction rewrites it.
+            if not os.path.exists(self.checkpoint_path) or self._journal_entries + 1 >= self.JOURNAL_COMPACT_EVERY:
+                self._write_snapshot()
+                return
+            record = {"file": filename, "saved_at": saved_at}
             if progress_metadata:
-                self.metadata.update(progress_metadata)
-
-            recent_files = list(self.metadata.get("recent_completed_files", []))
-            recent_files.append(filename)
-            self.metadata["recent_completed_files"] = recent_files[-10:]
-        # Save outside the lock to minimize blocking time? 
-        # No, save_checkpoint uses lock too. 
-        # Actually, we should save inside lock or make save_checkpoint re-entrant safe?
-        # save_checkpoint acquires lock. So we shouldn't hold lock when calling it if it's not re-entrant.
-        # RLock would solve this, or just calling save_checkpoint (which locks) is enough.
-        # But we need to add to set atomically.
-        
-        # Correct pattern:
-        # with self._lock:
-        #    self.completed_files.add(filename)
-        # self.save_checkpoint() 
-        
-        # But if another thread adds between add and save, it's fine.
-        self.save_checkpoint()
+                record["progress"] = progress_metadata
+            self._append_journal(record)
 
     def filter_pending_files(self, all_files_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Returns a list of files that still need to be processed."""
@@ -145,20 +212,22 @@ class CheckpointManager:
         return pending
 
     def clear_checkpoint(self):
-        """Deletes the checkpoint file upon successful completion."""
+        """Deletes the checkpoint snapshot and journal upon successful completion."""
         with self._lock:
-            if os.path.exists(self.checkpoint_path):
-                try:
-                    os.remove(self.checkpoint_path)
-                    self.logger.info("Checkpoint file cleared.")
-                except Exception as e:
-                    self.logger.warning(f"Failed to clear checkpoint file: {e}")
+            self._journal_entries = 0
+            for path in (self.journal_path, self.checkpoint_path):
+                if os.path.exists(path):
+                    try:
+                        os.remove(path)
+                        self.logger.info(f"Checkpoint file cleared: {os.path.basename(path)}")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to clear checkpoint file: {e}")
 
     def get_checkpoint_info(self) -> Dict[str, Any]:
         """Returns info about the checkpoint for UI display."""
         with self._lock:
             return {
-                "exists": os.path.exists(self.checkpoint_path),
+                "exists": os.path.exists(self.checkpoint_path) or os.path.exists(self.journal_path),
                 "completed_count": len(self.completed_files),
                 "metadata": self.metadata,
                 "last_saved_at": self.metadata.get("last_saved_at"),
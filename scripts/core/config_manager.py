@@ -20,6 +20,7 @@ class ConfigManager:
         self.user_data_dir = user_data_dir or config_dir
         self._game_profiles = None
         self._api_providers = None
+        self._revision = 0
 
     @property
     def game_profiles(self) -> Dict[str, Any]:
@@ -116,6 +117,20 @@ class ConfigManager:
                 json.dump(config, f, indent=4, ensure_ascii=False)
         except Exception as e:
             logger.error(f"Failed to save user config: {e}")
+        finally:
+            self._revision += 1
+
+    def revision(self) -> tuple:
+        """
+        Cheap change marker for the user configuration: changes on every write from this
+        process and on external edits of config.json. Lets callers cache values derived
+        from ``get_value`` without re-reading the file.
+        """
+        try:
+            stat = os.stat(self.user_config_path)
+        except OSError:
+            return (self._revision, None, None)
+        return (self._revision, stat.st_mtime_ns, stat.st_size)
 
     def get_value(self, key: str, default: Any = None) -> Any:
         """Retrieves a value from the user configuration."""
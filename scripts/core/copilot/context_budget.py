@@ -9,6 +9,7 @@ Strategy (Phase 1.1):
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -19,25 +20,17 @@ DEFAULT_INPUT_TOKEN_BUDGET = 24_000
 MIN_RECENT_MESSAGES = 1
 # Soft cap for how many recent turns we try to keep when budget allows.
 DEFAULT_MAX_HISTORY_MESSAGES = 24
+# CJK ideographs, kana and Hangul syllables.
+_CJK_CHARS = re.compile("[\u4e00-\u9fff\u3400-\u4dbf\u3040-\u30ff\uac00-\ud7af]")
 
 
 def estimate_tokens(text: str) -> int:
     """Conservative token estimate for mixed Chinese / English prompts."""
     if not text:
         return 0
-    cjk = 0
-    other = 0
-    for ch in text:
-        code = ord(ch)
-        if (
-            0x4E00 <= code <= 0x9FFF
-            or 0x3400 <= code <= 0x4DBF
-            or 0x3040 <= code <= 0x30FF
-            or 0xAC00 <= code <= 0xD7AF
-        ):
-            cjk += 1
-        else:
-            other += 1
+    # Counted with a regex: the translation batcher estimates every source string of a mod.
+    cjk = len(_CJK_CHARS.findall(text))
+    other = len(text) - cjk
     # CJK often ≈ 1–1.5 tokens/char; ASCII ≈ 4 chars/token. Bias high.
     return max(1, int(cjk * 1.35 + other / 3.2) + 4)
 
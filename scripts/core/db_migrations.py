@@ -22,7 +22,7 @@ from scripts.core.db_models import (
 
 logger = logging.getLogger("remis_init")
 
-MAIN_DB_TARGET_VERSION = 12
+MAIN_DB_TARGET_VERSION = 13
 
 
 class UnsupportedDatabaseVersionError(RuntimeError):
@@ -651,6 +651,76 @@ def _migration_012_track_bundled_seed_state(db_path: str) -> None:
         conn.commit()
 
 
+def _migration_013_key_task_pages_by_stored_time(db_path: str) -> None:
+    """Store a sortable task time, index keyset pages and keep queue counters incrementally."""
+    task_time_sql = "strftime('%Y-%m-%dT%H:%M:%fZ', COALESCE({prefix}created_at, {prefix}started_at))"
+    count_key_sql = "{prefix}status, {prefix}archived_at IS NOT NULL, {prefix}parent_task_id IS NOT NULL"
+    with _connect(db_path) as conn:
+        if not _table_exists(conn, "background_tasks"):
+            return
+        _ensure_column(conn, "background_tasks", "task_time", "task_time TEXT")
+        conn.execute(f"UPDATE background_tasks SET task_time = {task_time_sql.format(prefix='')}")
+        conn.execute(
+            "UPDATE background_tasks SET updated_at = COALESCE(created_at, started_at) "
+            "WHERE updated_at IS NULL"
+        )
+        _ensure_index(
+            conn,
+            "CREATE INDEX IF NOT EXISTS ix_background_tasks_archived_updated_id "
+            "ON background_tasks (archived_at, updated_at DESC, task_id DESC)",
+        )
+        _ensure_index(
+            conn,
+            "CREATE INDEX IF NOT EXISTS ix_background_tasks_archived_task_time "
+            "ON background_tasks (archived_at, task_time DESC, task_id DESC)",
+        )
+        _ensure_index(
+            conn,
+            "CREATE INDEX IF NOT EXISTS ix_background_tasks_task_time "
+            "ON background_tasks (task_time DESC, task_id DESC)",
+        )
+        conn.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS background_task_counts (
+                status TEXT NOT NULL,
+                archived INTEGER NOT NULL,
+                is_child INTEGER NOT NULL,
+                task_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (status, archived, is_child)
+            ) WITHOUT ROWID;
+            DELETE FROM background_task_counts;
+            INSERT INTO background_task_counts (status, archived, is_child, task_count)
+            SELECT {count_key_sql.format(prefix='')}, COUNT(*)
+            FROM background_tasks
+            GROUP BY 1, 2, 3;
+            CREATE TRIGGER IF NOT EXISTS trg_background_task_counts_insert
+            AFTER INSERT ON background_tasks
+            BEGIN
+                INSERT INTO background_task_counts (status, archived, is_child, task_count)
+                VALUES ({count_key_sql.format(prefix='NEW.')}, 1)
+                ON CONFLICT(status, archived, is_child) DO UPDATE SET task_count = task_count + 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_background_task_counts_delete
+            AFTER DELETE ON background_tasks
+            BEGIN
+                UPDATE background_task_counts SET task_count = task_count - 1
+                WHERE (status, archived, is_child) = ({count_key_sql.format(prefix='OLD.')});
+            END;
+            CREATE TRIGGER IF NOT EXISTS trg_background_task_counts_update
+            AFTER UPDATE OF status, archived_at, parent_task_id ON background_tasks
+            FOR EACH ROW WHEN ({count_key_sql.format(prefix='OLD.')}) IS NOT ({count_key_sql.format(prefix='NEW.')})
+            BEGIN
+                UPDATE background_task_counts SET task_count = task_count - 1
+                WHERE (status, archived, is_child) = ({count_key_sql.format(prefix='OLD.')});
+                INSERT INTO background_task_counts (status, archived, is_child, task_count)
+                VALUES ({count_key_sql.format(prefix='NEW.')}, 1)
+                ON CONFLICT(status, archived, is_child) DO UPDATE SET task_count = task_count + 1;
+            END;
+            """
+        )
+        conn.commit()
+
+
 MAIN_DB_MIGRATIONS: list[tuple[int, str, Callable[[str], None]]] = [
     (1, "establish_managed_main_schema", _migration_001_establish_managed_main_schema),
     (2, "add_project_watches", _migration_002_add_project_watches),
@@ -664,6 +734,7 @@ MAIN_DB_MIGRATIONS: list[tuple[int, str, Callable[[str], None]]] = [
     (10, "enforce_status_contracts", _migration_010_enforce_status_contracts),
     (11, "add_steam_workshop_assets", _migration_011_add_steam_workshop_assets),
     (12, "track_bundled_seed_state", _migration_012_track_bundled_seed_state),
+    (13, "key_task_pages_by_stored_time", _migration_013_key_task_pages_by_stored_time),
 ]
 
 
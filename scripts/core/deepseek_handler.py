@@ -48,6 +48,8 @@ class DeepSeekHandler(BaseApiHandler):
             response = client.chat.completions.create(
                 **self._apply_reasoning_to_openai_kwargs(request_kwargs)
             )
+            # DeepSeek 的上下文硬盘缓存按前缀自动命中，这里只记录命中量。
+            self._record_chat_completion_usage(response)
             return response.choices[0].message.content.strip()
         except Exception as e:
             self.logger.exception(f"DeepSeek API call failed: {e}")
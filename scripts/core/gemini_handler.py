@@ -37,31 +37,64 @@ class GeminiHandler(BaseApiHandler):
             self.logger.exception(f"Error initializing Gemini client: {e}")
             raise
 
-    def _call_api(self, client: Any, prompt: str) -> str:
-        """【必须由子类实现】执行对Gemini API的调用并返回原始文本响应。"""
+    async def _generate_content_async(self, client: Any, **kwargs):
+        try:
+            return await client.aio.models.generate_content(**kwargs, http_options={'timeout': 300})
+        except TypeError as exc:
+            if "http_options" not in str(exc):
+                raise
+            return await client.aio.models.generate_content(**kwargs)
+
+    def _content_request(self, prompt: str) -> dict:
         provider_config = self.get_provider_config()
         model_name = provider_config.get("default_model", "gemini-3.6-flash")
         
         generation_config = self._reasoning_request_parameters()
-
-        try:
+        return {
+            "model": model_name,
+            "contents": prompt,
             # Pass the generation_config to the API call
-            response = self._generate_content(
-                client,
-                model=model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(**generation_config) if generation_config else None,
+            "config": types.GenerateContentConfig(**generation_config) if generation_config else None,
+        }
+
+    @classmethod
+    def _record_usage_metadata(cls, response: Any) -> None:
+        # 依赖 Gemini 的隐式缓存（相同前缀自动命中）；显式 cachedContents 需要单独计费存储，这里不创建。
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            cls._record_prompt_cache_usage(
+                getattr(usage, "prompt_token_count", 0),
+                getattr(usage, "cached_content_token_count", 0),
             )
-            
-            # SAFE EXTRACTION: Avoid the 'thought_signature' warning by extracting only text parts
-            # Response parts can contain Text, Thought, Call, etc.
-            if response.candidates and response.candidates[0].content.parts:
-                text_parts = [part.text for part in response.candidates[0].content.parts if part.text]
-                if text_parts:
-                    return "".join(text_parts).strip()
-            
-            # Fallback to .text if parts extraction fails (will trigger warning but at least returns something)
-            return response.text.strip()
+
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        # SAFE EXTRACTION: Avoid the 'thought_signature' warning by extracting only text parts
+        # Response parts can contain Text, Thought, Call, etc.
+        if response.candidates and response.candidates[0].content.parts:
+            text_parts = [part.text for part in response.candidates[0].content.parts if part.text]
+            if text_parts:
+                return "".join(text_parts).strip()
+        
+        # Fallback to .text if parts extraction fails (will trigger warning but at least returns something)
+        return response.text.strip()
+
+    def _call_api(self, client: Any, prompt: str) -> str:
+        """【必须由子类实现】执行对Gemini API的调用并返回原始文本响应。"""
+        try:
+            response = self._generate_content(client, **self._content_request(prompt))
+            self._record_usage_metadata(response)
+            return self._response_text(response)
+        except Exception as e:
+            self.logger.exception(f"Gemini API call failed: {e}")
+            raise
+
+    async def _call_api_async(self, client: Any, prompt: str) -> str:
+        """使用 google-genai 自带的 client.aio 异步接口。"""
+        try:
+            response = await self._generate_content_async(client, **self._content_request(prompt))
+            self._record_usage_metadata(response)
+            return self._response_text(response)
         except Exception as e:
             self.logger.exception(f"Gemini API call failed: {e}")
             raise
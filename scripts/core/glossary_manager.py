@@ -1,6 +1,5 @@
 import logging
 import json
-import re
 import threading
 import asyncio
 import uuid
@@ -15,9 +14,11 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from scripts import app_settings
 from scripts.utils import i18n
+from scripts.utils.glossary_validator import GlossaryValidationIndex
 from scripts.utils.phonetics_engine import PhoneticsEngine
 from scripts.core.db_manager import DatabaseConnectionManager
 from scripts.core.db_models import Glossary, GlossaryEntry, Project, ProjectGlossaryBinding
+from scripts.core.glossary_matcher import CompiledGlossaryCache, CompiledGlossaryMatcher
 from scripts.core.glossary_health_service import (
     GlossaryHealthService,
     entry_source_text,
@@ -35,6 +36,7 @@ class GlossaryManager:
         self._project_glossary_locks: Dict[str, asyncio.Lock] = {}
         self.current_game_id: Optional[str] = None
         self.in_memory_glossary: Dict[str, Any] = {'entries': []}
+        self.compiled_indexes = CompiledGlossaryCache()
         self.fuzzy_matching_mode: str = 'loose'
         self.phonetics_engine = PhoneticsEngine()
         self.db_manager = DatabaseConnectionManager()
@@ -595,7 +597,9 @@ class GlossaryManager:
                 
                 with self._lock:
                     self.in_memory_glossary = {'entries': entries_data}
-                
+                # Matchers and validation indexes are compiled lazily per language pair.
+                self.compiled_indexes.clear()
+
                 logger.info(i18n.t("log_glossary_loaded_from_selected", entries_count=len(entries_data), glossaries_count=len(selected_glossary_ids)))
                 return True
         except Exception as e:
@@ -1402,60 +1406,31 @@ class GlossaryManager:
         relevant_terms.sort(key=lambda x: (x['confidence'], len(x['translations'][source_lang])), reverse=True)
         return relevant_terms
 
-    def _smart_term_matching(self, text: str, source_lang: str, target_lang: str) -> List[Dict]:
-        matches = []
-        glossary = self.get_glossary_for_translation()
-        if not glossary:
-            return matches
-            
-        text_fingerprint = ""
-        is_cjk = source_lang in ['zh-CN', 'zh-TW', 'ja', 'ko']
-        if is_cjk:
-            pe_lang = 'zh' if 'zh' in source_lang else source_lang
-            text_fingerprint = self.phonetics_engine.generate_fingerprint(text, pe_lang)
-
-        for entry in glossary.get('entries', []):
-            translations = entry.get('translations', {})
-            source_term = translations.get(source_lang, "")
-            target_term = translations.get(target_lang, "")
-            if not source_term or not target_term:
-                continue
-                
-            # 1. Exact Match
-            if source_term.lower() in text:
-                matches.append(self._make_match(entry, source_term, target_term, 'exact', 1.0))
-                continue
-                
-            # 2. Phonetic Match
-            if is_cjk and len(source_term) > 1:
-                term_fingerprint = self.phonetics_engine.generate_fingerprint(source_term, pe_lang)
-                if term_fingerprint and term_fingerprint in text_fingerprint:
-                    matches.append(self._make_match(entry, source_term, target_term, 'phonetic', 0.85))
-                    continue
+    def get_term_matcher(self, source_lang: str, target_lang: str) -> Optional[CompiledGlossaryMatcher]:
+        """Return the compiled matcher for the loaded glossary, compiling it on first use per language pair."""
+        return self.compiled_indexes.get(
+            self.get_glossary_for_translation(),
+            ('matcher', source_lang, target_lang),
+            lambda entries: CompiledGlossaryMatcher(entries, source_lang, target_lang, self.phonetics_engine),
+        )
 
-            # 3. Variant Match
-            variants = entry.get('variants', {}).get(source_lang, [])
-            found_variant = False
-            for variant in variants:
-                if variant.lower() in text:
-                    matches.append(self._make_match(entry, source_term, target_term, 'variant', 0.9))
-                    found_variant = True
-                    break
-            if found_variant: continue
-            
-            # 4. Abbreviation Match
-            abbreviations = entry.get('abbreviations', {}).get(source_lang, [])
-            if abbreviations:
-                 for abbreviation in abbreviations:
-                    if self._is_abbreviation_in_text(abbreviation, text, source_lang):
-                         matches.append(self._make_match(entry, source_term, target_term, 'abbreviation', 0.85))
-                         break
-            
-            # 5. Partial Match
-            partial_match = self._check_partial_match(source_term, text, source_lang)
-            if partial_match:
-                 matches.append(self._make_match(entry, source_term, target_term, partial_match.get('match_type', 'partial'), partial_match['confidence']))
+    def get_validation_index(self, source_lang: str, target_lang: str) -> Optional[GlossaryValidationIndex]:
+        """Return the per-run validation index for the loaded glossary, or None when no term applies."""
+        index = self.compiled_indexes.get(
+            self.get_glossary_for_translation(),
+            ('validation', source_lang, target_lang),
+            lambda entries: GlossaryValidationIndex.from_entries(entries, source_lang, target_lang),
+        )
+        return index if index else None
 
+    def _smart_term_matching(self, text: str, source_lang: str, target_lang: str) -> List[Dict]:
+        matcher = self.get_term_matcher(source_lang, target_lang)
+        if matcher is None:
+            return []
+        matches = []
+        for index, match_type, confidence in matcher.match(text, self.fuzzy_matching_mode):
+            source_term, target_term = matcher.terms[index]
+            matches.append(self._make_match(matcher.entries[index], source_term, target_term, match_type, confidence))
         return self._deduplicate_matches(matches)
 
     def _make_match(self, entry, source, target, mtype, conf):
@@ -1514,83 +1489,6 @@ class GlossaryManager:
         ])
         return "\n".join(prompt_lines)
 
-    def _check_partial_match(self, source_term: str, text: str, source_lang: str) -> Optional[Dict]:
-        if len(source_term) > 3 and source_term.lower() in text:
-            match_ratio = len(source_term) / len(text)
-            if match_ratio > 0.3:
-                return {'confidence': 0.7 + (match_ratio * 0.2)}
-        fuzzy_match = self._check_fuzzy_match(source_term, text, source_lang)
-        if fuzzy_match:
-            return fuzzy_match
-        return None
-
-    def _check_fuzzy_match(self, source_term: str, text: str, source_lang: str) -> Optional[Dict]:
-        if self.fuzzy_matching_mode == 'strict':
-            return None
-        text_tokens = self._tokenize_text(text, source_lang)
-        source_tokens = self._tokenize_text(source_term, source_lang)
-        if len(source_tokens) == 1:
-            return self._check_single_word_fuzzy_match(source_term, text, source_lang)
-        return self._check_multi_word_fuzzy_match(source_tokens, text_tokens, source_lang)
-
-    def _check_single_word_fuzzy_match(self, source_term: str, text: str, source_lang: str) -> Optional[Dict]:
-        if self._is_similar_word(source_term, text):
-            distance = self._levenshtein_distance(source_term, text)
-            max_distance = max(1, len(source_term) // 4)
-            confidence = 0.6 - (distance / max_distance) * 0.3
-            return {'confidence': confidence, 'match_type': 'fuzzy'}
-        return None
-
-    def _check_multi_word_fuzzy_match(self, source_tokens: List[str], text_tokens: List[str], source_lang: str) -> Optional[Dict]:
-        matched_tokens = 0
-        total_source_tokens = len(source_tokens)
-        for source_token in source_tokens:
-            if len(source_token) < 2: continue
-            for text_token in text_tokens:
-                if len(text_token) < 2: continue
-                if source_token == text_token or self._is_similar_word(source_token, text_token):
-                    matched_tokens += 1
-                    break
-        if matched_tokens > 0:
-            match_ratio = matched_tokens / total_source_tokens
-            if match_ratio > 0.5:
-                confidence = 0.3 + (match_ratio * 0.3)
-                return {'confidence': confidence, 'match_type': 'fuzzy'}
-        return None
-
-    def _tokenize_text(self, text: str, lang: str) -> List[str]:
-        if lang in ['zh-CN', 'zh-TW', 'ja', 'ko']:
-            return list(text)
-        return re.findall(r'\w+', text.lower())
-
-    def _is_similar_word(self, word1: str, word2: str) -> bool:
-        if len(word1) < 3 or len(word2) < 3: return False
-        distance = self._levenshtein_distance(word1, word2)
-        max_distance = max(1, len(word1) // 4)
-        return distance <= max_distance
-
-    def _levenshtein_distance(self, s1: str, s2: str) -> int:
-        if len(s1) < len(s2): return self._levenshtein_distance(s2, s1)
-        if len(s2) == 0: return len(s1)
-        previous_row = list(range(len(s2) + 1))
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        return previous_row[-1]
-
-    def _is_abbreviation_in_text(self, abbreviation: str, text: str, source_lang: str) -> bool:
-        if source_lang in ['en', 'fr', 'de', 'es']:
-            pattern = r'\b' + re.escape(abbreviation.lower()) + r'\b'
-            return bool(re.search(pattern, text.lower()))
-        else:
-            text_words = text.split()
-            return abbreviation.lower() in [word.lower() for word in text_words]
-
     def _deduplicate_matches(self, matches: List[Dict]) -> List[Dict]:
         unique_matches = {}
         for match in matches:
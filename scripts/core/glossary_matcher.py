@@ -0,0 +1,330 @@
+"""Precompiled glossary term matcher used by ``GlossaryManager.extract_relevant_terms``.
+
+The matcher is compiled once per loaded glossary and language pair. Exact,
+variant and abbreviation lookups go through one Aho-Corasick pass over the batch
+text, phonetic lookups through a second pass over the text fingerprint, and the
+fuzzy pass only compares against entries whose length or tokens make a match
+possible. Match types, confidences and per-entry evaluation order are the same
+as the original per-entry scan.
+"""
+
+import logging
+import re
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from scripts.utils.aho_corasick import AhoCorasickAutomaton
+
+try:
+    import Levenshtein
+    LEVENSHTEIN_AVAILABLE = True
+except ImportError:
+    LEVENSHTEIN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CJK_SOURCE_LANGS = ('zh-CN', 'zh-TW', 'ja', 'ko')
+WORD_BOUNDARY_ABBREVIATION_LANGS = ('en', 'fr', 'de', 'es')
+
+# Cap on memoised text-token similarity lookups per compiled matcher.
+_SIMILAR_TOKEN_CACHE_LIMIT = 50000
+# Source tokens up to this length are indexed by their deletion neighbourhood
+# (max edit distance <= 2); longer, rarer tokens are compared by length bucket.
+_DELETION_INDEX_MAX_LENGTH = 11
+
+_EXACT = 'exact'
+_VARIANT = 'variant'
+_ABBREVIATION = 'abbreviation'
+
+
+def tokenize_text(text: str, lang: str) -> List[str]:
+    if lang in CJK_SOURCE_LANGS:
+        return list(text)
+    return re.findall(r'\w+', text.lower())
+
+
+def levenshtein_distance(s1: str, s2: str) -> int:
+    if LEVENSHTEIN_AVAILABLE:
+        return Levenshtein.distance(s1, s2)
+    if len(s1) < len(s2):
+        return levenshtein_distance(s2, s1)
+    if len(s2) == 0:
+        return len(s1)
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def _deletion_variants(word: str, depth: int) -> Set[str]:
+    """``word`` plus every string reachable by deleting up to ``depth`` characters."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {
+            candidate[:position] + candidate[position + 1:]
+            for candidate in frontier
+            for position in range(len(candidate))
+        }
+        variants |= frontier
+    return variants
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _has_word_boundary(text: str, index: int) -> bool:
+    """Mirror ``re``'s ``\\b`` assertion at ``index`` for a Unicode ``str``."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+class CompiledGlossaryMatcher:
+    """Term matcher compiled for one in-memory glossary snapshot and language pair."""
+
+    def __init__(self, entries: List[Dict[str, Any]], source_lang: str, target_lang: str, phonetics_engine):
+        self.entries = entries
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.is_cjk = source_lang in CJK_SOURCE_LANGS
+        self.pe_lang = ('zh' if 'zh' in source_lang else source_lang) if self.is_cjk else source_lang
+        self.phonetics_engine = phonetics_engine
+        self.word_boundary_abbreviations = source_lang in WORD_BOUNDARY_ABBREVIATION_LANGS
+
+        # Index into ``entries`` -> (source_term, target_term) for usable entries.
+        self.terms: Dict[int, Tuple[str, str]] = {}
+        self._automaton = AhoCorasickAutomaton()
+        self._phonetic_automaton = AhoCorasickAutomaton()
+        self._always_variant: Set[int] = set()
+        self._split_abbreviations: Dict[str, List[int]] = {}
+        self._regex_abbreviations: Dict[int, List[str]] = {}
+        self._single_token_by_length: Dict[int, List[int]] = {}
+        self._multi_token_terms: Dict[int, Tuple[List[str], int]] = {}
+        self._token_entries: Dict[str, List[int]] = {}
+        self._deletion_index: Dict[str, List[str]] = {}
+        self._long_vocab_by_length: Dict[int, List[str]] = {}
+        self._similar_token_cache: Dict[str, FrozenSet[str]] = {}
+
+        for index, entry in enumerate(entries):
+            self._compile_entry(index, entry)
+        self._automaton.build()
+        self._phonetic_automaton.build()
+        self._index_vocabulary()
+
+    def _compile_entry(self, index: int, entry: Dict[str, Any]) -> None:
+        translations = entry.get('translations') or {}
+        source_term = translations.get(self.source_lang, "")
+        target_term = translations.get(self.target_lang, "")
+        if not source_term or not target_term:
+            return
+        self.terms[index] = (source_term, target_term)
+        self._automaton.add(source_term.lower(), (index, _EXACT))
+
+        if self.is_cjk and len(source_term) > 1:
+            fingerprint = self.phonetics_engine.generate_fingerprint(source_term, self.pe_lang)
+            self._phonetic_automaton.add(fingerprint, index)
+
+        for variant in (entry.get('variants') or {}).get(self.source_lang, []):
+            if variant:
+                self._automaton.add(variant.lower(), (index, _VARIANT))
+            else:
+                self._always_variant.add(index)
+
+        for abbreviation in (entry.get('abbreviations') or {}).get(self.source_lang, []):
+            lowered = abbreviation.lower()
+            if not self.word_boundary_abbreviations:
+                self._split_abbreviations.setdefault(lowered, []).append(index)
+            elif lowered:
+                self._automaton.add(lowered, (index, _ABBREVIATION))
+            else:
+                self._regex_abbreviations.setdefault(index, []).append(abbreviation)
+
+        self._compile_fuzzy_terms(index, source_term)
+
+    def _compile_fuzzy_terms(self, index: int, source_term: str) -> None:
+        source_tokens = tokenize_text(source_term, self.source_lang)
+        if len(source_tokens) == 1:
+            if len(source_term) >= 3:
+                self._single_token_by_length.setdefault(len(source_term), []).append(index)
+            return
+        usable_tokens = [token for token in source_tokens if len(token) >= 2]
+        # A multi-word match needs more than half of all source tokens to match.
+        if not source_tokens or len(usable_tokens) / len(source_tokens) <= 0.5:
+            return
+        self._multi_token_terms[index] = (usable_tokens, len(source_tokens))
+        for token in set(usable_tokens):
+            self._token_entries.setdefault(token, []).append(index)
+
+    def _index_vocabulary(self) -> None:
+        # Two words within edit distance d share a string reachable from both by
+        # at most d deletions, so similar-token lookups only verify candidates
+        # that share a deletion key instead of scanning the whole vocabulary.
+        for token in self._token_entries:
+            if len(token) < 3:
+                continue
+            if len(token) > _DELETION_INDEX_MAX_LENGTH:
+                self._long_vocab_by_length.setdefault(len(token), []).append(token)
+                continue
+            for key in _deletion_variants(token, max(1, len(token) // 4)):
+                self._deletion_index.setdefault(key, []).append(token)
+
+    def match(self, text: str, fuzzy_matching_mode: str = 'loose') -> List[Tuple[int, str, float]]:
+        """Return ``(entry_index, match_type, confidence)`` in glossary order.
+
+        ``text`` is the lowercased batch text, as produced by
+        ``extract_relevant_terms``.
+        """
+        exact, variant, abbreviation = self._scan_literals(text)
+        claimed = set(exact)
+        phonetic: Set[int] = set()
+        if self.is_cjk and len(self._phonetic_automaton):
+            text_fingerprint = self.phonetics_engine.generate_fingerprint(text, self.pe_lang)
+            phonetic = self._phonetic_automaton.find_values(text_fingerprint) - claimed
+            claimed |= phonetic
+        variant = (variant | self._always_variant) - claimed
+        claimed |= variant
+        abbreviation -= claimed
+
+        fuzzy: Dict[int, float] = {}
+        if fuzzy_matching_mode != 'strict':
+            fuzzy = self._fuzzy_matches(text, claimed)
+
+        results: List[Tuple[int, int, str, float]] = []
+        results.extend((index, 0, 'exact', 1.0) for index in exact)
+        results.extend((index, 0, 'phonetic', 0.85) for index in phonetic)
+        results.extend((index, 0, 'variant', 0.9) for index in variant)
+        results.extend((index, 0, 'abbreviation', 0.85) for index in abbreviation)
+        results.extend((index, 1, 'fuzzy', confidence) for index, confidence in fuzzy.items())
+        results.sort(key=lambda item: (item[0], item[1]))
+        return [(index, match_type, confidence) for index, _, match_type, confidence in results]
+
+    def _scan_literals(self, text: str) -> Tuple[Set[int], Set[int], Set[int]]:
+        exact: Set[int] = set()
+        variant: Set[int] = set()
+        abbreviation: Set[int] = set()
+        for start, end, (index, kind) in self._automaton.iter_matches(text):
+            if kind == _EXACT:
+                exact.add(index)
+            elif kind == _VARIANT:
+                variant.add(index)
+            elif _has_word_boundary(text, start) and _has_word_boundary(text, end):
+                abbreviation.add(index)
+
+        for index, abbreviations in self._regex_abbreviations.items():
+            if any(re.search(r'\b' + re.escape(abbr.lower()) + r'\b', text) for abbr in abbreviations):
+                abbreviation.add(index)
+        if self._split_abbreviations:
+            for word in set(word.lower() for word in text.split()):
+                abbreviation.update(self._split_abbreviations.get(word, ()))
+        return exact, variant, abbreviation
+
+    def _fuzzy_matches(self, text: str, claimed: Set[int]) -> Dict[int, float]:
+        fuzzy: Dict[int, float] = {}
+        text_length = len(text)
+        if text_length >= 3:
+            for length, indices in self._single_token_by_length.items():
+                max_distance = max(1, length // 4)
+                if abs(length - text_length) > max_distance:
+                    continue
+                for index in indices:
+                    if index in claimed:
+                        continue
+                    distance = levenshtein_distance(self.terms[index][0], text)
+                    if distance <= max_distance:
+                        fuzzy[index] = 0.6 - (distance / max_distance) * 0.3
+
+        if self._multi_token_terms:
+            matched_tokens = self._matched_vocabulary(text)
+            candidates = set()
+            for token in matched_tokens:
+                candidates.update(self._token_entries[token])
+            for index in candidates - claimed:
+                usable_tokens, total_tokens = self._multi_token_terms[index]
+                matched = sum(1 for token in usable_tokens if token in matched_tokens)
+                match_ratio = matched / total_tokens
+                if matched > 0 and match_ratio > 0.5:
+                    fuzzy[index] = 0.3 + (match_ratio * 0.3)
+        return fuzzy
+
+    def _matched_vocabulary(self, text: str) -> Set[str]:
+        """Source tokens equal or similar to at least one token of ``text``."""
+        matched: Set[str] = set()
+        for token in set(tokenize_text(text, self.source_lang)):
+            if len(token) < 2:
+                continue
+            if token in self._token_entries:
+                matched.add(token)
+            if len(token) >= 3:
+                matched.update(self._similar_vocabulary(token))
+        return matched
+
+    def _similar_vocabulary(self, token: str) -> FrozenSet[str]:
+        cached = self._similar_token_cache.get(token)
+        if cached is not None:
+            return cached
+        token_length = len(token)
+        candidates: Set[str] = set()
+        depth = max(
+            (
+                max(1, length // 4)
+                for length in range(max(3, token_length - 2), min(_DELETION_INDEX_MAX_LENGTH, token_length + 2) + 1)
+                if abs(length - token_length) <= max(1, length // 4)
+            ),
+            default=0,
+        )
+        if depth:
+            for key in _deletion_variants(token, depth):
+                candidates.update(self._deletion_index.get(key, ()))
+        for length, vocabulary in self._long_vocab_by_length.items():
+            if abs(length - token_length) <= max(1, length // 4):
+                candidates.update(vocabulary)
+        result = frozenset(
+            word for word in candidates
+            if abs(len(word) - token_length) <= max(1, len(word) // 4)
+            and levenshtein_distance(word, token) <= max(1, len(word) // 4)
+        )
+        if len(self._similar_token_cache) >= _SIMILAR_TOKEN_CACHE_LIMIT:
+            self._similar_token_cache.clear()
+        self._similar_token_cache[token] = result
+        return result
+
+
+class CompiledGlossaryCache:
+    """Per-snapshot cache for structures compiled from ``in_memory_glossary``.
+
+    Entries are keyed by an arbitrary tuple (kind, source_lang, target_lang) and
+    dropped as soon as a different ``entries`` list is loaded or assigned.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Optional[List[Dict[str, Any]]] = None
+        self._compiled: Dict[tuple, Any] = {}
+
+    def get(self, glossary: Optional[Dict[str, Any]], key: tuple, factory: Callable[[List[Dict[str, Any]]], Any]) -> Any:
+        if not glossary:
+            return None
+        entries = glossary['entries']
+        with self._lock:
+            if self._entries is not entries:
+                self._entries = entries
+                self._compiled = {}
+            compiled = self._compiled.get(key)
+            if compiled is None:
+                compiled = factory(entries)
+                self._compiled[key] = compiled
+                logger.debug(f"Compiled glossary {key[0]} for {key[1:]} over {len(entries)} entries")
+            return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = None
+            self._compiled = {}
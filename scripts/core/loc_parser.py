@@ -3,10 +3,15 @@
 # Parser i generator plików lokalizacyjnych Paradoxu (EU4, Vic3, Stellaris)
 # Fix #139: Correct quote escaping for HOI4 loc files
 
+import io
+import os
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from scripts.utils import read_text_bom, write_text_bom
+from scripts.utils import EU4_ENCODING, read_text_bom, write_text_bom
 
 # Relaxed Regex: Captures key (anything before colon), version (digits after colon), and value (in quotes)
 # This allows for keys like "FNG_zhernani.100.a" or even ones with strange symbols, as long as they don't have spaces/colons in the key itself.
@@ -23,6 +28,143 @@ def unescape_value(value: str) -> str:
     return value.replace('\\"', '"')
 
 
+# Same fallback chain QuoteExtractor has always used for mods saved in legacy encodings.
+FALLBACK_ENCODINGS = (EU4_ENCODING, "cp1252", "gb18030")
+
+
+def _is_translatable(full_key: str, value: str) -> bool:
+    # --- [UNIFICATION] Filtering Logic matching QuoteExtractor ---
+    # 1. Skip if value is same as key (self-referencing)
+    # 2. Skip if value is empty
+    # 3. Skip if value is a pure variable (e.g. $VAR$)
+    if full_key == value or not value:
+        return False
+    return not (value.startswith('$') and value.endswith('$') and value.count('$') == 2)
+
+
+class LocEntry(NamedTuple):
+    """One ``key:version "value"`` line; ``raw_value`` keeps the escapes, ``line_number`` is 1-based."""
+    key: str
+    raw_value: str
+    line_number: int
+
+
+class LocDocument:
+    """
+    Single parse of a Paradox .yml file shared by snapshot, discovery, validation and export.
+
+    ``lines`` matches ``file.readlines()`` (newlines kept), ``entries`` holds every line matched
+    by ``ENTRY_RE``. Documents are cached and shared: treat both as read-only.
+    """
+
+    __slots__ = ("path", "encoding", "lines", "entries", "size", "_keys_by_line", "_translatable", "_translatable_map")
+
+    def __init__(self, path: Path, text: str, encoding: str):
+        self.path = path
+        self.encoding = encoding
+        self.lines: Tuple[str, ...] = tuple(io.StringIO(text, newline=None).readlines())
+        self.size = len(text)
+        entries = []
+        for index, line in enumerate(self.lines):
+            match = ENTRY_RE.match(line)
+            if match:
+                base_key, version, raw_value = match.groups()
+                # Universal Normalization: Strip spaces and recombine to 'key:version' or just 'key'
+                full_key = f"{base_key.strip()}:{version.strip()}" if version.strip() else base_key.strip()
+                entries.append(LocEntry(full_key, raw_value, index + 1))
+        self.entries: Tuple[LocEntry, ...] = tuple(entries)
+        self._keys_by_line: Optional[Dict[int, str]] = None
+        self._translatable: Optional[List[Tuple[str, str, int]]] = None
+        self._translatable_map: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def read(cls, path: Path) -> "LocDocument":
+        data = Path(path).read_bytes()
+        for encoding in FALLBACK_ENCODINGS:
+            try:
+                return cls(path, data.decode(encoding), encoding)
+            except UnicodeDecodeError:
+                continue
+        return cls(path, data.decode("utf-8", errors="ignore"), "utf-8")
+
+    @property
+    def keys_by_line(self) -> Dict[int, str]:
+        """``{0-based line index: normalized key}`` for every entry line."""
+        if self._keys_by_line is None:
+            self._keys_by_line = {entry.line_number - 1: entry.key for entry in self.entries}
+        return self._keys_by_line
+
+    def translatable_entries(self) -> List[Tuple[str, str, int]]:
+        """``(key, unescaped value, line_number)`` for entries that need translating."""
+        if self._translatable is None:
+            translatable = []
+            for key, raw_value, line_number in self.entries:
+                # Fix #139: unescape before filtering so \"text\" is not treated as empty
+                value = unescape_value(raw_value)
+                if _is_translatable(key, value):
+                    translatable.append((key, value, line_number))
+            self._translatable = translatable
+        return list(self._translatable)
+
+    def translatable_map(self) -> Dict[str, str]:
+        """``{key: unescaped value}`` of ``translatable_entries()``, built once; callers must not mutate it."""
+        if self._translatable_map is None:
+            self._translatable_map = {key: value for key, value, _ in self.translatable_entries()}
+        return self._translatable_map
+
+
+class LocDocumentCache:
+    """
+    LRU of parsed documents keyed by ``(path, size, mtime_ns)``; a rewritten file is parsed again.
+    Bounded by the total number of cached characters so a 5,000-file mod cannot exhaust memory.
+    """
+
+    def __init__(self, max_chars: int = 64 * 1024 * 1024):
+        self.max_chars = max_chars
+        self._documents: "OrderedDict[str, Tuple[Tuple[int, int], LocDocument]]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Path) -> LocDocument:
+        cache_key = os.path.abspath(path)
+        stat = os.stat(cache_key)
+        signature = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._documents.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                self._documents.move_to_end(cache_key)
+                self.hits += 1
+                return cached[1]
+        document = LocDocument.read(Path(path))
+        with self._lock:
+            self.misses += 1
+            previous = self._documents.pop(cache_key, None)
+            if previous is not None:
+                self._chars -= previous[1].size
+            if document.size <= self.max_chars:
+                self._documents[cache_key] = (signature, document)
+                self._chars += document.size
+            while self._chars > self.max_chars and self._documents:
+                _, (_, evicted) = self._documents.popitem(last=False)
+                self._chars -= evicted.size
+        return document
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+            self._chars = 0
+
+
+loc_document_cache = LocDocumentCache()
+
+
+def load_loc_document(path: Path) -> LocDocument:
+    """Parse ``path`` once; later calls reuse the document until the file changes on disk."""
+    return loc_document_cache.load(path)
+
+
 def parse_loc_file(path: Path) -> list[tuple[str, str]]:
     """
     Wczytaj plik .yml lub .json i zwróć listę krotek (key, text).
@@ -52,29 +194,7 @@ def parse_loc_file(path: Path) -> list[tuple[str, str]]:
             pass
     else:
         # YAML / Paradox Loc
-        for line in read_text_bom(path).splitlines():
-            match = ENTRY_RE.match(line)
-            if match:
-                base_key, version, raw_value = match.groups()
-                # Fix #139: unescape before filtering so \"text\" is not treated as empty
-                value = unescape_value(raw_value)
-                # Universal Normalization: Strip spaces and recombine to 'key:version' or just 'key'
-                full_key = f"{base_key.strip()}:{version.strip()}" if version.strip() else base_key.strip()
-                
-                # --- [UNIFICATION] Filtering Logic matching QuoteExtractor ---
-                # 1. Skip if value is same as key (self-referencing)
-                if full_key == value:
-                    continue
-                
-                # 2. Skip if value is empty
-                if not value:
-                    continue
-                
-                # 3. Skip if value is a pure variable (e.g. $VAR$)
-                if value.startswith('$') and value.endswith('$') and value.count('$') == 2:
-                    continue
-                
-                entries.append((full_key, value))
+        entries = [(key, value) for key, value, _ in load_loc_document(path).translatable_entries()]
     return entries
 
 
@@ -98,25 +218,7 @@ def parse_loc_file_with_lines(path: Path) -> list[tuple[str, str, int]]:
             pass
     else:
         # YAML / Paradox Loc
-        lines = read_text_bom(path).splitlines()
-        for i, line in enumerate(lines):
-            match = ENTRY_RE.match(line)
-            if match:
-                base_key, version, raw_value = match.groups()
-                # Fix #139: unescape before filtering
-                value = unescape_value(raw_value)
-                # Universal Normalization: Strip spaces and recombine
-                full_key = f"{base_key.strip()}:{version.strip()}" if version.strip() else base_key.strip()
-
-                # --- [UNIFICATION] Filtering Logic matching QuoteExtractor ---
-                if full_key == value:
-                    continue
-                if not value:
-                    continue
-                if value.startswith('$') and value.endswith('$') and value.count('$') == 2:
-                    continue
-
-                entries.append((full_key, value, i + 1))
+        entries = load_loc_document(path).translatable_entries()
     return entries
 
 
@@ -7,6 +7,7 @@ from urllib.parse import urlsplit
 from openai import APIConnectionError, OpenAI
 
 from scripts.core.base_handler import BaseApiHandler
+from scripts.core.openai_handler import async_client_for
 
 
 def _append_system_suffix(system_prompt: str, provider_config: dict) -> str:
@@ -238,41 +239,56 @@ class LocalLLMHandler(BaseApiHandler):
             self.logger.exception(f"Ollama Native API call failed: {e}")
             raise
 
-    def _call_openai_compatible(self, client: OpenAI, prompt: str) -> str:
+    def _openai_compatible_request(self, prompt: str) -> tuple[str, dict]:
         provider_config = self.get_provider_config()
         model_name = provider_config.get("default_model", "local-model")
-        
-        try:
-            messages = [
-                {
-                    "role": "system",
-                    "content": _append_system_suffix(
-                        "You are a professional translator for game mods.",
-                        provider_config,
-                    ),
-                },
-                {"role": "user", "content": prompt}
-            ]
-            
-            request_kwargs = {
-                "model": model_name,
-                "messages": messages,
-                "temperature": 0.3,
-            }
-            response = client.chat.completions.create(
-                **self._apply_reasoning_to_openai_kwargs(request_kwargs)
-            )
-            return self._extract_chat_content(response, model_name, self.base_url)
-        except APIConnectionError as e:
+        messages = [
+            {
+                "role": "system",
+                "content": _append_system_suffix(
+                    "You are a professional translator for game mods.",
+                    provider_config,
+                ),
+            },
+            {"role": "user", "content": prompt}
+        ]
+
+        request_kwargs = {
+            "model": model_name,
+            "messages": messages,
+            "temperature": 0.3,
+        }
+        return model_name, self._apply_reasoning_to_openai_kwargs(request_kwargs)
+
+    def _raise_openai_compatible_error(self, e: Exception):
+        if isinstance(e, APIConnectionError):
             message = self._connection_error_message()
             self.logger.error(message)
             raise ConnectionError(message) from e
+        # Check for context length error message in the exception string or checking type if imported
+        error_str = str(e).lower()
+        if "context length" in error_str or "context size has been exceeded" in error_str:
+            self.logger.error("Context Length Exceeded! The prompt is too long for the current model configuration.")
+            self.logger.error("SUGGESTION: Increase context length in LM Studio/vLLM (e.g., to 8192) or reduce 'chunk_size' in config.")
+
+        self.logger.exception(f"Local OpenAI-Compatible API call failed: {e}")
+        raise e
+
+    def _call_openai_compatible(self, client: OpenAI, prompt: str) -> str:
+        model_name, request_kwargs = self._openai_compatible_request(prompt)
+        try:
+            response = client.chat.completions.create(**request_kwargs)
+            return self._extract_chat_content(response, model_name, self.base_url)
+        except Exception as e:
+            self._raise_openai_compatible_error(e)
+
+    async def _call_api_async(self, client: Any, prompt: str) -> str:
+        """vLLM / LM Studio 等 OpenAI 兼容端点走 AsyncOpenAI；Ollama 原生协议仍在线程中执行。"""
+        if self.protocol != "openai":
+            return await super()._call_api_async(client, prompt)
+        model_name, request_kwargs = self._openai_compatible_request(prompt)
+        try:
+            response = await async_client_for(client).chat.completions.create(**request_kwargs)
+            return self._extract_chat_content(response, model_name, self.base_url)
         except Exception as e:
-             # Check for context length error message in the exception string or checking type if imported
-             error_str = str(e).lower()
-             if "context length" in error_str or "context size has been exceeded" in error_str:
-                 self.logger.error("Context Length Exceeded! The prompt is too long for the current model configuration.")
-                 self.logger.error("SUGGESTION: Increase context length in LM Studio/vLLM (e.g., to 8192) or reduce 'chunk_size' in config.")
-             
-             self.logger.exception(f"Local OpenAI-Compatible API call failed: {e}")
-             raise
+            self._raise_openai_compatible_error(e)
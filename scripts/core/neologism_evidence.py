@@ -0,0 +1,72 @@
+# scripts/core/neologism_evidence.py
+"""
+新词候选的语料证据
+一次挖掘运行只把语料 casefold 一次，并用一个 Aho-Corasick 自动机覆盖全部候选词，
+单次遍历语料即可得到每个候选的出现次数、来源文件和前 N 条上下文片段。
+计数与 ``str.count`` 一致（同一候选在一条文本内的出现不重叠计数），输出结构与逐词扫描相同。
+"""
+
+from typing import Any, Dict, List, Sequence
+
+from scripts.utils.aho_corasick import AhoCorasickAutomaton
+
+
+class _Evidence:
+    __slots__ = ("snippets", "seen_snippets", "context_evidence", "seen_evidence", "source_files", "frequency")
+
+    def __init__(self):
+        self.snippets: List[str] = []
+        self.seen_snippets = set()
+        self.context_evidence: List[Dict[str, Any]] = []
+        self.seen_evidence = set()
+        self.source_files: List[str] = []
+        self.frequency = 0
+
+    def add(self, snippet: str, source_file: str, count: int, max_snippets: int) -> None:
+        self.frequency += count
+        if not self.source_files or self.source_files[-1] != source_file:
+            self.source_files.append(source_file)
+        if len(self.context_evidence) < max_snippets and (snippet, source_file) not in self.seen_evidence:
+            self.seen_evidence.add((snippet, source_file))
+            self.context_evidence.append({"snippet": snippet, "source_file": source_file, "line": None})
+        if len(self.snippets) < max_snippets and snippet not in self.seen_snippets:
+            self.seen_snippets.add(snippet)
+            self.snippets.append(snippet)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "context_snippets": self.snippets,
+            "source_files": self.source_files,
+            "context_evidence": self.context_evidence,
+            "frequency": self.frequency,
+        }
+
+
+class EvidenceCorpus:
+    """The texts of one mining run, stripped and casefolded once, in file order."""
+
+    def __init__(self, file_texts: Dict[str, List[str]]):
+        self.files = [
+            (file_path, [(text.strip(), text.casefold()) for text in texts])
+            for file_path, texts in file_texts.items()
+        ]
+
+    def collect(self, originals: Sequence[str], max_snippets: int = 5) -> List[Dict[str, Any]]:
+        """Evidence for every term in ``originals``, in the same order, from one pass over the corpus."""
+        automaton = AhoCorasickAutomaton()
+        for index, original in enumerate(originals):
+            automaton.add(original.casefold(), index)
+        automaton.build()
+        evidence = [_Evidence() for _ in originals]
+        for file_path, texts in self.files:
+            for snippet, folded in texts:
+                counts: Dict[int, int] = {}
+                match_ends: Dict[int, int] = {}
+                # 同一候选的匹配按结束位置递增产出，贪心跳过重叠即等价于 str.count
+                for start, end, index in automaton.iter_matches(folded):
+                    if start >= match_ends.get(index, 0):
+                        counts[index] = counts.get(index, 0) + 1
+                        match_ends[index] = end
+                for index, count in counts.items():
+                    evidence[index].add(snippet, file_path, count, max_snippets)
+        return [item.as_dict() for item in evidence]
@@ -8,15 +8,17 @@ import tempfile
 import threading
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
-from scripts.app_settings import PROJECT_ROOT
+from scripts.app_settings import NEOLOGISM_MINING_WORKERS, PROJECT_ROOT
 from scripts.core.api_handler import get_handler
 from scripts.core.file_parser import extract_translatable_content
 from scripts.core.glossary_manager import glossary_manager
+from scripts.core.neologism_evidence import EvidenceCorpus
 from scripts.core.neologism_miner import NeologismMiner
+from scripts.core.neologism_pipeline import MiningCancelled, MiningPipeline, RateLimitedClient
 from scripts.shared import task_state
 
 
@@ -63,6 +65,7 @@ class NeologismManager:
         self.logger = logging.getLogger(__name__)
         self._status_lock = threading.Lock()
         self._mining_status: Dict[str, Dict[str, Any]] = {}
+        self._cancel_events: Dict[str, threading.Event] = {}
         self._candidate_locks_guard = threading.Lock()
         self._candidate_locks: Dict[str, threading.RLock] = {}
 
@@ -101,6 +104,16 @@ class NeologismManager:
                 "total_files": total_files,
                 "task_id": task_id,
             }
+            self._cancel_events[project_id] = threading.Event()
+            return True
+
+    def cancel_mining(self, project_id: str) -> bool:
+        """Ask the active mining run to stop; queued extraction and review calls are dropped."""
+        with self._status_lock:
+            current = self._mining_status.get(project_id, self._default_status())
+            if current.get("status") not in ACTIVE_STATUSES:
+                return False
+            self._cancel_events.setdefault(project_id, threading.Event()).set()
             return True
 
     def get_mining_status(self, project_id: str) -> Dict[str, Any]:
@@ -384,49 +397,6 @@ class NeologismManager:
         _, texts, _ = extract_translatable_content(str(path))
         return [text for text in texts if text and text.strip()]
 
-    def _collect_evidence(
-        self,
-        original: str,
-        file_texts: Dict[str, List[str]],
-        max_snippets: int = 5,
-    ) -> Dict[str, Any]:
-        needle = original.casefold()
-        snippets: List[str] = []
-        source_files: List[str] = []
-        context_evidence: List[Dict[str, Any]] = []
-        frequency = 0
-        for file_path, texts in file_texts.items():
-            file_matched = False
-            for text in texts:
-                count = text.casefold().count(needle)
-                if not count:
-                    continue
-                frequency += count
-                file_matched = True
-                normalized_text = text.strip()
-                if (
-                    len(context_evidence) < max_snippets
-                    and not any(
-                        item["snippet"] == normalized_text and item["source_file"] == file_path
-                        for item in context_evidence
-                    )
-                ):
-                    context_evidence.append({
-                        "snippet": normalized_text,
-                        "source_file": file_path,
-                        "line": None,
-                    })
-                if len(snippets) < max_snippets and normalized_text not in snippets:
-                    snippets.append(normalized_text)
-            if file_matched:
-                source_files.append(file_path)
-        return {
-            "context_snippets": snippets,
-            "source_files": source_files,
-            "context_evidence": context_evidence,
-            "frequency": frequency,
-        }
-
     def _fail_workflow(
         self,
         project_id: str,
@@ -455,6 +425,49 @@ class NeologismManager:
             log_message=f"Neologism mining failed: {message}",
         )
 
+    def _cancel_workflow(self, project_id: str, task_id: Optional[str], total_files: int, processed_files: int) -> None:
+        self._set_mining_status(
+            project_id,
+            status="cancelled",
+            processed_files=processed_files,
+            total_files=total_files,
+            current_file=None,
+        )
+        self._push_task_status(
+            task_id,
+            project_id,
+            status="cancelled",
+            stage="Cancelled",
+            processed_files=processed_files,
+            total_files=total_files,
+            log_message="Neologism mining cancelled. No candidates were saved.",
+        )
+
+    def _aggregate_terms(self, mined_files) -> Tuple[Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
+        """Merge per-chunk extraction results in file/chunk order, keeping the most confident grounded spelling."""
+        file_texts: Dict[str, List[str]] = {}
+        aggregates: Dict[str, Dict[str, Any]] = {}
+        for file_path, texts, chunk_results in mined_files:
+            file_texts[file_path] = texts
+            for chunk, terms in chunk_results:
+                for item in terms:
+                    if item.original.casefold() not in chunk.casefold():
+                        self.logger.warning(
+                            "Discarded ungrounded neologism candidate %r from %s",
+                            item.original,
+                            file_path,
+                        )
+                        continue
+                    key = self._normalize_term(item.original)
+                    current = aggregates.get(key)
+                    if current is None or item.confidence > current["confidence"]:
+                        aggregates[key] = {
+                            "original": item.original.strip(),
+                            "category": item.category,
+                            "confidence": item.confidence,
+                        }
+        return file_texts, aggregates
+
     def run_mining_workflow(
         self,
         project_id: str,
@@ -469,7 +482,6 @@ class NeologismManager:
         review_language: str = "en",
     ) -> int:
         total_files = len(file_paths)
-        processed_files = 0
         self._set_mining_status(
             project_id,
             status="running",
@@ -493,63 +505,43 @@ class NeologismManager:
             log_message="Neologism mining started.",
         )
 
+        with self._status_lock:
+            cancel_event = self._cancel_events.setdefault(project_id, threading.Event())
+        pipeline = MiningPipeline(NEOLOGISM_MINING_WORKERS, cancel_event)
+
+        def report_file_done(file_path: str, processed: int) -> None:
+            self._set_mining_status(project_id, processed_files=processed, current_file=file_path)
+            self._push_task_status(
+                task_id,
+                project_id,
+                stage="Mining",
+                processed_files=processed,
+                total_files=total_files,
+                current_file=file_path,
+            )
+
         try:
             if not file_paths:
                 raise ValueError("No supported project files were selected for mining")
             handler = get_handler(api_provider, model_name=model_name)
-            miner = NeologismMiner(handler)
-            file_texts: Dict[str, List[str]] = {}
-            aggregates: Dict[str, Dict[str, Any]] = {}
-
-            for index, file_path in enumerate(file_paths, start=1):
-                self._set_mining_status(project_id, processed_files=index - 1, current_file=file_path)
-                self._push_task_status(
-                    task_id,
-                    project_id,
-                    stage="Mining",
-                    processed_files=index - 1,
-                    total_files=total_files,
-                    current_file=file_path,
-                )
-                texts = self._read_translatable_texts(file_path)
-                file_texts[file_path] = texts
-                for chunk in self._chunk_texts(texts):
-                    for item in miner.extract_terms(chunk, game_name=game_name):
-                        if item.original.casefold() not in chunk.casefold():
-                            self.logger.warning(
-                                "Discarded ungrounded neologism candidate %r from %s",
-                                item.original,
-                                file_path,
-                            )
-                            continue
-                        key = self._normalize_term(item.original)
-                        current = aggregates.get(key)
-                        if current is None or item.confidence > current["confidence"]:
-                            aggregates[key] = {
-                                "original": item.original.strip(),
-                                "category": item.category,
-                                "confidence": item.confidence,
-                            }
-                processed_files = index
-                self._set_mining_status(project_id, processed_files=index)
-                self._push_task_status(
-                    task_id,
-                    project_id,
-                    stage="Mining",
-                    processed_files=index,
-                    total_files=total_files,
-                    current_file=file_path,
-                )
+            miner = NeologismMiner(RateLimitedClient(handler, api_provider, model_name))
+            mined_files = pipeline.extract_files(
+                file_paths,
+                self._read_translatable_texts,
+                self._chunk_texts,
+                lambda chunk: miner.extract_terms(chunk, game_name=game_name),
+                on_file_done=report_file_done,
+            )
+            file_texts, aggregates = self._aggregate_terms(mined_files)
 
             existing_candidates = self.load_candidates(project_id)
             existing_terms = {self._normalize_term(candidate.original) for candidate in existing_candidates}
             duplicate_index = duplicate_index or {}
             prepared: List[Dict[str, Any]] = []
             duplicate_count = 0
-            for key, aggregate in aggregates.items():
-                if key in existing_terms:
-                    continue
-                evidence = self._collect_evidence(aggregate["original"], file_texts)
+            fresh = [(key, aggregate) for key, aggregate in aggregates.items() if key not in existing_terms]
+            evidence_by_term = EvidenceCorpus(file_texts).collect([aggregate["original"] for _, aggregate in fresh])
+            for (key, aggregate), evidence in zip(fresh, evidence_by_term):
                 if not evidence["context_snippets"]:
                     continue
                 duplicate_matches = duplicate_index.get(key, [])
@@ -572,14 +564,21 @@ class NeologismManager:
                 if not self._existing_target_suggestion(item["duplicate_matches"], target_lang)
             ]
             reviews: Dict[str, Any] = {}
-            for offset in range(0, len(review_payloads), REVIEW_BATCH_SIZE):
-                reviews.update(miner.review_terms(
-                    review_payloads[offset:offset + REVIEW_BATCH_SIZE],
+            review_batches = [
+                review_payloads[offset:offset + REVIEW_BATCH_SIZE]
+                for offset in range(0, len(review_payloads), REVIEW_BATCH_SIZE)
+            ]
+            for batch_reviews in pipeline.map_ordered(
+                lambda batch: miner.review_terms(
+                    batch,
                     source_lang=source_lang,
                     target_lang=target_lang,
                     game_name=game_name,
                     review_language=review_language,
-                ))
+                ),
+                review_batches,
+            ):
+                reviews.update(batch_reviews)
 
             new_candidates: List[Candidate] = []
             for item in prepared:
@@ -612,6 +611,8 @@ class NeologismManager:
                     confidence=confidence,
                 ))
 
+            if cancel_event.is_set():
+                raise MiningCancelled("Neologism mining was cancelled")
             with self._candidate_lock(project_id):
                 latest = self._load_candidates_unlocked(project_id)
                 latest_terms = {self._normalize_term(candidate.original) for candidate in latest}
@@ -649,10 +650,18 @@ class NeologismManager:
                 log_message=f"Neologism mining completed. Found {new_count} new candidates.",
             )
             return new_count
+        except MiningCancelled:
+            self.logger.info("Neologism mining cancelled for project %s", project_id)
+            self._cancel_workflow(project_id, task_id, total_files, pipeline.completed_files)
+            return 0
         except Exception as exc:
             self.logger.error("Neologism mining failed for project %s: %s", project_id, exc, exc_info=True)
-            self._fail_workflow(project_id, task_id, total_files, processed_files, exc)
+            self._fail_workflow(project_id, task_id, total_files, pipeline.completed_files, exc)
             raise
+        finally:
+            with self._status_lock:
+                if self._cancel_events.get(project_id) is cancel_event:
+                    del self._cancel_events[project_id]
 
     @staticmethod
     def _existing_target_suggestion(matches: List[Dict[str, Any]], target_lang: str) -> str:
@@ -0,0 +1,127 @@
+# scripts/core/neologism_pipeline.py
+"""
+新词挖掘的有界并发流水线
+文件读取、分块抽取与复核批次在同一个线程池中执行，LLM 调用经由全局 rate_limiter
+按 (provider, model) 限速。结果按输入顺序（文件序号、分块序号）返回，聚合结果与串行执行一致；
+进度回调只在调用线程中触发，已完成文件数单调递增。取消后排队中的任务不再执行。
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from scripts.utils.rate_limiter import estimate_prompt_tokens, is_rate_limit_error, rate_limiter, retry_after_seconds
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# (文件路径, 可翻译文本, [(分块, 该分块的抽取结果)])
+MinedFile = Tuple[str, List[str], List[Tuple[str, List[Any]]]]
+
+
+class MiningCancelled(RuntimeError):
+    """Raised inside the pipeline once the mining run has been cancelled."""
+
+
+class RateLimitedClient:
+    """Wraps a handler so every ``generate_with_messages`` call (including repair calls) waits for the provider budget."""
+
+    def __init__(self, client: Any, provider: Optional[str], model: Optional[str]):
+        self.client = client
+        self.provider = getattr(client, "provider_name", None) or provider
+        self.model = getattr(client, "model_id", None) or model
+
+    def generate_with_messages(self, messages: List[Dict[str, str]], temperature: float = 0.7) -> str:
+        prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        rate_limiter.wait(self.provider, self.model, tokens=estimate_prompt_tokens(prompt))
+        try:
+            response = self.client.generate_with_messages(messages, temperature=temperature)
+        except Exception as exc:
+            if is_rate_limit_error(exc):
+                rate_limiter.report_rate_limited(self.provider, self.model, retry_after_seconds(exc))
+            raise
+        rate_limiter.report_success(self.provider, self.model)
+        return response
+
+
+class MiningPipeline:
+    """
+    One mining run's worker pool. ``cancel_event`` is checked by every job before it starts
+    and by the coordinating thread after every completion; the first failure cancels the rest.
+    """
+
+    def __init__(self, max_workers: int, cancel_event: Optional[threading.Event] = None):
+        self.max_workers = max(1, int(max_workers))
+        self.cancel_event = cancel_event or threading.Event()
+        self.completed_files = 0
+
+    def _guarded(self, fn: Callable[..., R], *args) -> R:
+        if self.cancel_event.is_set():
+            raise MiningCancelled("Neologism mining was cancelled")
+        return fn(*args)
+
+    def _drain(self, executor: ThreadPoolExecutor, pending: Dict[Future, Any]):
+        """Yield ``(tag, result)`` as jobs finish; new jobs may be added to ``pending`` meanwhile."""
+        try:
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    tag = pending.pop(future)
+                    if self.cancel_event.is_set():
+                        raise MiningCancelled("Neologism mining was cancelled")
+                    yield tag, future.result()
+        finally:
+            if pending:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def extract_files(
+        self,
+        file_paths: Sequence[str],
+        read_texts: Callable[[str], List[str]],
+        chunk_texts: Callable[[List[str]], List[str]],
+        extract_chunk: Callable[[str], List[Any]],
+        on_file_done: Optional[Callable[[str, int], None]] = None,
+    ) -> List[MinedFile]:
+        """Read every file and extract terms from every chunk; returns one entry per file in input order."""
+        texts: Dict[int, List[str]] = {}
+        chunks: Dict[int, List[str]] = {}
+        chunk_results: Dict[int, List[Optional[List[Any]]]] = {}
+        remaining: Dict[int, int] = {}
+
+        def finish_file(file_index: int) -> None:
+            self.completed_files += 1
+            if on_file_done:
+                on_file_done(file_paths[file_index], self.completed_files)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="neologism-mining") as executor:
+            pending: Dict[Future, Tuple[int, Optional[int]]] = {
+                executor.submit(self._guarded, read_texts, file_path): (file_index, None)
+                for file_index, file_path in enumerate(file_paths)
+            }
+            for (file_index, chunk_index), result in self._drain(executor, pending):
+                if chunk_index is None:
+                    texts[file_index] = result
+                    chunks[file_index] = chunk_texts(result)
+                    chunk_results[file_index] = [None] * len(chunks[file_index])
+                    remaining[file_index] = len(chunks[file_index])
+                    for index, chunk in enumerate(chunks[file_index]):
+                        pending[executor.submit(self._guarded, extract_chunk, chunk)] = (file_index, index)
+                else:
+                    chunk_results[file_index][chunk_index] = result
+                    remaining[file_index] -= 1
+                if remaining[file_index] == 0:
+                    finish_file(file_index)
+
+        return [
+            (file_path, texts[index], list(zip(chunks[index], chunk_results[index])))
+            for index, file_path in enumerate(file_paths)
+        ]
+
+    def map_ordered(self, fn: Callable[[T], R], items: Sequence[T]) -> List[R]:
+        """``[fn(item) for item in items]`` on the pool, in input order."""
+        results: List[Optional[R]] = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="neologism-review") as executor:
+            pending = {executor.submit(self._guarded, fn, item): index for index, item in enumerate(items)}
+            for index, result in self._drain(executor, pending):
+                results[index] = result
+        return results
@@ -1,10 +1,47 @@
 # scripts/core/openai_handler.py
+import asyncio
+import weakref
+
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from scripts.app_settings import get_api_key
 from scripts.core.base_handler import BaseApiHandler
 
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def async_client_for(client: OpenAI) -> AsyncOpenAI:
+    """
+    返回与同步客户端配置相同的 AsyncOpenAI 客户端（含 default_headers，例如 OpenRouter 的署名头）。
+
+    异步 HTTP 连接池绑定在创建它的事件循环上，因此按事件循环缓存；
+    事件循环结束前由 ``close_async_clients`` 关闭。
+    """
+    loop = asyncio.get_running_loop()
+    clients = _ASYNC_CLIENTS.setdefault(loop, {})
+    async_client = clients.get(id(client))
+    if async_client is None:
+        async_client = AsyncOpenAI(
+            api_key=client.api_key,
+            organization=client.organization,
+            project=client.project,
+            base_url=client.base_url,
+            timeout=client.timeout,
+            max_retries=client.max_retries,
+            default_headers=client._custom_headers,
+        )
+        clients[id(client)] = async_client
+    return async_client
+
+
+async def close_async_clients() -> None:
+    """关闭当前事件循环缓存的 AsyncOpenAI 客户端，释放其连接池。"""
+    clients = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for async_client in clients.values():
+        await async_client.close()
+
+
 class OpenAIHandler(BaseApiHandler):
     """OpenAI API Handler子类"""
 
@@ -34,25 +71,22 @@ class OpenAIHandler(BaseApiHandler):
             self.logger.exception(f"Error initializing OpenAI client: {e}")
             raise
 
-    def _call_api(self, client: OpenAI, prompt: str) -> str:
-        """【必须由子类实现】执行对OpenAI API的调用并返回原始文本响应。"""
+    def _chat_request(self, prompt: str) -> tuple[str, dict]:
+        # 服务端按前缀自动缓存：批次无关的指令必须位于用户消息开头（见 PromptPlan）。
         provider_config = self.get_provider_config()
         model_name = provider_config.get("default_model", "gpt-5.6-terra")
-        
-        try:
-            request_kwargs = {
-                "model": model_name,
-                "messages": [
-                    {"role": "system", "content": "You are a professional translator for game mods."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_completion_tokens": 4000,
-            }
-            response = client.chat.completions.create(
-                **self._apply_reasoning_to_openai_kwargs(request_kwargs)
-            )
-            return response.choices[0].message.content.strip()
-        except openai.NotFoundError as e:
+        request_kwargs = {
+            "model": model_name,
+            "messages": [
+                {"role": "system", "content": "You are a professional translator for game mods."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_completion_tokens": 4000,
+        }
+        return model_name, self._apply_reasoning_to_openai_kwargs(request_kwargs)
+
+    def _raise_api_error(self, client: OpenAI, model_name: str, e: Exception):
+        if isinstance(e, openai.NotFoundError):
             # 捕获 404 错误 (Model Not Found) - 特别针对本地 LLM 用户
             error_msg = str(e)
             hint = f"OpenAI API Error (404 Not Found): {error_msg}. "
@@ -66,10 +100,31 @@ class OpenAIHandler(BaseApiHandler):
             
             self.logger.error(hint)
             raise ValueError(hint) from e
+        self.logger.exception(f"OpenAI API call failed: {e}")
+        # 重新引发异常，让基类的重试逻辑捕获
+        raise e
+
+    def _call_api(self, client: OpenAI, prompt: str) -> str:
+        """【必须由子类实现】执行对OpenAI API的调用并返回原始文本响应。"""
+        model_name, request_kwargs = self._chat_request(prompt)
+        try:
+            response = client.chat.completions.create(**request_kwargs)
+            self._record_chat_completion_usage(response)
+            return response.choices[0].message.content.strip()
         except Exception as e:
-            self.logger.exception(f"OpenAI API call failed: {e}")
-            # 重新引发异常，让基类的重试逻辑捕获
-            raise
+            self._raise_api_error(client, model_name, e)
+
+    async def _call_api_async(self, client: OpenAI, prompt: str) -> str:
+        """使用 SDK 自带的 AsyncOpenAI 客户端发起调用；覆盖了 _call_api 的子类仍走线程回退。"""
+        if type(self)._call_api is not OpenAIHandler._call_api:
+            return await super()._call_api_async(client, prompt)
+        model_name, request_kwargs = self._chat_request(prompt)
+        try:
+            response = await async_client_for(client).chat.completions.create(**request_kwargs)
+            self._record_chat_completion_usage(response)
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            self._raise_api_error(client, model_name, e)
 
     def generate_with_messages(self, messages: list[dict], temperature: float = 0.7) -> str:
         """
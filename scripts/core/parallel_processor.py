@@ -5,24 +5,46 @@
 职责：批次级并行调度，不包含文件操作逻辑
 """
 
-import os
 import logging
 import concurrent.futures
 from typing import List, Dict, Any, Callable, Optional, Tuple
+from scripts.core.batch_budget import (
+    LOCAL_PROVIDERS,
+    BatchPlanStats,
+    TokenBudget,
+    batch_budgets,
+    nominal_token_budget,
+    pack_slices,
+    resolve_chunk_size,
+    text_costs,
+)
 from scripts.core.parallel_types import FileTask, BatchTask
+from scripts.core.translation_memory import MemoryPlan, TranslationMemory, TranslationMemoryStats
 from scripts.core.glossary_manager import glossary_manager
+from scripts.utils.glossary_validator import GlossaryValidator
 from scripts.utils import i18n
-from scripts.app_settings import CHUNK_SIZE, LOCAL_LLM_CHUNK_SIZE, OLLAMA_CHUNK_SIZE
 
 
 class ParallelProcessor:
-    LOCAL_PROVIDERS = {"ollama", "lm_studio", "vllm", "koboldcpp", "oobabooga", "text-generation-webui", "hunyuan"}
+    LOCAL_PROVIDERS = LOCAL_PROVIDERS
 
     """批次级全局并行处理器 - 实现真正的批次级并行调度"""
 
-    def __init__(self, max_workers: int = 24, chunk_size_override: Optional[int] = None):
+    def __init__(
+        self,
+        max_workers: int = 24,
+        chunk_size_override: Optional[int] = None,
+        translation_memory: Optional[TranslationMemory] = None,
+        memory_stats: Optional[TranslationMemoryStats] = None,
+        batch_plan_stats: Optional[BatchPlanStats] = None,
+    ):
         self.max_workers = max_workers
         self.chunk_size_override = max(1, int(chunk_size_override)) if chunk_size_override else None
+        # Strings found in the translation memory are filled in before batching; only misses reach the model.
+        self.translation_memory = translation_memory
+        self.memory_stats = memory_stats if memory_stats is not None else TranslationMemoryStats()
+        # Batches are packed to a per-provider/model token budget; item counts are only a cap.
+        self.batch_plan_stats = batch_plan_stats if batch_plan_stats is not None else BatchPlanStats()
         self.logger = logging.getLogger(__name__)
 
     def process_files_parallel(
@@ -34,17 +56,26 @@ class ParallelProcessor:
         if not file_tasks:
             return {}, []
         
-        batch_tasks = self._create_batch_tasks(file_tasks)
+        memory_plans = {
+            file_task.filename: self._plan_translation_memory(file_task)
+            for file_task in file_tasks
+            if file_task.texts_to_translate and self.translation_memory is not None
+        }
+        batch_tasks = self._create_batch_tasks(file_tasks, memory_plans)
         self.logger.info(i18n.t("parallel_processing_start", count=len(batch_tasks)))
         
         batch_results, all_warnings = self._process_batches_parallel(batch_tasks, translation_function, progress_callback)
         
-        file_results = self._collect_file_results(file_tasks, batch_results)
+        file_results = self._collect_file_results(file_tasks, batch_results, memory_plans)
         
         self.logger.info(i18n.t("all_files_processing_completed", count=len(file_results)))
         return file_results, all_warnings
 
-    def _create_batch_tasks(self, file_tasks: List[FileTask]) -> List[BatchTask]:
+    def _create_batch_tasks(
+        self,
+        file_tasks: List[FileTask],
+        memory_plans: Optional[Dict[str, MemoryPlan]] = None,
+    ) -> List[BatchTask]:
         batch_tasks = []
         global_batch_index = 0
         
@@ -52,17 +83,15 @@ class ParallelProcessor:
             if not file_task.texts_to_translate:
                 continue
 
-            chunk_size = self._resolve_chunk_size(file_task.provider_name)
-            
-            texts = file_task.texts_to_translate
-            for i in range(0, len(texts), chunk_size):
-                batch_texts = texts[i:i + chunk_size]
+            memory_plan = (memory_plans or {}).get(file_task.filename)
+            texts = memory_plan.miss_texts if memory_plan else file_task.texts_to_translate
+            for start, end in self._batch_slices(file_task, texts):
                 batch_task = BatchTask(
                     file_task=file_task,
                     batch_index=global_batch_index,
-                    start_index=i,
-                    end_index=i + len(batch_texts),
-                    texts=batch_texts
+                    start_index=start,
+                    end_index=end,
+                    texts=texts[start:end]
                 )
                 batch_tasks.append(batch_task)
                 global_batch_index += 1
@@ -129,52 +158,91 @@ class ParallelProcessor:
         return batch_results, all_warnings
 
     def _resolve_chunk_size(self, provider_name: str) -> int:
-        if self.chunk_size_override:
-            return self.chunk_size_override
-        if provider_name == "ollama":
-            return OLLAMA_CHUNK_SIZE
-        if provider_name in self.LOCAL_PROVIDERS:
-            return LOCAL_LLM_CHUNK_SIZE
-        return CHUNK_SIZE
+        return resolve_chunk_size(provider_name, self.chunk_size_override)
+
+    @staticmethod
+    def _token_budget(file_task: FileTask) -> TokenBudget:
+        return batch_budgets.get(file_task.provider_name, file_task.model_name)
+
+    def _nominal_batch_count(self, file_task: FileTask, costs: List[int]) -> int:
+        """Batch count at the nominal budget, i.e. what the progress total was computed with."""
+        chunk_size = self._resolve_chunk_size(file_task.provider_name)
+        return len(pack_slices(costs, chunk_size, nominal_token_budget(file_task.provider_name)))
+
+    def _batch_slices(self, file_task: FileTask, texts: List[str]) -> List[Tuple[int, int]]:
+        costs = text_costs(texts)
+        chunk_size = self._resolve_chunk_size(file_task.provider_name)
+        slices = pack_slices(costs, chunk_size, self._token_budget(file_task).current)
+        extra_batches = len(slices) - self._nominal_batch_count(file_task, costs)
+        if extra_batches:
+            self.batch_plan_stats.record(extra_batches)
+        return slices
 
     def _process_single_batch(
         self,
         batch_task: BatchTask,
         translation_function: Callable
     ) -> Tuple[BatchTask, List[Dict[str, Any]]]:
-        warnings = []
-        
         # Initial Translation Pass
-        processed_task = translation_function(batch_task)
+        return self._validate_processed_batch(translation_function(batch_task))
+
+    def _validate_processed_batch(self, processed_task: BatchTask) -> Tuple[BatchTask, List[Dict[str, Any]]]:
+        warnings = []
         if processed_task.warnings:
             warnings.extend(processed_task.warnings)
         
         if processed_task.translated_texts is None:
             processed_task.failed = True
+            self._token_budget(processed_task.file_task).observe(processed_task.warnings, failed=True)
             return processed_task, warnings
 
+        self._token_budget(processed_task.file_task).observe(processed_task.warnings, processed_task.failed)
+
         # Glossary Validation (Warnings only)
-        glossary = glossary_manager.get_glossary_for_translation()
-        if glossary:
-            simple_glossary = {}
-            source_lang_code = processed_task.file_task.source_lang.get("code")
-            target_lang_code = processed_task.file_task.target_lang.get("code")
-            if source_lang_code and target_lang_code and 'entries' in glossary:
-                for entry in glossary.get('entries', []):
-                    translations = entry.get('translations', {})
-                    source_term = translations.get(source_lang_code)
-                    target_term = translations.get(target_lang_code)
-                    if source_term and target_term and isinstance(source_term, str) and isinstance(target_term, str):
-                        simple_glossary[source_term] = target_term
-            if simple_glossary:
-                from scripts.utils.glossary_validator import GlossaryValidator
-                validator = GlossaryValidator()
-                validation_warnings = validator.validate_batch(processed_task, simple_glossary)
-                if validation_warnings:
-                    warnings.extend(validation_warnings)
+        source_lang_code = processed_task.file_task.source_lang.get("code")
+        target_lang_code = processed_task.file_task.target_lang.get("code")
+        validation_index = glossary_manager.get_validation_index(source_lang_code, target_lang_code)
+        if validation_index:
+            validation_warnings = GlossaryValidator().validate_batch(
+                processed_task, validation_index.glossary, index=validation_index
+            )
+            if validation_warnings:
+                warnings.extend(validation_warnings)
 
         return processed_task, warnings
 
+    def _plan_translation_memory(self, file_task: FileTask) -> MemoryPlan:
+        memory_plan = self.translation_memory.plan(file_task, self.memory_stats)
+        if memory_plan.hits:
+            full_batches = self._nominal_batch_count(file_task, text_costs(file_task.texts_to_translate))
+            miss_batches = self._nominal_batch_count(file_task, text_costs(memory_plan.miss_texts))
+            self.memory_stats.record(skipped_batches=full_batches - miss_batches)
+            self.logger.info(
+                f"Translation memory: {len(memory_plan.hits)}/{len(file_task.texts_to_translate)} "
+                f"strings of {file_task.filename} reused."
+            )
+        return memory_plan
+
+    def _create_file_batches(self, file_task: FileTask, texts: Optional[List[str]] = None) -> List[BatchTask]:
+        texts = file_task.texts_to_translate if texts is None else texts
+        return [
+            BatchTask(
+                file_task=file_task,
+                batch_index=batch_index,
+                start_index=start,
+                end_index=end,
+                texts=texts[start:end],
+            )
+            for batch_index, (start, end) in enumerate(self._batch_slices(file_task, texts))
+        ]
+
+    def _prepare_file_batches(self, file_task: FileTask) -> Tuple[List[BatchTask], Optional[MemoryPlan]]:
+        """Split a file into batches, leaving out strings the translation memory already knows."""
+        if not file_task.texts_to_translate or self.translation_memory is None:
+            return self._create_file_batches(file_task), None
+        memory_plan = self._plan_translation_memory(file_task)
+        return self._create_file_batches(file_task, memory_plan.miss_texts), memory_plan
+
     def process_files_stream(
         self,
         file_tasks_generator: Any, # Iterator[FileTask]
@@ -184,162 +252,62 @@ class ParallelProcessor:
         Stream processing of files.
         Yields (filename, translated_texts, warnings) as soon as a file is completed.
         """
-        # Buffer to hold incomplete file batches: {filename: {batch_index: BatchTask}}
-        file_buffers: Dict[str, Dict[int, BatchTask]] = {}
-        # Track total batches expected per file: {filename: total_batches}
-        file_batch_counts: Dict[str, int] = {}
-        file_warning_buffers: Dict[str, List[Dict[str, Any]]] = {}
-        
-        # We need a way to map futures back to their file and batch index
-        # But since we are consuming a generator, we can't submit everything at once if we want to be lazy?
-        # Actually, for "streaming" input, we should submit as we consume.
-        # But we also need to yield results as they complete.
-        
-        # Use a bounded executor or semaphore to prevent submitting too many tasks at once if the generator is infinite?
-        # For now, assuming the generator yields all files, but we want to process them in parallel and yield results ASAP.
-        
+        assembler = FileStreamAssembler(self.logger)
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # We need to manage submission and completion simultaneously.
-            # Since we can't easily "select" on both generator and futures, 
-            # we can submit all tasks (if memory allows) or use a separate thread for submission.
-            # Given the requirement is to reduce memory usage, we shouldn't generate ALL BatchTasks at once if there are millions.
-            # But typically we have thousands. 
-            
-            # However, the main memory bottleneck is loading ALL file contents into memory.
             # The `file_tasks_generator` should yield FileTasks one by one (reading file content on demand).
-            
+            # `BatchTask` holds a reference to its `FileTask`, so submitting everything at once would keep
+            # every file in memory. We MUST limit the number of active files/batches.
             future_to_info = {}
-            
-            # Helper to submit batches for a file
-            def submit_file(file_task: FileTask):
-                if not file_task.texts_to_translate:
-                    # Handle empty file immediately
-                    return True, (file_task, [], [], False)
-                
-                chunk_size = self._resolve_chunk_size(file_task.provider_name)
-                texts = file_task.texts_to_translate
-                total_batches = (len(texts) + chunk_size - 1) // chunk_size
-                file_batch_counts[file_task.filename] = total_batches
-                file_buffers[file_task.filename] = {}
-                file_warning_buffers[file_task.filename] = []
-                
-                for i in range(0, len(texts), chunk_size):
-                    batch_texts = texts[i:i + chunk_size]
-                    batch_index = i // chunk_size
-                    
-                    batch_task = BatchTask(
-                        file_task=file_task,
-                        batch_index=batch_index,
-                        start_index=i,
-                        end_index=i + len(batch_texts),
-                        texts=batch_texts
-                    )
-                    
-                    future = executor.submit(self._process_single_batch, batch_task, translation_function)
-                    future_to_info[future] = (file_task.filename, batch_index, batch_task)
-                return False, None
-
-            # We iterate through the generator and submit tasks. 
-            # To avoid loading EVERYTHING, we can't just loop to end.
-            # But `as_completed` requires a set of futures.
-            
-            # Strategy: 
-            # 1. Submit a chunk of files.
-            # 2. Loop while there are pending futures.
-            # 3. In the loop, check for completed futures.
-            # 4. Also try to submit more files if we have capacity (optional, for now let's just submit all or use a smart loop).
-            
-            # Simpler approach for V1: 
-            # The generator yields FileTasks. We iterate it.
-            # If we just iterate and submit, we still hold all Futures in memory. 
-            # But Futures are small. The FileTask content is what's big.
-            # Wait, `BatchTask` holds reference to `FileTask`. 
-            # So if we submit all, we hold all FileTasks in memory. That defeats the purpose.
-            
-            # So we MUST limit the number of active files/batches.
             MAX_PENDING_BATCHES = self.max_workers * 4
             pending_batches_count = 0
-            
+
             iterator = iter(file_tasks_generator)
             done_consuming = False
-            
+
             while not done_consuming or future_to_info:
                 # 1. Submit new tasks if we have capacity
                 while not done_consuming and pending_batches_count < MAX_PENDING_BATCHES:
                     try:
                         file_task = next(iterator)
-                        is_empty, empty_result = submit_file(file_task)
-                        if is_empty:
-                            yield empty_result
-                        else:
-                            # Update pending count
-                            pending_batches_count += file_batch_counts[file_task.filename]
                     except StopIteration:
                         done_consuming = True
-                
+                        break
+                    batch_tasks, memory_plan = self._prepare_file_batches(file_task)
+                    if not batch_tasks:
+                        # Empty file, or every string came from the translation memory
+                        yield assembler.complete_without_batches(file_task, memory_plan)
+                        continue
+                    assembler.register(file_task, len(batch_tasks), memory_plan)
+                    for batch_task in batch_tasks:
+                        future = executor.submit(self._process_single_batch, batch_task, translation_function)
+                        future_to_info[future] = batch_task
+                    pending_batches_count += len(batch_tasks)
+
                 # 2. Wait for at least one future to complete
                 if future_to_info:
-                    # wait for first completed
                     done, _ = concurrent.futures.wait(
-                        future_to_info.keys(), 
+                        future_to_info.keys(),
                         return_when=concurrent.futures.FIRST_COMPLETED
                     )
-                    
+
                     for future in done:
-                        filename, batch_index, batch_task = future_to_info.pop(future)
+                        batch_task = future_to_info.pop(future)
                         pending_batches_count -= 1
-                        warnings = []
-                        
                         try:
                             processed_task, warnings = future.result()
                         except Exception as e:
-                            self.logger.error(f"Critical error in batch processing thread for {filename} batch {batch_index}: {e}")
-                            # Create a fatal task result so the file logic can progress
-                            batch_task.failed = True
-                            batch_task.translated_texts = batch_task.texts
-                            processed_task = batch_task
-
-                        if filename not in file_buffers:
-                            continue
-                            
-                        file_buffers[filename][batch_index] = processed_task
-                        if warnings:
-                            file_warning_buffers.setdefault(filename, []).extend(warnings)
-                        
-                        # Check if file is complete (all batches accounted for, even if failed)
-                        if len(file_buffers[filename]) == file_batch_counts[filename]:
-                            # Assemble file
-                            sorted_batches = [file_buffers[filename][i] for i in range(file_batch_counts[filename])]
-                            
-                            # Get the FileTask from the first batch (all batches share the same FileTask reference)
-                            # We need this to return the full context (original lines, etc.)
-                            file_task_ref = sorted_batches[0].file_task
-                            
-                            full_translated_texts = []
-                            file_failed = False
-                            
-                            for task in sorted_batches:
-                                if task.failed or task.fell_back_to_source:
-                                    file_failed = True
-                                full_translated_texts.extend(task.translated_texts or [])
-
-                            file_warnings = file_warning_buffers.get(filename, [])
-                            
-                            if file_failed:
-                                self.logger.error(f"File {filename} incomplete or failed.")
-                                yield (file_task_ref, full_translated_texts, file_warnings, True) # Fourth item is 'failed' flag
-                            else:
-                                yield (file_task_ref, full_translated_texts, file_warnings, False)
-                            
-                            # Cleanup
-                            del file_buffers[filename]
-                            del file_batch_counts[filename]
-                            file_warning_buffers.pop(filename, None)
+                            processed_task, warnings = assembler.crashed_batch(batch_task, e), []
+
+                        file_result = assembler.add(batch_task, processed_task, warnings)
+                        if file_result is not None:
+                            yield file_result
 
     def _collect_file_results(
         self,
         file_tasks: List[FileTask],
-        batch_results: Dict[Tuple[str, int], BatchTask]
+        batch_results: Dict[Tuple[str, int], BatchTask],
+        memory_plans: Optional[Dict[str, MemoryPlan]] = None,
     ) -> Dict[str, List[str]]:
         file_results = {}
         
@@ -372,6 +340,10 @@ class ParallelProcessor:
                     break
                 file_translated_texts.extend(task.translated_texts)
 
+            memory_plan = (memory_plans or {}).get(file_task.filename)
+            if memory_plan and not file_failed and len(file_translated_texts) == len(memory_plan.miss_indices):
+                file_translated_texts = memory_plan.merge(file_translated_texts)
+
             if file_failed or len(file_translated_texts) != len(file_task.texts_to_translate):
                 self.logger.error(f"File translation failed for {file_task.filename}, using fallback.")
                 file_results[file_task.filename] = file_task.texts_to_translate
@@ -380,3 +352,81 @@ class ParallelProcessor:
                 self.logger.info(i18n.t("file_translation_completed", filename=file_task.filename))
 
         return file_results
+
+
+class FileStreamAssembler:
+    """Collects finished batches per file and assembles a streamed file result once all batches are in."""
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        # Buffer to hold incomplete file batches: {filename: {batch_index: BatchTask}}
+        self.file_buffers: Dict[str, Dict[int, BatchTask]] = {}
+        # Track total batches expected per file: {filename: total_batches}
+        self.file_batch_counts: Dict[str, int] = {}
+        self.file_warning_buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self.memory_plans: Dict[str, MemoryPlan] = {}
+
+    def register(self, file_task: FileTask, batch_count: int, memory_plan: Optional[MemoryPlan] = None) -> None:
+        self.file_batch_counts[file_task.filename] = batch_count
+        self.file_buffers[file_task.filename] = {}
+        self.file_warning_buffers[file_task.filename] = []
+        if memory_plan is not None:
+            self.memory_plans[file_task.filename] = memory_plan
+
+    @staticmethod
+    def complete_without_batches(file_task: FileTask, memory_plan: Optional[MemoryPlan] = None) -> Tuple:
+        """Result for a file that needs no model call: it is empty or fully served by the translation memory."""
+        return (file_task, memory_plan.merge([]) if memory_plan else [], [], False)
+
+    def crashed_batch(self, batch_task: BatchTask, error: BaseException) -> BatchTask:
+        self.logger.error(
+            f"Critical error in batch processing thread for {batch_task.file_task.filename} "
+            f"batch {batch_task.batch_index}: {error}"
+        )
+        # Create a fatal task result so the file logic can progress
+        batch_task.failed = True
+        batch_task.translated_texts = batch_task.texts
+        return batch_task
+
+    def add(self, batch_task: BatchTask, processed_task: BatchTask, warnings: List[Dict[str, Any]]) -> Optional[Tuple]:
+        """Buffer one finished batch; returns ``(file_task, texts, warnings, failed)`` when its file completes."""
+        filename = batch_task.file_task.filename
+        if filename not in self.file_buffers:
+            return None
+
+        self.file_buffers[filename][batch_task.batch_index] = processed_task
+        if warnings:
+            self.file_warning_buffers.setdefault(filename, []).extend(warnings)
+
+        # Check if file is complete (all batches accounted for, even if failed)
+        if len(self.file_buffers[filename]) != self.file_batch_counts[filename]:
+            return None
+
+        sorted_batches = [self.file_buffers[filename][i] for i in range(self.file_batch_counts[filename])]
+        # All batches share the same FileTask reference; it carries the full context (original lines, etc.)
+        file_task_ref = sorted_batches[0].file_task
+
+        full_translated_texts = []
+        kept_source: List[int] = []
+        file_failed = False
+        for task in sorted_batches:
+            if task.failed or task.fell_back_to_source:
+                file_failed = True
+            kept_source.extend(len(full_translated_texts) + index for index in task.fallback_indices)
+            full_translated_texts.extend(task.translated_texts or [])
+
+        memory_plan = self.memory_plans.pop(filename, None)
+        if memory_plan is not None:
+            # 二分恢复后仅个别条目保留原文时，其余已恢复的译文仍记入翻译记忆，保留原文的条目除外
+            batch_lost = any(task.failed or (task.fell_back_to_source and not task.fallback_indices) for task in sorted_batches)
+            full_translated_texts = memory_plan.merge(full_translated_texts, failed=batch_lost, kept_source=kept_source)
+
+        file_warnings = self.file_warning_buffers.get(filename, [])
+        if file_failed:
+            self.logger.error(f"File {filename} incomplete or failed.")
+
+        # Cleanup
+        del self.file_buffers[filename]
+        del self.file_batch_counts[filename]
+        self.file_warning_buffers.pop(filename, None)
+        return (file_task_ref, full_translated_texts, file_warnings, file_failed) # Fourth item is 'failed' flag
@@ -22,6 +22,7 @@ class FileTask:
     mod_name: str  # 添加mod_name字段
     loc_root: str = "" # Localization root path (e.g. mod/main_menu/localization)
     file_path: str = "" # Stable archive-relative path for this source file
+    model_name: str = "" # Model the batches are sent to; keys the adaptive batch token budget
 
 
 @dataclass
@@ -35,4 +36,10 @@ class BatchTask:
     translated_texts: Optional[List[str]] = field(default=None, init=False)
     failed: bool = field(default=False, init=False)
     fell_back_to_source: bool = field(default=False, init=False)
+    fallback_indices: List[int] = field(default_factory=list, init=False)  # 批次内保留原文的位置（二分恢复后仍失败的条目）
     warnings: List[Dict[str, Any]] = field(default_factory=list, init=False)
+
+    @property
+    def rate_lane(self) -> Optional[str]:
+        """限速公平通道：并发翻译多个目标语言时按语言平分 RPM。"""
+        return (self.file_task.target_lang or {}).get("code")
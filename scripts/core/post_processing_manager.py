@@ -15,20 +15,21 @@ from pathlib import Path
 from scripts.utils.post_process_validator import PostProcessValidator, ValidationResult, ValidationLevel
 from scripts.app_settings import GAME_PROFILES
 from scripts.utils import i18n
-from scripts.utils.quote_extractor import QuoteExtractor
-from scripts.core.loc_parser import parse_loc_file, parse_loc_file_with_lines
+from scripts.core.source_file_index import load_source_entries, source_tree_indexes
+from scripts.core.services.parallel_validation_service import FileValidationOutcome, ValidationContext, validate_files
 
 
 class PostProcessingManager:
     """后处理验证管理器"""
     
-    def __init__(self, game_profile: dict, output_folder: str, source_root: Optional[str] = None):
+    def __init__(self, game_profile: dict, output_folder: str, source_root: Optional[str] = None, max_workers: Optional[int] = None):
         """
         初始化后处理验证管理器
         
         Args:
             game_profile: 游戏配置信息
             output_folder: 输出文件夹路径
+            max_workers: 验证进程数，None 使用 VALIDATION_WORKERS，1 为串行
         """
         self.game_profile = game_profile
         self.output_folder = output_folder
@@ -37,7 +38,10 @@ class PostProcessingManager:
         # 优先使用配置中的 name，其次回退到 id
         self.game_name = game_profile.get("name") or game_profile.get("display_name") or game_profile.get("id") or "Unknown Game"
         self.validator = PostProcessValidator()
+        self.max_workers = max_workers
         self.logger = logging.getLogger(__name__)
+        # 本次验证中源目录索引最多因查找未命中重建一次
+        self._index_scope = object()
 
         # 解析并规范化游戏键（转换成验证器需要的数字键 "1"~"5"）
         self.normalized_game_key = self._resolve_game_key(self.game_id)
@@ -91,9 +95,17 @@ class PostProcessingManager:
             
             self.logger.info(i18n.t("post_processing_scanning", file_count=self.total_files))
             
-            # 验证每个文件
-            for file_path in translated_files:
-                self._validate_single_file(file_path, target_lang, source_lang, dynamic_valid_tags=dynamic_valid_tags)
+            # 验证每个文件：源文件在主进程解析一次，文件按块并行验证，结果按扫描顺序合并
+            try:
+                game_validator = self.validator.get_validator_by_game_id(self.normalized_game_key)
+            except ValueError as e:
+                self.logger.warning(f"验证文件失败 {self.output_folder}: {e}")
+                game_validator = None
+            if game_validator is not None:
+                context = ValidationContext(self.normalized_game_key, source_lang, target_lang.get("code"), dynamic_valid_tags)
+                jobs = [(file_path, self._load_source_entries(file_path, target_lang, source_lang)) for file_path in translated_files]
+                for outcome in validate_files(game_validator, context, jobs, self.max_workers):
+                    self._record_file_outcome(game_validator, outcome)
             
             # 输出验证摘要
             self._log_validation_summary()
@@ -188,32 +200,6 @@ class PostProcessingManager:
         
         self.logger.info("\n" + "="*60)
     
-    def _sanitize_content(self, content: str) -> str:
-        """
-        [Sanitizer] 自动修复常见的 AI 格式幻觉。
-        """
-        import re
-        original_content = content
-        
-        # 1. 修复全角感叹号作为结束符 (#!#！ -> #!)
-        content = content.replace("#!#！", "#!")
-        content = content.replace("#！", "#!")
-        
-        # 2. 修复错误的换行符 (nn -> \n\n) - 仅在特定上下文中，避免误伤
-        # Vic3 通常使用 \n 换行，但也支持 \n\n。AI 有时会把 \n\n 转义成 nn。
-        # 我们可以保守地修复 quotes 内部的 nn? 暂时全局修复风险较大，仅修复显然的模式。
-        # 观察用户案例: "...#!#!nn#variable..." -> "\n\n"
-        content = content.replace("#!#!nn#", "#!#!\n\n#")
-        content = content.replace("!nn#", "!\n\n#")
-        
-        # 3. 修复全角标点后紧接TAG缺少空格的问题 (虽然Vic3不一定强制，但好看)
-        # content = re.sub(r'([。！？])#', r'\1 #', content) # 暂时不开启，避免破坏特定紧凑排版
-        
-        if content != original_content:
-            self.logger.info(i18n.t("post_processing_sanitized_content"))
-        
-        return content
-
     def _resolve_source_file(self, target_file_path: str, target_lang: dict, source_lang: dict) -> Optional[Path]:
         if not self.source_root:
             return None
@@ -240,111 +226,50 @@ class PostProcessingManager:
             flags=re.IGNORECASE,
         )
 
-        candidate = self.source_root.joinpath(*rel_parts)
-        if candidate.exists():
-            return candidate
-
-        expected_name = Path(rel_parts[-1]).name
-        for found in self.source_root.rglob(expected_name):
-            if found.name.lower() == expected_name.lower():
-                return found
-        return None
+        return source_tree_indexes.find(self.source_root, "/".join(rel_parts), scope=self._index_scope)
 
     def _load_source_entries(self, target_file_path: str, target_lang: dict, source_lang: dict) -> Dict[str, str]:
         source_file = self._resolve_source_file(target_file_path, target_lang, source_lang)
         if not source_file:
             return {}
         try:
-            return dict(parse_loc_file(source_file))
+            return load_source_entries(source_file)
         except Exception as e:
             self.logger.warning(f"Failed to parse source file {source_file}: {e}")
             return {}
 
-    def _lookup_source_value(self, source_entries: Dict[str, str], key: str) -> str:
-        if key in source_entries:
-            return source_entries[key]
-        base_key = key.split(":")[0]
-        if base_key in source_entries:
-            return source_entries[base_key]
-        return source_entries.get(f"{base_key}:0", "")
+    def _record_file_outcome(self, game_validator, outcome: FileValidationOutcome) -> None:
+        """合并单个文件的验证结果到统计与详细结果中"""
+        file_path = outcome.file_path
+        if outcome.sanitized_fixes:
+            self.logger.info(i18n.t("post_processing_sanitized_content", filename=os.path.basename(file_path), count=outcome.sanitized_fixes))
+            if outcome.write_error:
+                self.logger.error(f"Failed to write back sanitized content: {outcome.write_error}")
+            else:
+                self.logger.info(f"Auto-fixed formatting issues in {os.path.basename(file_path)}")
+        if outcome.error:
+            self.logger.warning(f"验证文件失败 {file_path}: {outcome.error}")
+            return
 
-    def _validate_single_file(self, file_path: str, target_lang: dict, source_lang: dict, dynamic_valid_tags: Optional[List[str]] = None):
-        """
-        验证单个文件，均值并自动修复常见格式错误
-        """
-        try:
-            # 读取文件内容
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # [Fix] 自动清理幻觉
-            sanitized_content = self._sanitize_content(content)
-            
-            # 如果内容有变化，回写文件
-            if sanitized_content != content:
-                try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(sanitized_content)
-                    content = sanitized_content # 使用修复后的内容进行验证
-                    self.logger.info(f"Auto-fixed formatting issues in {os.path.basename(file_path)}")
-                except Exception as e:
-                    self.logger.error(f"Failed to write back sanitized content: {e}")
+        file_results = outcome.results
+        for result in file_results:
+            game_validator._log_validation_result(result)
 
-            source_entries = self._load_source_entries(file_path, target_lang, source_lang)
-            file_results = []
-            parsed_entries = parse_loc_file_with_lines(Path(file_path))
-            if parsed_entries:
-                for key, translatable_content, line_num in parsed_entries:
-                    results = self.validator.validate_entry(
-                        self.normalized_game_key,
-                        key,
-                        translatable_content,
-                        line_num,
-                        source_lang,
-                        source_value=self._lookup_source_value(source_entries, key),
-                        target_lang=target_lang.get("code"),
-                        dynamic_valid_tags=dynamic_valid_tags
-                    )
-                    if results:
-                        file_results.extend(results)
-            else:
-                # Fallback for malformed files that the loc parser cannot parse.
-                lines = content.split('\n')
-                for line_num, line in enumerate(lines, 1):
-                    stripped = line.strip()
-                    if not stripped or stripped.startswith("#"):
-                        continue
-                    translatable_content = QuoteExtractor.extract_from_line(line)
-                    if translatable_content:
-                        results = self.validator.validate_game_text(
-                            self.normalized_game_key,
-                            translatable_content,
-                            line_num,
-                            source_lang,
-                            target_lang=target_lang.get("code"),
-                            dynamic_valid_tags=dynamic_valid_tags
-                        )
-                        if results:
-                            file_results.extend(results)
-            
-            # 记录文件验证结果
-            if file_results:
-                self.validation_results[file_path] = file_results
-                self.files_with_issues += 1
-                
-                # 统计问题数量
-                for result in file_results:
-                    if result.level == ValidationLevel.ERROR:
-                        self.total_errors += 1
-                    elif result.level == ValidationLevel.WARNING:
-                        self.total_warnings += 1
-                    elif result.level == ValidationLevel.INFO:
-                        self.total_info += 1
-            else:
-                self.valid_files += 1
-                
-        except Exception as e:
-            self.logger.warning(f"验证文件失败 {file_path}: {e}")
+        # 记录文件验证结果
+        if file_results:
+            self.validation_results[file_path] = file_results
+            self.files_with_issues += 1
+
+            # 统计问题数量
+            for result in file_results:
+                if result.level == ValidationLevel.ERROR:
+                    self.total_errors += 1
+                elif result.level == ValidationLevel.WARNING:
+                    self.total_warnings += 1
+                elif result.level == ValidationLevel.INFO:
+                    self.total_info += 1
+        else:
+            self.valid_files += 1
 
     def attach_results_to_proofreading_tracker(self, proofreading_tracker) -> None:
         """将验证结果合并写入校对进度追踪器的每个文件记录"""
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import base64
+import binascii
 import json
 import sqlite3
 import threading
@@ -8,6 +10,17 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional
 
+# Same normalization as migration 013, so stored task_time and bound filters compare as text.
+TASK_TIME_SQL = "strftime('%Y-%m-%dT%H:%M:%fZ', {value})"
+_STORED_TASK_TIME_SQL = TASK_TIME_SQL.format(value="COALESCE(:created_at, :started_at)")
+ACTIVE_TASK_STATUSES = frozenset({
+    "pending", "starting", "queued", "running",
+    "processing", "in_progress", "awaiting_approval", "waiting_approval",
+})
+ATTENTION_TASK_STATUSES = frozenset({
+    "awaiting_approval", "waiting_approval", "failed", "partial_failed", "interrupted",
+})
+
 
 class TaskRepository:
     """Synchronous SQLite ledger for background task state and ordered events."""
@@ -15,12 +28,23 @@ class TaskRepository:
     def __init__(self, db_path: str):
         self.db_path = str(Path(db_path))
         self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
 
     def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.db_path, timeout=10)
-        connection.row_factory = sqlite3.Row
-        connection.execute("PRAGMA foreign_keys=ON")
-        return connection
+        """Return the repository's pooled connection; callers hold ``self._lock`` while using it."""
+        with self._lock:
+            if self._connection is None:
+                connection = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+                connection.row_factory = sqlite3.Row
+                connection.execute("PRAGMA foreign_keys=ON")
+                self._connection = connection
+            return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
     @staticmethod
     def _json(value: Any) -> str:
@@ -40,24 +64,27 @@ class TaskRepository:
         task: Dict[str, Any],
         *,
         event: Optional[Dict[str, Any]] = None,
+        events: Iterable[Dict[str, Any]] = (),
     ) -> None:
-        snapshot = deepcopy(task)
-        snapshot.pop("log", None)
+        """Upsert the task row and append ``event`` / ``events`` (in order) in one transaction."""
+        # The row is JSON-encoded right away, so a shallow copy without the log is enough.
+        snapshot = {key: value for key, value in task.items() if key != "log"}
+        pending_events = [item for item in (*events, event) if item and item.get("message")]
         with self._lock, self._connect() as connection:
             connection.execute(
-                """
+                f"""
                 INSERT INTO background_tasks (
                     task_id, kind, project_id, parent_task_id, created_by, title,
                     status, stage, progress, created_at, started_at, updated_at,
                     finished_at, message, attention_reason, checkpoint, result,
                     blocking, dedupe_key, idempotency_key, source_route, archived_at,
-                    payload
+                    payload, task_time
                 ) VALUES (
                     :task_id, :kind, :project_id, :parent_task_id, :created_by, :title,
                     :status, :stage, :progress, :created_at, :started_at, :updated_at,
                     :finished_at, :message, :attention_reason, :checkpoint, :result,
                     :blocking, :dedupe_key, :idempotency_key, :source_route, :archived_at,
-                    :payload
+                    :payload, {_STORED_TASK_TIME_SQL}
                 )
                 ON CONFLICT(task_id) DO UPDATE SET
                     kind=excluded.kind,
@@ -81,7 +108,8 @@ class TaskRepository:
                     idempotency_key=excluded.idempotency_key,
                     source_route=excluded.source_route,
                     archived_at=excluded.archived_at,
-                    payload=excluded.payload
+                    payload=excluded.payload,
+                    task_time=excluded.task_time
                 """,
                 {
                     "task_id": str(snapshot["task_id"]),
@@ -95,7 +123,8 @@ class TaskRepository:
                     "progress": self._json(snapshot.get("progress") or {}),
                     "created_at": snapshot.get("created_at"),
                     "started_at": snapshot.get("started_at"),
-                    "updated_at": snapshot.get("updated_at"),
+                    # Keyset pages order by updated_at, so it is never stored as NULL.
+                    "updated_at": snapshot.get("updated_at") or snapshot.get("created_at") or snapshot.get("started_at"),
                     "finished_at": snapshot.get("finished_at"),
                     "message": snapshot.get("message"),
                     "attention_reason": snapshot.get("attention_reason"),
@@ -109,27 +138,30 @@ class TaskRepository:
                     "payload": self._json(snapshot),
                 },
             )
-            if event and event.get("message"):
+            if pending_events:
                 next_sequence = connection.execute(
                     "SELECT COALESCE(MAX(sequence), 0) + 1 FROM task_events WHERE task_id = ?",
                     (str(snapshot["task_id"]),),
                 ).fetchone()[0]
-                connection.execute(
+                connection.executemany(
                     """
                     INSERT INTO task_events (
                         task_id, sequence, timestamp, level, event_type, audience, message, metadata
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        str(snapshot["task_id"]),
-                        next_sequence,
-                        event.get("timestamp"),
-                        str(event.get("level") or "info"),
-                        str(event.get("event_type") or "log"),
-                        str(event.get("audience") or "user"),
-                        str(event["message"]),
-                        self._json(event.get("metadata") or {}),
-                    ),
+                    [
+                        (
+                            str(snapshot["task_id"]),
+                            next_sequence + offset,
+                            item.get("timestamp"),
+                            str(item.get("level") or "info"),
+                            str(item.get("event_type") or "log"),
+                            str(item.get("audience") or "user"),
+                            str(item["message"]),
+                            self._json(item.get("metadata") or {}),
+                        )
+                        for offset, item in enumerate(pending_events)
+                    ],
                 )
             connection.commit()
 
@@ -245,6 +277,46 @@ class TaskRepository:
             ).fetchone()
         return self._row_to_task(row) if row else None
 
+    @staticmethod
+    def encode_page_cursor(order: str, sort_value: Optional[str], task_id: str) -> str:
+        raw = json.dumps([order, sort_value, task_id], ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_page_cursor(cursor: str, order: str) -> tuple[str, str]:
+        """Return ``(sort_value, task_id)``; raises ``ValueError`` for foreign or damaged cursors."""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            cursor_order, sort_value, task_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (ValueError, TypeError, binascii.Error):
+            raise ValueError("Invalid task page cursor") from None
+        if cursor_order != order or not isinstance(sort_value, str) or not isinstance(task_id, str):
+            raise ValueError("Task page cursor does not match this query")
+        return sort_value, task_id
+
+    @staticmethod
+    def _queue_counts(
+        connection: sqlite3.Connection,
+        *,
+        include_archived: bool,
+        include_children: bool,
+    ) -> Dict[str, int]:
+        """Per-status task counts from the trigger-maintained counter table (migration 013)."""
+        clauses = ["task_count > 0"]
+        if not include_archived:
+            clauses.append("archived = 0")
+        if not include_children:
+            clauses.append("is_child = 0")
+        rows = connection.execute(
+            f"""
+            SELECT status, SUM(task_count) AS task_count
+            FROM background_task_counts
+            WHERE {' AND '.join(clauses)}
+            GROUP BY status
+            """
+        ).fetchall()
+        return {row["status"]: int(row["task_count"]) for row in rows}
+
     def query_task_page(
         self,
         *,
@@ -256,85 +328,90 @@ class TaskRepository:
         to_time: Optional[str] = None,
         offset: int = 0,
         limit: int = 50,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Return one summary page and global queue counts without loading events."""
+        """
+        Return one summary page and global queue counts without loading events.
+
+        Pages are keyed by ``(sort column, task_id)``: pass the returned ``next_cursor``
+        back as ``cursor`` to continue without an OFFSET scan. ``offset`` is still
+        honoured when no cursor is given.
+        """
+        empty_page = {"tasks": [], "total_count": 0, "active_count": 0, "attention_count": 0, "next_cursor": None}
         clauses: list[str] = []
         parameters: list[Any] = []
         if not include_archived:
             clauses.append("archived_at IS NULL")
         if not include_children:
             clauses.append("parent_task_id IS NULL")
+        normalized_statuses: Optional[list[str]] = None
         if statuses is not None:
-            placeholders, normalized = self._in_clause(statuses)
-            if not normalized:
-                return {"tasks": [], "total_count": 0, "active_count": 0, "attention_count": 0}
+            placeholders, normalized_statuses = self._in_clause(statuses)
+            if not normalized_statuses:
+                return empty_page
             clauses.append(f"status IN ({placeholders})")
-            parameters.extend(normalized)
+            parameters.extend(normalized_statuses)
         if kind:
             clauses.append("kind = ?")
             parameters.append(kind)
-        task_time_sql = "COALESCE(created_at, started_at)"
         if from_time:
-            clauses.append(f"julianday({task_time_sql}) >= julianday(?)")
+            clauses.append(f"task_time >= {TASK_TIME_SQL.format(value='?')}")
             parameters.append(from_time)
         if to_time:
-            clauses.append(f"julianday({task_time_sql}) < julianday(?)")
+            clauses.append(f"task_time < {TASK_TIME_SQL.format(value='?')}")
             parameters.append(to_time)
-        where_sql = f" WHERE {' AND '.join(clauses)}" if clauses else ""
-        order_sql = (
-            f"julianday({task_time_sql}) DESC"
-            if from_time or to_time
-            else "updated_at DESC, created_at DESC"
-        )
+        filter_sql = " AND ".join(clauses)
+
+        order = "task_time" if from_time or to_time else "updated_at"
+        page_clauses = list(clauses)
+        page_parameters = list(parameters)
+        if cursor:
+            sort_value, task_id = self.decode_page_cursor(cursor, order)
+            page_clauses.append(f"({order}, task_id) < (?, ?)")
+            page_parameters.extend([sort_value, task_id])
+            offset = 0
+        page_where_sql = f" WHERE {' AND '.join(page_clauses)}" if page_clauses else ""
 
-        count_clauses: list[str] = []
-        if not include_archived:
-            count_clauses.append("archived_at IS NULL")
-        if not include_children:
-            count_clauses.append("parent_task_id IS NULL")
-        count_scope = f"WHERE {' AND '.join(count_clauses)}" if count_clauses else ""
         with self._lock, self._connect() as connection:
-            count_row = connection.execute(
-                f"""
-                SELECT
-                    COUNT(*) AS total_count,
-                    COALESCE(SUM(
-                        CASE WHEN status IN (
-                            'pending', 'starting', 'queued', 'running',
-                            'processing', 'in_progress', 'awaiting_approval',
-                            'waiting_approval'
-                        ) THEN 1 ELSE 0 END
-                    ), 0) AS active_count,
-                    COALESCE(SUM(
-                        CASE WHEN status IN (
-                            'awaiting_approval', 'waiting_approval', 'failed',
-                            'partial_failed', 'interrupted'
-                        ) THEN 1 ELSE 0 END
-                    ), 0) AS attention_count
-                FROM background_tasks
-                {count_scope}
-                """
-            ).fetchone()
-            total_count = connection.execute(
-                f"SELECT COUNT(*) FROM background_tasks{where_sql}",
-                parameters,
-            ).fetchone()[0]
+            status_counts = self._queue_counts(
+                connection,
+                include_archived=include_archived,
+                include_children=include_children,
+            )
+            if kind or from_time or to_time:
+                total_count = connection.execute(
+                    f"SELECT COUNT(*) FROM background_tasks WHERE {filter_sql}",
+                    parameters,
+                ).fetchone()[0]
+            else:
+                total_count = sum(
+                    count
+                    for status, count in status_counts.items()
+                    if normalized_statuses is None or status in normalized_statuses
+                )
             rows = connection.execute(
                 f"""
                 SELECT *
                 FROM background_tasks
-                {where_sql}
-                ORDER BY {order_sql}
+                {page_where_sql}
+                ORDER BY {order} DESC, task_id DESC
                 LIMIT ? OFFSET ?
                 """,
-                [*parameters, limit, offset],
+                [*page_parameters, limit + 1, offset],
             ).fetchall()
 
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self.encode_page_cursor(order, rows[-1][order], rows[-1]["task_id"])
         return {
             "tasks": [self._row_to_task(row, include_events=False) for row in rows],
             "total_count": int(total_count),
-            "active_count": int(count_row["active_count"]),
-            "attention_count": int(count_row["attention_count"]),
+            "active_count": sum(count for status, count in status_counts.items() if status in ACTIVE_TASK_STATUSES),
+            "attention_count": sum(
+                count for status, count in status_counts.items() if status in ATTENTION_TASK_STATUSES
+            ),
+            "next_cursor": next_cursor,
         }
 
     def list_events(
@@ -3,8 +3,7 @@ import logging
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
-from scripts.core.loc_parser import parse_loc_file_with_lines
-from scripts.utils import read_text_bom
+from scripts.core.loc_parser import load_loc_document
 
 logger = logging.getLogger(__name__)
 
@@ -58,12 +57,12 @@ class IncrementalSnapshotService:
 
                 full_path = Path(os.path.join(root, file_name))
                 try:
-                    parsed_entries = parse_loc_file_with_lines(full_path)
+                    document = load_loc_document(full_path)
+                    parsed_entries = document.translatable_entries()
                     if not parsed_entries:
                         continue
 
-                    raw_content = read_text_bom(full_path)
-                    original_lines = raw_content.splitlines(keepends=True)
+                    original_lines = list(document.lines)
                     relative_file_path = os.path.relpath(full_path, source_path).replace("\\", "/")
 
                     files_data.append({
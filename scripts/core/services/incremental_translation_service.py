@@ -46,6 +46,7 @@ class IncrementalTranslationService:
 
         for task in file_tasks_for_ai:
             task.client = handler.client
+            task.model_name = getattr(handler, "model_id", "") or ""
 
         processor = ParallelProcessor(
             max_workers=self._resolve_max_workers(selected_provider, concurrency_limit),
@@ -73,12 +74,5 @@ class IncrementalTranslationService:
         )
 
         from scripts.utils.rate_limiter import rate_limiter
-        previous_rpm = rate_limiter.rpm
-        if rpm_limit:
-            rate_limiter.update_rpm(int(rpm_limit))
-
-        try:
+        with rate_limiter.temporary_limit(handler.provider_name, handler.model_id, rpm_limit):
             return processor.process_files_parallel(file_tasks_for_ai, translate_batch, internal_progress)
-        finally:
-            if rpm_limit and previous_rpm != rate_limiter.rpm:
-                rate_limiter.update_rpm(previous_rpm)
@@ -1,8 +1,8 @@
 import logging
 from contextlib import contextmanager
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional
 
-from scripts.app_settings import RECOMMENDED_MAX_WORKERS
+from scripts.app_settings import RECOMMENDED_MAX_WORKERS, TRANSLATION_ENGINE, TRANSLATION_ENGINES, config_manager
 from scripts.utils.rate_limiter import rate_limiter
 
 
@@ -25,6 +25,32 @@ def resolve_max_workers(concurrency_limit: Optional[int], selected_provider: str
     return RECOMMENDED_MAX_WORKERS
 
 
+def resolve_translation_engine() -> str:
+    engine = config_manager.get_value("translation_engine") or TRANSLATION_ENGINE
+    if engine not in TRANSLATION_ENGINES:
+        logging.warning("Unknown translation engine %r; falling back to threads.", engine)
+        return "threads"
+    return engine
+
+
+def build_translation_function(handler, processor, on_batch_done: Callable):
+    """Wrap the handler for the processor's engine and report every finished batch."""
+    if getattr(processor, "is_async", False):
+        async def translate_async(batch_task):
+            result = await handler.translate_batch_async(batch_task)
+            on_batch_done(batch_task)
+            return result
+
+        return translate_async
+
+    def translate(batch_task):
+        result = handler.translate_batch(batch_task)
+        on_batch_done(batch_task)
+        return result
+
+    return translate
+
+
 def summarize_batch_warning_codes(warnings: Iterable) -> str:
     warning_codes = []
     for warning in warnings:
@@ -66,6 +92,17 @@ def format_batch_warning_detail(warning, index: int, total: int) -> str:
     return "; ".join(parts)
 
 
+def split_prompt_cache_warnings(warnings: Iterable) -> tuple[list, int]:
+    """Separate informational prompt-cache entries from batch issues; returns (issues, cached prompt tokens)."""
+    issues, cached_tokens = [], 0
+    for warning in warnings or []:
+        if isinstance(warning, dict) and warning.get("type") == "prompt_cache":
+            cached_tokens += int(warning.get("cached_tokens") or 0)
+        else:
+            issues.append(warning)
+    return issues, cached_tokens
+
+
 def log_batch_warnings(filename: str, warnings: Iterable):
     warnings = list(warnings or [])
     if not warnings:
@@ -84,7 +121,13 @@ def log_batch_warnings(filename: str, warnings: Iterable):
 
 
 @contextmanager
-def temporary_rpm_limit(rpm_limit: Optional[int]):
+def temporary_rpm_limit(rpm_limit: Optional[int], provider: Optional[str] = None, model: Optional[str] = None):
+    """Apply ``rpm_limit`` for the duration of a run; scoped to one provider/model bucket when given."""
+    if provider is not None:
+        with rate_limiter.temporary_limit(provider, model, rpm_limit):
+            yield
+        return
+
     previous_rpm = rate_limiter.rpm
     if rpm_limit:
         rate_limiter.update_rpm(int(rpm_limit))
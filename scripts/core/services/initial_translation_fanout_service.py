@@ -0,0 +1,180 @@
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from scripts.core.services.initial_translation_batch_service import resolve_max_workers, temporary_rpm_limit
+from scripts.core.services.initial_translation_progress_service import progress_log_bridge
+from scripts.utils.rate_limiter import rate_limiter
+
+
+_SUMMED_PROGRESS_FIELDS = (
+    "current",
+    "total",
+    "current_batch",
+    "total_batches",
+    "error_count",
+    "glossary_issues",
+    "format_issues",
+)
+
+
+def plan_language_fanout(
+    concurrency_limit: Optional[int],
+    selected_provider: str,
+    language_count: int,
+) -> tuple:
+    """Return ``(parallel_languages, workers_per_language)`` for one shared worker budget."""
+    total_workers = resolve_max_workers(concurrency_limit, selected_provider)
+    parallel_languages = max(1, min(language_count, total_workers))
+    return parallel_languages, max(1, total_workers // parallel_languages)
+
+
+class LanguageProgressAggregator:
+    """Merges the progress streams of concurrently translated languages into one callback."""
+
+    def __init__(self, progress_callback: Optional[Any], language_codes: List[str], total_batches: int):
+        self._callback = progress_callback
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, Dict[str, int]] = {
+            code: {"total": total_batches, "total_batches": total_batches}
+            for code in language_codes
+        }
+
+    def for_language(self, lang_code: str) -> Optional[Callable]:
+        if not self._callback:
+            return None
+
+        def report(current=0, total=0, current_file="", stage="Translating", **fields):
+            fields.update(current=current, total=total)
+            self._emit(lang_code, current_file, stage, fields)
+
+        return report
+
+    def log(self, log_message=None):
+        self._emit(None, "", "Translating", {"log_message": log_message})
+
+    def _emit(self, lang_code: Optional[str], current_file: str, stage: str, fields: dict):
+        if not self._callback:
+            return
+        with self._lock:
+            if lang_code is not None:
+                snapshot = self._snapshots.setdefault(lang_code, {})
+                for name in _SUMMED_PROGRESS_FIELDS:
+                    if fields.get(name) is not None:
+                        snapshot[name] = fields[name]
+            totals = {
+                name: sum(snapshot.get(name) or 0 for snapshot in self._snapshots.values())
+                for name in _SUMMED_PROGRESS_FIELDS
+            }
+            if lang_code and current_file:
+                current_file = f"[{lang_code.upper()}] {current_file}"
+            self._callback(
+                current_file=current_file,
+                stage=stage,
+                format_repair=fields.get("format_repair"),
+                workshop_progress=fields.get("workshop_progress"),
+                log_message=fields.get("log_message"),
+                **totals,
+            )
+
+
+def _translate_in_fair_lane(translate_language: Callable[..., None], provider: str, model: Optional[str], **kwargs) -> None:
+    with rate_limiter.fair_share(provider, model, kwargs["target_lang"].get("code", "")):
+        translate_language(**kwargs)
+
+
+def run_languages_concurrently(
+    target_languages: List[dict],
+    translate_language: Callable[..., None],
+    *,
+    selected_provider: str,
+    model_name: Optional[str] = None,
+    concurrency_limit: Optional[int],
+    rpm_limit: Optional[int],
+    total_batches: int,
+    progress_callback: Optional[Any],
+) -> None:
+    """
+    Translate every target language at once over one worker and RPM budget.
+
+    ``translate_language(target_lang=..., concurrency_limit=..., progress_callback=..., bridge_logs=False)``
+    runs a single language; each call keeps its own checkpoint, proofreading tracker and
+    progress state while sharing the read-only source snapshot. The worker budget is
+    split evenly between the languages running at the same time, and each language
+    reserves requests in its own fair-share lane of the (provider, model) token bucket,
+    so a fast language cannot starve the others of the RPM budget; a finished language
+    returns its share. Every language runs to completion; the first failure is raised afterwards.
+    """
+    parallel_languages, workers_per_language = plan_language_fanout(
+        concurrency_limit, selected_provider, len(target_languages)
+    )
+    logging.info(
+        "Translating %s languages concurrently (%s at a time, %s worker(s) each).",
+        len(target_languages),
+        parallel_languages,
+        workers_per_language,
+    )
+    aggregator = LanguageProgressAggregator(
+        progress_callback,
+        [lang.get("code", "") for lang in target_languages],
+        total_batches,
+    )
+
+    # 外层先设定限速，各语言内部的同值设定在退出时不会提前恢复。
+    with temporary_rpm_limit(rpm_limit, selected_provider, model_name):
+        with progress_log_bridge(aggregator.log if progress_callback else None):
+            with ThreadPoolExecutor(max_workers=parallel_languages, thread_name_prefix="language") as executor:
+                futures = [
+                    executor.submit(
+                        _translate_in_fair_lane,
+                        translate_language,
+                        selected_provider,
+                        model_name,
+                        target_lang=target_lang,
+                        concurrency_limit=workers_per_language,
+                        progress_callback=aggregator.for_language(target_lang.get("code", "")),
+                        bridge_logs=False,
+                    )
+                    for target_lang in target_languages
+                ]
+                errors = [future.exception() for future in futures]
+
+    failures = [error for error in errors if error is not None]
+    for target_lang, error in zip(target_languages, errors):
+        if error is not None:
+            logging.error("Concurrent translation to %s failed: %s", target_lang.get("name"), error)
+    if failures:
+        raise failures[0]
+
+
+def translate_target_languages(
+    run_language: Callable[..., None],
+    target_languages: List[dict],
+    parallel_languages: bool = False,
+    **language_kwargs,
+) -> Optional[dict]:
+    """
+    Run ``run_language`` for every target language and return the last one.
+
+    Languages are translated one after another unless ``parallel_languages`` is set and
+    there is more than one of them; ``language_kwargs`` are shared by every language,
+    including the read-only ``all_files_content`` snapshot.
+    """
+    translate_language = functools.partial(run_language, **language_kwargs)
+    if parallel_languages and len(target_languages) > 1:
+        run_languages_concurrently(
+            target_languages,
+            translate_language,
+            selected_provider=language_kwargs["selected_provider"],
+            model_name=language_kwargs.get("model_name"),
+            concurrency_limit=language_kwargs.get("concurrency_limit"),
+            rpm_limit=language_kwargs.get("rpm_limit"),
+            total_batches=language_kwargs.get("total_batches", 0),
+            progress_callback=language_kwargs.get("progress_callback"),
+        )
+    else:
+        for target_lang in target_languages:
+            translate_language(target_lang=target_lang)
+    return target_languages[-1] if target_languages else None
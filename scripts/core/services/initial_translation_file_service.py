@@ -187,8 +187,15 @@ def finalize_translated_file(
     project_id: Optional[str],
     version_id: Optional[int],
     all_files_content: List[dict],
+    archive_writer: Optional[Any] = None,
 ):
-    """Write translated content, update trackers, and archive the result."""
+    """Write translated content, update trackers, and archive the result.
+
+    When ``archive_writer`` is given, the archive upsert is buffered in it and
+    written when the caller flushes the writer at the end of the run; the file is
+    checkpointed only after that flush commits its rows, so a crash in between
+    makes a resumed run translate it again instead of losing its archive rows.
+    """
     dest_dir = build_dest_dir(file_task, target_lang, output_folder_name, game_profile)
     os.makedirs(dest_dir, exist_ok=True)
 
@@ -216,19 +223,30 @@ def finalize_translated_file(
         })
         logging.info(i18n.t("file_build_completed", filename=os.path.basename(dest_file_path)))
 
-    if not is_failed:
-        checkpoint_manager.mark_file_completed(file_task.filename)
+    if is_failed:
+        return
 
-    if project_id and not is_failed:
+    if project_id:
         sync_project_file_status(project_id, source_file_path)
 
-    if version_id and not is_failed:
-        try:
+    if not version_id:
+        checkpoint_manager.mark_file_completed(file_task.filename)
+        return
+
+    file_results = {file_task.file_path or file_task.filename: translated_texts}
+    try:
+        if archive_writer is not None:
+            archive_writer.add_file_results(
+                file_results,
+                on_archived=lambda: checkpoint_manager.mark_file_completed(file_task.filename),
+            )
+        else:
             archive_manager.archive_translated_results(
                 version_id,
-                {file_task.file_path or file_task.filename: translated_texts},
+                file_results,
                 all_files_content,
                 target_lang.get("code")
             )
-        except Exception as e:
-            logging.error(f"Failed to archive results for {file_task.filename}: {e}")
+            checkpoint_manager.mark_file_completed(file_task.filename)
+    except Exception as e:
+        logging.error(f"Failed to archive results for {file_task.filename}: {e}")
@@ -1,18 +1,23 @@
 import logging
-import threading
 from typing import Any, List, Optional
 
+from scripts.core.archive_manager import archive_manager
+from scripts.core.async_parallel_processor import AsyncParallelProcessor
 from scripts.core.parallel_processor import ParallelProcessor
 from scripts.core.proofreading_tracker import create_proofreading_tracker
 from scripts.core.services.initial_translation_batch_service import (
+    build_translation_function,
     log_batch_warnings,
     resolve_max_workers,
+    split_prompt_cache_warnings,
+    resolve_translation_engine,
     temporary_rpm_limit,
 )
 from scripts.core.services.initial_translation_file_service import finalize_translated_file
 from scripts.core.services.initial_translation_postprocess_service import finalize_language_run
 from scripts.core.services.initial_translation_progress_service import (
     LanguageRunState,
+    batch_progress_recorder,
     build_checkpoint_manager,
     emit_progress,
     progress_log_bridge,
@@ -22,9 +27,59 @@ from scripts.core.services.initial_translation_workshop_service import (
     export_workshop_issues_for_language,
     run_embedded_workshop_for_language,
 )
+from scripts.core.translation_memory import resolve_translation_memory
 from scripts.utils import i18n
 
 
+def _consume_translation_stream(file_results, run_state, update_progress, finalize_file, archive_writer) -> None:
+    """Finalize files as the processor streams them; buffered archive rows are flushed even on failure."""
+    try:
+        for file_task, translated_texts, warnings, is_failed in file_results:
+            if is_failed:
+                run_state.error_count += 1
+                logging.error(f"File {file_task.filename} failed to translate (partially or fully). Using fallback.")
+                update_progress(
+                    file_task.filename,
+                    "Failed",
+                    log_message=f"ERROR: File {file_task.filename} failed to translate. Rolled back to original text.",
+                )
+            else:
+                update_progress(file_task.filename, log_message=f"SUCCESS: {file_task.filename} translated.")
+
+            warnings, cached_tokens = split_prompt_cache_warnings(warnings)
+            run_state.prompt_cache_tokens += cached_tokens
+            log_batch_warnings(file_task.filename, warnings)
+            finalize_file(file_task, translated_texts, is_failed)
+        if run_state.memory.hits:
+            memory = run_state.memory
+            update_progress(
+                log_message=f"Translation memory: {memory.hits} hit(s), {memory.misses} miss(es), "
+                f"{memory.skipped_batches} batch(es) skipped.",
+            )
+        if run_state.prompt_cache_tokens:
+            update_progress(log_message=f"Provider prompt cache: {run_state.prompt_cache_tokens} prompt token(s) served from cache.")
+    finally:
+        if archive_writer is not None:
+            archive_writer.flush()
+
+
+def _build_processor(max_workers: int, chunk_size: int, run_state: LanguageRunState):
+    processor_cls = AsyncParallelProcessor if resolve_translation_engine() == "asyncio" else ParallelProcessor
+    return processor_cls(
+        max_workers=max_workers,
+        chunk_size_override=chunk_size,
+        translation_memory=resolve_translation_memory(),
+        memory_stats=run_state.memory,
+        batch_plan_stats=run_state.batch_plan,
+    )
+
+
+def _open_archive_writer(version_id: Optional[int], all_files_content: List[dict], target_lang: dict):
+    if not version_id:
+        return None
+    return archive_manager.open_translation_archiver(version_id, all_files_content, target_lang.get("code"))
+
+
 def run_language_translation(
     *,
     mod_name: str,
@@ -49,6 +104,7 @@ def run_language_translation(
     rpm_limit: Optional[int],
     batch_size_limit: Optional[int],
     embedded_workshop: Optional[dict],
+    bridge_logs: bool = True,
 ) -> None:
     logging.info(i18n.t("translating_to_language", lang_name=target_lang["name"]))
 
@@ -65,7 +121,6 @@ def run_language_translation(
         use_resume,
     )
     run_state = LanguageRunState()
-    progress_lock = threading.Lock()
 
     def update_progress(
         current_file_name="",
@@ -103,48 +158,36 @@ def run_language_translation(
         total_batches,
     )
 
-    max_workers = resolve_max_workers(concurrency_limit, selected_provider)
-    processor = ParallelProcessor(max_workers=max_workers, chunk_size_override=effective_chunk_size)
-
-    def translation_wrapper(batch_task):
-        result = handler.translate_batch(batch_task)
-        with progress_lock:
-            run_state.completed_batches += 1
-            update_progress(batch_task.file_task.filename)
-        return result
-
-    with temporary_rpm_limit(rpm_limit):
-        with progress_log_bridge(update_progress):
-            for file_task, translated_texts, warnings, is_failed in processor.process_files_stream(
-                file_task_generator,
-                translation_wrapper,
-            ):
-                if is_failed:
-                    run_state.error_count += 1
-                    logging.error(f"File {file_task.filename} failed to translate (partially or fully). Using fallback.")
-                    update_progress(
-                        file_task.filename,
-                        "Failed",
-                        log_message=f"ERROR: File {file_task.filename} failed to translate. Rolled back to original text.",
-                    )
-                else:
-                    update_progress(file_task.filename, log_message=f"SUCCESS: {file_task.filename} translated.")
-
-                log_batch_warnings(file_task.filename, warnings)
-
-                finalize_translated_file(
-                    file_task,
-                    translated_texts,
-                    is_failed,
-                    target_lang,
-                    output_folder_name,
-                    game_profile,
-                    proofreading_tracker,
-                    checkpoint_manager,
-                    project_id,
-                    version_id,
-                    all_files_content,
-                )
+    processor = _build_processor(resolve_max_workers(concurrency_limit, selected_provider), effective_chunk_size, run_state)
+    translation_wrapper = build_translation_function(handler, processor, batch_progress_recorder(run_state, update_progress))
+
+    archive_writer = _open_archive_writer(version_id, all_files_content, target_lang)
+
+    def finalize_file(file_task, translated_texts, is_failed):
+        finalize_translated_file(
+            file_task,
+            translated_texts,
+            is_failed,
+            target_lang,
+            output_folder_name,
+            game_profile,
+            proofreading_tracker,
+            checkpoint_manager,
+            project_id,
+            version_id,
+            all_files_content,
+            archive_writer,
+        )
+
+    with temporary_rpm_limit(rpm_limit, selected_provider, model_name):
+        with progress_log_bridge(update_progress if bridge_logs else None):
+            _consume_translation_stream(
+                processor.process_files_stream(file_task_generator, translation_wrapper),
+                run_state,
+                update_progress,
+                finalize_file,
+                archive_writer,
+            )
 
     if run_state.error_count:
         message = f"Translation failed for {run_state.error_count} file(s) while translating to {target_lang['name']}."
@@ -1,9 +1,12 @@
 import logging
+import threading
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 
+from scripts.core.batch_budget import BatchPlanStats
 from scripts.core.checkpoint_manager import CheckpointManager
+from scripts.core.translation_memory import TranslationMemoryStats
 
 
 @dataclass
@@ -12,6 +15,9 @@ class LanguageRunState:
     error_count: int = 0
     glossary_issues: int = 0
     format_issues: int = 0
+    prompt_cache_tokens: int = 0
+    memory: TranslationMemoryStats = field(default_factory=TranslationMemoryStats)
+    batch_plan: BatchPlanStats = field(default_factory=BatchPlanStats)
 
 
 def build_checkpoint_manager(
@@ -39,6 +45,18 @@ def build_checkpoint_manager(
     return checkpoint_manager
 
 
+def batch_progress_recorder(run_state: LanguageRunState, update_progress) -> Callable[[Any], None]:
+    """Return a thread-safe callback that counts a finished batch and reports progress for its file."""
+    progress_lock = threading.Lock()
+
+    def record_batch_done(batch_task):
+        with progress_lock:
+            run_state.completed_batches += 1
+            update_progress(batch_task.file_task.filename)
+
+    return record_batch_done
+
+
 def emit_progress(
     progress_callback: Optional[Any],
     run_state: LanguageRunState,
@@ -54,12 +72,16 @@ def emit_progress(
         run_state.format_issues = format_issues_override
 
     if progress_callback:
+        # Batches answered entirely from the translation memory count as done.
+        completed_batches = run_state.completed_batches + run_state.memory.skipped_batches
+        # The total was estimated at the nominal token budget; adaptive packing may plan more or fewer batches.
+        total_batches = max(completed_batches, total_batches + run_state.batch_plan.extra_batches)
         progress_callback(
-            current=run_state.completed_batches,
+            current=completed_batches,
             total=total_batches,
             current_file=current_file_name,
             stage=stage,
-            current_batch=run_state.completed_batches,
+            current_batch=completed_batches,
             total_batches=total_batches,
             error_count=run_state.error_count,
             glossary_issues=run_state.glossary_issues,
@@ -72,6 +94,10 @@ def emit_progress(
 
 @contextmanager
 def progress_log_bridge(progress_logger):
+    if progress_logger is None:
+        yield
+        return
+
     class CallbackHandler(logging.Handler):
         def emit(self, record):
             try:
@@ -4,8 +4,8 @@ from typing import Any, List, Optional
 
 from scripts.core import file_parser
 from scripts.core.archive_manager import archive_manager
+from scripts.core.batch_budget import count_batches, resolve_chunk_size
 from scripts.shared.services import project_manager
-from scripts.app_settings import CHUNK_SIZE, OLLAMA_CHUNK_SIZE
 
 
 def read_files_for_backup(
@@ -37,20 +37,17 @@ def read_files_for_backup(
 
 
 def get_chunk_size_for_provider(selected_provider: str, batch_size_limit: Optional[int] = None) -> int:
-    if batch_size_limit:
-        return max(1, int(batch_size_limit))
-    if selected_provider == "ollama":
-        return OLLAMA_CHUNK_SIZE
-    return CHUNK_SIZE
+    return resolve_chunk_size(selected_provider, batch_size_limit)
 
 
-def calculate_total_batches(all_files_content: List[dict], chunk_size: int) -> int:
+def calculate_total_batches(all_files_content: List[dict], chunk_size: int, token_budget: Optional[int] = None) -> int:
+    """Batches the processor plans at ``token_budget`` (the provider's nominal budget); count-only when omitted."""
     total_batches = 0
     for file_data in all_files_content:
         texts_to_translate = file_data.get("texts_to_translate", [])
         if not texts_to_translate:
             continue
-        total_batches += (len(texts_to_translate) + chunk_size - 1) // chunk_size
+        total_batches += count_batches(texts_to_translate, chunk_size, token_budget)
     return total_batches
 
 
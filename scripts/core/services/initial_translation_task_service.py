@@ -72,6 +72,7 @@ def build_file_task_iterator(
             dest_dir=DEST_DIR,
             client=handler.client,
             mod_name=mod_name,
+            model_name=getattr(handler, "model_id", "") or "",
             loc_root=file_data.get("loc_root", ""),
             file_path=file_data.get("file_path", file_data["filename"]),
         )
@@ -4,15 +4,18 @@ This module intentionally has no repository or HTTP dependencies. Callers
 provide frozen run inputs and a handler factory, then persist the returned
 evidence/result dataclasses themselves.
 
-The service calls each provider exactly once and serially. It deliberately does
-not use ``BaseApiHandler.translate_batch`` because that method retries and can
-fall back to the source text, both of which would corrupt arena evidence.
+The service calls each provider exactly once. Contestants run serially by
+default, or concurrently up to ``max_parallel_contestants``; results are always
+returned in execution order. It deliberately does not use
+``BaseApiHandler.translate_batch`` because that method retries and can fall back
+to the source text, both of which would corrupt arena evidence.
 """
 
 from __future__ import annotations
 
 from collections import Counter
 from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 import hashlib
@@ -222,10 +225,15 @@ class ModelArenaExecutionService:
         validator: PostProcessValidator | None = None,
         timer: Callable[[], float] = time.perf_counter,
         utcnow: Callable[[], datetime] | None = None,
+        max_parallel_contestants: int = 1,
+        contestant_timeout: float | None = None,
     ) -> None:
         self._validator = validator or PostProcessValidator()
         self._timer = timer
         self._utcnow = utcnow or (lambda: datetime.now(timezone.utc))
+        self._max_parallel_contestants = max(1, max_parallel_contestants)
+        # Seconds each contestant's provider request may take; None waits forever.
+        self._contestant_timeout = contestant_timeout
 
     def execute(
         self,
@@ -236,7 +244,7 @@ class ModelArenaExecutionService:
         handler_factory: HandlerFactory,
         retry_subset: bool = False,
     ) -> ArenaExecutionResult:
-        """Run contestants serially and return persistence-ready data.
+        """Run contestants and return persistence-ready data in execution order.
 
         Initial execution requires 2 or 3 contestants. After the router has
         obtained a fresh paid-action confirmation, ``retry_subset=True`` allows
@@ -254,17 +262,26 @@ class ModelArenaExecutionService:
         output_results: list[ArenaOutput] = []
         contestant_results: list[ArenaContestantResult] = []
 
-        for contestant in ordered_contestants:
+        def run(contestant: ArenaContestant) -> tuple[Any, ...]:
             started = self._timer()
-            contestant_requests, contestant_outputs, status, failure_code = (
-                self._execute_contestant(
-                    config=config,
-                    samples=ordered_samples,
-                    contestant=contestant,
-                    handler_factory=handler_factory,
-                )
+            outcome = self._execute_contestant(
+                config=config,
+                samples=ordered_samples,
+                contestant=contestant,
+                handler_factory=handler_factory,
             )
-            elapsed_ms = _elapsed_ms(started, self._timer())
+            return (*outcome, _elapsed_ms(started, self._timer()))
+
+        workers = min(self._max_parallel_contestants, len(ordered_contestants))
+        if workers > 1:
+            # Contestants use independent providers; pool.map keeps execution order.
+            with ThreadPoolExecutor(workers, thread_name_prefix="model-arena") as pool:
+                outcomes = list(pool.map(run, ordered_contestants))
+        else:
+            outcomes = [run(contestant) for contestant in ordered_contestants]
+
+        for contestant, outcome in zip(ordered_contestants, outcomes):
+            contestant_requests, contestant_outputs, status, failure_code, elapsed_ms = outcome
             request_results.extend(contestant_requests)
             output_results.extend(contestant_outputs)
             hard_error_occurrences = sum(
@@ -352,37 +369,16 @@ class ModelArenaExecutionService:
                 prompt_text=config.prompt_text,
                 effective_parameters=effective_parameters,
             )
-        except TimeoutError:
-            return self._request_failure(
-                config=config,
-                samples=samples,
-                contestant=contestant,
-                system_instruction=system_instruction,
-                effective_parameters=effective_parameters,
-                failure_code=FAILURE_PROVIDER_TIMEOUT,
-                request_started=request_started,
-                created_at=created_at,
-            )
-        except _HandlerContractError:
-            logger.debug("Model arena handler contract failed", exc_info=True)
-            return self._request_failure(
-                config=config,
-                samples=samples,
-                contestant=contestant,
-                system_instruction=system_instruction,
-                effective_parameters=effective_parameters,
-                failure_code=FAILURE_HANDLER_CONTRACT,
-                request_started=request_started,
-                created_at=created_at,
-            )
-        except Exception:
+        except Exception as exc:
+            if isinstance(exc, _HandlerContractError):
+                logger.debug("Model arena handler contract failed", exc_info=True)
             return self._request_failure(
                 config=config,
                 samples=samples,
                 contestant=contestant,
                 system_instruction=system_instruction,
                 effective_parameters=effective_parameters,
-                failure_code=FAILURE_PROVIDER_REQUEST,
+                failure_code=_request_failure_code(exc),
                 request_started=request_started,
                 created_at=created_at,
             )
@@ -453,32 +449,19 @@ class ModelArenaExecutionService:
             )
 
         if completion_text is None or not completion_text.strip():
-            failure_code = FAILURE_EMPTY_COMPLETION
-            request = self._make_request(
+            return self._parsed_failure(
                 config=config,
+                samples=samples,
                 contestant=contestant,
+                completion=completion,
                 system_instruction=actual_system_instruction,
                 prompt_text=actual_prompt,
                 effective_parameters=actual_parameters,
-                completion=completion,
                 usage=usage,
-                parse_status="failed",
-                failure_code=failure_code,
-                elapsed_ms=request_elapsed_ms,
+                failure_code=FAILURE_EMPTY_COMPLETION,
+                request_elapsed_ms=request_elapsed_ms,
                 created_at=created_at,
             )
-            return (
-                [request],
-                self._failure_outputs(
-                    config=config,
-                    samples=samples,
-                    contestant=contestant,
-                    failure_code=failure_code,
-                    created_at=created_at,
-                ),
-                "failed",
-                failure_code,
-            )
 
         source_texts = [sample.source_text for sample in samples]
         try:
@@ -578,31 +561,19 @@ class ModelArenaExecutionService:
                 created_at=created_at,
             )
         except Exception:
-            failure_code = FAILURE_VALIDATION
-            request = self._make_request(
+            return self._parsed_failure(
                 config=config,
+                samples=samples,
                 contestant=contestant,
+                completion=completion,
                 system_instruction=actual_system_instruction,
                 prompt_text=actual_prompt,
                 effective_parameters=actual_parameters,
-                completion=completion,
                 usage=usage,
-                parse_status="validation_failed",
-                failure_code=failure_code,
-                elapsed_ms=request_elapsed_ms,
+                failure_code=FAILURE_VALIDATION,
+                request_elapsed_ms=request_elapsed_ms,
                 created_at=created_at,
-            )
-            return (
-                [request],
-                self._failure_outputs(
-                    config=config,
-                    samples=samples,
-                    contestant=contestant,
-                    failure_code=failure_code,
-                    created_at=created_at,
-                ),
-                "failed",
-                failure_code,
+                parse_status="validation_failed",
             )
 
         empty_output = any(not output.translated_text.strip() for output in outputs)
@@ -627,7 +598,19 @@ class ModelArenaExecutionService:
             failure_code,
         )
 
-    def _invoke_handler(
+    def _invoke_handler(self, **request: Any) -> ArenaHandlerCompletion:
+        if self._contestant_timeout is None:
+            return self._call_handler(**request)
+        # A late response is abandoned, never recorded; the worker thread is not joined.
+        pool = ThreadPoolExecutor(1, thread_name_prefix="model-arena-request")
+        try:
+            return pool.submit(self._call_handler, **request).result(self._contestant_timeout)
+        except FutureTimeoutError as exc:
+            raise TimeoutError("Model arena contestant exceeded its timeout") from exc
+        finally:
+            pool.shutdown(wait=False)
+
+    def _call_handler(
         self,
         *,
         handler: Any,
@@ -814,6 +797,7 @@ class ModelArenaExecutionService:
         failure_code: str,
         request_elapsed_ms: int,
         created_at: str,
+        parse_status: str = "failed",
     ) -> tuple[
         list[ArenaRequestEvidence],
         list[ArenaOutput],
@@ -828,7 +812,7 @@ class ModelArenaExecutionService:
             effective_parameters=effective_parameters,
             completion=completion,
             usage=usage,
-            parse_status="failed",
+            parse_status=parse_status,
             failure_code=failure_code,
             elapsed_ms=request_elapsed_ms,
             created_at=created_at,
@@ -1039,6 +1023,14 @@ class _HandlerContractError(RuntimeError):
     pass
 
 
+def _request_failure_code(error: Exception) -> str:
+    if isinstance(error, TimeoutError):
+        return FAILURE_PROVIDER_TIMEOUT
+    if isinstance(error, _HandlerContractError):
+        return FAILURE_HANDLER_CONTRACT
+    return FAILURE_PROVIDER_REQUEST
+
+
 def _sha256_text(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import dataclasses
 import hashlib
 import json
+import logging
 import os
 import threading
 from collections import Counter, defaultdict
@@ -190,11 +191,9 @@ class _NeutralPromptBuilder:
     """Reuse the production prompt contract without provider-specific prefixes."""
 
     _build_custom_global_prompt_part = BaseApiHandler._build_custom_global_prompt_part
-
-    def __init__(self) -> None:
-        import logging
-
-        self.logger = logging.getLogger("ModelArenaPromptBuilder")
+    _prompt_plan = BaseApiHandler._prompt_plan
+    _build_prompt_plan = BaseApiHandler._build_prompt_plan
+    logger = logging.getLogger("ModelArenaPromptBuilder")
 
     @staticmethod
     def _apply_model_prompt_adapter(prompt: str) -> str:
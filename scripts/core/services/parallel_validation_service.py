@@ -0,0 +1,185 @@
+# scripts/core/services/parallel_validation_service.py
+"""
+后处理验证的文件级执行
+单个输出文件的清理与验证在这里完成，可在当前进程串行执行，也可按文件分块交给进程池。
+源文件由调用方在主进程解析后随任务下发（loc_document_cache 让各目标语言共享同一次解析），
+结果按输入顺序返回，提示消息保持延迟格式化，由主进程读取时按当前界面语言格式化；
+子进程以 spawn 启动时会先加载主进程的界面语言，即使在子进程中读取消息也与串行验证一致。
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from scripts.app_settings import PARALLEL_VALIDATION_MIN_FILES, VALIDATION_WORKERS
+from scripts.core.loc_parser import parse_loc_file_with_lines
+from scripts.utils.post_process_validator import BaseGameValidator, PostProcessValidator, ValidationResult
+from scripts.utils import i18n
+from scripts.utils.quote_extractor import QuoteExtractor
+
+logger = logging.getLogger(__name__)
+
+# (输出文件路径, 该文件对应的源文本条目)
+ValidationJob = Tuple[str, Dict[str, str]]
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class FileValidationOutcome:
+    file_path: str
+    results: List[ValidationResult] = field(default_factory=list)
+    sanitized_fixes: int = 0
+    write_error: str = ""
+    error: str = ""
+
+
+@dataclass
+class ValidationContext:
+    game_key: str
+    source_lang: Dict[str, Any]
+    target_code: Optional[str]
+    dynamic_valid_tags: Optional[List[str]] = None
+    # 在主进程构造时记录界面语言，spawn 的子进程默认会加载 zh_CN
+    ui_language: str = field(default_factory=i18n.get_current_language)
+
+
+# [Sanitizer] 常见 AI 格式幻觉的修复，按顺序应用
+SANITIZE_REPLACEMENTS = (
+    # 1. 修复全角感叹号作为结束符 (#!#！ -> #!)
+    ("#!#！", "#!"),
+    ("#！", "#!"),
+    # 2. 修复错误的换行符 (nn -> \n\n) - 仅在特定上下文中，避免误伤
+    # Vic3 通常使用 \n 换行，但也支持 \n\n。AI 有时会把 \n\n 转义成 nn。
+    # 观察用户案例: "...#!#!nn#variable..." -> "\n\n"
+    ("#!#!nn#", "#!#!\n\n#"),
+    ("!nn#", "!\n\n#"),
+)
+
+
+def sanitize_content(content: str) -> Tuple[str, int]:
+    """自动修复常见的 AI 格式幻觉，返回修复后的内容与修复处数。"""
+    fixes = 0
+    for old, new in SANITIZE_REPLACEMENTS:
+        fixes += content.count(old)
+        content = content.replace(old, new)
+    return content, fixes
+
+
+def lookup_source_value(source_entries: Dict[str, str], key: str) -> str:
+    if key in source_entries:
+        return source_entries[key]
+    base_key = key.split(":")[0]
+    if base_key in source_entries:
+        return source_entries[base_key]
+    return source_entries.get(f"{base_key}:0", "")
+
+
+def validate_loc_file(
+    game_validator: BaseGameValidator,
+    context: ValidationContext,
+    file_path: str,
+    source_entries: Dict[str, str],
+) -> FileValidationOutcome:
+    """清理并验证一个输出文件；异常记录在 outcome.error 中而不是抛出。"""
+    outcome = FileValidationOutcome(file_path)
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+
+        sanitized_content, outcome.sanitized_fixes = sanitize_content(content)
+        if sanitized_content != content:
+            try:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(sanitized_content)
+                content = sanitized_content  # 使用修复后的内容进行验证
+            except Exception as e:
+                outcome.write_error = str(e)
+
+        parsed_entries = parse_loc_file_with_lines(Path(file_path))
+        if parsed_entries:
+            entries = [
+                (key, value, line_num, lookup_source_value(source_entries, key))
+                for key, value, line_num in parsed_entries
+            ]
+            for results in game_validator.validate_many(entries, context.source_lang, context.target_code, context.dynamic_valid_tags):
+                outcome.results.extend(results)
+            return outcome
+
+        # Fallback for malformed files that the loc parser cannot parse.
+        for line_num, line in enumerate(content.split('\n'), 1):
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            translatable_content = QuoteExtractor.extract_from_line(line)
+            if translatable_content:
+                outcome.results.extend(game_validator.validate_text(
+                    translatable_content,
+                    line_num,
+                    context.source_lang,
+                    target_lang=context.target_code,
+                    dynamic_valid_tags=context.dynamic_valid_tags,
+                ))
+    except Exception as e:
+        outcome.error = str(e)
+    return outcome
+
+
+# --- 进程池 worker ---
+_worker_validator: Optional[BaseGameValidator] = None
+_worker_context: Optional[ValidationContext] = None
+
+
+def _init_worker(context: ValidationContext) -> None:
+    global _worker_validator, _worker_context
+    logging.disable(logging.CRITICAL)  # 结果由主进程统一记录
+    _worker_context = context
+    i18n.load_language(context.ui_language)
+    _worker_validator = PostProcessValidator().get_validator_by_game_id(context.game_key)
+
+
+def _validate_chunk(jobs: Sequence[ValidationJob]) -> List[FileValidationOutcome]:
+    return [validate_loc_file(_worker_validator, _worker_context, file_path, source_entries) for file_path, source_entries in jobs]
+
+
+def resolve_worker_count(max_workers: Optional[int] = None) -> int:
+    workers = VALIDATION_WORKERS if max_workers is None else max_workers
+    if workers <= 0:
+        workers = min(8, (os.cpu_count() or 1) - 1)
+    return max(1, workers)
+
+
+def _chunks(jobs: Sequence[ValidationJob], workers: int) -> List[Sequence[ValidationJob]]:
+    size = max(1, -(-len(jobs) // (workers * CHUNKS_PER_WORKER)))
+    return [jobs[start:start + size] for start in range(0, len(jobs), size)]
+
+
+def validate_files(
+    game_validator: BaseGameValidator,
+    context: ValidationContext,
+    jobs: Sequence[ValidationJob],
+    max_workers: Optional[int] = None,
+) -> Iterator[FileValidationOutcome]:
+    """按 jobs 的顺序产出每个文件的验证结果；文件数足够多时使用进程池。"""
+    workers = min(resolve_worker_count(max_workers), len(jobs))
+    if workers > 1 and len(jobs) >= PARALLEL_VALIDATION_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(context,),
+            ) as executor:
+                outcomes = [outcome for chunk in executor.map(_validate_chunk, _chunks(jobs, workers)) for outcome in chunk]
+            yield from outcomes
+            return
+        except (BrokenProcessPool, OSError) as e:
+            # 无法创建子进程（受限环境、冻结程序等）时退回串行验证；清理是幂等的，重跑安全
+            logger.warning(f"Parallel validation unavailable, validating serially: {e}")
+
+    for file_path, source_entries in jobs:
+        yield validate_loc_file(game_validator, context, file_path, source_entries)
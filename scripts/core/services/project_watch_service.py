@@ -1,7 +1,11 @@
+import asyncio
 import hashlib
+import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from scripts.app_settings import GAME_PROFILES_BY_ID
 from scripts.core.repositories.project_repository import ProjectRepository
@@ -11,6 +15,11 @@ from scripts.shared import task_state
 
 LOCALIZATION_DIR_NAMES = {"localization", "localisation"}
 LOCALIZATION_EXTENSIONS = {".yml", ".yaml", ".csv", ".txt"}
+# Scheduled scans of different watches run side by side, up to this many at once.
+MAX_CONCURRENT_WATCH_SCANS = 4
+HASH_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+# Nested localization folders found by walking the whole mod are rediscovered after this long.
+LOCALIZATION_ROOT_CACHE_SECONDS = 15 * 60
 
 
 class ProjectWatchService:
@@ -23,6 +32,7 @@ class ProjectWatchService:
         self.repository = watch_repository or ProjectWatchRepository()
         self.project_repository = project_repository or ProjectRepository()
         self.task_ledger = task_ledger
+        self._root_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[Path]]] = {}
 
     async def list_watches(self) -> List[Dict[str, Any]]:
         watches = await self.repository.list_watches()
@@ -57,11 +67,14 @@ class ProjectWatchService:
 
     async def delete_watch(self, watch_id: str) -> None:
         await self.repository.delete_watch(watch_id)
+        self._root_cache = {key: value for key, value in self._root_cache.items() if key[1] != watch_id}
 
     async def scan_watch(self, watch_id: str) -> Dict[str, Any]:
         watch = await self.repository.get_watch(watch_id)
         if not watch:
             raise ValueError(f"Watch not found: {watch_id}")
+        # A manual scan always rediscovers nested localization folders.
+        self._root_cache = {key: value for key, value in self._root_cache.items() if key[1] != watch.watch_id}
         return await self._scan_watch_task(
             watch,
             created_by={"type": "user"},
@@ -96,19 +109,22 @@ class ProjectWatchService:
             age_minutes = (now - last_scan).total_seconds() / 60
             if age_minutes >= watch.scan_interval_minutes:
                 due.append(watch)
-        return [
-            await self._scan_watch_task(
-                watch,
-                created_by={
-                    "type": "automation",
-                    "actor_id": "project_watch_scheduler",
-                    "label": "Automatic monitor",
-                },
-                scheduled=True,
-                suppress_errors=True,
-            )
-            for watch in due
-        ]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_WATCH_SCANS)
+
+        async def scan_due(watch):
+            async with semaphore:
+                return await self._scan_watch_task(
+                    watch,
+                    created_by={
+                        "type": "automation",
+                        "actor_id": "project_watch_scheduler",
+                        "label": "Automatic monitor",
+                    },
+                    scheduled=True,
+                    suppress_errors=True,
+                )
+
+        return list(await asyncio.gather(*(scan_due(watch) for watch in due)))
 
     def _validate_path(self, raw_path: Optional[str]) -> Path:
         if not raw_path:
@@ -280,11 +296,11 @@ class ProjectWatchService:
 
     async def _scan_watch_record(self, watch, task_id: Optional[str] = None) -> Dict[str, Any]:
         root = self._validate_path(watch.path)
-        current = self._collect_localization_snapshots(root, watch.project_id)
         previous = {
             snapshot.relative_path: snapshot
             for snapshot in await self.repository.get_snapshots(watch.watch_id)
         }
+        current = await asyncio.to_thread(self._collect_localization_snapshots, root, watch.project_id, previous, watch.watch_id)
         previous_summary = watch.last_scan_summary if isinstance(watch.last_scan_summary, dict) else {}
         has_pending_change = (
             watch.status == "changed"
@@ -400,9 +416,22 @@ class ProjectWatchService:
         )
         return summary
 
-    def _collect_localization_snapshots(self, root: Path, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        roots = self._localization_roots(root, project_id)
+    def _collect_localization_snapshots(
+        self,
+        root: Path,
+        project_id: Optional[str] = None,
+        previous: Optional[Dict[str, Any]] = None,
+        watch_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stat every localization file and hash only the ones whose (size, mtime_ns) differ from
+        ``previous`` (stored ``ProjectWatchFileSnapshot`` rows by relative path); the rest reuse
+        the stored hash. New or changed files are hashed in a thread pool.
+        """
+        roots = self._localization_roots(root, project_id, watch_id)
+        previous = previous or {}
         snapshots = []
+        to_hash: List[Tuple[Dict[str, Any], Path]] = []
         seen = set()
         for loc_root in roots:
             for path in loc_root.rglob("*"):
@@ -415,16 +444,27 @@ class ProjectWatchService:
                     continue
                 seen.add(rel_path)
                 stat = path.stat()
-                snapshots.append({
+                snapshot = {
                     "relative_path": rel_path,
-                    "sha256": self._sha256(path),
+                    "sha256": None,
                     "size": stat.st_size,
                     "mtime_ns": stat.st_mtime_ns,
-                })
+                }
+                old = previous.get(rel_path)
+                if old is not None and old.sha256 and (old.size, old.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                    snapshot["sha256"] = old.sha256
+                else:
+                    to_hash.append((snapshot, path))
+                snapshots.append(snapshot)
+
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(to_hash))) as executor:
+                for (snapshot, _), digest in zip(to_hash, executor.map(self._sha256, [path for _, path in to_hash])):
+                    snapshot["sha256"] = digest
         snapshots.sort(key=lambda item: item["relative_path"])
         return snapshots
 
-    def _localization_roots(self, root: Path, project_id: Optional[str] = None) -> List[Path]:
+    def _localization_roots(self, root: Path, project_id: Optional[str] = None, watch_id: Optional[str] = None) -> List[Path]:
         candidates: List[Path] = []
         if root.name.lower() in LOCALIZATION_DIR_NAMES:
             candidates.append(root)
@@ -441,9 +481,9 @@ class ProjectWatchService:
                 if child.exists() and child.is_dir():
                     candidates.append(child)
 
-        for child in root.rglob("*"):
-            if child.is_dir() and child.name.lower() in LOCALIZATION_DIR_NAMES:
-                candidates.append(child)
+        candidates.extend(
+            path for path in self._nested_localization_dirs(root, watch_id) if path.is_dir()
+        )
 
         unique = []
         seen = set()
@@ -455,6 +495,19 @@ class ProjectWatchService:
             unique.append(candidate)
         return unique
 
+    def _nested_localization_dirs(self, root: Path, watch_id: Optional[str] = None) -> List[Path]:
+        """Every directory named like a localization folder under ``root``, cached per watch."""
+        cache_key = (str(root), watch_id)
+        cached = self._root_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < LOCALIZATION_ROOT_CACHE_SECONDS:
+            return cached[1]
+
+        found = []
+        for dirpath, dirnames, _ in os.walk(root):
+            found.extend(Path(dirpath) / name for name in dirnames if name.lower() in LOCALIZATION_DIR_NAMES)
+        self._root_cache[cache_key] = (time.monotonic(), found)
+        return found
+
     def _sha256(self, path: Path) -> str:
         digest = hashlib.sha256()
         with path.open("rb") as handle:
@@ -1,10 +1,15 @@
 import os
 import re
+import asyncio
+import bisect
 import logging
 import hashlib
 import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from scripts.utils.quote_extractor import QuoteExtractor
 from scripts.core.file_builder import patch_file_content
@@ -14,6 +19,11 @@ from scripts.schemas.common import LanguageCode
 
 logger = logging.getLogger(__name__)
 
+# 服务端缓存最近打开的文档数；窗口请求默认/最大行数
+DOCUMENT_CACHE_SIZE = 8
+DEFAULT_WINDOW_SIZE = 200
+MAX_WINDOW_SIZE = 2000
+
 class ProofreadingDataError(Exception):
     def __init__(self, code: str, message: str, *, status_code: int = 404):
         super().__init__(message)
@@ -34,6 +44,82 @@ def _file_revision(file_path: str) -> str:
     return digest.hexdigest()
 
 
+def _file_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _archive_revision(archive_manager) -> Tuple[int, int]:
+    """Changes so far on the connection every archive writer shares, bulk flushes included."""
+    connection = archive_manager.connection
+    if connection is None:
+        return (0, 0)
+    return (id(connection), connection.total_changes)
+
+
+@dataclass
+class ProofreadingDocument:
+    """Parsed proofreading state of one target file at one ``document_revision``."""
+    file_id: str
+    target_file_path: str
+    template_file_path: str
+    template_signature: Optional[Tuple[int, int]]
+    archive_revision: Tuple[int, int]
+    mod_name: str
+    revision: str
+    source_lang_key: str
+    current_lang_key: str
+    original_lines: List[str]
+    texts_to_translate: List[str]
+    key_map: Dict[int, Dict[str, Any]]
+    ai_translated_texts: List[str]
+    disk_translated_texts: List[str]
+    entries: List[Dict[str, Any]]
+    rows: List[Dict[str, Any]]
+    _contents: Optional[Dict[str, str]] = field(default=None, repr=False)
+    _row_line_ends: Optional[List[int]] = field(default=None, repr=False)
+
+    def template_is_current(self) -> bool:
+        return _file_signature(self.template_file_path) == self.template_signature
+
+    def contents(self) -> Dict[str, str]:
+        """Full file, AI draft and final content; patched on first request only."""
+        if self._contents is None:
+            ai_lines = patch_file_content(self.original_lines, self.texts_to_translate, self.ai_translated_texts, self.key_map, self.source_lang_key, self.current_lang_key)
+            final_lines = patch_file_content(self.original_lines, self.texts_to_translate, self.disk_translated_texts, self.key_map, self.source_lang_key, self.current_lang_key)
+            self._contents = {
+                "file_content": "".join(self.original_lines),
+                "ai_content": "".join(ai_lines),
+                "final_content": "".join(final_lines),
+            }
+        return self._contents
+
+    def row_window(self, start: int, count: int) -> List[Dict[str, Any]]:
+        return self.rows[start:start + count]
+
+    def line_window(self, start: int, count: int) -> List[Dict[str, Any]]:
+        """Rows overlapping 1-based lines ``start + 1 .. start + count``; rows are ordered by line."""
+        if self._row_line_ends is None:
+            self._row_line_ends = [row.get("line_end", row["line_number"]) for row in self.rows]
+        first = bisect.bisect_left(self._row_line_ends, start + 1)
+        rows = []
+        for row in self.rows[first:]:
+            if row["line_number"] > start + count:
+                break
+            rows.append(row)
+        return rows
+
+    def entries_for_rows(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            self.entries[int(row["entry_id"].split("-", 1)[1])]
+            for row in rows
+            if row.get("row_type") == "translation"
+        ]
+
+
 def _atomic_write_lines(file_path: str, lines: List[str]) -> None:
     target_path = Path(file_path)
     temp_path = None
@@ -61,6 +147,8 @@ class ProofreadingService:
     def __init__(self, project_manager, archive_manager):
         self.project_manager = project_manager
         self.archive_manager = archive_manager
+        self._documents: "OrderedDict[Tuple[str, str], ProofreadingDocument]" = OrderedDict()
+        self._documents_lock = threading.Lock()
 
     def _classify_structure_line(self, line: str) -> str:
         stripped = line.strip()
@@ -377,12 +465,8 @@ class ProofreadingService:
         _, target_file_path = await self._resolve_target_file_path(project_id, file_id)
         return {"document_revision": _file_revision(target_file_path)}
 
-    async def get_proofread_data(self, project_id: str, file_id: str) -> Dict[str, Any]:
-        project, target_file_path = await self._resolve_target_file_path(project_id, file_id)
-
+    def _detect_document_languages(self, project: Dict[str, Any], target_file_path: str) -> tuple[str, str]:
         filename = os.path.basename(target_file_path)
-        
-        # 1. Detect Languages
         current_lang = "english"
         lang_match = re.search(r"_l_(\w+)\.yml$", filename, re.IGNORECASE)
         if lang_match:
@@ -395,12 +479,33 @@ class ProofreadingService:
                     if header_match:
                         current_lang = header_match.group(1).lower()
             except: pass
-
-        current_lang_key = f"l_{current_lang}"
         iso_source = project.get('source_language', 'en')
-        source_lang = iso_to_paradox(iso_source)
-        source_lang_key = f"l_{source_lang}"
-        
+        return current_lang, iso_to_paradox(iso_source)
+
+    async def _load_document(self, project_id: str, file_id: str) -> ProofreadingDocument:
+        """
+        Parsed proofreading document of one file, reused while the target file keeps its
+        ``document_revision``, the template file is unchanged and nothing was written to the
+        archive the AI draft is read from. Blocking work runs in a thread.
+        """
+        project, target_file_path = await self._resolve_target_file_path(project_id, file_id)
+        revision = await asyncio.to_thread(_file_revision, target_file_path)
+        archive_revision = _archive_revision(self.archive_manager)
+        cache_key = (project_id, file_id)
+        with self._documents_lock:
+            cached = self._documents.get(cache_key)
+        if (
+            cached
+            and cached.revision == revision
+            and cached.archive_revision == archive_revision
+            and cached.target_file_path == target_file_path
+            and cached.template_is_current()
+        ):
+            with self._documents_lock:
+                self._documents.move_to_end(cache_key)
+            return cached
+
+        current_lang, source_lang = await asyncio.to_thread(self._detect_document_languages, project, target_file_path)
         # 2. Locate Template
         if current_lang.lower() == source_lang.lower():
             template_file_path = target_file_path
@@ -410,99 +515,10 @@ class ProofreadingService:
         if not template_file_path or not os.path.exists(template_file_path):
             template_file_path = target_file_path
 
-        # 3. Parse and Patch
         try:
-            original_lines, texts_to_translate, key_map = QuoteExtractor.extract_from_file(template_file_path)
-            texts_to_translate = [self._normalize_translation_value(text) for text in texts_to_translate]
-            original_content = "".join(original_lines)
-            
-            # AI Draft
-            lang_code = LanguageCode.from_str(current_lang).value
-            db_entries = self.archive_manager.get_entries(
-                mod_name=project['name'],
-                file_path=template_file_path,
-                language=lang_code
+            document = await asyncio.to_thread(
+                self._build_document, project, file_id, target_file_path, template_file_path, current_lang, source_lang, revision
             )
-            if not db_entries:
-                folder_mod_name = os.path.basename(project['source_path'])
-                db_entries = self.archive_manager.get_entries(
-                    mod_name=folder_mod_name,
-                    file_path=template_file_path,
-                    language=lang_code
-                )
-
-            db_translation_map = {
-                e['key']: self._normalize_translation_value(e['translation'])
-                for e in db_entries
-                if e['translation']
-            }
-            
-            # Disk State
-            disk_translation_map = {}
-            target_lines = original_lines
-            if os.path.exists(target_file_path):
-                target_lines, target_texts, target_map = QuoteExtractor.extract_from_file(target_file_path)
-                for i, text in enumerate(target_texts):
-                    if i in target_map:
-                        disk_translation_map[target_map[i]['key_part'].strip()] = self._normalize_translation_value(text)
-
-            entries = []
-            ai_translated_texts = []
-            disk_translated_texts = []
-            
-            for i, text in enumerate(texts_to_translate):
-                key = key_map[i]['key_part'].strip()
-                
-                # AI Logic
-                ai_trans = db_translation_map.get(key)
-                if ai_trans is None: ai_trans = db_translation_map.get(str(i))
-                if ai_trans is None and ":" in key: ai_trans = db_translation_map.get(key.split(':')[0])
-                if ai_trans is None: ai_trans = db_translation_map.get(key + ":")
-                
-                # [REVERTED] Disk Fallback removed as per user request (DB consistency check)
-                
-                # If still None, it means DB is missing this key.
-                # User requested explicit warning.
-                if ai_trans is None: 
-                    ai_trans = "⚠️ [DB_MISSING] " + text 
-
-                ai_translated_texts.append(ai_trans)
-                
-                # Disk Logic
-                disk_trans = disk_translation_map.get(key)
-                if disk_trans is None and ":" in key: disk_trans = disk_translation_map.get(key.split(':')[0])
-                if disk_trans is None: disk_trans = ai_trans
-                disk_translated_texts.append(disk_trans)
-                
-                entries.append({
-                    "key": key,
-                    "original": text,
-                    "translation": disk_trans, 
-                    "line_number": key_map[i]['line_num'] 
-                })
-
-            ai_lines = patch_file_content(original_lines, texts_to_translate, ai_translated_texts, key_map, source_lang_key, current_lang_key)
-            final_lines = patch_file_content(original_lines, texts_to_translate, disk_translated_texts, key_map, source_lang_key, current_lang_key)
-            proofreading_rows = self._build_proofreading_rows(
-                original_lines,
-                texts_to_translate,
-                key_map,
-                ai_translated_texts,
-                disk_translated_texts,
-                target_lines,
-            )
-
-            return {
-                "file_id": file_id,
-                "file_path": target_file_path,
-                "mod_name": project['name'],
-                "entries": entries,
-                "rows": proofreading_rows,
-                "file_content": original_content,
-                "ai_content": "".join(ai_lines),
-                "final_content": "".join(final_lines),
-                "document_revision": _file_revision(target_file_path),
-            }
         except Exception as e:
             logger.error(f"ProofreadingService: Data preparation failed: {e}", exc_info=True)
             raise ProofreadingDataError(
@@ -510,6 +526,170 @@ class ProofreadingService:
                 "Cannot prepare proofreading data for this file. Check that the source and translation files are valid localization files.",
                 status_code=500,
             ) from e
+        with self._documents_lock:
+            self._documents[cache_key] = document
+            self._documents.move_to_end(cache_key)
+            while len(self._documents) > DOCUMENT_CACHE_SIZE:
+                self._documents.popitem(last=False)
+        return document
+
+    def _build_document(
+        self,
+        project: Dict[str, Any],
+        file_id: str,
+        target_file_path: str,
+        template_file_path: str,
+        current_lang: str,
+        source_lang: str,
+        revision: str,
+    ) -> ProofreadingDocument:
+        # 3. Parse
+        original_lines, texts_to_translate, key_map = QuoteExtractor.extract_from_file(template_file_path)
+        texts_to_translate = [self._normalize_translation_value(text) for text in texts_to_translate]
+
+        # AI Draft (revision read first, so a write racing the read rebuilds on the next request)
+        archive_revision = _archive_revision(self.archive_manager)
+        lang_code = LanguageCode.from_str(current_lang).value
+        db_entries = self.archive_manager.get_entries(
+            mod_name=project['name'],
+            file_path=template_file_path,
+            language=lang_code
+        )
+        if not db_entries:
+            folder_mod_name = os.path.basename(project['source_path'])
+            db_entries = self.archive_manager.get_entries(
+                mod_name=folder_mod_name,
+                file_path=template_file_path,
+                language=lang_code
+            )
+
+        db_translation_map = {
+            e['key']: self._normalize_translation_value(e['translation'])
+            for e in db_entries
+            if e['translation']
+        }
+
+        # Disk State
+        disk_translation_map = {}
+        target_lines = original_lines
+        if os.path.exists(target_file_path):
+            target_lines, target_texts, target_map = QuoteExtractor.extract_from_file(target_file_path)
+            for i, text in enumerate(target_texts):
+                if i in target_map:
+                    disk_translation_map[target_map[i]['key_part'].strip()] = self._normalize_translation_value(text)
+
+        entries = []
+        ai_translated_texts = []
+        disk_translated_texts = []
+
+        for i, text in enumerate(texts_to_translate):
+            key = key_map[i]['key_part'].strip()
+
+            # AI Logic
+            ai_trans = db_translation_map.get(key)
+            if ai_trans is None: ai_trans = db_translation_map.get(str(i))
+            if ai_trans is None and ":" in key: ai_trans = db_translation_map.get(key.split(':')[0])
+            if ai_trans is None: ai_trans = db_translation_map.get(key + ":")
+
+            # [REVERTED] Disk Fallback removed as per user request (DB consistency check)
+
+            # If still None, it means DB is missing this key.
+            # User requested explicit warning.
+            if ai_trans is None:
+                ai_trans = "⚠️ [DB_MISSING] " + text
+
+            ai_translated_texts.append(ai_trans)
+
+            # Disk Logic
+            disk_trans = disk_translation_map.get(key)
+            if disk_trans is None and ":" in key: disk_trans = disk_translation_map.get(key.split(':')[0])
+            if disk_trans is None: disk_trans = ai_trans
+            disk_translated_texts.append(disk_trans)
+
+            entries.append({
+                "key": key,
+                "original": text,
+                "translation": disk_trans,
+                "line_number": key_map[i]['line_num']
+            })
+
+        proofreading_rows = self._build_proofreading_rows(
+            original_lines,
+            texts_to_translate,
+            key_map,
+            ai_translated_texts,
+            disk_translated_texts,
+            target_lines,
+        )
+        return ProofreadingDocument(
+            file_id=file_id,
+            target_file_path=target_file_path,
+            template_file_path=template_file_path,
+            template_signature=_file_signature(template_file_path),
+            archive_revision=archive_revision,
+            mod_name=project['name'],
+            revision=revision,
+            source_lang_key=f"l_{source_lang}",
+            current_lang_key=f"l_{current_lang}",
+            original_lines=original_lines,
+            texts_to_translate=texts_to_translate,
+            key_map=key_map,
+            ai_translated_texts=ai_translated_texts,
+            disk_translated_texts=disk_translated_texts,
+            entries=entries,
+            rows=proofreading_rows,
+        )
+
+    async def get_proofread_data(self, project_id: str, file_id: str) -> Dict[str, Any]:
+        document = await self._load_document(project_id, file_id)
+        return {
+            "file_id": file_id,
+            "file_path": document.target_file_path,
+            "mod_name": document.mod_name,
+            "entries": document.entries,
+            "rows": document.rows,
+            **await asyncio.to_thread(document.contents),
+            "document_revision": document.revision,
+        }
+
+    async def get_proofread_window(
+        self,
+        project_id: str,
+        file_id: str,
+        start: int = 0,
+        count: int = DEFAULT_WINDOW_SIZE,
+        by: str = "row",
+        include_content: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        One window of a proofreading document.
+
+        ``by="row"`` returns ``rows[start:start + count]``; ``by="line"`` returns the rows that touch
+        source lines ``start + 1 .. start + count``. Totals let the client page through the file.
+        The full ``file_content``/``ai_content``/``final_content`` are only built when ``include_content``.
+        """
+        if by not in ("row", "line"):
+            raise ProofreadingDataError("invalid_window", f"Unsupported proofreading window unit: {by}", status_code=400)
+        start, count = max(0, int(start)), max(0, min(int(count), MAX_WINDOW_SIZE))
+        document = await self._load_document(project_id, file_id)
+        rows = document.row_window(start, count) if by == "row" else document.line_window(start, count)
+        window = {
+            "file_id": file_id,
+            "file_path": document.target_file_path,
+            "mod_name": document.mod_name,
+            "document_revision": document.revision,
+            "by": by,
+            "start": start,
+            "count": count,
+            "total_rows": len(document.rows),
+            "total_entries": len(document.entries),
+            "total_lines": len(document.original_lines),
+            "rows": rows,
+            "entries": document.entries_for_rows(rows),
+        }
+        if include_content:
+            window.update(await asyncio.to_thread(document.contents))
+        return window
 
     async def save_proofread_data(
         self,
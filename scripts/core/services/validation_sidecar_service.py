@@ -1,9 +1,13 @@
 import json
 import logging
+import os
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
 from fastapi import HTTPException
 
@@ -12,6 +16,113 @@ from scripts.utils.validation_logger import ValidationLogger
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# (absolute path, size, mtime_ns)
+SidecarSignature = Tuple[str, int, int]
+
+
+class _Sidecar:
+    __slots__ = ("payload", "issues", "active_count")
+
+    def __init__(self, payload: Dict[str, Any] | List[Any], issues: List[Dict[str, Any]], active_count: int):
+        self.payload = payload
+        self.issues = issues
+        self.active_count = active_count
+
+
+class ValidationSidecarCache:
+    """
+    LRU of parsed sidecars keyed by ``(path, size, mtime_ns)``, plus the merged active issue lists
+    built from them, keyed by the signatures of every merged sidecar; a rewritten sidecar is parsed
+    again and every merge that included it misses. Callers must not mutate cached payloads or issues.
+    """
+
+    def __init__(self, max_files: int = 512, max_merges: int = 64):
+        self.max_files = max_files
+        self.max_merges = max_merges
+        self._sidecars: "OrderedDict[str, Tuple[SidecarSignature, Any]]" = OrderedDict()
+        self._merges: "OrderedDict[Tuple[SidecarSignature, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def signature(path: Path | str) -> Optional[SidecarSignature]:
+        cache_key = os.path.abspath(path)
+        try:
+            stat = os.stat(cache_key)
+        except OSError:
+            return None
+        return cache_key, stat.st_size, stat.st_mtime_ns
+
+    def load(self, path: Path, read: Callable[[Path], T]) -> T:
+        signature = self.signature(path)
+        if signature is None:
+            return read(path)
+        with self._lock:
+            cached = self._sidecars.get(signature[0])
+            if cached is not None and cached[0] == signature:
+                self._sidecars.move_to_end(signature[0])
+                self.hits += 1
+                return cached[1]
+        value = read(path)
+        with self._lock:
+            self.misses += 1
+            self._sidecars[signature[0]] = (signature, value)
+            self._sidecars.move_to_end(signature[0])
+            while len(self._sidecars) > self.max_files:
+                self._sidecars.popitem(last=False)
+        return value
+
+    def merged(self, paths: List[Path], build: Callable[[], T]) -> T:
+        merge_key = tuple(self.signature(path) or (os.path.abspath(path), -1, -1) for path in paths)
+        with self._lock:
+            if merge_key in self._merges:
+                self._merges.move_to_end(merge_key)
+                self.hits += 1
+                return self._merges[merge_key]
+        value = build()
+        with self._lock:
+            self.misses += 1
+            self._merges[merge_key] = value
+            while len(self._merges) > self.max_merges:
+                self._merges.popitem(last=False)
+        return value
+
+    def invalidate(self, path: Path | str) -> None:
+        """Forget ``path`` and every merge that read it, for writers that cannot rely on mtime alone."""
+        cache_key = os.path.abspath(path)
+        with self._lock:
+            self._sidecars.pop(cache_key, None)
+            for merge_key in [key for key in self._merges if any(item[0] == cache_key for item in key)]:
+                del self._merges[merge_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sidecars.clear()
+            self._merges.clear()
+
+
+validation_sidecar_cache = ValidationSidecarCache()
+
+
+@lru_cache(maxsize=16)
+def _project_file_index(files: Tuple[Tuple[Any, Any], ...]) -> Tuple[Dict[str, Set[Any]], Dict[str, Set[Any]]]:
+    """Normalized project file path -> file ids, and every ``/``-separated path suffix -> file ids."""
+    exact: Dict[str, Set[Any]] = {}
+    suffixes: Dict[str, Set[Any]] = {}
+    for file_path, file_id in files:
+        if not file_path or not file_id:
+            continue
+        normalized_path = str(Path(file_path).resolve(strict=False)).replace("\\", "/").lower()
+        exact.setdefault(normalized_path, set()).add(file_id)
+        separator = normalized_path.find("/")
+        while separator != -1:
+            suffixes.setdefault(normalized_path[separator + 1:], set()).add(file_id)
+            separator = normalized_path.find("/", separator + 1)
+    return exact, suffixes
+
 
 class ValidationSidecarService:
     CURRENT_VERSION_SCOPE = "current_translation_version"
@@ -22,16 +133,10 @@ class ValidationSidecarService:
         project_files: List[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
         """Attach stable project file ids to legacy and current validation issues."""
-        normalized_files = []
-        for project_file in project_files or []:
-            file_path = project_file.get("file_path")
-            file_id = project_file.get("file_id")
-            if not file_path or not file_id:
-                continue
-            normalized_files.append((
-                str(Path(file_path).resolve(strict=False)).replace("\\", "/").lower(),
-                file_id,
-            ))
+        exact_index, suffix_index = _project_file_index(tuple(
+            (project_file.get("file_path"), project_file.get("file_id"))
+            for project_file in project_files or []
+        ))
 
         enriched = []
         for issue in issues or []:
@@ -44,31 +149,31 @@ class ValidationSidecarService:
                 str(candidate).replace("\\", "/").lower().lstrip("./")
                 for candidate in filter(None, candidates)
             ]
-            exact_matches = {
-                file_id
-                for normalized_candidate in normalized_candidates
-                for normalized_path, file_id in normalized_files
-                if normalized_path == normalized_candidate
-            }
-            matches = exact_matches
+            matches = set().union(*(exact_index.get(candidate, ()) for candidate in normalized_candidates))
             if not matches:
-                matches = {
-                    file_id
-                    for normalized_candidate in normalized_candidates
-                    for normalized_path, file_id in normalized_files
-                    if normalized_path.endswith(f"/{normalized_candidate}")
-                }
+                # a suffix key is what follows some "/" in the project path, i.e. an ``endswith("/" + candidate)`` match
+                matches = set().union(*(suffix_index.get(candidate, ()) for candidate in normalized_candidates))
             if len(matches) == 1:
                 item["file_id"] = matches.pop()
             enriched.append(item)
         return enriched
 
     def load_issue_file(self, path: Path) -> List[Dict[str, Any]]:
-        payload = self.load_payload(path)
-        issues = payload.get("issues", []) if isinstance(payload, dict) else payload if isinstance(payload, list) else []
-        return [issue for issue in issues if isinstance(issue, dict)]
+        return self._sidecar(path).issues
 
     def load_payload(self, path: Path) -> Dict[str, Any] | List[Any]:
+        return self._sidecar(path).payload
+
+    def _sidecar(self, path: Path) -> _Sidecar:
+        return validation_sidecar_cache.load(path, self._read_sidecar)
+
+    def _read_sidecar(self, path: Path) -> _Sidecar:
+        payload = self._read_payload(path)
+        issues = payload.get("issues", []) if isinstance(payload, dict) else payload if isinstance(payload, list) else []
+        issues = [issue for issue in issues if isinstance(issue, dict)]
+        return _Sidecar(payload, issues, len(self.active_issues(issues)))
+
+    def _read_payload(self, path: Path) -> Dict[str, Any] | List[Any]:
         try:
             payload = json.loads(path.read_text(encoding="utf-8"))
         except Exception as exc:
@@ -97,14 +202,13 @@ class ValidationSidecarService:
             resolved = str(path.resolve(strict=False)).lower()
             if resolved in seen_paths or not path.exists():
                 return
-            payload = self.load_payload(path)
-            issues = payload.get("issues", []) if isinstance(payload, dict) else payload if isinstance(payload, list) else []
-            issues = self.active_issues([issue for issue in issues if isinstance(issue, dict)])
+            sidecar = self._sidecar(path)
+            payload = sidecar.payload
             seen_paths.add(resolved)
             candidates.append({
                 "path": str(path),
                 "kind": kind,
-                "issue_count": len(issues),
+                "issue_count": sidecar.active_count,
                 "last_updated_at": self._format_file_mtime(path),
                 "project_id": payload.get("project_id") if isinstance(payload, dict) else None,
                 "run_id": payload.get("run_id") if isinstance(payload, dict) else None,
@@ -132,7 +236,16 @@ class ValidationSidecarService:
         candidates.sort(key=lambda item: item.get("last_updated_at") or "", reverse=True)
         return candidates
 
-    def load_status(self, project_root: str, selected_sidecar_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def load_status(
+        self,
+        project_root: str,
+        selected_sidecar_path: Optional[str] = None,
+        include_issues: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Active issues of the selected sidecar scope. The issue dicts are shared with the sidecar
+        cache and must not be mutated; ``include_issues=False`` returns only the counts.
+        """
         candidates = self.list_candidates(project_root)
         if not candidates:
             return None
@@ -147,11 +260,15 @@ class ValidationSidecarService:
             source_paths = self._current_translation_paths(candidates, selected_candidate)
             scope = self.CURRENT_VERSION_SCOPE
 
-        active_issues = self.active_issues(self._merge_issue_paths(source_paths))
+        active_issues, counts = validation_sidecar_cache.merged(
+            source_paths,
+            lambda: self._merged_active_issues(source_paths),
+        )
 
         return {
-            "issues": active_issues,
-            "issue_type_counts": self.issue_counts(active_issues),
+            "issues": list(active_issues) if include_issues else [],
+            "issue_count": len(active_issues),
+            "issue_type_counts": dict(counts),
             "sidecar_path": selected_candidate["path"],
             "last_updated_at": selected_candidate.get("last_updated_at"),
             "sidecar_candidates": self._public_candidates(candidates),
@@ -215,6 +332,10 @@ class ValidationSidecarService:
 
         return sorted(by_root.values(), key=lambda item: item.get("path") or "")
 
+    def _merged_active_issues(self, paths: List[Path]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        active_issues = self.active_issues(self._merge_issue_paths(paths))
+        return active_issues, self.issue_counts(active_issues)
+
     def _merge_issue_paths(self, paths: List[Path]) -> List[Dict[str, Any]]:
         merged: Dict[tuple, Dict[str, Any]] = {}
         for path in paths:
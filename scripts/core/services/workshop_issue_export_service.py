@@ -7,7 +7,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from scripts.core.archive_manager import archive_manager
-from scripts.core.loc_parser import parse_loc_file, parse_loc_file_with_lines
+from scripts.core.loc_parser import parse_loc_file_with_lines
+from scripts.core.services.validation_sidecar_service import validation_sidecar_cache
+from scripts.core.source_file_index import load_source_entries, source_tree_indexes
 from scripts.utils.i18n_utils import iso_to_paradox
 from scripts.utils.post_process_validator import PostProcessValidator
 from scripts.utils.validation_logger import ValidationLogger
@@ -69,6 +71,7 @@ class WorkshopIssueExportService:
         target_paradox = iso_to_paradox(target_lang_info.get("code", ""))
         source_paradox = iso_to_paradox(source_lang_info.get("code", ""))
         game_id = game_profile.get("id", "")
+        index_scope = object()  # 源目录索引在本次导出中最多因查找未命中重建一次
 
         if not output_root.exists():
             return self._write_exports(output_root, issues, generated_at)
@@ -84,6 +87,7 @@ class WorkshopIssueExportService:
                 source_root=source_root,
                 source_paradox=source_paradox,
                 target_paradox=target_paradox,
+                index_scope=index_scope,
             )
 
             source_entries = self._load_source_entries(source_file)
@@ -94,8 +98,8 @@ class WorkshopIssueExportService:
                 logger.error(f"Failed to parse translated output file {translated_file}: {exc}")
                 continue
 
-            for key, value, line_number in target_entries:
-                source_lookup = self._resolve_source_context(
+            source_lookups = [
+                self._resolve_source_context(
                     source_entries=source_entries,
                     key=key,
                     source_file=source_file,
@@ -104,22 +108,22 @@ class WorkshopIssueExportService:
                     project_name=project_name,
                     project_id=project_id,
                 )
-                source_value = source_lookup["source_str"]
-                try:
-                    results = self.validator.validate_entry(
-                        game_id=game_id,
-                        key=key,
-                        value=value,
-                        line_number=line_number,
-                        source_lang=source_lang_info,
-                        source_value=source_value,
-                        target_lang=target_lang_info.get("code"),
-                        dynamic_valid_tags=dynamic_valid_tags,
-                    )
-                except Exception as exc:
-                    logger.error(f"Failed to validate {translated_file} [{key}]: {exc}")
-                    continue
+                for key, _value, _line_number in target_entries
+            ]
+            try:
+                results_per_entry = self.validator.validate_many(
+                    game_id,
+                    [(key, value, line_number, lookup["source_str"]) for (key, value, line_number), lookup in zip(target_entries, source_lookups)],
+                    source_lang=source_lang_info,
+                    target_lang=target_lang_info.get("code"),
+                    dynamic_valid_tags=dynamic_valid_tags,
+                )
+            except Exception as exc:
+                logger.error(f"Failed to validate {translated_file}: {exc}")
+                continue
 
+            for (key, value, _line_number), source_lookup, results in zip(target_entries, source_lookups, results_per_entry):
+                source_value = source_lookup["source_str"]
                 for result in results:
                     if result.level.value not in {"error", "warning"}:
                         continue
@@ -299,6 +303,8 @@ class WorkshopIssueExportService:
         }
         with open(workshop_path, "w", encoding="utf-8") as handle:
             json.dump(payload, handle, ensure_ascii=False, indent=2)
+        validation_sidecar_cache.invalidate(workshop_path)
+        validation_sidecar_cache.invalidate(output_root / ValidationLogger.FILENAME)
 
         return {
             "issues_path": str(workshop_path),
@@ -328,6 +334,7 @@ class WorkshopIssueExportService:
         source_root: Path,
         source_paradox: str,
         target_paradox: str,
+        index_scope: object = None,
     ) -> Optional[Path]:
         try:
             rel_parts = list(translated_file.relative_to(output_root).parts)
@@ -345,21 +352,13 @@ class WorkshopIssueExportService:
             flags=re.IGNORECASE,
         )
 
-        candidate = source_root.joinpath(*rel_parts)
-        if candidate.exists():
-            return candidate
-
-        expected_name = Path(rel_parts[-1]).name.lower()
-        for found in source_root.rglob(Path(rel_parts[-1]).name):
-            if found.name.lower() == expected_name:
-                return found
-        return None
+        return source_tree_indexes.find(source_root, "/".join(rel_parts), scope=index_scope)
 
     def _load_source_entries(self, source_file: Optional[Path]) -> Dict[str, str]:
         if not source_file or not source_file.exists():
             return {}
         try:
-            return dict(parse_loc_file(source_file))
+            return load_source_entries(source_file)
         except Exception as exc:
             logger.error(f"Failed to parse source file {source_file}: {exc}")
             return {}
@@ -0,0 +1,101 @@
+# scripts/core/source_file_index.py
+"""
+源文件查找与源条目缓存
+翻译输出对应的源文件按“规范化相对路径”和“文件名”建立索引，一次遍历源目录即可供
+一次运行中的所有目标语言复用，代替每个输出文件一次的 rglob。
+源条目字典挂在共享的 LocDocument 上，同一个英文源文件不会为每个目标语言重复解析。
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from scripts.core.loc_parser import load_loc_document, parse_loc_file
+
+
+def normalize_relpath(path) -> str:
+    return str(path).replace("\\", "/").strip("/").lower()
+
+
+class SourceTreeIndex:
+    """Files under one source root, by normalized relative path and by lower-cased file name."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.by_relpath: Dict[str, Path] = {}
+        self.by_name: Dict[str, Path] = {}
+        self.build_token: object = None
+        for directory, _, files in os.walk(self.root):
+            for name in sorted(files):
+                path = Path(directory) / name
+                self.by_relpath.setdefault(normalize_relpath(path.relative_to(self.root).as_posix()), path)
+                self.by_name.setdefault(name.lower(), path)
+
+    def find(self, relpath: str) -> Optional[Path]:
+        """The file at ``relpath`` (case-insensitive), else the first file with the same name."""
+        found = self.by_relpath.get(normalize_relpath(relpath)) or self.by_name.get(Path(relpath).name.lower())
+        return found if found is not None and found.exists() else None
+
+
+class SourceIndexRegistry:
+    """
+    One index per source root, shared by every exporter and language in the process, LRU-bounded
+    to ``max_roots`` trees. The exact ``source_root / relpath`` is checked on disk before the index,
+    so a stale index never shadows it with a same-named file; finding it there while the index does
+    not know it drops the index. An index is rebuilt when a lookup misses, at most once per ``scope``
+    token (one export call), so files added to the source tree are still found without walking it
+    once per output file.
+    """
+
+    def __init__(self, max_roots: int = 8):
+        self.max_roots = max_roots
+        self._indexes: "OrderedDict[str, SourceTreeIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def find(self, source_root: Path, relpath: str, scope: object = None) -> Optional[Path]:
+        key = os.path.abspath(source_root)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+        exact = Path(source_root) / relpath
+        if exact.is_file():
+            if index is not None and normalize_relpath(relpath) not in index.by_relpath:
+                with self._lock:
+                    if self._indexes.get(key) is index:
+                        del self._indexes[key]
+            return exact
+        if index is not None:
+            found = index.find(relpath)
+            if found is not None or (scope is not None and index.build_token is scope):
+                return found
+        if not Path(source_root).is_dir():
+            return None
+        index = SourceTreeIndex(Path(source_root))
+        index.build_token = scope
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_roots:
+                self._indexes.popitem(last=False)
+        return index.find(relpath)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+source_tree_indexes = SourceIndexRegistry()
+
+
+def load_source_entries(path: Path) -> Dict[str, str]:
+    """
+    ``{key: source text}`` of ``path``; callers must not mutate the returned dict.
+    .yml maps are memoized on the shared ``LocDocument``, so they live and die with the
+    character-bounded document cache instead of a second per-file cache.
+    """
+    if Path(path).suffix.lower() == ".json":
+        return dict(parse_loc_file(Path(path)))
+    return load_loc_document(path).translatable_map()
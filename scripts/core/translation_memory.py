@@ -0,0 +1,328 @@
+# scripts/core/translation_memory.py
+"""
+翻译记忆（Translation Memory）
+以 (原文, 源语言, 目标语言, 游戏, 术语表指纹, 提供商, 模型, 提示词指纹) 为键持久化已翻译字符串，
+在批次切分之前命中的字符串直接回填，只有未命中的字符串才会发给模型。
+原文只做 NFC 规范化，首尾空白保持原样（本地化值中的空白是有意义的）。
+术语表、模型、提示词模板或 mod 上下文变化时键随之变化，旧记录自然失效。
+默认关闭，需通过 REMIS_TRANSLATION_MEMORY=1 或用户配置开启。
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import unicodedata
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from scripts.app_settings import TRANSLATION_MEMORY_DB_PATH, TRANSLATION_MEMORY_ENABLED, config_manager
+from scripts.core.parallel_types import FileTask
+
+# SQLite caps bound parameters per statement (999 on older builds).
+_LOOKUP_CHUNK = 500
+_FINGERPRINTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def normalize_source_text(text: str) -> str:
+    """NFC only: leading/trailing whitespace is part of the value and must survive a hit."""
+    return unicodedata.normalize("NFC", text)
+
+
+def prompt_fingerprint(file_task: FileTask) -> str:
+    """Digest of everything besides the model that shapes the prompt: templates, custom instructions, mod context."""
+    from scripts.core.prompt_manager import prompt_manager
+
+    game_id = str((file_task.game_profile or {}).get("id") or "")
+    target_lang = file_task.target_lang or {}
+    parts = (
+        prompt_manager.get_effective_prompt(game_id) or "",
+        prompt_manager.get_effective_format_prompt(game_id) or "",
+        prompt_manager.get_custom_global_prompt() or "",
+        file_task.mod_context or "",
+        str(target_lang.get("custom_name") or target_lang.get("name") or ""),
+        str((file_task.source_lang or {}).get("name") or ""),
+    )
+    return hashlib.sha1("\x1e".join(parts).encode("utf-8")).hexdigest()
+
+
+def glossary_fingerprint(source_lang: str, target_lang: str) -> str:
+    """Stable digest of the loaded glossary terms for one language pair ("" without a glossary)."""
+    from scripts.core.glossary_manager import glossary_manager
+
+    index = glossary_manager.get_validation_index(source_lang, target_lang)
+    if index is None:
+        return ""
+    fingerprint = _FINGERPRINTS.get(index)
+    if fingerprint is None:
+        digest = hashlib.sha1()
+        for source_term, target_term in sorted(index.glossary.items()):
+            digest.update(f"{source_term}\x1f{target_term}\x1e".encode("utf-8"))
+        fingerprint = digest.hexdigest()
+        _FINGERPRINTS[index] = fingerprint
+    return fingerprint
+
+
+@dataclass(frozen=True)
+class MemoryScope:
+    source_lang: str
+    target_lang: str
+    game_id: str
+    glossary_fingerprint: str
+    provider: str = ""
+    model: str = ""
+    prompt_fingerprint: str = ""
+
+    @classmethod
+    def for_file(cls, file_task: FileTask) -> "MemoryScope":
+        source_lang = file_task.source_lang.get("code") or ""
+        target_lang = file_task.target_lang.get("code") or ""
+        return cls(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            game_id=str((file_task.game_profile or {}).get("id") or ""),
+            glossary_fingerprint=glossary_fingerprint(source_lang, target_lang),
+            provider=file_task.provider_name or "",
+            model=file_task.model_name or "",
+            prompt_fingerprint=prompt_fingerprint(file_task),
+        )
+
+    def key_for(self, normalized_text: str) -> str:
+        raw = "\x1f".join((
+            self.source_lang,
+            self.target_lang,
+            self.game_id,
+            self.glossary_fingerprint,
+            self.provider,
+            self.model,
+            self.prompt_fingerprint,
+            normalized_text,
+        ))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class TranslationMemoryStats:
+    """Per-run hit/miss counters; shared by every batch worker of one language run."""
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    skipped_batches: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, hits: int = 0, misses: int = 0, stored: int = 0, skipped_batches: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.stored += stored
+            self.skipped_batches += skipped_batches
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "stored": self.stored, "skipped_batches": self.skipped_batches}
+
+
+class MemoryPlan:
+    """Memory hits of one file plus the strings that still have to be translated."""
+
+    def __init__(self, memory: "TranslationMemory", scope: MemoryScope, file_task: FileTask, hits: Dict[int, str], stats=None):
+        self.memory = memory
+        self.scope = scope
+        self.file_task = file_task
+        self.hits = hits
+        self.stats = stats
+        self.miss_indices = [i for i in range(len(file_task.texts_to_translate)) if i not in hits]
+
+    @property
+    def miss_texts(self) -> List[str]:
+        texts = self.file_task.texts_to_translate
+        return [texts[i] for i in self.miss_indices]
+
+    def merge(self, miss_translations: Sequence[str], failed: bool = False, kept_source: Iterable[int] = ()) -> List[str]:
+        """
+        Interleave the hits with the model output for the misses; successful misses are remembered.
+        ``kept_source`` lists miss positions that fell back to their source text and must not be remembered.
+        """
+        merged = list(self.file_task.texts_to_translate)
+        for index, text in self.hits.items():
+            merged[index] = text
+        for index, text in zip(self.miss_indices, miss_translations):
+            merged[index] = text
+        if not failed and len(miss_translations) == len(self.miss_indices):
+            skipped = set(kept_source)
+            remembered = [i for i in range(len(self.miss_indices)) if i not in skipped]
+            miss_texts = self.miss_texts
+            stored = self.memory.remember(
+                self.scope,
+                [miss_texts[i] for i in remembered],
+                [miss_translations[i] for i in remembered],
+            )
+            if self.stats is not None:
+                self.stats.record(stored=stored)
+        return merged
+
+
+class TranslationMemory:
+    """
+    SQLite 翻译记忆库；键为作用域与规范化原文的 SHA-1，主键即索引。
+    连接在线程间共享，读写均在锁内完成。查询只读：命中次数先在内存中累计，
+    随下一次写入（remember/summary/close）一并提交，热路径上不产生写事务。
+    """
+
+    def __init__(self, db_path: str = TRANSLATION_MEMORY_DB_PATH):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pending_hits: Counter = Counter()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translation_memory (
+                    memory_key TEXT PRIMARY KEY,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    game_id TEXT NOT NULL,
+                    glossary_fingerprint TEXT NOT NULL,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                ) WITHOUT ROWID
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translation_memory_scope "
+                "ON translation_memory (source_lang, target_lang, game_id)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def lookup(self, scope: MemoryScope, texts: Sequence[str]) -> Dict[int, str]:
+        """Return ``{position: translation}`` for every text already in memory."""
+        keys_by_position = {
+            i: scope.key_for(normalized)
+            for i, normalized in enumerate(normalize_source_text(text) for text in texts)
+            if normalized
+        }
+        if not keys_by_position:
+            return {}
+        unique_keys = list(set(keys_by_position.values()))
+        found: Dict[str, str] = {}
+        with self._lock:
+            cursor = self.connection.cursor()
+            for start in range(0, len(unique_keys), _LOOKUP_CHUNK):
+                chunk = unique_keys[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT memory_key, translated_text FROM translation_memory WHERE memory_key IN ({placeholders})",
+                    chunk,
+                )
+                found.update(cursor.fetchall())
+            self._pending_hits.update(found.keys())
+        return {i: found[key] for i, key in keys_by_position.items() if key in found}
+
+    def remember(self, scope: MemoryScope, sources: Iterable[str], translations: Iterable[str]) -> int:
+        rows = {}
+        for source, translation in zip(sources, translations):
+            normalized = normalize_source_text(source)
+            if normalized and translation:
+                rows[scope.key_for(normalized)] = (normalized, translation)
+        if not rows:
+            return 0
+        try:
+            with self._lock:
+                self.connection.executemany(
+                    """
+                    INSERT INTO translation_memory
+                        (memory_key, source_lang, target_lang, game_id, glossary_fingerprint, source_text, translated_text)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(memory_key) DO UPDATE SET
+                        translated_text = excluded.translated_text,
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    [
+                        (key, scope.source_lang, scope.target_lang, scope.game_id, scope.glossary_fingerprint, source, translation)
+                        for key, (source, translation) in rows.items()
+                    ],
+                )
+                self._write_pending_hits()
+                self.connection.commit()
+        except sqlite3.Error as e:
+            logging.error(f"Failed to store translation memory entries: {e}")
+            return 0
+        return len(rows)
+
+    def _write_pending_hits(self) -> None:
+        """Add the hit counts accumulated by lookups; caller holds the lock and commits."""
+        if not self._pending_hits:
+            return
+        pending, self._pending_hits = self._pending_hits, Counter()
+        self.connection.executemany(
+            "UPDATE translation_memory SET hit_count = hit_count + ? WHERE memory_key = ?",
+            [(count, key) for key, count in pending.items()],
+        )
+
+    def plan(self, file_task: FileTask, stats: Optional[TranslationMemoryStats] = None) -> MemoryPlan:
+        scope = MemoryScope.for_file(file_task)
+        try:
+            hits = self.lookup(scope, file_task.texts_to_translate)
+        except sqlite3.Error as e:
+            logging.error(f"Translation memory lookup failed for {file_task.filename}: {e}")
+            hits = {}
+        plan = MemoryPlan(self, scope, file_task, hits, stats)
+        if stats is not None:
+            stats.record(hits=len(hits), misses=len(plan.miss_indices))
+        return plan
+
+    def invalidate(self, source_lang: Optional[str] = None, target_lang: Optional[str] = None, game_id: Optional[str] = None) -> int:
+        """Delete remembered translations, optionally limited to a language pair and/or game. Returns the row count."""
+        conditions, params = [], []
+        for column, value in (("source_lang", source_lang), ("target_lang", target_lang), ("game_id", game_id)):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            cursor = self.connection.execute(f"DELETE FROM translation_memory{where}", params)
+            self.connection.commit()
+        logging.info(f"Translation memory invalidated: {cursor.rowcount} entries removed.")
+        return cursor.rowcount
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            if self._pending_hits:
+                self._write_pending_hits()
+                self.connection.commit()
+            entries, hits = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hit_count), 0) FROM translation_memory"
+            ).fetchone()
+        return {"entries": entries, "total_hits": hits}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._write_pending_hits()
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logging.error(f"Failed to store translation memory hit counts: {e}")
+                self._conn.close()
+                self._conn = None
+
+
+def resolve_translation_memory(use_translation_memory: Optional[bool] = None) -> Optional[TranslationMemory]:
+    """Return the shared memory when the caller, the user config or ``REMIS_TRANSLATION_MEMORY=1`` opts in."""
+    enabled = use_translation_memory
+    if enabled is None:
+        enabled = config_manager.get_value("translation_memory_enabled", TRANSLATION_MEMORY_ENABLED)
+    return translation_memory if enabled else None
+
+
+translation_memory = TranslationMemory()
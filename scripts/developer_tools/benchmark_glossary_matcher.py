@@ -0,0 +1,191 @@
+"""Compare the legacy per-entry glossary scan with the compiled glossary matcher.
+
+Builds a synthetic glossary (20k entries by default), runs both matchers over
+the same batch texts, checks that they return identical matches and prints the
+per-batch timings.
+
+    python scripts/developer_tools/benchmark_glossary_matcher.py --entries 20000 --batches 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+if str(REPOSITORY_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+
+from scripts.core.glossary_manager import GlossaryManager
+from scripts.core.glossary_matcher import levenshtein_distance, tokenize_text
+
+SYLLABLES = ["ka", "ro", "vel", "dun", "mir", "tha", "sol", "gar", "en", "is", "or", "qua", "lor", "bren"]
+FILLER_WORDS = ["the", "of", "and", "to", "their", "empire", "fleet", "gains", "loses", "opinion", "with", "is", "now"]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def build_entries(count: int, seed: int) -> List[Dict]:
+    rng = random.Random(seed)
+    entries = []
+    for index in range(count):
+        words = [_word(rng).capitalize() for _ in range(rng.choice([1, 1, 2, 2, 3]))]
+        source = " ".join(words)
+        entry = {
+            "entry_id": f"bench-{index}",
+            "translations": {"en": source, "zh-CN": f"术语{index}"},
+            "variants": {"en": [source + "s"]} if rng.random() < 0.2 else {},
+            "abbreviations": {"en": ["".join(w[0] for w in words)]} if len(words) > 1 and rng.random() < 0.1 else {},
+            "raw_metadata": {},
+            "_glossary_priority": rng.randint(0, 2),
+        }
+        entries.append(entry)
+    return entries
+
+
+def build_batches(entries: List[Dict], batch_count: int, lines_per_batch: int, seed: int) -> List[List[str]]:
+    rng = random.Random(seed + 1)
+    batches = []
+    for _ in range(batch_count):
+        lines = []
+        for _ in range(lines_per_batch):
+            words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(6, 14))]
+            for _ in range(rng.randint(0, 2)):
+                words.insert(rng.randrange(len(words) + 1), rng.choice(entries)["translations"]["en"])
+            if rng.random() < 0.3:
+                words.append(_word(rng))
+            lines.append(" ".join(words) + ".")
+        batches.append(lines)
+    return batches
+
+
+def legacy_smart_term_matching(manager: GlossaryManager, text: str, source_lang: str, target_lang: str) -> List[Dict]:
+    """The per-entry scan that ``CompiledGlossaryMatcher`` replaced, kept for comparison."""
+    matches = []
+    glossary = manager.get_glossary_for_translation()
+    if not glossary:
+        return matches
+    text_fingerprint = ""
+    is_cjk = source_lang in ['zh-CN', 'zh-TW', 'ja', 'ko']
+    if is_cjk:
+        pe_lang = 'zh' if 'zh' in source_lang else source_lang
+        text_fingerprint = manager.phonetics_engine.generate_fingerprint(text, pe_lang)
+
+    for entry in glossary.get('entries', []):
+        translations = entry.get('translations', {})
+        source_term = translations.get(source_lang, "")
+        target_term = translations.get(target_lang, "")
+        if not source_term or not target_term:
+            continue
+        if source_term.lower() in text:
+            matches.append(manager._make_match(entry, source_term, target_term, 'exact', 1.0))
+            continue
+        if is_cjk and len(source_term) > 1:
+            term_fingerprint = manager.phonetics_engine.generate_fingerprint(source_term, pe_lang)
+            if term_fingerprint and term_fingerprint in text_fingerprint:
+                matches.append(manager._make_match(entry, source_term, target_term, 'phonetic', 0.85))
+                continue
+        variants = entry.get('variants', {}).get(source_lang, [])
+        if any(variant.lower() in text for variant in variants):
+            matches.append(manager._make_match(entry, source_term, target_term, 'variant', 0.9))
+            continue
+        for abbreviation in entry.get('abbreviations', {}).get(source_lang, []):
+            if _legacy_abbreviation_in_text(abbreviation, text, source_lang):
+                matches.append(manager._make_match(entry, source_term, target_term, 'abbreviation', 0.85))
+                break
+        fuzzy = None if manager.fuzzy_matching_mode == 'strict' else _legacy_fuzzy(source_term, text, source_lang)
+        if fuzzy is not None:
+            matches.append(manager._make_match(entry, source_term, target_term, 'fuzzy', fuzzy))
+    return manager._deduplicate_matches(matches)
+
+
+def _legacy_abbreviation_in_text(abbreviation: str, text: str, source_lang: str) -> bool:
+    if source_lang in ['en', 'fr', 'de', 'es']:
+        return bool(re.search(r'\b' + re.escape(abbreviation.lower()) + r'\b', text.lower()))
+    return abbreviation.lower() in [word.lower() for word in text.split()]
+
+
+def _legacy_similar(word1: str, word2: str) -> bool:
+    if len(word1) < 3 or len(word2) < 3:
+        return False
+    return levenshtein_distance(word1, word2) <= max(1, len(word1) // 4)
+
+
+def _legacy_fuzzy(source_term: str, text: str, source_lang: str):
+    source_tokens = tokenize_text(source_term, source_lang)
+    if len(source_tokens) == 1:
+        if not _legacy_similar(source_term, text):
+            return None
+        max_distance = max(1, len(source_term) // 4)
+        return 0.6 - (levenshtein_distance(source_term, text) / max_distance) * 0.3
+    text_tokens = tokenize_text(text, source_lang)
+    matched = 0
+    for source_token in source_tokens:
+        if len(source_token) < 2:
+            continue
+        for text_token in text_tokens:
+            if len(text_token) < 2:
+                continue
+            if source_token == text_token or _legacy_similar(source_token, text_token):
+                matched += 1
+                break
+    if matched and matched / len(source_tokens) > 0.5:
+        return 0.3 + (matched / len(source_tokens)) * 0.3
+    return None
+
+
+def run_benchmark(entry_count: int, batch_count: int, lines_per_batch: int, seed: int) -> Dict:
+    manager = GlossaryManager()
+    entries = build_entries(entry_count, seed)
+    manager.in_memory_glossary = {"entries": entries}
+    batches = build_batches(entries, batch_count, lines_per_batch, seed)
+
+    started = time.perf_counter()
+    manager.get_term_matcher("en", "zh-CN")
+    compile_seconds = time.perf_counter() - started
+
+    legacy_seconds = 0.0
+    compiled_seconds = 0.0
+    for batch in batches:
+        text = " ".join(batch).lower()
+        started = time.perf_counter()
+        legacy = legacy_smart_term_matching(manager, text, "en", "zh-CN")
+        legacy_seconds += time.perf_counter() - started
+        started = time.perf_counter()
+        compiled = manager._smart_term_matching(text, "en", "zh-CN")
+        compiled_seconds += time.perf_counter() - started
+        if legacy != compiled:
+            raise AssertionError("Compiled glossary matcher diverged from the legacy scan")
+
+    return {
+        "entries": entry_count,
+        "batches": batch_count,
+        "compile_seconds": round(compile_seconds, 4),
+        "legacy_ms_per_batch": round(legacy_seconds / batch_count * 1000, 2),
+        "compiled_ms_per_batch": round(compiled_seconds / batch_count * 1000, 2),
+        "speedup": round(legacy_seconds / compiled_seconds, 1) if compiled_seconds else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20000)
+    parser.add_argument("--batches", type=int, default=5)
+    parser.add_argument("--lines-per-batch", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    result = run_benchmark(args.entries, args.batches, args.lines_per_batch, args.seed)
+    for key, value in result.items():
+        print(f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+"""Measure how often a mod's .yml files are parsed with and without the shared document cache.
+
+Writes a synthetic mod (5,000 files by default) to a temporary directory and runs the
+consumers of one translation workflow over it: the incremental snapshot, QuoteExtractor
+discovery, post-processing validation and the workshop issue export. "before" clears the
+document cache between consumers, so every consumer parses every file again as it did
+before the cache existed; "after" lets them share one parse per file. The legacy
+line-by-line parser is kept here to check that the document model returns the same entries.
+
+    python scripts/developer_tools/benchmark_loc_parser.py --files 5000 --entries 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+if str(REPOSITORY_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+
+from scripts.core.loc_parser import ENTRY_RE, loc_document_cache, parse_loc_file, parse_loc_file_with_lines, unescape_value
+from scripts.core.services.incremental_snapshot_service import IncrementalSnapshotService
+from scripts.utils import read_text_bom, write_text_bom
+from scripts.utils.quote_extractor import QuoteExtractor
+
+WORDS = ["empire", "fleet", "gains", "opinion", "trade", "$COUNTRY$", "[GetName]", "§Y", "§!", "war", "\\\"quoted\\\""]
+
+
+def write_mod(root: Path, file_count: int, entries_per_file: int, seed: int) -> List[Path]:
+    rng = random.Random(seed)
+    folder = root / "localization" / "english"
+    folder.mkdir(parents=True)
+    paths = []
+    for file_index in range(file_count):
+        rows = ["l_english:"]
+        for entry_index in range(entries_per_file):
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 16)))
+            rows.append(f' bench_{file_index}_{entry_index}:0 "{text}"')
+            if rng.random() < 0.05:
+                rows.append(" # comment line")
+        path = folder / f"bench_{file_index}_l_english.yml"
+        write_text_bom(path, "\n".join(rows) + "\n")
+        paths.append(path)
+    return paths
+
+
+def legacy_parse_loc_file_with_lines(path: Path) -> list:
+    """The per-call splitlines parser that ``LocDocument`` replaced, kept for comparison."""
+    entries = []
+    for index, line in enumerate(read_text_bom(path).splitlines()):
+        match = ENTRY_RE.match(line)
+        if not match:
+            continue
+        base_key, version, raw_value = match.groups()
+        value = unescape_value(raw_value)
+        full_key = f"{base_key.strip()}:{version.strip()}" if version.strip() else base_key.strip()
+        if full_key == value or not value:
+            continue
+        if value.startswith('$') and value.endswith('$') and value.count('$') == 2:
+            continue
+        entries.append((full_key, value, index + 1))
+    return entries
+
+
+def run_consumers(root: Path, paths: List[Path], share_documents: bool) -> float:
+    def boundary():
+        if not share_documents:
+            loc_document_cache.clear()
+
+    loc_document_cache.clear()
+    started = time.perf_counter()
+    IncrementalSnapshotService().build_snapshot(str(root), {"name_en": "English"})
+    boundary()
+    for path in paths:
+        QuoteExtractor.extract_from_file(str(path))
+    boundary()
+    for path in paths:
+        parse_loc_file_with_lines(path)  # post-processing validation of the source
+    boundary()
+    for path in paths:
+        parse_loc_file(path)  # workshop issue export source lookup
+    return time.perf_counter() - started
+
+
+def run_benchmark(file_count: int, entries_per_file: int, seed: int) -> Dict:
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        paths = write_mod(root, file_count, entries_per_file, seed)
+        for path in paths[:50]:
+            if legacy_parse_loc_file_with_lines(path) != parse_loc_file_with_lines(path):
+                raise AssertionError(f"Document parser diverged from the legacy parser for {path.name}")
+
+        loc_document_cache.hits = loc_document_cache.misses = 0
+        before = run_consumers(root, paths, share_documents=False)
+        before_parses = loc_document_cache.misses
+        loc_document_cache.hits = loc_document_cache.misses = 0
+        after = run_consumers(root, paths, share_documents=True)
+
+    return {
+        "files": file_count,
+        "entries_per_file": entries_per_file,
+        "before_seconds": round(before, 3),
+        "after_seconds": round(after, 3),
+        "before_parses": before_parses,
+        "after_parses": loc_document_cache.misses,
+        "speedup": round(before / after, 2) if after else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--entries", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # QuoteExtractor logs every parsed file
+    result = run_benchmark(args.files, args.entries, args.seed)
+    for key, value in result.items():
+        print(f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
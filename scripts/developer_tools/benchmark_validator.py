@@ -0,0 +1,131 @@
+"""Measure post-processing validation throughput before and after the compiled rule engine.
+
+Builds a synthetic localisation file (40,000 entries by default) of source/translation
+pairs with variables, scopes, colour codes and formatting tags, a few percent of them
+broken, and validates it for each game. "before" replays the per-entry path the engine
+used to take: every check looks its regex up through the ``re`` module cache, tag
+whitelists are lower-cased per line and every message is formatted through i18n as soon
+as an issue is found, one ``validate_entry`` call per entry. "after" validates the whole
+file with ``validate_many`` on the rules compiled once per game and formats messages only
+when they are read. Both runs must report the same issues, messages and details.
+
+    python scripts/developer_tools/benchmark_validator.py --entries 40000 --games victoria3 stellaris
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+if str(REPOSITORY_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+
+from scripts.utils.post_process_validator import BaseGameValidator, PostProcessValidator, _i18n_message
+
+SOURCE_WORDS = ["empire", "fleet", "gains", "opinion", "trade", "war", "$COUNTRY$", "$VALUE|0$", "[GetName]", "[ROOT.GetName]", "#bold", "#!", "§Y", "§!"]
+TARGET_WORDS = ["帝国", "舰队", "获得", "好感", "贸易", "战争"]
+BROKEN = ["$国家$", "#粗体", "[获取名称]", "§Y", "#unknown_tag", "，"]
+
+
+class UncompiledPatterns(dict):
+    def __missing__(self, pattern: str):
+        return re.compile(pattern)  # the re module cache lookup every per-call re.finditer paid
+
+
+class LegacyGameValidator(BaseGameValidator):
+    """The same rules run the way the engine did before they were compiled."""
+
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        self.patterns = UncompiledPatterns()
+        self._static_tags = {}
+
+    def _deferred(self, message_key: str, fallback=None, **kwargs) -> str:
+        message = _i18n_message(message_key, **kwargs)
+        return fallback if fallback is not None and message == message_key else message
+
+
+def build_entries(entry_count: int, seed: int) -> List[Tuple[str, str, int, str]]:
+    rng = random.Random(seed)
+    entries = []
+    for index in range(entry_count):
+        source_tokens = [rng.choice(SOURCE_WORDS) for _ in range(rng.randint(3, 14))]
+        target_tokens = [token if token[0] in "$[#§" else rng.choice(TARGET_WORDS) for token in source_tokens]
+        if rng.random() < 0.05:
+            target_tokens[rng.randrange(len(target_tokens))] = rng.choice(BROKEN)
+        entries.append((f"bench_entry_{index}", " ".join(target_tokens), index + 1, " ".join(source_tokens)))
+    return entries
+
+
+def _issue_rows(results_per_entry: Sequence[Sequence]) -> List[Tuple]:
+    return [
+        (result.line_number, result.code, result.message, result.details)
+        for results in results_per_entry
+        for result in results
+    ]
+
+
+def run_benchmark(entry_count: int, games: Sequence[str], seed: int) -> Dict:
+    entries = build_entries(entry_count, seed)
+    source_lang = {"code": "en"}
+    validator = PostProcessValidator()
+    legacy = PostProcessValidator()
+    legacy.validators = {}
+    legacy.validators_by_id_str = {
+        game_id: LegacyGameValidator(validator.get_validator_by_game_id(game_id).config) for game_id in games
+    }
+
+    before = after = 0.0
+    issue_count = 0
+    for game_id in games:
+        started = time.perf_counter()
+        legacy_results = [
+            legacy.validate_entry(game_id, key, value, line_number, source_lang, source_value=source_value, target_lang="zh-CN")
+            for key, value, line_number, source_value in entries
+        ]
+        before += time.perf_counter() - started
+
+        started = time.perf_counter()
+        compiled_results = validator.validate_many(game_id, entries, source_lang, target_lang="zh-CN")
+        after += time.perf_counter() - started
+
+        legacy_rows, compiled_rows = _issue_rows(legacy_results), _issue_rows(compiled_results)
+        if legacy_rows != compiled_rows:
+            raise AssertionError(f"Compiled rules reported different issues than the legacy path for {game_id}")
+        issue_count += len(compiled_rows)
+
+    validated = entry_count * len(games)
+    return {
+        "entries": entry_count,
+        "games": ",".join(games),
+        "issues": issue_count,
+        "before_seconds": round(before, 3),
+        "after_seconds": round(after, 3),
+        "before_entries_per_second": round(validated / before) if before else None,
+        "after_entries_per_second": round(validated / after) if after else None,
+        "speedup": round(before / after, 2) if after else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=40000)
+    parser.add_argument("--games", nargs="+", default=["victoria3", "stellaris"])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)  # every issue is logged at warning or error level
+    result = run_benchmark(args.entries, args.games, args.seed)
+    for key, value in result.items():
+        print(f"{key}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -73,11 +73,12 @@ export default function TaskHistoryPage() {
   const [selectedDate, setSelectedDate] = useState(today);
   const [tasks, setTasks] = useState([]);
   const [totalCount, setTotalCount] = useState(0);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
   const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState('');
 
-  const loadTasks = useCallback(async (offset = 0, append = false) => {
+  const loadTasks = useCallback(async (cursor = null, append = false) => {
     if (append) setLoadingMore(true);
     else setLoading(true);
     try {
@@ -87,13 +88,14 @@ export default function TaskHistoryPage() {
           include_archived: true,
           from_time: fromTime,
           to_time: toTime,
-          offset,
+          ...(cursor ? { cursor } : { offset: 0 }),
           limit: PAGE_SIZE,
         },
       });
       const nextTasks = Array.isArray(response.data?.tasks) ? response.data.tasks : [];
       setTasks((current) => (append ? [...current, ...nextTasks] : nextTasks));
       setTotalCount(Number(response.data?.total_count || 0));
+      setNextCursor(response.data?.next_cursor || null);
       setError('');
     } catch (loadError) {
       setError(loadError.response?.data?.detail || loadError.message || t('task_history.load_error'));
@@ -228,8 +230,8 @@ export default function TaskHistoryPage() {
                 </Card>
               );
             })}
-            {tasks.length < totalCount && (
-              <Button variant="light" loading={loadingMore} onClick={() => loadTasks(tasks.length, true)}>
+            {nextCursor && (
+              <Button variant="light" loading={loadingMore} onClick={() => loadTasks(nextCursor, true)}>
                 {t('task_history.load_more')}
               </Button>
             )}
@@ -38,7 +38,15 @@ export const projectService = {
      */
     checkArchive: (projectId) => api.get(`/api/project/${projectId}/check-archive`),
 
-    getProjectValidationStatus: (projectId) => api.get(`/api/project/${projectId}/validation-status`),
+    /**
+     * Retrieve validation issue counts; pass includeIssues to also load the issue list.
+     * @param {string} projectId Project ID
+     * @param {boolean} includeIssues Whether to include the issue payload
+     * @returns {Promise} Axios response promise
+     */
+    getProjectValidationStatus: (projectId, includeIssues = false) => api.get(
+        `/api/project/${projectId}/validation-status${includeIssues ? '' : '?include_issues=false'}`
+    ),
 
     /**
      * Retrieve status and progress of a background task.
@@ -1155,7 +1155,7 @@ async def _run_fix_batch(request: FixBatchRequest) -> FixBatchResponse:
     
     final_results = []
     
-    if project:
+    with ValidationLogger.batch(project['source_path']):  # one sidecar export for the whole batch
         for res in batch_result.get("results", []):
             if res.get('status') == 'SUCCESS':
                 original_issue = next(
@@ -295,6 +295,25 @@ def test_provider_connection(payload: TestProviderConnectionRequest):
 
     return {"status": "success", "provider": provider_name, "api_url": api_url}
 
+@router.get("/api/config/rate-limits")
+def get_rate_limit_metrics():
+    """Returns fill level, waits and 429 counts of every provider/model rate-limit bucket."""
+    from scripts.utils.rate_limiter import rate_limiter
+    return {"default_rpm": rate_limiter.rpm, "buckets": rate_limiter.metrics()}
+
+@router.get("/api/config/translation-memory")
+def get_translation_memory_summary():
+    """Returns whether the translation memory is used by new runs and how many entries it holds."""
+    from scripts.core.translation_memory import resolve_translation_memory, translation_memory
+    return {"enabled": resolve_translation_memory() is not None, **translation_memory.summary()}
+
+@router.delete("/api/config/translation-memory")
+def invalidate_translation_memory(source_lang: str = None, target_lang: str = None, game_id: str = None):
+    """Drops remembered translations, optionally only for one language pair and/or game."""
+    from scripts.core.translation_memory import translation_memory
+    removed = translation_memory.invalidate(source_lang=source_lang, target_lang=target_lang, game_id=game_id)
+    return {"status": "success", "removed": removed}
+
 @router.post("/api/config/rpm")
 def update_rpm_limit(payload: dict):
     """Updates the global RPM limit."""
@@ -425,3 +425,10 @@ async def unbind_project_neologism_glossary(project_id: str):
 def get_mining_status(project_id: str):
     """Return the latest neologism mining status for a project."""
     return neologism_manager.get_mining_status(project_id)
+
+@router.post("/api/neologisms/status/{project_id}/cancel")
+def cancel_mining(project_id: str):
+    """Cancel the active neologism mining run; queued LLM calls are not sent."""
+    if not neologism_manager.cancel_mining(project_id):
+        raise HTTPException(status_code=409, detail="No neologism mining run is active for this project")
+    return {"status": "cancelling"}
@@ -369,19 +369,27 @@ async def check_project_archive(project_id: str):
 
 
 @router.get("/api/project/{project_id}/validation-status")
-async def get_project_validation_status(project_id: str, sidecar_path: Optional[str] = None):
+async def get_project_validation_status(
+    project_id: str,
+    sidecar_path: Optional[str] = None,
+    include_issues: bool = True,
+):
+    """``include_issues=false`` returns only the counts, for dashboards that poll while the workshop runs."""
     project = await project_manager.get_project(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
     project_root = project["source_path"]
-    sidecar_status = validation_sidecars.load_status(project_root, sidecar_path)
+    sidecar_status = validation_sidecars.load_status(project_root, sidecar_path, include_issues=include_issues)
     if sidecar_status:
-        project_files = await project_manager.get_project_files(project_id)
-        active_issues = validation_sidecars.attach_project_file_ids(
-            sidecar_status["issues"],
-            project_files,
-        )
+        active_issues = []
+        if include_issues:
+            project_files = await project_manager.get_project_files(project_id)
+            active_issues = validation_sidecars.attach_project_file_ids(
+                sidecar_status["issues"],
+                project_files,
+            )
+        issues_count = sidecar_status["issue_count"]
         counts = sidecar_status["issue_type_counts"]
         selected_sidecar_path = sidecar_status["sidecar_path"]
         last_updated_at = sidecar_status["last_updated_at"]
@@ -389,6 +397,7 @@ async def get_project_validation_status(project_id: str, sidecar_path: Optional[
         sidecar_scope = sidecar_status["sidecar_scope"]
     else:
         active_issues = []
+        issues_count = 0
         counts = {}
         selected_sidecar_path = str(ValidationLogger._get_log_path(project_root))
         last_updated_at = None
@@ -405,7 +414,7 @@ async def get_project_validation_status(project_id: str, sidecar_path: Optional[
 
     return {
         "project_id": project_id,
-        "issues_count": len(active_issues),
+        "issues_count": issues_count,
         "issues": active_issues,
         "issue_type_counts": counts,
         "last_updated_at": last_updated_at,
@@ -20,6 +20,28 @@ async def get_proofread_revision(project_id: str, file_id: str):
             detail={"code": exc.code, "message": exc.message},
         ) from exc
 
+@router.get("/api/proofread/{project_id}/{file_id}/window")
+async def get_proofread_window(
+    project_id: str,
+    file_id: str,
+    start: int = 0,
+    count: int = 200,
+    by: str = "row",
+    include_content: bool = False,
+):
+    """
+    获取校对数据的一个窗口（按行或按条目），附带总数；完整内容仅在 include_content 时返回
+    """
+    try:
+        return await proofreading_service.get_proofread_window(
+            project_id, file_id, start=start, count=count, by=by, include_content=include_content
+        )
+    except ProofreadingDataError as exc:
+        raise HTTPException(
+            status_code=exc.status_code,
+            detail={"code": exc.code, "message": exc.message},
+        ) from exc
+
 @router.get("/api/proofread/{project_id}/{file_id}")
 async def get_proofread_data(project_id: str, file_id: str):
     """
@@ -138,11 +138,13 @@ async def reset_database():
             await db_manager._async_engine.dispose()
             delattr(db_manager, "_async_engine")
 
-        _remove_sqlite_family(REMIS_DB_PATH)
-        initialize_database()
         from scripts.core.repositories.task_repository import TaskRepository
         from scripts.shared import task_state
 
+        # Close the task ledger's pooled connection before its files are deleted.
+        task_state.configure_repository(None)
+        _remove_sqlite_family(REMIS_DB_PATH)
+        initialize_database()
         task_state.configure_repository(
             TaskRepository(REMIS_DB_PATH),
             hydrate=True,
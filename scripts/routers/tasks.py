@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import PlainTextResponse
 
 from scripts.core.agent_service import agent_registry
+from scripts.core.repositories.task_repository import TaskRepository
 from scripts.schemas.tasks import TaskCheckpoint, TaskChildAggregate, TaskCreator, TaskDetail, TaskEvent, TaskProjectContext, TaskResult, TaskSummary, TaskSummaryList
 from scripts.shared import task_state
 from scripts.shared.services import project_manager
@@ -236,6 +237,13 @@ def _iso_utc(value: Optional[datetime]) -> Optional[str]:
     return normalized.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _fallback_cursor_offset(cursor: str) -> int:
+    try:
+        return max(0, int(TaskRepository.decode_page_cursor(cursor, "offset")[0]))
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from None
+
+
 def _persisted_task_page(
     *,
     jobs: Dict[str, Dict[str, Any]],
@@ -248,6 +256,7 @@ def _persisted_task_page(
     to_time: Optional[datetime],
     offset: int,
     limit: int,
+    cursor: Optional[str],
 ) -> Optional[TaskSummaryList]:
     repository = task_state.get_repository()
     if repository is None:
@@ -272,16 +281,22 @@ def _persisted_task_page(
         if normalized_statuses is not None
         else None
     )
-    page = repository.query_task_page(
-        include_archived=include_archived,
-        include_children=include_children,
-        statuses=raw_statuses,
-        kind=kind,
-        from_time=_iso_utc(from_time),
-        to_time=_iso_utc(to_time),
-        offset=offset,
-        limit=limit,
-    )
+    # Coalesced progress must reach the ledger before it is paged from SQLite.
+    task_state.flush_pending_writes()
+    try:
+        page = repository.query_task_page(
+            include_archived=include_archived,
+            include_children=include_children,
+            statuses=raw_statuses,
+            kind=kind,
+            from_time=_iso_utc(from_time),
+            to_time=_iso_utc(to_time),
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from None
     summaries = [
         _from_live_task(task, jobs.get(str(task.get("task_id") or "")))
         for task in page["tasks"]
@@ -291,6 +306,7 @@ def _persisted_task_page(
         active_count=page["active_count"],
         attention_count=page["attention_count"],
         total_count=page["total_count"],
+        next_cursor=page["next_cursor"],
     )
 
 
@@ -355,6 +371,7 @@ async def list_task_summaries(
     to_time: Annotated[Optional[datetime], Query()] = None,
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: Annotated[Optional[str], Query(max_length=512)] = None,
 ):
     normalized_status = _status(status) if status else None
     jobs = {
@@ -374,6 +391,7 @@ async def list_task_summaries(
             to_time=to_time,
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
         if persisted_page is not None:
             await _enrich_project_context(persisted_page.tasks)
@@ -407,12 +425,21 @@ async def list_task_summaries(
         ]
         summaries.sort(key=lambda item: item.created_at or item.started_at or "", reverse=True)
     total_count = len(summaries)
+    if cursor:
+        # The in-memory fallback pages by position; its cursors are only valid here.
+        offset = _fallback_cursor_offset(cursor)
+    next_cursor = (
+        TaskRepository.encode_page_cursor("offset", str(offset + limit), "")
+        if offset + limit < total_count
+        else None
+    )
     summaries = summaries[offset:offset + limit]
     return TaskSummaryList(
         tasks=summaries,
         active_count=active_count,
         attention_count=attention_count,
         total_count=total_count,
+        next_cursor=next_cursor,
     )
 
 
@@ -425,6 +452,12 @@ def _raw_task_and_job(task_id: str) -> tuple[Optional[Dict[str, Any]], Optional[
     return task, job
 
 
+@router.get("/metrics")
+async def get_task_write_metrics() -> Dict[str, Any]:
+    """Write-behind counters: task updates received, ledger writes made and updates coalesced."""
+    return task_state.get_write_metrics()
+
+
 @router.get("/{task_id}", response_model=TaskDetail)
 async def get_task_detail(
     task_id: str,
@@ -35,6 +35,18 @@ def _resolve_target_languages(target_lang_codes: List[str]):
     return resolved
 
 
+def _resolve_game_profile(game_profile_id: str) -> Optional[dict]:
+    normalized_game_id = game_profile_id
+    if game_profile_id == 'vic3':
+        normalized_game_id = 'victoria3'
+        logging.info(f"Normalized game_id 'vic3' to '{normalized_game_id}'")
+
+    game_profile = GAME_PROFILES.get(normalized_game_id)
+    if not game_profile:
+        game_profile = next((p for p in GAME_PROFILES.values() if p['id'] == normalized_game_id), None)
+    return game_profile
+
+
 def _resolve_requested_target_languages(target_lang_codes: List[str], custom_lang_config: Optional[CustomLangConfig] = None) -> List[dict]:
     if custom_lang_config:
         return [custom_lang_config.model_dump()]
@@ -178,6 +190,7 @@ def run_translation_workflow_v2(
     concurrency_limit: Optional[int] = None,
     rpm_limit: Optional[int] = 40,
     embedded_workshop: Optional[dict] = None,
+    parallel_languages: bool = False,
 ):
     i18n.load_language('en_US')
     task_state.update_task(
@@ -249,15 +262,7 @@ def run_translation_workflow_v2(
         logging.info(f"Starting V2 Workflow for Task {task_id}")
         logging.info(f"Params: game_profile_id={game_profile_id}, source={source_lang_code}, targets={target_lang_codes}")
 
-        normalized_game_id = game_profile_id
-        if game_profile_id == 'vic3':
-            normalized_game_id = 'victoria3'
-            logging.info(f"Normalized game_id 'vic3' to '{normalized_game_id}'")
-
-        game_profile = GAME_PROFILES.get(normalized_game_id)
-        if not game_profile:
-            game_profile = next((p for p in GAME_PROFILES.values() if p['id'] == normalized_game_id), None)
-
+        game_profile = _resolve_game_profile(game_profile_id)
         source_lang = next((lang for lang in LANGUAGES.values() if lang["code"] == source_lang_code), None)
         target_languages = _resolve_target_languages(target_lang_codes)
 
@@ -322,7 +327,8 @@ def run_translation_workflow_v2(
             override_path=override_path, project_id=project_id, use_resume=use_resume,
             clean_source=clean_source, batch_size_limit=batch_size_limit,
             concurrency_limit=concurrency_limit, rpm_limit=rpm_limit,
-            embedded_workshop=embedded_workshop
+            embedded_workshop=embedded_workshop,
+            parallel_languages=parallel_languages,
         )
         logging.info("Returned from initial_translate.run")
         task_state.update_task(
@@ -447,6 +453,7 @@ async def start_translation_project(request: InitialTranslationRequest, backgrou
         concurrency_limit=request.concurrency_limit,
         rpm_limit=request.rpm_limit,
         embedded_workshop=request.embedded_workshop.model_dump() if request.embedded_workshop else None,
+        parallel_languages=request.parallel_languages,
     )
 
     # Auto-register translation path (Optimistic registration)
@@ -84,6 +84,7 @@ class TaskSummaryList(BaseModel):
     active_count: int = 0
     attention_count: int = 0
     total_count: int = 0
+    next_cursor: Optional[str] = None
 
 
 class TaskEvent(BaseModel):
@@ -44,6 +44,7 @@ class InitialTranslationRequest(BaseModel):
     batch_size_limit: Optional[int] = None
     concurrency_limit: Optional[int] = None
     rpm_limit: Optional[int] = 40
+    parallel_languages: bool = False
     mod_context: Optional[str] = ""
     selected_glossary_ids: Optional[List[int]] = []
     use_main_glossary: bool = True
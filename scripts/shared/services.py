@@ -11,6 +11,7 @@ from scripts.core.archive_manager import ArchiveManager
 from scripts.core.repositories.project_repository import ProjectRepository
 from scripts.core.repositories.project_watch_repository import ProjectWatchRepository
 from scripts.core.repositories.model_arena_repository import ModelArenaRepository
+from scripts.core.services.model_arena_execution_service import ModelArenaExecutionService
 from scripts.core.services.model_arena_service import ModelArenaService
 from scripts.core.services.project_watch_service import ProjectWatchService
 
@@ -45,6 +46,10 @@ model_arena_service = ModelArenaService(
     repository=model_arena_repository,
     project_manager=project_manager,
     glossary_manager=glossary_manager,
+    executor=ModelArenaExecutionService(
+        max_parallel_contestants=app_settings.MODEL_ARENA_PARALLEL_CONTESTANTS,
+        contestant_timeout=app_settings.MODEL_ARENA_CONTESTANT_TIMEOUT,
+    ),
 )
 
 proofreading_service = ProofreadingService(
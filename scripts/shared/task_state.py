@@ -1,6 +1,9 @@
+import atexit
 import logging
+import os
 import sqlite3
 import threading
+import time
 from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Optional
@@ -27,9 +30,31 @@ ACTIVE_TASK_STATUSES = {
     "waiting_approval",
 }
 TERMINAL_TASK_STATUSES = {"completed", "complete", "success", "failed", "partial_failed", "cancelled", "canceled", "interrupted"}
+# Progress-only updates of one task are persisted and pushed at most once per interval (write-behind).
+# Status changes and terminal states are always written immediately; 0 disables coalescing.
+try:
+    TASK_PROGRESS_FLUSH_SECONDS = max(0.0, float(os.getenv("REMIS_TASK_PROGRESS_FLUSH_SECONDS", "1.0")))
+except ValueError:
+    TASK_PROGRESS_FLUSH_SECONDS = 1.0
 _repository: Optional[TaskRepository] = None
 
 
+class _PendingTaskWrite:
+    """Events, push request and flush timer of a task whose latest state is not persisted yet."""
+
+    __slots__ = ("events", "push", "timer")
+
+    def __init__(self):
+        self.events: list[Dict[str, Any]] = []
+        self.push = False
+        self.timer: Optional[threading.Timer] = None
+
+
+_PENDING_WRITES: Dict[str, _PendingTaskWrite] = {}
+_LAST_WRITE_AT: Dict[str, float] = {}
+_WRITE_METRICS = {"updates": 0, "writes": 0, "coalesced_writes": 0, "pushes": 0, "coalesced_pushes": 0}
+
+
 class DuplicateTaskError(RuntimeError):
     def __init__(self, existing_task: Dict[str, Any]):
         self.existing_task = deepcopy(existing_task)
@@ -103,10 +128,17 @@ def configure_repository(
     hydrate: bool = False,
     replace: bool = False,
 ) -> None:
-    """Attach the persistent ledger after database initialization."""
+    """
+    Attach the persistent ledger after database initialization. Coalesced progress is written
+    to the previous ledger first, and its pooled connection is closed when it is replaced.
+    """
     global _repository
+    flush_pending_writes()
     with _LOCK:
+        previous = _repository
         _repository = repository
+        if previous is not None and previous is not repository:
+            previous.close()
         if not hydrate or repository is None:
             return
         try:
@@ -225,6 +257,31 @@ def _event_level(status: Optional[str], message: Optional[str]) -> str:
     return "info"
 
 
+def _build_event(
+    task: Dict[str, Any],
+    event_message: Optional[str],
+    event_type: str,
+    event_audience: str,
+    event_level: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    if not event_message:
+        return None
+    return {
+        "timestamp": task.get("updated_at") or _utc_now_iso(),
+        "level": event_level or _event_level(task.get("status"), event_message),
+        "event_type": event_type,
+        "audience": event_audience,
+        "message": event_message,
+    }
+
+
+def _take_pending_write(task_id: str) -> Optional[_PendingTaskWrite]:
+    pending = _PENDING_WRITES.pop(task_id, None)
+    if pending is not None and pending.timer is not None:
+        pending.timer.cancel()
+    return pending
+
+
 def _persist_task(
     task: Dict[str, Any],
     *,
@@ -232,22 +289,86 @@ def _persist_task(
     event_type: str = "log",
     event_audience: str = "user",
     event_level: Optional[str] = None,
-) -> None:
-    if _repository is None:
-        return
-    try:
-        event = None
-        if event_message:
-            event = {
-                "timestamp": task.get("updated_at") or _utc_now_iso(),
-                "level": event_level or _event_level(task.get("status"), event_message),
-                "event_type": event_type,
-                "audience": event_audience,
-                "message": event_message,
-            }
-        _repository.save_task(task, event=event)
-    except (OSError, sqlite3.Error, ValueError, KeyError) as exc:
-        logging.error("Failed to persist task %s: %s", task.get("task_id"), exc)
+    event: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """Write the task with any coalesced events first; returns whether a coalesced push is owed."""
+    task_id = str(task.get("task_id"))
+    pending = _take_pending_write(task_id)
+    if str(task.get("status") or "").lower() in TERMINAL_TASK_STATUSES:
+        _LAST_WRITE_AT.pop(task_id, None)
+    else:
+        _LAST_WRITE_AT[task_id] = time.monotonic()
+    if _repository is not None:
+        _WRITE_METRICS["writes"] += 1
+        try:
+            _repository.save_task(
+                task,
+                event=event or _build_event(task, event_message, event_type, event_audience, event_level),
+                events=pending.events if pending else (),
+            )
+        except (OSError, sqlite3.Error, ValueError, KeyError) as exc:
+            logging.error("Failed to persist task %s: %s", task.get("task_id"), exc)
+    return bool(pending and pending.push)
+
+
+def _defer_task_write(task: Dict[str, Any], event: Optional[Dict[str, Any]], push: bool) -> bool:
+    """Coalesce a progress-only update when the task was written less than an interval ago."""
+    task_id = str(task.get("task_id"))
+    last_write = _LAST_WRITE_AT.get(task_id)
+    if TASK_PROGRESS_FLUSH_SECONDS <= 0 or last_write is None:
+        return False
+    remaining = TASK_PROGRESS_FLUSH_SECONDS - (time.monotonic() - last_write)
+    if remaining <= 0:
+        return False
+    pending = _PENDING_WRITES.get(task_id)
+    if pending is None:
+        pending = _PENDING_WRITES[task_id] = _PendingTaskWrite()
+        pending.timer = threading.Timer(remaining, _flush_pending_write, args=(task_id,))
+        pending.timer.daemon = True
+        pending.timer.start()
+    if event is not None:
+        pending.events.append(event)
+    pending.push = pending.push or push
+    _WRITE_METRICS["coalesced_writes"] += 1
+    if push:
+        _WRITE_METRICS["coalesced_pushes"] += 1
+    return True
+
+
+def _flush_pending_write(task_id: str) -> None:
+    with _LOCK:
+        task = tasks.get(task_id)
+        if task is None or task_id not in _PENDING_WRITES:
+            _take_pending_write(task_id)
+            return
+        push = _persist_task(task)
+        snapshot = deepcopy(task)
+    _notify_task_update_listeners(task_id, snapshot)
+    if push:
+        push_task_update(task_id)
+
+
+def flush_pending_writes(task_id: Optional[str] = None) -> None:
+    """Persist coalesced progress now, for one task or all of them (e.g. before reading the ledger)."""
+    with _LOCK:
+        task_ids = [task_id] if task_id is not None else list(_PENDING_WRITES)
+    for pending_task_id in task_ids:
+        if pending_task_id in _PENDING_WRITES:
+            _flush_pending_write(pending_task_id)
+
+
+# Timer threads are daemons: write the last coalesced window before the interpreter exits.
+atexit.register(flush_pending_writes)
+
+
+def get_write_metrics() -> Dict[str, Any]:
+    """Counters of the write-behind layer: how many task updates were coalesced instead of written."""
+    with _LOCK:
+        return {
+            **_WRITE_METRICS,
+            "pending_tasks": len(_PENDING_WRITES),
+            "flush_interval_seconds": TASK_PROGRESS_FLUSH_SECONDS,
+        }
 
 
 def register_task_update_listener(
@@ -364,7 +485,13 @@ def update_task(
     clear_result_path: bool = False,
     push: bool = True,
     event_audience: str = "user",
-) -> Dict[str, Any]:
+    snapshot: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Apply an update and return a detached copy of the task. A caller that ignores the result
+    passes ``snapshot=False``: a coalesced update then returns None without copying the task,
+    which is only copied when the window is flushed.
+    """
     with _LOCK:
         task = _ensure_task(task_id)
         if status is not None:
@@ -392,12 +519,20 @@ def update_task(
         task["updated_at"] = now
         if event_audience == "user":
             _append_log(task, append_log)
-        _persist_task(
-            task,
-            event_message=append_log or message,
-            event_type="status_changed" if status is not None else "log",
-            event_audience=event_audience,
+        _WRITE_METRICS["updates"] += 1
+        event = _build_event(task, append_log or message, "status_changed" if status is not None else "log", event_audience)
+        urgent = (
+            status is not None
+            or message is not None
+            or result_path is not None
+            or clear_result_path
+            or normalized_status in TERMINAL_TASK_STATUSES
         )
+        if not urgent and _defer_task_write(task, event, push):
+            return deepcopy(task) if snapshot else None
+        push = _persist_task(task, event=event) or push
+        if push:
+            _WRITE_METRICS["pushes"] += 1
         snapshot = deepcopy(task)
     _notify_task_update_listeners(task_id, snapshot)
     if push:
@@ -425,7 +560,8 @@ def update_progress(
     push: bool = False,
     event_audience: str = "user",
     fields: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
+) -> Optional[Dict[str, Any]]:
+    """Progress is the chattiest update, so a coalesced one returns None instead of a task copy."""
     progress_updates: Dict[str, Any] = {}
     if current is not None:
         progress_updates["current"] = current
@@ -464,6 +600,7 @@ def update_progress(
         push=push,
         event_audience=event_audience,
         fields=fields,
+        snapshot=False,
     )
 
 
@@ -484,21 +621,17 @@ def append_task_event(
         task["updated_at"] = _utc_now_iso()
         if audience == "user":
             _append_log(task, message)
-        if _repository is not None:
-            try:
-                _repository.save_task(
-                    task,
-                    event={
-                        "timestamp": task["updated_at"],
-                        "level": level,
-                        "event_type": event_type,
-                        "audience": audience,
-                        "message": message,
-                        "metadata": metadata or {},
-                    },
-                )
-            except (OSError, sqlite3.Error, ValueError, KeyError) as exc:
-                logging.error("Failed to append task event %s: %s", task_id, exc)
+        push = _persist_task(
+            task,
+            event={
+                "timestamp": task["updated_at"],
+                "level": level,
+                "event_type": event_type,
+                "audience": audience,
+                "message": message,
+                "metadata": metadata or {},
+            },
+        ) or push
         snapshot = deepcopy(task)
     if push:
         push_task_update(task_id)
@@ -532,6 +665,7 @@ def get_task_events(
     include_diagnostics: bool = False,
 ) -> list[Dict[str, Any]]:
     if _repository is not None:
+        flush_pending_writes(task_id)
         try:
             return _repository.list_events(
                 task_id,
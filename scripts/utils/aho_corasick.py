@@ -0,0 +1,119 @@
+"""Pure-Python Aho-Corasick automaton for multi-pattern substring search.
+
+Glossary matching, glossary validation and neologism evidence collection all
+need to know which of many thousands of terms occur in a piece of text. Running
+one substring or regex scan per term makes those passes scale with the term
+count; an automaton scans the text once and reports every term that ends at each
+position, so the cost follows the text length plus the number of hits.
+"""
+
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+
+class AhoCorasickAutomaton:
+    """Multi-pattern matcher that maps each added pattern to one or more values.
+
+    Patterns are matched verbatim; callers normalise case before adding patterns
+    and before searching. Call ``build`` after the last ``add``.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # (pattern_length, value) pairs for patterns that end exactly at a node.
+        self._outputs: List[List[Tuple[int, Any]]] = [[]]
+        # Nearest proper suffix node that has outputs of its own, or -1.
+        self._output_link: List[int] = [-1]
+        self._built = False
+        self.pattern_count = 0
+
+    def __len__(self) -> int:
+        return self.pattern_count
+
+    def add(self, pattern: str, value: Any) -> None:
+        """Register ``pattern``; empty patterns are ignored."""
+        if not pattern:
+            return
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._output_link.append(-1)
+            node = next_node
+        self._outputs[node].append((len(pattern), value))
+        self.pattern_count += 1
+        self._built = False
+
+    def build(self) -> "AhoCorasickAutomaton":
+        """Compute failure and output links breadth-first."""
+        goto, fail, outputs, output_link = self._goto, self._fail, self._outputs, self._output_link
+        queue = list(goto[0].values())
+        for node in queue:
+            fail[node] = 0
+            output_link[node] = -1
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                candidate = goto[state].get(char, 0)
+                fail[child] = candidate if candidate != child else 0
+                suffix = fail[child]
+                output_link[child] = suffix if outputs[suffix] else output_link[suffix]
+        self._built = True
+        return self
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.build()
+
+    def _walk(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield ``(end_index, node)`` for every position that reaches an output."""
+        goto, fail, outputs, output_link = self._goto, self._fail, self._outputs, self._output_link
+        node = 0
+        for index, char in enumerate(text):
+            transitions = goto[node]
+            while node and char not in transitions:
+                node = fail[node]
+                transitions = goto[node]
+            node = transitions.get(char, 0)
+            if outputs[node] or output_link[node] != -1:
+                yield index, node
+
+    def _node_outputs(self, node: int) -> Iterator[Tuple[int, Any]]:
+        outputs, output_link = self._outputs, self._output_link
+        if not outputs[node]:
+            node = output_link[node]
+        while node != -1:
+            yield from outputs[node]
+            node = output_link[node]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """Yield ``(start, end, value)`` for every occurrence, ``end`` exclusive."""
+        self._ensure_built()
+        for index, node in self._walk(text):
+            end = index + 1
+            for length, value in self._node_outputs(node):
+                yield end - length, end, value
+
+    def find_values(self, text: str) -> Set[Any]:
+        """Return the values of all patterns that occur at least once in ``text``."""
+        self._ensure_built()
+        seen_nodes: Set[int] = set()
+        values: Set[Any] = set()
+        for _, node in self._walk(text):
+            if node in seen_nodes:
+                continue
+            seen_nodes.add(node)
+            for _, value in self._node_outputs(node):
+                values.add(value)
+        return values
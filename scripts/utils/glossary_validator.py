@@ -1,33 +1,125 @@
 # scripts/utils/glossary_validator.py
-import logging
-import re
-from typing import List, Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from scripts.utils import i18n
+from scripts.utils.aho_corasick import AhoCorasickAutomaton
 # Assuming BatchTask is available from scripts.core.parallel_processor
 # We will handle the exact import path later if needed.
 from scripts.core.parallel_types import BatchTask
 
+
+def _is_cjk_lang(lang_code: str) -> bool:
+    return any(lang in (lang_code or "").lower() for lang in ['zh', 'ja', 'ko'])
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _has_word_boundary(text: str, index: int) -> bool:
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+class _TermCounter:
+    """Counts every term of one language in a single pass over the text.
+
+    Equivalent to ``len(re.findall(pattern, text, re.IGNORECASE))`` per term,
+    where the pattern is the escaped term, wrapped in ``\\b`` for non-CJK
+    languages.
+    """
+
+    def __init__(self, terms: List[str], lang_code: str):
+        self.word_bounded = not _is_cjk_lang(lang_code)
+        self.automaton = AhoCorasickAutomaton()
+        for term_index, term in enumerate(terms):
+            self.automaton.add(term.lower(), term_index)
+        self.automaton.build()
+
+    def count(self, text: str) -> Dict[int, int]:
+        counts: Dict[int, int] = {}
+        last_end: Dict[int, int] = {}
+        lowered = text.lower()
+        # Occurrences of one term arrive in start order; keep them non-overlapping like re.findall.
+        for start, end, term_index in self.automaton.iter_matches(lowered):
+            if start < last_end.get(term_index, 0):
+                continue
+            if self.word_bounded and not (_has_word_boundary(lowered, start) and _has_word_boundary(lowered, end)):
+                continue
+            counts[term_index] = counts.get(term_index, 0) + 1
+            last_end[term_index] = end
+        return counts
+
+
+class GlossaryValidationIndex:
+    """
+    Precompiled source/target term counters for one glossary and language pair.
+
+    Built once per (glossary snapshot, language pair) and shared by every batch
+    of a run, so validating a batch costs one pass over the source chunk and one
+    over the translated chunk regardless of the glossary size.
+    """
+
+    def __init__(self, glossary: Dict[str, str], source_lang_code: str, target_lang_code: str):
+        self.glossary = glossary
+        self.source_lang_code = source_lang_code
+        self.target_lang_code = target_lang_code
+        self.terms = list(glossary.items())
+        self._source_counter = _TermCounter([source for source, _ in self.terms], source_lang_code)
+        self._target_counter = _TermCounter([target for _, target in self.terms], target_lang_code)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @classmethod
+    def from_entries(cls, entries: List[Dict[str, Any]], source_lang_code: str, target_lang_code: str) -> "GlossaryValidationIndex":
+        """Build the index from in-memory glossary entries; later entries win for a repeated source term."""
+        simple_glossary = {}
+        if source_lang_code and target_lang_code:
+            for entry in entries:
+                translations = entry.get('translations', {})
+                source_term = translations.get(source_lang_code)
+                target_term = translations.get(target_lang_code)
+                if source_term and target_term and isinstance(source_term, str) and isinstance(target_term, str):
+                    simple_glossary[source_term] = target_term
+        return cls(simple_glossary, source_lang_code, target_lang_code)
+
+    def count_mismatches(self, original_chunk: str, translated_chunk: str) -> List[Tuple[str, str, int, int]]:
+        """Return ``(source_term, target_term, source_count, translated_count)`` for inconsistent terms."""
+        source_counts = self._source_counter.count(original_chunk)
+        if not source_counts:
+            return []
+        translated_counts = self._target_counter.count(translated_chunk)
+        mismatches = []
+        for term_index in sorted(source_counts):
+            source_count = source_counts[term_index]
+            translated_count = translated_counts.get(term_index, 0)
+            if source_count != translated_count:
+                source_term, target_term = self.terms[term_index]
+                mismatches.append((source_term, target_term, source_count, translated_count))
+        return mismatches
+
+
 class GlossaryValidator:
     """
     Validates translation consistency against a glossary.
     """
 
-    def _get_pattern_for_lang(self, term: str, lang_code: str) -> str:
-        """根据语言代码，为术语生成合适的正则表达式模式。"""
-        is_cjk = any(lang in lang_code for lang in ['zh', 'ja', 'ko'])
-        if is_cjk:
-            return re.escape(term)
-        else:
-            return r'\b' + re.escape(term) + r'\b'
-
-    def validate_batch(self, task: BatchTask, glossary: Dict[str, str]) -> List[Dict[str, Any]]:
+    def validate_batch(
+        self,
+        task: BatchTask,
+        glossary: Dict[str, str],
+        index: Optional[GlossaryValidationIndex] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Validates a batch of translations against the glossary.
 
         Args:
             task (BatchTask): The batch task containing original and translated texts.
             glossary (Dict[str, str]): The glossary to validate against.
+            index (GlossaryValidationIndex, optional): A prebuilt index for ``glossary``
+                and the task's language pair. Built on the fly when omitted.
 
         Returns:
             List[Dict[str, Any]]: A list of warnings for inconsistencies.
@@ -42,39 +134,30 @@ class GlossaryValidator:
         file_path = task.file_task.filename
         batch_id = task.batch_index
 
-        target_lang_code = task.file_task.target_lang.get("code", "").lower()
-        source_lang_code = task.file_task.source_lang.get("code", "").lower()
-
-        for source_term, target_term in glossary.items():
-            try:
-                source_pattern = self._get_pattern_for_lang(source_term, source_lang_code)
-                target_pattern = self._get_pattern_for_lang(target_term, target_lang_code)
-
-                source_count = len(re.findall(source_pattern, original_chunk, re.IGNORECASE))
-                translated_count = len(re.findall(target_pattern, translated_chunk, re.IGNORECASE))
-            except re.error as e:
-                logging.warning(f"Skipping glossary term due to regex error: {e}")
-                continue
+        if index is None:
+            target_lang_code = task.file_task.target_lang.get("code", "").lower()
+            source_lang_code = task.file_task.source_lang.get("code", "").lower()
+            index = GlossaryValidationIndex(glossary, source_lang_code, target_lang_code)
 
-            if source_count > 0 and source_count != translated_count:
-                warnings.append({
-                    "level": "warning",
-                    "file_path": file_path,
-                    "batch_id": batch_id,
-                    "source_term": source_term,
-                    "target_term": target_term,
-                    "source_count": source_count,
-                    "translated_count": translated_count,
-                    "message": i18n.t(
-                        "glossary_validator_warning",
-                        file_path=file_path,
-                        batch_id=batch_id + 1,
-                        source_term=source_term,
-                        source_count=source_count,
-                        target_term=target_term,
-                        translated_count=translated_count
-                    )
-                })
+        for source_term, target_term, source_count, translated_count in index.count_mismatches(original_chunk, translated_chunk):
+            warnings.append({
+                "level": "warning",
+                "file_path": file_path,
+                "batch_id": batch_id,
+                "source_term": source_term,
+                "target_term": target_term,
+                "source_count": source_count,
+                "translated_count": translated_count,
+                "message": i18n.t(
+                    "glossary_validator_warning",
+                    file_path=file_path,
+                    batch_id=batch_id + 1,
+                    source_term=source_term,
+                    source_count=source_count,
+                    target_term=target_term,
+                    translated_count=translated_count
+                )
+            })
 
         return warnings
 
@@ -16,11 +16,14 @@
 import re
 import logging
 import importlib.util
+import threading
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Callable
+from typing import Dict, List, Tuple, Optional, Any, Callable, Iterable, Sequence
 from dataclasses import dataclass
 from enum import Enum
 
+from scripts.utils.validation_rule_engine import DeferredMessage, DeferredText, LoweredTags, PatternTable
+
 # 导入国际化支持
 try:
     from . import i18n
@@ -44,15 +47,35 @@ class ValidationResult:
     """验证结果数据类"""
     is_valid: bool
     level: ValidationLevel
-    message: str
+    message: str = DeferredText(required=True)
     code: Optional[str] = None
-    details: Optional[str] = None
+    details: Optional[str] = DeferredText()
     details_code: Optional[str] = None
     details_params: Optional[Dict[str, Any]] = None
     line_number: Optional[int] = None
     text_sample: Optional[str] = None
     key: Optional[str] = None  # Added key field
 
+# 一个待验证条目：(key, value, line_number, source_value)
+ValidationEntry = Tuple[str, str, Optional[int], Optional[str]]
+
+# [FIX] Allow '£' (hex \xa3) character as it is used for icons in PDS games (HOI4, etc.)
+_BANNED_CHARS = re.compile(r'[^\x00-\x7F\xa3]')
+_KEY_VERSION_SUFFIX = re.compile(r":[0-9]+$")
+_VALID_KEY = re.compile(r'^[a-zA-Z0-9_\.\-]+$')
+
+
+def _i18n_message(message_key: str, **kwargs) -> str:
+    """获取国际化消息。如果失败，则直接返回消息键本身。"""
+    if not message_key:
+        return ""
+    try:
+        if i18n and getattr(i18n, '_language_loaded', False):
+            return i18n.t(message_key, **kwargs)
+    except Exception:
+        pass
+    return message_key
+
 
 class BaseGameValidator:
     """
@@ -87,20 +110,30 @@ class BaseGameValidator:
             "variable_parity": self._check_variable_parity,
         }
 
+        # 规则只编译一次：正则、标签白名单、以及每条规则对应的工人方法
+        self.patterns = PatternTable().compile_rules(self.rules)
+        self._static_tags: Dict[int, Tuple[frozenset, frozenset]] = {}
+        self._plan: List[Tuple[Dict, Callable[..., List[ValidationResult]]]] = []
+        for rule in self.rules:
+            checker = self.check_map.get(rule.get("check_function"))
+            if not checker:
+                self.logger.warning(self._get_i18n_message("validator_warning_unknown_check_function", rule_name=rule.get('name', 'N/A'), check_function_name=rule.get("check_function")))
+                continue
+            self._plan.append((rule, checker))
+            if rule.get("check_function") == "formatting_tags":
+                params = rule.get("params", {})
+                self._static_tags[id(rule)] = (LoweredTags.of(params.get("valid_tags", [])), LoweredTags.of(params.get("no_space_required_tags", [])))
 
     def _get_i18n_message(self, message_key: str, **kwargs) -> str:
         """
         获取国际化消息。如果失败，则直接返回消息键本身。
         这样可以消除对 fallback_messages 的依赖。
         """
-        if not message_key:
-            return ""
-        try:
-            if i18n and getattr(i18n, '_language_loaded', False):
-                return i18n.t(message_key, **kwargs)
-        except Exception:
-            pass
-        return message_key
+        return _i18n_message(message_key, **kwargs)
+
+    def _deferred(self, message_key: str, fallback: Optional[str] = None, **kwargs) -> DeferredMessage:
+        """延迟格式化的消息：只有结果被读取时才调用 i18n。"""
+        return DeferredMessage(_i18n_message, message_key, kwargs, fallback)
 
     # --- "工人"检查方法 ---
 
@@ -117,18 +150,17 @@ class BaseGameValidator:
             return results
 
         try:
-            matches = re.finditer(pattern, text)
+            matches = self.patterns[pattern].finditer(text)
             for match in matches:
                 if len(match.groups()) >= capture_group:
                     content_to_check = match.group(capture_group)
-                    # [FIX] Allow '£' (hex \xa3) character as it is used for icons in PDS games (HOI4, etc.)
-                    banned_chars = re.findall(r'[^\x00-\x7F\xa3]', content_to_check)
+                    banned_chars = _BANNED_CHARS.findall(content_to_check)
                     if banned_chars:
                         details_str = "".join(sorted(list(set(banned_chars))))
                         # [FIX] Pass 'key' as content_to_check so i18n strings expecting {key} (like validation_vic3_formatting_tag_key_non_ascii) work.
-                        message = self._get_i18n_message(rule["message_key"], key=content_to_check)
+                        message = self._deferred(rule["message_key"], key=content_to_check)
                         details_key = params.get("details_key", "validation_generic_banned_chars_found")
-                        details = self._get_i18n_message(details_key, match_text=match.group(0), banned_chars=details_str, key_content=content_to_check, found_text=match.group(0))
+                        details = self._deferred(details_key, match_text=match.group(0), banned_chars=details_str, key_content=content_to_check, found_text=match.group(0))
                         results.append(ValidationResult(
                             is_valid=False,
                             level=ValidationLevel(rule["level"]),
@@ -153,31 +185,29 @@ class BaseGameValidator:
         params = rule.get("params", {})
 
         # 核心改造：优先使用动态传入的标签列表
+        static_tags, no_space_required_tags = self._static_tags.get(id(rule)) or (
+            LoweredTags.of(params.get("valid_tags", [])), LoweredTags.of(params.get("no_space_required_tags", []))
+        )
         dynamic_tags = kwargs.get("dynamic_valid_tags")
-        if dynamic_tags is not None:
-            valid_tags = set(tag.lower() for tag in dynamic_tags)
-        else:
-            valid_tags = set(tag.lower() for tag in params.get("valid_tags", []))
-
-        no_space_required_tags = set(tag.lower() for tag in params.get("no_space_required_tags", []))
+        valid_tags = LoweredTags.of(dynamic_tags) if dynamic_tags is not None else static_tags
 
         if not pattern or not valid_tags:
             return results
 
         try:
-            matches = re.finditer(pattern, text)
+            matches = self.patterns[pattern].finditer(text)
             for match in matches:
                 tag_found = match.group(1)
                 normalized_tag = tag_found.lower()
                 if normalized_tag not in valid_tags:
-                    message = self._get_i18n_message(params["unknown_tag_error_key"], key=tag_found)
-                    details = self._get_i18n_message(params["unsupported_formatting_details_key"], found_text=match.group(0))
+                    message = self._deferred(params["unknown_tag_error_key"], key=tag_found)
+                    details = self._deferred(params["unsupported_formatting_details_key"], found_text=match.group(0))
                     results.append(ValidationResult(is_valid=False, level=ValidationLevel(rule["level"]), message=message, code=params.get("unknown_tag_error_key"), details=details, details_code=params["unsupported_formatting_details_key"], details_params={"foundText": match.group(0)}, line_number=line_number, text_sample=text[:100]))
                 elif normalized_tag not in no_space_required_tags:
                     next_char_pos = match.end()
                     if next_char_pos < len(text) and text[next_char_pos] not in (' ', '#', '!', ';'):
-                        message = self._get_i18n_message(rule["message_key"], key=tag_found)
-                        details = self._get_i18n_message(params["missing_space_details_key"], found_text=match.group(0))
+                        message = self._deferred(rule["message_key"], key=tag_found)
+                        details = self._deferred(params["missing_space_details_key"], found_text=match.group(0))
                         results.append(ValidationResult(is_valid=False, level=ValidationLevel(rule["level"]), message=message, code=rule.get("message_key"), details=details, details_code=params["missing_space_details_key"], details_params={"foundText": match.group(0)}, line_number=line_number, text_sample=text[:100]))
         except re.error as e:
             self.logger.warning(self._get_i18n_message("validator_error_regex_error", rule_name=rule['name'], e=e, pattern=pattern))
@@ -197,10 +227,11 @@ class BaseGameValidator:
             return results
 
         try:
-            start_tags_count = len(re.findall(start_tag_pattern, text))
+            start_regex = self.patterns[start_tag_pattern]
+            start_tags_count = len(start_regex.findall(text))
             end_tags_count = text.count(end_tag_string)
             if source_text:
-                source_start_tags_count = len(re.findall(start_tag_pattern, source_text))
+                source_start_tags_count = len(start_regex.findall(source_text))
                 source_end_tags_count = source_text.count(end_tag_string)
                 if source_start_tags_count != source_end_tags_count:
                     return results
@@ -211,9 +242,9 @@ class BaseGameValidator:
                     return results
 
             if start_tags_count != end_tags_count:
-                message = self._get_i18n_message(rule["message_key"])
+                message = self._deferred(rule["message_key"])
                 details_key = params.get("details_key", "validation_generic_tags_count")
-                details = self._get_i18n_message(details_key, start_count=start_tags_count, end_count=end_tags_count)
+                details = self._deferred(details_key, start_count=start_tags_count, end_count=end_tags_count)
                 results.append(ValidationResult(
                     is_valid=False,
                     level=ValidationLevel(rule["level"]),
@@ -244,8 +275,9 @@ class BaseGameValidator:
         end_tag_strings = params.get("end_tag_strings", [])
 
         try:
-            source_start_count = sum(len(re.findall(pattern, source_text)) for pattern in start_tag_patterns)
-            target_start_count = sum(len(re.findall(pattern, text)) for pattern in start_tag_patterns)
+            start_regexes = [self.patterns[pattern] for pattern in start_tag_patterns]
+            source_start_count = sum(len(regex.findall(source_text)) for regex in start_regexes)
+            target_start_count = sum(len(regex.findall(text)) for regex in start_regexes)
         except re.error as e:
             self.logger.warning(self._get_i18n_message("validator_error_regex_error", rule_name=rule.get('name', 'N/A'), e=e, pattern=", ".join(start_tag_patterns)))
             return []
@@ -273,13 +305,13 @@ class BaseGameValidator:
             "sourceEndCount": source_end_count,
             "targetEndCount": target_end_count,
         }
-        details = self._get_i18n_message(details_key, **details_params)
+        details = self._deferred(details_key, **details_params)
 
         return [
             ValidationResult(
                 is_valid=False,
                 level=ValidationLevel(rule["level"]),
-                message=self._get_i18n_message(message_key),
+                message=self._deferred(message_key),
                 code=message_key,
                 details=details,
                 details_code="validation_format_marker_parity_details_localized",
@@ -296,9 +328,9 @@ class BaseGameValidator:
         results = []
         pattern = rule.get("pattern")
         if not pattern: return results
-        if re.search(pattern, text):
-            message = self._get_i18n_message(rule["message_key"])
-            details = self._get_i18n_message(rule.get("params", {}).get("details_key", ""))
+        if self.patterns[pattern].search(text):
+            message = self._deferred(rule["message_key"])
+            details = self._deferred(rule.get("params", {}).get("details_key", ""))
             results.append(ValidationResult(is_valid=True, level=ValidationLevel(rule["level"]), message=message, code=rule.get("message_key"), details=details, line_number=line_number, text_sample=text[:100]))
         return results
 
@@ -318,72 +350,46 @@ class BaseGameValidator:
             return results
             
         from collections import Counter
-            
+
+        message_key = rule.get("message_key", "validation_variable_parity_mismatch")
+        details_key = params.get("details_key", "validation_generic_parity_mismatch")
         for pattern in patterns:
             try:
                 # 寻找原文和译文中的所有匹配项
-                source_vars = re.findall(pattern, source_text)
-                target_vars = re.findall(pattern, text)
-                
-                if not source_vars and not target_vars:
+                regex = self.patterns[pattern]
+                source_vars = regex.findall(source_text)
+                target_vars = regex.findall(text)
+
+                # 绝大多数条目变量完全一致，无需逐个计数
+                if source_vars == target_vars or sorted(source_vars) == sorted(target_vars):
                     continue
-                    
+
                 source_counts = Counter(source_vars)
                 target_counts = Counter(target_vars)
-                
-                # 检查所有在原文中出现的变量
-                for var, count in source_counts.items():
-                    target_count = target_counts.get(var, 0)
-                    if target_count != count:
-                        # 发现不匹配！
-                        message_key = rule.get("message_key", "validation_variable_parity_mismatch")
-                        message = self._get_i18n_message(message_key, var=var)
-                        
-                        if message == message_key:
-                            message = f"变量数量不一致 (Variable parity mismatch): {var}"
-                            
-                        details_key = params.get("details_key", "validation_generic_parity_mismatch")
-                        details = self._get_i18n_message(details_key, var=var, source_count=count, target_count=target_count)
-                        if details == details_key:
-                            details = f"原文含有 {count} 个，译文含有 {target_count} 个 (Expected {count}, found {target_count})"
-                            
-                        results.append(ValidationResult(
-                            is_valid=False,
-                            level=ValidationLevel(rule["level"]),
-                            message=message,
-                            code=message_key,
-                            details=details,
-                            details_code="validation_generic_variable_parity_details",
-                            details_params={"var": var, "sourceCount": count, "targetCount": target_count},
-                            line_number=line_number,
-                            text_sample=text[:100]
-                        ))
-                
+                mismatches = [(var, count, target_counts.get(var, 0)) for var, count in source_counts.items() if target_counts.get(var, 0) != count]
                 # 检查是否在译文中凭空多出了原文没有的变量（LLM幻觉）
-                for var, count in target_counts.items():
-                    if var not in source_counts:
-                        message_key = rule.get("message_key", "validation_variable_parity_mismatch")
-                        message = self._get_i18n_message(message_key, var=var)
-                        
-                        if message == message_key:
-                            message = f"多出未知变量 (Unexpected extra variable): {var}"
-                            
-                        details_key = params.get("details_key", "validation_generic_parity_mismatch")
-                        details = self._get_i18n_message(details_key, var=var, source_count=0, target_count=count)
-                        if details == details_key:
-                            details = f"原文含有 0 个，译文含有 {count} 个 (Expected 0, found {count})"
-                            
-                        results.append(ValidationResult(
-                            is_valid=False,
-                            level=ValidationLevel(rule["level"]),
-                            message=message,
-                            code=message_key,
-                            details=details,
-                            details_code="validation_generic_variable_parity_details",
-                            details_params={"var": var, "sourceCount": 0, "targetCount": count},
-                            line_number=line_number,
-                            text_sample=text[:100]
-                        ))
+                extras = [(var, 0, count) for var, count in target_counts.items() if var not in source_counts]
+
+                for var, count, target_count in mismatches + extras:
+                    if count:
+                        fallback = f"变量数量不一致 (Variable parity mismatch): {var}"
+                    else:
+                        fallback = f"多出未知变量 (Unexpected extra variable): {var}"
+                    results.append(ValidationResult(
+                        is_valid=False,
+                        level=ValidationLevel(rule["level"]),
+                        message=self._deferred(message_key, fallback=fallback, var=var),
+                        code=message_key,
+                        details=self._deferred(
+                            details_key,
+                            fallback=f"原文含有 {count} 个，译文含有 {target_count} 个 (Expected {count}, found {target_count})",
+                            var=var, source_count=count, target_count=target_count,
+                        ),
+                        details_code="validation_generic_variable_parity_details",
+                        details_params={"var": var, "sourceCount": count, "targetCount": target_count},
+                        line_number=line_number,
+                        text_sample=text[:100]
+                    ))
             except re.error as e:
                 self.logger.warning(self._get_i18n_message("validator_error_regex_error", rule_name=rule.get('name', 'N/A'), e=e, pattern=pattern))
                 
@@ -424,8 +430,8 @@ class BaseGameValidator:
 
             # 找到了真正的残留标点符号
             found_punctuations = ", ".join(analysis.get("details", {}).keys())
-            message = self._get_i18n_message("validation_residual_punctuation_found")
-            details = self._get_i18n_message(
+            message = self._deferred("validation_residual_punctuation_found")
+            details = self._deferred(
                 "validation_residual_punctuation_details",
                 punctuations=found_punctuations
             )
@@ -451,11 +457,11 @@ class BaseGameValidator:
         if not key:
             return results
 
-        key_for_validation = re.sub(r":[0-9]+$", "", key.strip())
+        key_for_validation = _KEY_VERSION_SUFFIX.sub("", key.strip())
             
         # 简单的键名检查：只允许字母、数字、下划线、点、冒号(某些游戏允许?)
         # 通常P社键名是 alphanumeric + underscore + dot
-        if not re.match(r'^[a-zA-Z0-9_\.\-]+$', key_for_validation):
+        if not _VALID_KEY.match(key_for_validation):
              # 暂时只作为 Warning，因为有些Mod可能有奇怪的键名
             message = "Invalid key format"
             details = f"Key '{key}' contains invalid characters. Expected alphanumeric, underscore, dot, or hyphen."
@@ -476,8 +482,8 @@ class BaseGameValidator:
     def validate_text(self, text: str, line_number: Optional[int] = None, source_lang: Optional[Dict] = None, source_text: Optional[str] = None, target_lang: Optional[str] = None, **kwargs) -> List[ValidationResult]:
         """
         纯粹的规则执行引擎。
-        它遍历加载自Python模块的规则，并根据 rule['check_function'] 的值，
-        从 self.check_map 中动态调用相应的“工人”检查方法。
+        它遍历构造时编译好的规则计划，每条规则对应 rule['check_function']
+        在 self.check_map 中的“工人”检查方法。
         增加了内置的标点符号检查。
         现在可以接受并传递 **kwargs 和 source_text 给工人方法。
         """
@@ -485,18 +491,13 @@ class BaseGameValidator:
         if not self.rules and not self.config: # 如果规则加载失败，则直接返回
             return all_results
 
-        for rule in self.rules:
-            check_function_name = rule.get("check_function")
-            checker = self.check_map.get(check_function_name)
-            if checker:
-                try:
-                    # 将 kwargs 和 source_text 传递给工人方法
-                    results = checker(text, rule, line_number, source_text=source_text, target_lang=target_lang, **kwargs)
-                    all_results.extend(results)
-                except Exception as e:
-                    self.logger.error(self._get_i18n_message("validator_error_executing_rule", rule_name=rule.get('name', 'N/A'), e=e))
-            else:
-                self.logger.warning(self._get_i18n_message("validator_warning_unknown_check_function", rule_name=rule.get('name', 'N/A'), check_function_name=check_function_name))
+        for rule, checker in self._plan:
+            try:
+                # 将 kwargs 和 source_text 传递给工人方法
+                results = checker(text, rule, line_number, source_text=source_text, target_lang=target_lang, **kwargs)
+                all_results.extend(results)
+            except Exception as e:
+                self.logger.error(self._get_i18n_message("validator_error_executing_rule", rule_name=rule.get('name', 'N/A'), e=e))
 
         # --- 内置基础检查 ---
         # 传递 target_lang 给标点符号检查
@@ -525,9 +526,28 @@ class BaseGameValidator:
         
         return results
 
+    def validate_many(self, entries: Iterable[ValidationEntry], source_lang: Optional[Dict] = None, target_lang: Optional[str] = None, dynamic_valid_tags: Optional[Iterable[str]] = None) -> List[List[ValidationResult]]:
+        """
+        一次验证整个文件的条目，entries 为 (key, value, line_number, source_value)。
+        返回与输入一一对应的结果列表；动态标签只小写化一次。
+        单个条目验证出错时只记录日志并返回空结果，不影响同一文件的其它条目。
+        """
+        valid_tags = LoweredTags.of(dynamic_valid_tags)
+        results_per_entry: List[List[ValidationResult]] = []
+        for key, value, line_number, source_value in entries:
+            try:
+                results = self.validate_entry(key, value, line_number, source_lang, source_value=source_value, target_lang=target_lang, dynamic_valid_tags=valid_tags)
+            except Exception as e:
+                self.logger.error(f"[{self.game_name}] Failed to validate [Key: {key}]: {e}")
+                results = []
+            results_per_entry.append(results)
+        return results_per_entry
+
     def _log_validation_result(self, result: ValidationResult):
         """记录验证结果到日志"""
         log_level = getattr(self.logger, result.level.value, self.logger.info)
+        if not self.logger.isEnabledFor(logging.getLevelName(result.level.name)):
+            return
         message = f"[{self.game_name}] {result.message}"
         if result.key:
             message = f"[Key: {result.key}] " + message
@@ -571,17 +591,31 @@ class EU5Validator(BaseGameValidator):
         super().__init__(eu5_rules)
 
 
+_GAME_VALIDATOR_CLASSES = {
+    "victoria3": Victoria3Validator,
+    "stellaris": StellarisValidator,
+    "eu4": EU4Validator,
+    "hoi4": HOI4Validator,
+    "ck3": CK3Validator,
+    "eu5": EU5Validator,
+}
+_game_validators: Optional[Dict[str, BaseGameValidator]] = None
+_game_validators_lock = threading.Lock()
+
+
+def _shared_game_validators() -> Dict[str, BaseGameValidator]:
+    """每个游戏的规则在进程内只编译一次，验证器本身无状态，可被所有 PostProcessValidator 共享。"""
+    global _game_validators
+    with _game_validators_lock:
+        if _game_validators is None:
+            _game_validators = {game_id: cls() for game_id, cls in _GAME_VALIDATOR_CLASSES.items()}
+        return _game_validators
+
+
 class PostProcessValidator:
     """后处理验证器主类"""
     def __init__(self):
-        self.validators_by_id_str = {
-            "victoria3": Victoria3Validator(),
-            "stellaris": StellarisValidator(),
-            "eu4": EU4Validator(),
-            "hoi4": HOI4Validator(),
-            "ck3": CK3Validator(),
-            "eu5": EU5Validator()
-        }
+        self.validators_by_id_str = dict(_shared_game_validators())
 
         # 最终的、按数字键（如'1'）索引的验证器字典
         self.validators: Dict[str, BaseGameValidator] = {}
@@ -649,6 +683,20 @@ class PostProcessValidator:
             validator._log_validation_result(result)
         return results
 
+    def validate_many(self, game_id: str, entries: Sequence[ValidationEntry], source_lang: Optional[Dict] = None, target_lang: Optional[str] = None, dynamic_valid_tags: Optional[List[str]] = None) -> List[List[ValidationResult]]:
+        """验证一个文件的全部条目 (key, value, line_number, source_value)，返回与 entries 对齐的结果列表"""
+        try:
+            validator = self.get_validator_by_game_id(game_id)
+        except ValueError as e:
+            self.logger.error(self._get_i18n_message("validation_unknown_game", game_id=game_id))
+            raise e
+
+        results_per_entry = validator.validate_many(entries, source_lang, target_lang=target_lang, dynamic_valid_tags=dynamic_valid_tags)
+        for results in results_per_entry:
+            for result in results:
+                validator._log_validation_result(result)
+        return results_per_entry
+
     def validate_batch(self, game_id: str, texts: List[str], start_line: int = 1, source_lang: Optional[Dict] = None, source_texts: Optional[List[str]] = None, target_lang: Optional[str] = None, dynamic_valid_tags: Optional[List[str]] = None) -> Dict[int, List[ValidationResult]]:
         """批量验证文本"""
         batch_results = {}
@@ -691,13 +739,7 @@ class PostProcessValidator:
 
     def _get_i18n_message(self, message_key: str, **kwargs) -> str:
         """PostProcessValidator也需要一个i18n消息获取器"""
-        if not message_key: return ""
-        try:
-            if i18n and getattr(i18n, '_language_loaded', False):
-                return i18n.t(message_key, **kwargs)
-        except Exception:
-            pass
-        return message_key
+        return _i18n_message(message_key, **kwargs)
 
 def validate_text(game_id: str, text: str, line_number: Optional[int] = None, source_lang: Optional[Dict] = None, source_text: Optional[str] = None, target_lang: Optional[str] = None, dynamic_valid_tags: Optional[List[str]] = None) -> List[ValidationResult]:
     validator = PostProcessValidator()
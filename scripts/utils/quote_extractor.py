@@ -8,6 +8,7 @@
 import re
 import os
 import logging
+from pathlib import Path
 from typing import Optional, List, Tuple, Dict, Any
 
 # 导入国际化支持
@@ -135,21 +136,12 @@ class QuoteExtractor:
             rel_path = os.path.basename(file_path)
         logging.info(i18n.t("parsing_file", filename=rel_path) if i18n else f"Parsing file: {rel_path}")
 
-        # 1) Read file contents
-        try:
-            with open(file_path, "r", encoding="utf-8-sig") as f:
-                original_lines = f.readlines()
-        except UnicodeDecodeError:
-            try:
-                with open(file_path, "r", encoding="cp1252") as f:
-                    original_lines = f.readlines()
-            except UnicodeDecodeError:
-                try:
-                    with open(file_path, "r", encoding="gb18030") as f:
-                        original_lines = f.readlines()
-                except UnicodeDecodeError:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        original_lines = f.readlines()
+        from scripts.core.loc_parser import load_loc_document
+
+        # 1) Read file contents (shared, cached parse; callers get their own copy of the lines)
+        document = load_loc_document(Path(file_path))
+        original_lines = list(document.lines)
+        keys_by_line = document.keys_by_line
 
         texts_to_translate: List[str] = []
         key_map: Dict[int, Dict[str, Any]] = {}
@@ -157,8 +149,6 @@ class QuoteExtractor:
         # Check if this is a .txt file in a customizable_localization directory.
         is_txt = file_path.lower().endswith(".txt") and "customizable_localization" in file_path.replace("\\", "/")
 
-        from scripts.core.loc_parser import ENTRY_RE
-
         # State machine variables
         current_key_part = None
         current_value_part_start = None
@@ -198,13 +188,10 @@ class QuoteExtractor:
                     )):
                         continue
 
-                    # Match new key
-                    match = ENTRY_RE.match(stripped)
-                    if not match:
+                    # Match new key (ENTRY_RE already ran once per line in the document)
+                    if line_num not in keys_by_line:
                         continue
-                    
-                    base_key, version, _ = match.groups()
-                    current_key_part = f"{base_key.strip()}:{version.strip()}" if version.strip() else base_key.strip()
+                    current_key_part = keys_by_line[line_num]
                     
                     # Find start of value (colon)
                     colon_pos = line.find(':')
@@ -2,17 +2,272 @@
 import time
 import threading
 import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+DEFAULT_BURST_SECONDS = 10.0
+DEFAULT_MIN_RPM = 1.0
+DEFAULT_BASE_COOLDOWN = 5.0
+DEFAULT_MAX_COOLDOWN = 120.0
+
+
+def estimate_prompt_tokens(text: Optional[str]) -> int:
+    """粗略估算提示词 token 数（约 4 个字符 / token），仅用于 TPM 预算。"""
+    return max(1, len(text or "") // 4)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    error_text = str(error).lower()
+    return "429" in error_text or "rate limit" in error_text or "too many requests" in error_text
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """读取 SDK 异常携带的 Retry-After 提示；没有则返回 None。"""
+    value = getattr(error, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers is not None and hasattr(headers, "get"):
+            value = headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    按每分钟速率补充的令牌桶。
+
+    预约允许透支：并发调用者各自扣除令牌并得到需要等待的秒数，
+    等价于在未来排队预约时间槽。满桶容量决定可突发的请求数。
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float, now: float):
+        self.rate_per_minute = float(rate_per_minute)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated_at = now
+
+    def _refill(self, now: float) -> None:
+        # _updated_at 位于未来表示桶处于冷却期，期间不补充令牌。
+        if now > self._updated_at:
+            if self.rate_per_minute > 0:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_minute / 60.0)
+            self._updated_at = now
+
+    def available(self, now: float) -> float:
+        self._refill(now)
+        return self._tokens
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """在不扣除令牌的情况下，计算取得 amount 个令牌需要等待的秒数。"""
+        if self.rate_per_minute <= 0:
+            return 0.0
+        missing = min(amount, self.capacity) - self.available(now)
+        return max(0.0, self._updated_at - now) + max(0.0, missing * 60.0 / self.rate_per_minute)
+
+    def take(self, amount: float) -> None:
+        # 超过容量的单次请求按满桶计费，否则它将永远等不到足够的令牌。
+        self._tokens -= min(amount, self.capacity)
+
+    def drain(self, now: float, resume_at: float) -> None:
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+        self._updated_at = max(self._updated_at, resume_at)
+
+    def set_rate(self, rate_per_minute: float, capacity: float, now: float) -> None:
+        self._refill(now)
+        self.rate_per_minute = float(rate_per_minute)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = min(self._tokens, self.capacity)
+
+
+def _burst_capacity(rate_per_minute: float, burst: Optional[float]) -> float:
+    if burst:
+        return float(burst)
+    return max(1.0, rate_per_minute * DEFAULT_BURST_SECONDS / 60.0)
+
+
+class ProviderRateLimiter:
+    """
+    单个 (provider, model) 的限速器：请求令牌桶 + 可选的 TPM 令牌桶。
+
+    收到 429 时有效 RPM 减半、桶被清空并暂停一段冷却时间（优先使用 Retry-After），
+    之后每次成功调用按配置值的 1/10 逐步恢复。
+    打开的公平通道（lane，例如并发翻译的各目标语言）平分有效 RPM 与突发容量：带 lane 的预约
+    按该通道桶排队，一个通道无法占用其它通道的份额；通道关闭后份额还给其余通道。
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        rpm: float,
+        tpm: Optional[int] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.provider = provider
+        self.model = model
+        self.pinned_rpm: Optional[float] = None
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self.configured_rpm = float(rpm)
+        self.effective_rpm = float(rpm)
+        self.burst = burst
+        self._requests = TokenBucket(rpm, _burst_capacity(rpm, burst), now)
+        self._tokens = TokenBucket(tpm, tpm, now) if tpm else None
+        self._lanes: Dict[str, TokenBucket] = {}
+        self._paused_until = 0.0
+        self._rate_limited_streak = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.rate_limited = 0
+        self.total_wait = 0.0
+        self.last_wait = 0.0
+
+    @property
+    def tpm(self) -> Optional[int]:
+        return int(self._tokens.rate_per_minute) if self._tokens else None
+
+    def configure(self, rpm: Optional[float] = None, tpm: Optional[int] = None, burst: Optional[float] = None) -> None:
+        with self._lock:
+            now = self._clock()
+            if burst is not None:
+                self.burst = burst
+            if rpm is not None:
+                self.configured_rpm = float(rpm)
+                self.effective_rpm = float(rpm)
+            self._requests.set_rate(self.effective_rpm, _burst_capacity(self.configured_rpm, self.burst), now)
+            if tpm and tpm != self.tpm:
+                self._tokens = TokenBucket(tpm, tpm, now)
+            self._split_lanes(now)
+
+    def open_lane(self, lane: str) -> None:
+        with self._lock:
+            now = self._clock()
+            if lane not in self._lanes:
+                self._lanes[lane] = TokenBucket(self.effective_rpm, self._requests.capacity, now)
+            self._split_lanes(now)
+
+    def close_lane(self, lane: str) -> None:
+        with self._lock:
+            self._lanes.pop(lane, None)
+            self._split_lanes(self._clock())
+
+    def _split_lanes(self, now: float) -> None:
+        """每个打开的通道平分有效速率与突发容量；调用方持有锁。"""
+        if not self._lanes:
+            return
+        share = len(self._lanes)
+        for bucket in self._lanes.values():
+            bucket.set_rate(self.effective_rpm / share, self._requests.capacity / share, now)
+
+    def _wait_time(self, tokens: int, now: float, lane: Optional[str] = None) -> float:
+        # 通道按份额排队：共享桶仍被扣除（其它调用方可见总负载），但不让别的通道预约的未来时间槽推迟本通道
+        lane_bucket = self._lanes.get(lane) if lane is not None else None
+        wait = max(self._paused_until - now, 0.0)
+        wait = max(wait, (lane_bucket or self._requests).wait_time(1, now))
+        if self._tokens and tokens:
+            wait = max(wait, self._tokens.wait_time(tokens, now))
+        return wait
+
+    def _take(self, tokens: int, lane: Optional[str] = None) -> None:
+        self._requests.take(1)
+        if self._tokens and tokens:
+            self._tokens.take(tokens)
+        lane_bucket = self._lanes.get(lane) if lane is not None else None
+        if lane_bucket is not None:
+            lane_bucket.take(1)
+
+    def reserve(self, tokens: int = 0, lane: Optional[str] = None) -> float:
+        """预约一次调用并返回调用前需要等待的秒数；lane 为已打开的公平通道时按其份额排队。"""
+        with self._lock:
+            wait = self._wait_time(tokens, self._clock(), lane)
+            if self.configured_rpm > 0:
+                self._take(tokens, lane)
+            self.acquired += 1
+            self.total_wait += wait
+            self.last_wait = wait
+            return wait
+
+    def try_acquire(self, tokens: int = 0) -> bool:
+        """不等待地取得一次调用许可；预算不足时记为一次拒绝。"""
+        with self._lock:
+            if self._wait_time(tokens, self._clock()) > 0:
+                self.rejected += 1
+                return False
+            if self.configured_rpm > 0:
+                self._take(tokens)
+            self.acquired += 1
+            self.last_wait = 0.0
+            return True
+
+    def report_success(self) -> None:
+        with self._lock:
+            self._rate_limited_streak = 0
+            if self.effective_rpm < self.configured_rpm:
+                self.effective_rpm = min(self.configured_rpm, self.effective_rpm + max(1.0, self.configured_rpm / 10.0))
+                self._requests.set_rate(self.effective_rpm, self._requests.capacity, self._clock())
+                self._split_lanes(self._clock())
+
+    def report_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """记录一次 429，降低有效速率并返回冷却秒数。"""
+        with self._lock:
+            now = self._clock()
+            self.rate_limited += 1
+            self._rate_limited_streak += 1
+            if retry_after is None:
+                retry_after = min(DEFAULT_MAX_COOLDOWN, DEFAULT_BASE_COOLDOWN * (2 ** (self._rate_limited_streak - 1)))
+            self._paused_until = max(self._paused_until, now + retry_after)
+            if self.configured_rpm > 0:
+                self.effective_rpm = max(min(DEFAULT_MIN_RPM, self.configured_rpm), self.effective_rpm / 2.0)
+                self._requests.set_rate(self.effective_rpm, self._requests.capacity, now)
+                self._requests.drain(now, self._paused_until)
+                self._split_lanes(now)
+            return max(self._paused_until - now, 0.0)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            now = self._clock()
+            return {
+                "provider": self.provider,
+                "model": self.model,
+                "configured_rpm": self.configured_rpm,
+                "effective_rpm": self.effective_rpm,
+                "tpm": self.tpm,
+                "request_fill": self._requests.available(now) / self._requests.capacity,
+                "token_fill": (self._tokens.available(now) / self._tokens.capacity) if self._tokens else None,
+                "paused_for": max(self._paused_until - now, 0.0),
+                "acquired": self.acquired,
+                "rejected": self.rejected,
+                "rate_limited": self.rate_limited,
+                "total_wait": self.total_wait,
+                "last_wait": self.last_wait,
+            }
+
 
 class RateLimiter:
     """
-    一个简单的全局 RPM (每分钟请求数) 速率限制器。
-    使用线程锁确保多线程环境下的调用频率。
+    全局速率限制器：按 (provider, model) 各持有一个令牌桶，互不拖慢。
+
+    未单独设置 RPM 的桶跟随全局默认值（``rpm`` / ``update_rpm``）。
+    ``clock`` 与 ``sleep`` 可注入，测试时无需真实等待。
     """
-    def __init__(self, rpm=40):
+
+    def __init__(
+        self,
+        rpm=40,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         self._rpm = rpm
-        self._interval = 60.0 / rpm if rpm > 0 else 0
-        self._last_call = 0.0
+        self._clock = clock
+        self._sleep = sleep
         self._lock = threading.Lock()
+        self._limiters: Dict[Tuple[str, str], ProviderRateLimiter] = {}
         self.logger = logging.getLogger(__name__)
 
     @property
@@ -20,35 +275,106 @@ class RateLimiter:
         return self._rpm
 
     def update_rpm(self, rpm):
-        """动态更新 RPM 限制。"""
+        """动态更新默认 RPM；已单独设置 RPM 的桶不受影响。"""
         with self._lock:
             self._rpm = rpm
-            self._interval = 60.0 / rpm if rpm > 0 else 0
-            self.logger.info(f"Rate limiter updated: {rpm} RPM (Interval: {self._interval:.2f}s)")
+            limiters = [limiter for limiter in self._limiters.values() if limiter.pinned_rpm is None]
+        for limiter in limiters:
+            limiter.configure(rpm=rpm)
+        self.logger.info(f"Rate limiter updated: {rpm} RPM (default for providers without their own limit)")
+
+    def for_provider(self, provider: Optional[str] = None, model: Optional[str] = None) -> ProviderRateLimiter:
+        key = (provider or "", model or "")
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = ProviderRateLimiter(key[0], key[1], self._rpm, clock=self._clock)
+                self._limiters[key] = limiter
+            return limiter
+
+    def configure(
+        self,
+        provider: Optional[str],
+        model: Optional[str] = None,
+        rpm: Optional[float] = None,
+        tpm: Optional[int] = None,
+        burst: Optional[float] = None,
+    ) -> ProviderRateLimiter:
+        limiter = self.for_provider(provider, model)
+        if rpm is not None:
+            limiter.pinned_rpm = rpm
+        limiter.configure(rpm=rpm, tpm=tpm, burst=burst)
+        return limiter
+
+    @contextmanager
+    def temporary_limit(self, provider: Optional[str], model: Optional[str], rpm: Optional[int]):
+        """在上下文内为单个 (provider, model) 设置 RPM，退出时恢复。"""
+        if not rpm:
+            yield
+            return
+        limiter = self.for_provider(provider, model)
+        previous_pinned = limiter.pinned_rpm
+        self.configure(provider, model, rpm=int(rpm))
+        try:
+            yield
+        finally:
+            # 之前未单独设置的桶恢复为跟随（可能已在期间更新过的）全局默认值
+            restored_rpm = previous_pinned if previous_pinned is not None else self._rpm
+            limiter.pinned_rpm = previous_pinned
+            if limiter.configured_rpm != restored_rpm:
+                limiter.configure(rpm=restored_rpm)
+
+    @contextmanager
+    def fair_share(self, provider: Optional[str], model: Optional[str], lane: str):
+        """在上下文内为 lane 打开 (provider, model) 的公平通道，与其它打开的通道平分 RPM。"""
+        limiter = self.for_provider(provider, model)
+        limiter.open_lane(lane)
+        try:
+            yield
+        finally:
+            limiter.close_lane(lane)
 
-    def wait(self):
+    def reserve(
+        self,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        tokens: int = 0,
+        lane: Optional[str] = None,
+    ) -> float:
+        """预约一次调用并返回需要等待的秒数，由调用方自行 sleep（线程或协程）。"""
+        return self.for_provider(provider, model).reserve(tokens, lane)
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._sleep(seconds)
+
+    def wait(self, provider: Optional[str] = None, model: Optional[str] = None, tokens: int = 0) -> float:
         """
-        在继续之前等待，直到满足 RPM 限制。
-        计算等待时间并在锁外执行 sleep，以允许其他线程预约未来的时间槽。
+        在继续之前等待，直到该 provider/model 的预算允许。
+        在锁内预约时间槽，锁外 sleep，以允许其他线程预约后续的时间槽。
         """
-        if self._rpm <= 0:
-            return
-        
-        sleep_time = 0
-        with self._lock:
-            now = time.time()
-            
-            # 如果上次调用时间比现在还早（说明很久没用了），则从现在开始算
-            # 否则从预定的下一次可用时间开始算
-            base_time = max(now, self._last_call)
-            target_time = base_time + self._interval
-            
-            sleep_time = target_time - now
-            self._last_call = target_time
-
-        if sleep_time > 0:
-            # self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        sleep_time = self.reserve(provider, model, tokens)
+        self.sleep(sleep_time)
+        return sleep_time
+
+    def try_acquire(self, provider: Optional[str] = None, model: Optional[str] = None, tokens: int = 0) -> bool:
+        return self.for_provider(provider, model).try_acquire(tokens)
+
+    def report_success(self, provider: Optional[str] = None, model: Optional[str] = None) -> None:
+        self.for_provider(provider, model).report_success()
+
+    def report_rate_limited(
+        self,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ) -> float:
+        return self.for_provider(provider, model).report_rate_limited(retry_after)
+
+    def metrics(self) -> List[dict]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return [limiter.metrics() for limiter in limiters]
 
 # 全局单例
 rate_limiter = RateLimiter()
@@ -0,0 +1,261 @@
+"""
+Indexed storage behind the .remis_errors.json sidecar.
+
+Issues live in a SQLite file per sidecar under VALIDATION_ISSUES_DB_DIR (never
+inside project or output folders), indexed by (file_name, key), so a status
+update touches only the matching rows. The JSON file stays the compatibility
+format read by ValidationSidecarService and the project health checks: it is
+re-exported atomically after every write, or once when the calling thread's
+outermost ``batch()`` exits. If the JSON file is replaced by anything else (its
+size/mtime no longer match the last export), the store re-imports it before the
+next write and replays the updates it has not exported yet; reads never write
+and fall back to the JSON file itself.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from scripts.app_settings import VALIDATION_ISSUES_DB_DIR
+
+# (file_name, key, fields merged into every matching issue)
+IssueUpdate = Tuple[str, str, Dict[str, Any]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    seq INTEGER PRIMARY KEY,
+    file_name TEXT,
+    issue_key TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issues_file_key ON issues (file_name, issue_key);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def _json_signature(path: Path) -> str:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _render(issue: Any) -> str:
+    # Stored exactly as the item appears inside ``json.dump(issues, indent=2)``, so an export
+    # only joins stored text instead of decoding and re-encoding every issue.
+    return "\n".join("  " + line for line in json.dumps(issue, ensure_ascii=False, indent=2).split("\n"))
+
+
+def _issue_row(issue: Any) -> Tuple[Any, Any, str]:
+    if isinstance(issue, dict):
+        return issue.get("file_name"), issue.get("key"), _render(issue)
+    return None, None, _render(issue)
+
+
+def _read_json(path: Path) -> List[Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            issues = json.load(f)
+    except FileNotFoundError:
+        return []
+    return issues if isinstance(issues, list) else []
+
+
+def _apply_in_memory(issues: List[Any], updates: List[IssueUpdate]) -> List[Any]:
+    for file_name, key, fields in updates:
+        for issue in issues:
+            if isinstance(issue, dict) and issue.get("file_name") == file_name and issue.get("key") == key:
+                issue.update(fields)
+    return issues
+
+
+class ValidationIssueStore:
+    def __init__(self, json_path: Path, db_path: Path):
+        self.json_path = Path(json_path)
+        self.db_path = Path(db_path).resolve()
+        self._lock = threading.RLock()
+        self._batches = threading.local()
+        # Updates written to the database but not yet to the JSON file (deferred by a batch).
+        self._unexported: List[IssueUpdate] = []
+
+    def _batch_depth(self) -> int:
+        return getattr(self._batches, "depth", 0)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """One write-locked transaction, so concurrent processes never interleave a sync and an update."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+        try:
+            connection.executescript(_SCHEMA)
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _stored_signature(connection: sqlite3.Connection) -> Any:
+        row = connection.execute("SELECT value FROM meta WHERE name = 'json_signature'").fetchone()
+        return row[0] if row is not None else None
+
+    def _sync(self, connection: sqlite3.Connection) -> None:
+        """Re-import the JSON sidecar if it changed since the store last wrote it, keeping unexported updates."""
+        signature = _json_signature(self.json_path)
+        if self._stored_signature(connection) == signature:
+            return
+        self._replace(connection, _read_json(self.json_path))
+        self._apply(connection, self._unexported)
+        self._set_signature(connection, signature)
+
+    @staticmethod
+    def _replace(connection: sqlite3.Connection, issues: List[Any]) -> None:
+        connection.execute("DELETE FROM issues")
+        connection.executemany(
+            "INSERT INTO issues (file_name, issue_key, payload) VALUES (?, ?, ?)",
+            (_issue_row(issue) for issue in issues),
+        )
+
+    @staticmethod
+    def _set_signature(connection: sqlite3.Connection, signature: str) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES ('json_signature', ?)",
+            (signature,),
+        )
+
+    @staticmethod
+    def _apply(connection: sqlite3.Connection, updates: List[IssueUpdate]) -> int:
+        changed = 0
+        for file_name, key, fields in updates:
+            rows = connection.execute(
+                "SELECT seq, payload FROM issues WHERE file_name IS ? AND issue_key IS ?",
+                (file_name, key),
+            ).fetchall()
+            for seq, payload in rows:
+                issue = json.loads(payload)
+                issue.update(fields)
+                connection.execute(
+                    "UPDATE issues SET payload = ? WHERE seq = ?",
+                    (_render(issue), seq),
+                )
+            changed += len(rows)
+        return changed
+
+    @staticmethod
+    def _rows(connection: sqlite3.Connection) -> List[Any]:
+        return [json.loads(payload) for (payload,) in connection.execute("SELECT payload FROM issues ORDER BY seq")]
+
+    def _export(self, connection: sqlite3.Connection) -> None:
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.json_path.parent,
+                prefix=f"{self.json_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as temp_file:
+                temp_path = temp_file.name
+                payloads = [payload for (payload,) in connection.execute("SELECT payload FROM issues ORDER BY seq")]
+                temp_file.write("[\n" + ",\n".join(payloads) + "\n]" if payloads else "[]")
+            os.replace(temp_path, self.json_path)
+            temp_path = None
+        finally:
+            if temp_path:
+                os.unlink(temp_path)
+        self._set_signature(connection, _json_signature(self.json_path))
+        self._unexported = []
+
+    def exists(self) -> bool:
+        return self.json_path.exists() or self.db_path.exists()
+
+    def load(self) -> List[Any]:
+        """Read-only: never takes the write lock or creates the database; a changed JSON file is read directly."""
+        with self._lock:
+            if self.db_path.exists():
+                connection = sqlite3.connect(f"{self.db_path.as_uri()}?mode=ro", uri=True, timeout=10, isolation_level=None)
+                try:
+                    connection.execute("BEGIN")
+                    try:
+                        if self._stored_signature(connection) == _json_signature(self.json_path):
+                            return self._rows(connection)
+                    finally:
+                        connection.execute("COMMIT")
+                finally:
+                    connection.close()
+            return _apply_in_memory(_read_json(self.json_path), self._unexported)
+
+    def save(self, issues: List[Any]) -> None:
+        """Replace every issue; always exported at once, since it supersedes any deferred update."""
+        with self._lock, self._transaction() as connection:
+            self._replace(connection, issues)
+            self._export(connection)
+
+    def update_many(self, updates: Iterable[IssueUpdate]) -> int:
+        """Merge fields into every issue matching each (file_name, key); returns the number of issues changed."""
+        updates = list(updates)
+        with self._lock, self._transaction() as connection:
+            self._sync(connection)
+            changed = self._apply(connection, updates)
+            if changed:
+                self._unexported.extend(updates)
+                if not self._batch_depth():
+                    self._export(connection)
+        return changed
+
+    @contextmanager
+    def batch(self) -> Iterator["ValidationIssueStore"]:
+        """Defer the JSON export of this thread's updates until its outermost batch exits."""
+        self._batches.depth = self._batch_depth() + 1
+        try:
+            yield self
+        finally:
+            self._batches.depth -= 1
+            if not self._batches.depth:
+                with self._lock:
+                    if self._unexported:
+                        with self._transaction() as connection:
+                            self._export(connection)
+
+
+class ValidationIssueStoreRegistry:
+    """One store per sidecar path, so locks and unexported updates are shared by every caller in the process."""
+
+    def __init__(self, db_dir: str = VALIDATION_ISSUES_DB_DIR):
+        self.db_dir = db_dir
+        self._stores: Dict[str, ValidationIssueStore] = {}
+        self._lock = threading.Lock()
+
+    def for_path(self, json_path: Path) -> ValidationIssueStore:
+        key = os.path.abspath(json_path)
+        with self._lock:
+            store = self._stores.get(key)
+            if store is None:
+                db_name = hashlib.sha1(os.path.normcase(key).encode("utf-8")).hexdigest() + ".db"
+                store = self._stores[key] = ValidationIssueStore(Path(key), Path(self.db_dir) / db_name)
+            return store
+
+    def configure(self, db_dir: str) -> None:
+        """Point new stores at another database directory (tests, relocated AppData)."""
+        with self._lock:
+            self.db_dir = db_dir
+            self._stores.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stores.clear()
+
+
+validation_issue_stores = ValidationIssueStoreRegistry()
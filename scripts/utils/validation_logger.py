@@ -1,12 +1,15 @@
-import json
-import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from datetime import datetime
 
+from scripts.utils.validation_issue_store import IssueUpdate, ValidationIssueStore, validation_issue_stores
+
 class ValidationLogger:
     """
     Manages the .remis_errors.json sidecar file in project roots.
+    Issues are kept in an indexed store under AppData (see validation_issue_store);
+    the JSON file is its export and keeps its existing shape.
     """
     
     FILENAME = ".remis_errors.json"
@@ -15,18 +18,22 @@ class ValidationLogger:
     def _get_log_path(project_root: str) -> Path:
         return Path(project_root) / ValidationLogger.FILENAME
     
+    @staticmethod
+    def _store(project_root: str) -> ValidationIssueStore:
+        return validation_issue_stores.for_path(ValidationLogger._get_log_path(project_root))
+
     @staticmethod
     def load_errors(project_root: str) -> List[Dict[str, Any]]:
         """
         Loads errors from the .remis_errors.json file.
         """
         log_path = ValidationLogger._get_log_path(project_root)
-        if not log_path.exists():
+        store = ValidationLogger._store(project_root)
+        if not store.exists():
             return []
             
         try:
-            with open(log_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return store.load()
         except Exception as e:
             print(f"Failed to load validation log at {log_path}: {e}")
             return []
@@ -38,40 +45,49 @@ class ValidationLogger:
         """
         log_path = ValidationLogger._get_log_path(project_root)
         try:
-            with open(log_path, 'w', encoding='utf-8') as f:
-                json.dump(errors, f, ensure_ascii=False, indent=2)
+            ValidationLogger._store(project_root).save(errors)
         except Exception as e:
             print(f"Failed to save validation log at {log_path}: {e}")
 
+    @staticmethod
+    def update_errors(project_root: str, updates: Iterable[IssueUpdate]) -> int:
+        """
+        Applies many (file_name, key, fields) updates in one transaction and one JSON export.
+        Returns the number of error entries changed.
+        """
+        log_path = ValidationLogger._get_log_path(project_root)
+        store = ValidationLogger._store(project_root)
+        if not store.exists():
+            return 0
+        try:
+            return store.update_many(updates)
+        except Exception as e:
+            print(f"Failed to update validation log at {log_path}: {e}")
+            return 0
+
+    @staticmethod
+    @contextmanager
+    def batch(project_root: str) -> Iterator[None]:
+        """
+        Defers the .remis_errors.json export until the block exits, so a run that updates
+        one issue at a time still rewrites the sidecar once.
+        """
+        with ValidationLogger._store(project_root).batch():
+            yield
+
     @staticmethod
     def update_error_status(project_root: str, file_name: str, key: str, status: str):
         """
         Updates the status of a specific error entry.
         """
-        errors = ValidationLogger.load_errors(project_root)
-        updated = False
-        for err in errors:
-            if err.get('file_name') == file_name and err.get('key') == key:
-                err['status'] = status
-                updated = True
-        
-        if updated:
-            ValidationLogger.save_errors(project_root, errors)
+        ValidationLogger.update_errors(project_root, [(file_name, key, {'status': status})])
 
     @staticmethod
     def update_error_metadata(project_root: str, file_name: str, key: str, updates: Dict[str, Any]):
         """
         Updates arbitrary metadata for a specific error entry.
         """
-        errors = ValidationLogger.load_errors(project_root)
-        updated = False
-        for err in errors:
-            if err.get('file_name') == file_name and err.get('key') == key:
-                err.update(updates)
-                updated = True
-
-        if updated:
-            ValidationLogger.save_errors(project_root, errors)
+        ValidationLogger.update_errors(project_root, [(file_name, key, updates)])
 
     @staticmethod
     def mark_attempt_result(
@@ -0,0 +1,97 @@
+# scripts/utils/validation_rule_engine.py
+"""
+验证规则的预编译支持
+BaseGameValidator 在构造时把规则文件编译一次：规则中的正则全部预编译，
+标签白名单预先小写化；提示消息只记录 i18n 键和参数，真正被读取时才格式化。
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, Optional, Pattern
+
+# 规则中保存正则的位置：顶层 "pattern"，以及 params 中的单个/列表形式
+PATTERN_PARAMS = ("start_tag_pattern",)
+PATTERN_LIST_PARAMS = ("patterns", "start_tag_patterns")
+
+
+class PatternTable(dict):
+    """Compiled regexes keyed by their source; a pattern missing from the rules is compiled on first use.
+
+    Invalid patterns are not compiled ahead of time, so ``table[pattern]`` raises ``re.error``
+    at the same point the per-call ``re`` functions used to.
+    """
+
+    def __missing__(self, pattern: str) -> Pattern:
+        compiled = self[pattern] = re.compile(pattern)
+        return compiled
+
+    def compile_rules(self, rules: Iterable[Dict[str, Any]]) -> "PatternTable":
+        for rule in rules:
+            params = rule.get("params") or {}
+            sources = [rule.get("pattern")] + [params.get(name) for name in PATTERN_PARAMS]
+            for name in PATTERN_LIST_PARAMS:
+                sources.extend(params.get(name) or [])
+            for pattern in sources:
+                if isinstance(pattern, str) and pattern and pattern not in self:
+                    try:
+                        self[pattern] = re.compile(pattern)
+                    except re.error:
+                        continue
+        return self
+
+
+class LoweredTags(frozenset):
+    """A tag whitelist that has already been lower-cased, so checkers can use it as-is."""
+
+    @classmethod
+    def of(cls, tags: Optional[Iterable[str]]) -> Optional["LoweredTags"]:
+        if tags is None or isinstance(tags, cls):
+            return tags
+        return cls(tag.lower() for tag in tags)
+
+
+class DeferredMessage:
+    """An i18n message formatted only when a caller reads it."""
+
+    __slots__ = ("resolve", "key", "params", "fallback")
+
+    def __init__(self, resolve: Callable[..., str], key: str, params: Dict[str, Any], fallback: Optional[str] = None):
+        self.resolve = resolve
+        self.key = key
+        self.params = params
+        self.fallback = fallback
+
+    def __call__(self) -> str:
+        text = self.resolve(self.key, **self.params)
+        if self.fallback is not None and text == self.key:
+            return self.fallback
+        return text
+
+
+
+class DeferredText:
+    """
+    Dataclass field descriptor for text that may hold a ``DeferredMessage``: it is formatted on
+    first read, in the process and UI language of the reader, and the text is kept after that.
+    """
+
+    def __init__(self, default: Any = None, required: bool = False):
+        self.default = default
+        self.required = required
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            # dataclass reads the class attribute for the field default; AttributeError means none
+            if self.required:
+                raise AttributeError(self.name)
+            return self.default
+        value = instance.__dict__.get(self.slot)
+        if isinstance(value, DeferredMessage):
+            value = instance.__dict__[self.slot] = value()
+        return value
+
+    def __set__(self, instance, value) -> None:
+        instance.__dict__[self.slot] = value
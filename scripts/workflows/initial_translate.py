@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Optional, List
 
+from scripts.core.batch_budget import nominal_token_budget
 from scripts.core.services.initial_translation_discovery_service import discover_localizable_files
 from scripts.core.services.initial_translation_completion_service import finalize_workflow_run
 from scripts.core.services.initial_translation_snapshot_service import (
@@ -14,6 +15,7 @@ from scripts.core.services.initial_translation_run_service import (
     create_translation_handler,
     resolve_provider_model,
 )
+from scripts.core.services.initial_translation_fanout_service import translate_target_languages
 from scripts.core.services.initial_translation_language_service import run_language_translation
 from scripts.core.services.initial_translation_workspace_service import (
     clean_source_directory,
@@ -43,7 +45,8 @@ def run(mod_name: str,
         batch_size_limit: Optional[int] = None,
         concurrency_limit: Optional[int] = None,
         rpm_limit: Optional[int] = 40,
-        embedded_workshop: Optional[dict] = None):
+        embedded_workshop: Optional[dict] = None,
+        parallel_languages: bool = False):
     """【最终版】初次翻译工作流（多语言 & 多游戏兼容）- 流式处理 & 断点续传版"""
     logging.info("Entered initial_translate.run")
     logging.info(f"--- Starting 'Initial Translation' workflow for: {mod_name} ---")
@@ -97,7 +100,7 @@ def run(mod_name: str,
 
     # Calculate Total Batches (Pre-calculation)
     effective_chunk_size = get_chunk_size_for_provider(selected_provider, batch_size_limit)
-    total_batches = calculate_total_batches(all_files_content, effective_chunk_size)
+    total_batches = calculate_total_batches(all_files_content, effective_chunk_size, nominal_token_budget(selected_provider))
     mod_id, version_id = create_source_snapshot(
         mod_name,
         all_files_content,
@@ -109,35 +112,34 @@ def run(mod_name: str,
     if not mod_id or not version_id:
         return
 
-    # ───────────── 5. 多语言并行翻译 (Streaming from Memory) ─────────────
+    # ───────────── 5. 多语言翻译 (Streaming from Memory) ─────────────
     
-    last_target_lang = None
-    for target_lang in target_languages:
-        last_target_lang = target_lang
-        run_language_translation(
-            mod_name=mod_name,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            game_profile=game_profile,
-            mod_context=mod_context,
-            handler=handler,
-            output_folder_name=output_folder_name,
-            output_dir_path=output_dir_path,
-            selected_provider=selected_provider,
-            model_name=resolved_model_name,
-            all_files_content=all_files_content,
-            total_batches=total_batches,
-            effective_chunk_size=effective_chunk_size,
-            progress_callback=progress_callback,
-            project_id=project_id,
-            version_id=version_id,
-            override_path=override_path,
-            use_resume=use_resume,
-            concurrency_limit=concurrency_limit,
-            rpm_limit=rpm_limit,
-            batch_size_limit=batch_size_limit,
-            embedded_workshop=embedded_workshop,
-        )
+    last_target_lang = translate_target_languages(
+        run_language_translation,
+        target_languages,
+        parallel_languages=parallel_languages,
+        mod_name=mod_name,
+        source_lang=source_lang,
+        game_profile=game_profile,
+        mod_context=mod_context,
+        handler=handler,
+        output_folder_name=output_folder_name,
+        output_dir_path=output_dir_path,
+        selected_provider=selected_provider,
+        model_name=resolved_model_name,
+        all_files_content=all_files_content,
+        total_batches=total_batches,
+        effective_chunk_size=effective_chunk_size,
+        progress_callback=progress_callback,
+        project_id=project_id,
+        version_id=version_id,
+        override_path=override_path,
+        use_resume=use_resume,
+        concurrency_limit=concurrency_limit,
+        rpm_limit=rpm_limit,
+        batch_size_limit=batch_size_limit,
+        embedded_workshop=embedded_workshop,
+    )
 
     finalize_workflow_run(
         run_plan.is_batch_mode,
@@ -15,6 +15,7 @@ from scripts.core.services.incremental_archive_service import IncrementalArchive
 from scripts.core.services.incremental_package_service import IncrementalPackageService
 from scripts.core.services.incremental_preparation_service import IncrementalPreparationService
 from scripts.core.services.incremental_translation_service import IncrementalTranslationService
+from scripts.core.services.initial_translation_batch_service import split_prompt_cache_warnings
 from scripts.core.services.workshop_issue_export_service import WorkshopIssueExportService, resolve_dynamic_valid_tags
 from scripts.core.services.embedded_workshop_service import run_embedded_workshop
 
@@ -39,6 +40,20 @@ def _build_aggregated_progress(
     progress_data["total_target_langs"] = total_langs
     return progress_data
 
+
+def _translate_language(
+    translation_service: IncrementalTranslationService,
+    lang_telemetry: Dict[str, Any],
+    **translate_kwargs: Any,
+):
+    """Translate one language's dirty files, recording its timing and prompt-cache usage in ``lang_telemetry``."""
+    translation_started_at = perf_counter()
+    translated_results, warnings = translation_service.translate_dirty_files(**translate_kwargs)
+    lang_telemetry["translation_ms"] = round((perf_counter() - translation_started_at) * 1000, 1)
+    warnings, lang_telemetry["prompt_cache_tokens"] = split_prompt_cache_warnings(warnings)
+    return translated_results, warnings
+
+
 async def run_incremental_update(
     project_id: str, 
     target_lang_infos: List[Dict[str, Any]], 
@@ -248,8 +263,9 @@ async def run_incremental_update(
             checkpoint_mgr.clear_checkpoint()
 
         try:
-            translation_started_at = perf_counter()
-            translated_results, warnings = translation_service.translate_dirty_files(
+            translated_results, warnings = _translate_language(
+                translation_service,
+                lang_telemetry,
                 file_tasks_for_ai=file_tasks_for_ai,
                 selected_provider=selected_provider,
                 model_name=model_name,
@@ -263,7 +279,6 @@ async def run_incremental_update(
                     if progress_callback else None
                 ),
             )
-            lang_telemetry["translation_ms"] = round((perf_counter() - translation_started_at) * 1000, 1)
             overall_warnings.extend(warnings)
         except RuntimeError as e:
             return {"status": "error", "message": str(e)}
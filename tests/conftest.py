@@ -1,6 +1,7 @@
 import pytest
 
 from scripts.shared import task_state
+from scripts.utils.validation_issue_store import validation_issue_stores
 
 
 @pytest.fixture(autouse=True)
@@ -10,3 +11,12 @@ def disable_product_task_ledger_during_tests():
     task_state.configure_repository(None)
     yield
     task_state.configure_repository(previous_repository)
+
+
+@pytest.fixture(autouse=True)
+def isolate_validation_issue_databases(tmp_path_factory):
+    """Keep validation issue stores out of the developer AppData directory."""
+    previous_dir = validation_issue_stores.db_dir
+    validation_issue_stores.configure(str(tmp_path_factory.mktemp("validation_issues")))
+    yield
+    validation_issue_stores.configure(previous_dir)
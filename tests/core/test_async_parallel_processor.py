@@ -0,0 +1,113 @@
+import asyncio
+
+from scripts.core import base_handler
+from scripts.core.async_parallel_processor import AsyncParallelProcessor
+from scripts.core.base_handler import BaseApiHandler
+from scripts.core.parallel_types import BatchTask, FileTask
+
+
+def _file_task(filename: str, texts) -> FileTask:
+    return FileTask(
+        filename=filename,
+        root=".",
+        original_lines=[],
+        texts_to_translate=list(texts),
+        key_map={},
+        is_custom_loc=False,
+        target_lang={"code": "zh-CN", "name": "Simplified Chinese"},
+        source_lang={"code": "en", "name": "English"},
+        game_profile={},
+        mod_context="",
+        provider_name="vllm",
+        output_folder_name="out",
+        source_dir=".",
+        dest_dir=".",
+        client=object(),
+        mod_name="Example",
+    )
+
+
+def test_async_engine_keeps_many_batches_in_flight_and_streams_files():
+    file_tasks = [_file_task(f"file_{index}.yml", [f"text {index}-{n}" for n in range(10)]) for index in range(6)]
+    in_flight = 0
+    peak = 0
+
+    async def translate(task: BatchTask) -> BatchTask:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        task.translated_texts = [text.upper() for text in task.texts]
+        return task
+
+    processor = AsyncParallelProcessor(max_workers=60, chunk_size_override=1)
+    results = list(processor.process_files_stream(iter(file_tasks + [_file_task("empty.yml", [])]), translate))
+
+    assert peak == 60
+    assert sorted(result[0].filename for result in results) == sorted(
+        [task.filename for task in file_tasks] + ["empty.yml"]
+    )
+    by_name = {result[0].filename: result for result in results}
+    assert by_name["file_3.yml"][1] == [f"TEXT 3-{n}" for n in range(10)]
+    assert by_name["file_3.yml"][3] is False
+
+
+def test_async_engine_marks_crashed_and_fallback_batches_as_failed_files():
+    def translate(task: BatchTask) -> BatchTask:
+        if task.texts == ["boom"]:
+            raise RuntimeError("worker crashed")
+        task.fell_back_to_source = True
+        task.translated_texts = task.texts
+        return task
+
+    processor = AsyncParallelProcessor(max_workers=2, chunk_size_override=1)
+    results = list(processor.process_files_stream(iter([_file_task("a.yml", ["ok", "boom"])]), translate))
+
+    assert len(results) == 1
+    _, translated_texts, _, is_failed = results[0]
+    assert translated_texts == ["ok", "boom"]
+    assert is_failed is True
+
+
+class AsyncStubHandler(BaseApiHandler):
+    def __init__(self, responses):
+        self.responses = list(responses)
+        super().__init__("async-stub", "stub-model")
+
+    def initialize_client(self):
+        return object()
+
+    def _build_prompt(self, task: BatchTask) -> str:
+        return "prompt"
+
+    def _call_api(self, client, prompt: str) -> str:
+        raise AssertionError("the async path must not call the blocking client")
+
+    async def _call_api_async(self, client, prompt: str) -> str:
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def _parse_response(self, response, original_texts, target_lang_code):
+        return response.split("|")
+
+
+def test_translate_batch_async_retries_and_falls_back(monkeypatch):
+    monkeypatch.setattr(base_handler, "MAX_RETRIES", 2)
+    monkeypatch.setattr(base_handler.asyncio, "sleep", _no_sleep)
+    task = BatchTask(file_task=_file_task("a.yml", ["a", "b"]), batch_index=0, start_index=0, end_index=2, texts=["a", "b"])
+
+    result = asyncio.run(AsyncStubHandler([RuntimeError("api down"), "甲|乙"]).translate_batch_async(task))
+    assert result.translated_texts == ["甲", "乙"]
+    assert result.failed is False
+
+    task = BatchTask(file_task=_file_task("a.yml", ["a"]), batch_index=0, start_index=0, end_index=1, texts=["a"])
+    result = asyncio.run(AsyncStubHandler([RuntimeError("api down"), RuntimeError("api down")]).translate_batch_async(task))
+    assert result.fell_back_to_source is True
+    assert result.warnings[-1]["type"] == "fallback_to_source"
+
+
+async def _no_sleep(seconds):
+    return None
@@ -0,0 +1,73 @@
+from scripts.core import parallel_processor
+from scripts.core.batch_budget import BatchBudgetRegistry, BatchPlanStats, TokenBudget, pack_slices, text_costs
+from scripts.core.parallel_processor import ParallelProcessor
+from scripts.core.parallel_types import FileTask
+from scripts.core.services.initial_translation_snapshot_service import calculate_total_batches
+
+
+def _file_task(name: str, texts) -> FileTask:
+    return FileTask(
+        filename=name,
+        root=".",
+        original_lines=[],
+        texts_to_translate=list(texts),
+        key_map={},
+        is_custom_loc=False,
+        target_lang={"code": "zh-CN"},
+        source_lang={"code": "en"},
+        game_profile={"id": "stellaris"},
+        mod_context="",
+        provider_name="gemini",
+        output_folder_name="out",
+        source_dir=".",
+        dest_dir=".",
+        client=None,
+        mod_name="Example",
+        model_name="stub-model",
+    )
+
+
+def test_short_strings_fill_the_item_cap_and_long_ones_split_by_tokens():
+    short = ["Fleet"] * 10
+    long = ["word " * 400] * 3
+    assert pack_slices(text_costs(short), 4, 1000) == [(0, 4), (4, 8), (8, 10)]
+    assert pack_slices(text_costs(long), 40, 1000) == [(0, 1), (1, 2), (2, 3)]
+    # One string above the budget still goes out on its own.
+    assert pack_slices(text_costs(["word " * 2000, "Fleet"]), 40, 1000) == [(0, 1), (1, 2)]
+
+
+def test_budget_halves_on_overflow_and_recovers_after_clean_batches():
+    budget = TokenBudget(1000)
+    budget.observe([{"type": "count_mismatch"}])
+    budget.observe([{"type": "context_exceeded"}], failed=True)
+    assert budget.current == 250
+    budget.observe([{"type": "api_error"}], failed=True)
+    assert budget.current == 250
+    for _ in range(10):
+        budget.observe([])
+    assert budget.current == 1000
+    for _ in range(10):
+        budget.observe([{"type": "count_mismatch"}])
+    assert budget.current == budget.floor
+
+
+def test_streamed_batches_shrink_after_overflow_and_progress_total_follows(monkeypatch):
+    monkeypatch.setattr(parallel_processor, "batch_budgets", BatchBudgetRegistry())
+    files = [_file_task(f"f{index}.yml", ["sentence " * 60] * 12) for index in range(3)]
+    total_batches = calculate_total_batches([{"texts_to_translate": f.texts_to_translate} for f in files], 40, 1800)
+    sizes = []
+
+    def translate(batch):
+        sizes.append(len(batch.texts))
+        if len(sizes) == 1:
+            batch.warnings.append({"type": "count_mismatch"})
+        batch.translated_texts = [text.upper() for text in batch.texts]
+        return batch
+
+    stats = BatchPlanStats()
+    processor = ParallelProcessor(max_workers=1, batch_plan_stats=stats)
+    results = list(processor.process_files_stream(iter(files), translate))
+
+    assert [len(texts) for _, texts, _, failed in results if not failed] == [12, 12, 12]
+    assert max(sizes) > min(sizes)
+    assert len(sizes) == total_batches + stats.extra_batches
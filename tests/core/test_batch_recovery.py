@@ -0,0 +1,164 @@
+import asyncio
+import json
+
+from scripts.core import base_handler
+from scripts.core import translation_memory as memory_module
+from scripts.core.base_handler import BaseApiHandler
+from scripts.core.batch_recovery import BisectionRecovery, aligned_prefix
+from scripts.core.parallel_processor import ParallelProcessor
+from scripts.core.parallel_types import BatchTask, FileTask
+from scripts.core.translation_memory import MemoryScope, TranslationMemory
+
+
+def _batch(texts) -> BatchTask:
+    file_task = FileTask(
+        filename="events_l_english.yml",
+        root=".",
+        original_lines=[],
+        texts_to_translate=list(texts),
+        key_map={},
+        is_custom_loc=False,
+        target_lang={"code": "zh-CN"},
+        source_lang={"code": "en"},
+        game_profile={"id": "stellaris"},
+        mod_context="",
+        provider_name="stub",
+        output_folder_name="out",
+        source_dir=".",
+        dest_dir=".",
+        client=None,
+        mod_name="Example",
+    )
+    return BatchTask(file_task=file_task, batch_index=0, start_index=0, end_index=len(texts), texts=list(texts))
+
+
+class ScriptedHandler(BaseApiHandler):
+    """Translates by upper-casing; drops ``poison`` from every response and can truncate the first one."""
+
+    def __init__(self, poison=None, truncate_first_after=None, failing_calls=()):
+        self.poison = poison
+        self.truncate_first_after = truncate_first_after
+        self.failing_calls = set(failing_calls)
+        self.prompts = []
+        super().__init__("stub", "stub-model")
+
+    def initialize_client(self):
+        return object()
+
+    def get_provider_config(self) -> dict:
+        return {}
+
+    def _build_prompt(self, task: BatchTask) -> str:
+        return json.dumps(task.texts)
+
+    def _reserve_rate_limit(self, prompt: str, lane=None) -> float:
+        return 0.0
+
+    def _call_api(self, client, prompt: str) -> str:
+        self.prompts.append(json.loads(prompt))
+        if len(self.prompts) in self.failing_calls:
+            raise TimeoutError("upstream timed out")
+        translations = [text.upper() for text in json.loads(prompt) if text != self.poison]
+        response = json.dumps(translations, ensure_ascii=False)
+        if self.truncate_first_after is not None and len(self.prompts) == 1:
+            return response[:self.truncate_first_after]
+        return response
+
+    async def _call_api_async(self, client, prompt: str) -> str:
+        return self._call_api(client, prompt)
+
+
+def test_bad_line_is_isolated_and_the_rest_of_the_batch_is_kept(monkeypatch):
+    monkeypatch.setattr(base_handler, "MAX_RETRIES", 2)
+    texts = [f"line {index}" for index in range(8)]
+    handler = ScriptedHandler(poison="line 5")
+
+    task = handler.translate_batch(_batch(texts))
+
+    assert task.failed is False and task.fell_back_to_source is True
+    assert task.fallback_indices == [5]
+    assert task.translated_texts == [text.upper() for text in texts[:5]] + ["line 5"] + ["LINE 6", "LINE 7"]
+    # Halves, quarters, pairs, then two single attempts of the bad line.
+    assert handler.prompts[1:] == [texts[:4], texts[4:], texts[4:6], ["line 4"], ["line 5"], ["line 5"], texts[6:]]
+    recovery = next(warning for warning in task.warnings if warning["type"] == "bisection_recovery")
+    assert (recovery["api_calls"], recovery["recovered_items"], recovery["fallback_items"]) == (7, 7, 1)
+    assert recovery["baseline_api_calls"] == 1
+    assert recovery["saved_prompt_tokens"] == recovery["baseline_prompt_tokens"] - recovery["prompt_tokens"]
+    assert task.warnings[0]["type"] == "count_mismatch"
+
+
+def test_unrecovered_item_fails_the_file_and_is_not_remembered(monkeypatch):
+    monkeypatch.setattr(base_handler, "MAX_RETRIES", 2)
+    monkeypatch.setattr(memory_module, "glossary_fingerprint", lambda source, target: "")
+    memory = TranslationMemory(":memory:")
+    texts = [f"line {index}" for index in range(8)]
+    handler = ScriptedHandler(poison="line 5")
+    processor = ParallelProcessor(max_workers=1, chunk_size_override=8, translation_memory=memory)
+
+    (file_task, translated, _, failed), = processor.process_files_stream(
+        iter([_batch(texts).file_task]), handler.translate_batch
+    )
+
+    assert failed is True
+    assert translated[5] == "line 5" and translated[4] == "LINE 4"
+    scope = MemoryScope.for_file(file_task)
+    remembered = memory.lookup(scope, texts)
+    assert sorted(remembered) == [0, 1, 2, 3, 4, 6, 7]
+    assert remembered[4] == "LINE 4"
+    memory.close()
+
+
+def test_api_errors_during_bisection_are_retried(monkeypatch):
+    monkeypatch.setattr(base_handler, "MAX_RETRIES", 2)
+    monkeypatch.setattr(base_handler.time, "sleep", lambda seconds: None)
+    texts = [f"line {index}" for index in range(4)]
+    # Call 1 is the whole batch (count mismatch); call 2, the first half, times out once.
+    handler = ScriptedHandler(poison="line 3", failing_calls={2})
+
+    task = handler.translate_batch(_batch(texts))
+
+    assert handler.prompts[1:3] == [texts[:2], texts[:2]]
+    assert task.translated_texts[:3] == ["LINE 0", "LINE 1", "LINE 2"]
+    assert task.fallback_indices == [3]
+    assert [warning["type"] for warning in task.warnings].count("api_error") == 1
+
+
+def test_abandoned_bisection_keeps_recovered_items(monkeypatch):
+    async def no_wait(seconds):
+        return None
+
+    monkeypatch.setattr(base_handler, "MAX_RETRIES", 2)
+    monkeypatch.setattr(base_handler.asyncio, "sleep", no_wait)
+    texts = [f"line {index}" for index in range(4)]
+    # The first half translates; the second half fails on every attempt.
+    handler = ScriptedHandler(poison="line 3", failing_calls={3, 4})
+
+    task = asyncio.run(handler.translate_batch_async(_batch(texts)))
+
+    assert task.failed is False and task.fell_back_to_source is True
+    assert task.translated_texts == ["LINE 0", "LINE 1", "line 2", "line 3"]
+    assert task.fallback_indices == [2, 3]
+    recovery = next(warning for warning in task.warnings if warning["type"] == "bisection_recovery")
+    assert (recovery["recovered_items"], recovery["fallback_items"]) == (2, 2)
+
+
+def test_truncated_response_keeps_its_aligned_prefix(monkeypatch):
+    texts = ["alpha", "beta", "gamma", "delta", "epsilon"]
+    handler = ScriptedHandler(truncate_first_after=len('["ALPHA", "BETA", "GAM'))
+
+    task = asyncio.run(handler.translate_batch_async(_batch(texts)))
+
+    assert task.translated_texts == ["ALPHA", "BETA", "GAMMA", "DELTA", "EPSILON"]
+    # "GAM" may be cut mid-string, so only ALPHA and BETA are kept and the rest is sent once.
+    assert handler.prompts[1:] == [["gamma", "delta", "epsilon"]]
+
+
+def test_only_truncated_responses_are_aligned():
+    assert aligned_prefix('["A", "B", "C', ["A", "B", "C"], 5) == ["A", "B"]
+    assert aligned_prefix('["A", "B", "C"]', ["A", "B", "C"], 5) == []
+    assert aligned_prefix("```json\n[\"A\"]\n```", ["A"], 2) == []
+
+    recovery = BisectionRecovery(["a", "b", "c"], aligned=["A"])
+    assert recovery.next_piece() == (1, 3)
+    recovery.resolve((1, 3), ["B", "C"])
+    assert recovery.next_piece() is None and recovery.merged() == ["A", "B", "C"]
@@ -0,0 +1,80 @@
+import json
+
+from scripts.core.checkpoint_manager import CheckpointManager
+
+CONFIG = {"model_name": "gemini-2.5-flash", "source_lang": "en", "target_lang_code": "zh-CN"}
+
+
+def test_completed_files_survive_a_crash_between_compactions(tmp_path, monkeypatch):
+    monkeypatch.setattr(CheckpointManager, "JOURNAL_COMPACT_EVERY", 4)
+    manager = CheckpointManager(str(tmp_path), current_config=CONFIG)
+    filenames = [f"file_{index}.yml" for index in range(10)]
+    for filename in filenames:
+        manager.mark_file_completed(filename, {"stage": "translating"})
+
+    snapshot = json.loads((tmp_path / ".remis_checkpoint.json").read_text(encoding="utf-8"))
+    assert len(snapshot["completed_files"]) < len(filenames)
+    journal_lines = (tmp_path / ".remis_checkpoint.json.journal").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["file"] for line in journal_lines] == filenames[len(snapshot["completed_files"]):]
+
+    # Simulate the process dying halfway through appending the next record.
+    with open(manager.journal_path, "a", encoding="utf-8") as journal:
+        journal.write('{"file": "file_10.y')
+
+    recovered = CheckpointManager(str(tmp_path), current_config=CONFIG)
+    assert recovered.completed_files == set(filenames)
+    assert recovered.metadata["model_name"] == "gemini-2.5-flash"
+    assert recovered.metadata["last_completed_file"] == "file_9.yml"
+    assert recovered.metadata["completed_count"] == 10
+    assert recovered.metadata["recent_completed_files"] == filenames[-10:]
+    assert recovered.metadata["stage"] == "translating"
+
+
+def test_records_appended_after_a_torn_line_survive_the_next_resume(tmp_path):
+    manager = CheckpointManager(str(tmp_path), current_config=CONFIG)
+    for filename in ("a.yml", "b.yml", "c.yml"):
+        manager.mark_file_completed(filename)
+    with open(manager.journal_path, "a", encoding="utf-8") as journal:
+        journal.write('{"file": "torn.y')
+
+    resumed = CheckpointManager(str(tmp_path), current_config=CONFIG)
+    resumed.mark_file_completed("d.yml")
+    resumed.mark_file_completed("e.yml")
+
+    assert CheckpointManager(str(tmp_path), current_config=CONFIG).completed_files == {"a.yml", "b.yml", "c.yml", "d.yml", "e.yml"}
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(CheckpointManager, "JOURNAL_COMPACT_EVERY", 3)
+    manager = CheckpointManager(str(tmp_path), current_config=CONFIG)
+    for index in range(4):
+        manager.mark_file_completed(f"file_{index}.yml")
+
+    assert not (tmp_path / ".remis_checkpoint.json.journal").exists()
+    snapshot = json.loads((tmp_path / ".remis_checkpoint.json").read_text(encoding="utf-8"))
+    assert sorted(snapshot["completed_files"]) == [f"file_{index}.yml" for index in range(4)]
+
+
+def test_legacy_json_checkpoint_is_loaded_and_extended(tmp_path):
+    (tmp_path / ".remis_checkpoint.json").write_text(
+        json.dumps({"metadata": dict(CONFIG), "completed_files": ["old_a.yml", "old_b.yml"]}),
+        encoding="utf-8",
+    )
+
+    manager = CheckpointManager(str(tmp_path), current_config=CONFIG)
+    assert manager.filter_pending_files([{"filename": "old_a.yml"}, {"filename": "new.yml"}]) == [{"filename": "new.yml"}]
+    manager.mark_file_completed("new.yml")
+
+    assert CheckpointManager(str(tmp_path)).completed_files == {"old_a.yml", "old_b.yml", "new.yml"}
+
+
+def test_clear_checkpoint_removes_snapshot_and_journal(tmp_path):
+    manager = CheckpointManager(str(tmp_path), current_config=CONFIG)
+    manager.mark_file_completed("a.yml")
+    manager.mark_file_completed("b.yml")
+    assert manager.get_checkpoint_info()["exists"] is True
+
+    manager.clear_checkpoint()
+
+    assert list(tmp_path.iterdir()) == []
+    assert manager.get_checkpoint_info()["exists"] is False
@@ -90,6 +90,7 @@ def test_initialize_database_builds_schema_and_imports_seed(tmp_path, monkeypatc
         (10, "enforce_status_contracts"),
         (11, "add_steam_workshop_assets"),
         (12, "track_bundled_seed_state"),
+        (13, "key_task_pages_by_stored_time"),
     ]
 
     cursor.execute("SELECT source_path, target_path FROM projects WHERE project_id = 'proj_1'")
@@ -199,6 +200,7 @@ def test_run_projects_db_migrations_upgrades_legacy_schema(tmp_path):
         (10,),
         (11,),
         (12,),
+        (13,),
     ]
 
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='project_watches'")
@@ -0,0 +1,75 @@
+from scripts.core.glossary_manager import GlossaryManager
+
+
+def _entry(entry_id, source, target="目标", variants=None, abbreviations=None, priority=0):
+    return {
+        "entry_id": entry_id,
+        "translations": {"en": source, "zh-CN": target},
+        "variants": {"en": variants} if variants else {},
+        "abbreviations": {"en": abbreviations} if abbreviations else {},
+        "raw_metadata": {},
+        "_glossary_priority": priority,
+    }
+
+
+def _match_types(matches):
+    return {match["id"]: (match["match_type"], round(match["confidence"], 4)) for match in matches}
+
+
+def test_compiled_matcher_preserves_match_types_and_confidences():
+    manager = GlossaryManager()
+    manager.in_memory_glossary = {
+        "entries": [
+            _entry("exact", "Heartfire"),
+            _entry("variant", "Star Fleet", variants=["starfleets"]),
+            _entry("abbr", "United Federation", abbreviations=["UF"]),
+            _entry("abbr-inside-word", "Unknown Form", abbreviations=["nf"]),
+            _entry("multi-fuzzy", "Crimson Legion"),
+            _entry("absent", "Obsidian Throne"),
+        ]
+    }
+
+    matches = manager.extract_relevant_terms(
+        ["The heartfire starfleets answer the UF call.", "A crimsn legion marches."],
+        "en",
+        "zh-CN",
+    )
+
+    assert _match_types(matches) == {
+        "exact": ("exact", 1.0),
+        "variant": ("variant", 0.9),
+        "abbr": ("abbreviation", 0.85),
+        "multi-fuzzy": ("fuzzy", 0.6),
+    }
+    assert [match["id"] for match in matches][0] == "exact"
+
+
+def test_single_word_fuzzy_match_compares_against_whole_text():
+    manager = GlossaryManager()
+    manager.in_memory_glossary = {"entries": [_entry("single", "gehenna")]}
+
+    matches = manager.extract_relevant_terms(["gehena"], "en", "zh-CN")
+
+    assert _match_types(matches) == {"single": ("fuzzy", 0.3)}
+
+
+def test_strict_mode_disables_fuzzy_matches():
+    manager = GlossaryManager()
+    manager.set_fuzzy_matching_mode("strict")
+    manager.in_memory_glossary = {"entries": [_entry("multi-fuzzy", "Crimson Legion")]}
+
+    assert manager.extract_relevant_terms(["A crimsn legion marches."], "en", "zh-CN") == []
+
+
+def test_matcher_is_compiled_once_per_language_pair_and_snapshot():
+    manager = GlossaryManager()
+    manager.in_memory_glossary = {"entries": [_entry("exact", "Heartfire")]}
+
+    first = manager.get_term_matcher("en", "zh-CN")
+    assert manager.get_term_matcher("en", "zh-CN") is first
+
+    manager.in_memory_glossary = {"entries": [_entry("other", "Starforge")]}
+    second = manager.get_term_matcher("en", "zh-CN")
+
+    assert second is not first
+    assert [match["id"] for match in manager.extract_relevant_terms(["the starforge"], "en", "zh-CN")] == ["other"]
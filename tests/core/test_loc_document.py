@@ -0,0 +1,61 @@
+import os
+
+from scripts.core.loc_parser import LocDocumentCache, load_loc_document, parse_loc_file_with_lines
+from scripts.utils.quote_extractor import QuoteExtractor
+
+
+def _write(path, text, encoding="utf-8-sig"):
+    path.write_text(text, encoding=encoding, newline="")
+    return path
+
+
+def test_document_is_parsed_once_and_reparsed_after_rewrite(tmp_path):
+    path = _write(tmp_path / "events_l_english.yml", 'l_english:\n key_a:0 "Alpha"\n key_b: "$VAR$"\n')
+    cache = LocDocumentCache()
+
+    first = cache.load(path)
+    assert cache.load(path) is first
+    assert first.entries[0].key == "key_a:0"
+    assert first.translatable_entries() == [("key_a:0", "Alpha", 2)]
+
+    _write(path, 'l_english:\n key_a:0 "Alpha, revised"\n')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.load(path).translatable_entries() == [("key_a:0", "Alpha, revised", 2)]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_evicts_least_recently_used_documents(tmp_path):
+    cache = LocDocumentCache(max_chars=60)
+    paths = [_write(tmp_path / f"f{i}_l_english.yml", f'l_english:\n key_{i}:0 "Value {i}"\n') for i in range(3)]
+
+    for path in paths:
+        cache.load(path)
+    cache.load(paths[-1])
+    cache.load(paths[0])
+
+    assert cache.misses == 4
+
+
+def test_quote_extractor_and_line_parser_share_one_document(tmp_path):
+    path = _write(
+        tmp_path / "quotes_l_english.yml",
+        'l_english:\r\n # note\r\n single:0 "One \\"quoted\\" word" # trailing\r\n plain: "Two"\r\n',
+    )
+
+    original_lines, texts, key_map = QuoteExtractor.extract_from_file(str(path))
+
+    assert original_lines == list(load_loc_document(path).lines)
+    assert original_lines[2].endswith("# trailing\n")
+    assert texts == ['One \\"quoted\\" word', "Two"]
+    assert [key_map[i]["key_part"] for i in range(2)] == ["single:0", "plain"]
+    assert parse_loc_file_with_lines(path)[0] == ("single:0", 'One "quoted" word', 3)
+
+
+def test_legacy_encoded_files_fall_back_like_quote_extractor(tmp_path):
+    path = _write(tmp_path / "legacy_l_english.yml", 'l_english:\n key:0 "Caf\xe9"\n', encoding="cp1252")
+
+    document = load_loc_document(path)
+
+    assert document.encoding == "cp1252"
+    assert document.translatable_entries() == [("key:0", "Café", 2)]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 import json
+import threading
 from typing import Any
 
 import pytest
@@ -16,6 +17,7 @@ from scripts.core.services.model_arena_execution_service import (
     FAILURE_ITEM_COUNT,
     FAILURE_PARSE,
     FAILURE_PROVIDER_REQUEST,
+    FAILURE_PROVIDER_TIMEOUT,
     FAILURE_VALIDATION,
     ModelArenaExecutionService,
 )
@@ -605,3 +607,89 @@ def test_rejects_unsupported_contestant_counts(
             ],
             handler_factory=lambda item: None,
         )
+
+
+class BlockingHandler(FakeHandler):
+    def __init__(self, *args: Any, gate: threading.Barrier | threading.Event) -> None:
+        super().__init__(*args)
+        self.gate = gate
+
+    def execute_model_arena_request(self, **kwargs: Any) -> ArenaHandlerCompletion | str:
+        self.gate.wait(5)
+        return super().execute_model_arena_request(**kwargs)
+
+
+def test_parallel_contestants_overlap_and_return_in_execution_order(
+    samples: list[ArenaSample],
+    config: ArenaExecutionConfig,
+) -> None:
+    call_log: list[tuple[Any, ...]] = []
+    barrier = threading.Barrier(3)  # only passes if all three requests are in flight together
+    contestants = [contestant(f"c{index}", order=4 - index) for index in range(1, 4)]
+
+    def handler_factory(item: ArenaContestant) -> FakeHandler:
+        parsed = [f"{item.contestant_id} $RULER$", item.contestant_id]
+        return BlockingHandler(
+            item.contestant_id,
+            ArenaHandlerCompletion(json.dumps(parsed)),
+            parsed,
+            call_log,
+            gate=barrier,
+        )
+
+    service = ModelArenaExecutionService(
+        validator=FakeValidator(),  # type: ignore[arg-type]
+        max_parallel_contestants=3,
+    )
+    result = service.execute(
+        config=config,
+        samples=samples,
+        contestants=contestants,
+        handler_factory=handler_factory,
+    )
+
+    assert result.status == "voting"
+    assert [item.contestant_id for item in result.contestants] == ["c3", "c2", "c1"]
+    assert [request.contestant_id for request in result.requests] == ["c3", "c2", "c1"]
+    assert [(output.contestant_id, output.sample_id) for output in result.outputs] == [
+        (contestant_id, sample.sample_id)
+        for contestant_id in ("c3", "c2", "c1")
+        for sample in samples
+    ]
+
+
+def test_contestant_timeout_fails_only_the_slow_contestant(
+    samples: list[ArenaSample],
+    config: ArenaExecutionConfig,
+) -> None:
+    call_log: list[tuple[Any, ...]] = []
+    release = threading.Event()
+
+    def handler_factory(item: ArenaContestant) -> FakeHandler:
+        parsed = ["ok $RULER$", "ok"]
+        args = (item.contestant_id, ArenaHandlerCompletion(json.dumps(parsed)), parsed, call_log)
+        if item.contestant_id == "slow":
+            return BlockingHandler(*args, gate=release)
+        return FakeHandler(*args)
+
+    service = ModelArenaExecutionService(
+        validator=FakeValidator(),  # type: ignore[arg-type]
+        max_parallel_contestants=2,
+        contestant_timeout=0.05,
+    )
+    try:
+        result = service.execute(
+            config=config,
+            samples=samples,
+            contestants=[contestant("slow", order=1), contestant("fast", order=2)],
+            handler_factory=handler_factory,
+        )
+    finally:
+        release.set()
+
+    assert result.status == "partial_failed"
+    slow, fast = result.contestants
+    assert (slow.contestant_id, slow.status, slow.failure_code) == ("slow", "failed", FAILURE_PROVIDER_TIMEOUT)
+    assert (fast.contestant_id, fast.status) == ("fast", "completed")
+    assert result.requests[0].failure_code == FAILURE_PROVIDER_TIMEOUT
+    assert not any(event[0:2] == ("parse", "slow") for event in call_log)
@@ -0,0 +1,52 @@
+import random
+
+from scripts.core.neologism_evidence import EvidenceCorpus
+
+
+def scan_evidence(original, file_texts, max_snippets=5):
+    """The per-term scan the corpus index replaces."""
+    needle = original.casefold()
+    snippets, source_files, context_evidence, frequency = [], [], [], 0
+    for file_path, texts in file_texts.items():
+        file_matched = False
+        for text in texts:
+            count = text.casefold().count(needle)
+            if not count:
+                continue
+            frequency += count
+            file_matched = True
+            normalized_text = text.strip()
+            if len(context_evidence) < max_snippets and not any(
+                item["snippet"] == normalized_text and item["source_file"] == file_path
+                for item in context_evidence
+            ):
+                context_evidence.append({"snippet": normalized_text, "source_file": file_path, "line": None})
+            if len(snippets) < max_snippets and normalized_text not in snippets:
+                snippets.append(normalized_text)
+        if file_matched:
+            source_files.append(file_path)
+    return {
+        "context_snippets": snippets,
+        "source_files": source_files,
+        "context_evidence": context_evidence,
+        "frequency": frequency,
+    }
+
+
+def test_corpus_index_matches_per_term_scan():
+    rng = random.Random(3)
+    words = ["Void", "void", "Dweller", "aa", "Straße", "STRASSE", "Curia", "Caelestis", "a"]
+    file_texts = {
+        f"file_{file_index}.yml": [
+            " " + " ".join(rng.choice(words) for _ in range(rng.randint(1, 8))) + "aaa "
+            for _ in range(40)
+        ]
+        for file_index in range(4)
+    }
+    file_texts["file_1.yml"] += file_texts["file_1.yml"][:3]  # duplicate snippets in one file
+    originals = ["Void Dweller", "aa", "Straße", "strasse", "Curia Caelestis", "a", "Not present"]
+
+    collected = EvidenceCorpus(file_texts).collect(originals)
+
+    assert collected == [scan_evidence(original, file_texts) for original in originals]
+    assert collected[-1]["frequency"] == 0 and collected[-1]["context_snippets"] == []
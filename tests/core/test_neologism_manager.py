@@ -1,3 +1,4 @@
+import time
 from pathlib import Path
 
 import pytest
@@ -303,3 +304,100 @@ def test_reject_is_idempotent_but_does_not_overwrite_other_terminal_statuses(tmp
         "ignored": "ignored",
         "approved": "approved",
     }
+
+
+class SlowFirstFileMiner(FakeMiner):
+    def extract_terms(self, chunk, **kwargs):
+        if "Void Dweller" in chunk:
+            time.sleep(0.05)  # 第一个文件最后完成
+        return [
+            NeologismTerm(original=term, category="concept", confidence=0.8)
+            for term in ("Void Dweller", "VOID DWELLER", "Curia Caelestis")
+            if term in chunk
+        ]
+
+
+def test_concurrent_mining_aggregates_in_file_order_with_monotonic_progress(tmp_path, monkeypatch):
+    monkeypatch.setattr(neologism_module, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(neologism_module, "NEOLOGISM_MINING_WORKERS", 4)
+    monkeypatch.setattr(neologism_module, "get_handler", lambda provider, model_name=None: object())
+    monkeypatch.setattr(neologism_module, "NeologismMiner", SlowFirstFileMiner)
+    progress = []
+    monkeypatch.setattr(
+        neologism_module.task_state,
+        "update_task",
+        lambda task_id, **kwargs: progress.append((kwargs.get("progress") or {}).get("current")),
+    )
+    files = []
+    for index, text in enumerate(["The Void Dweller habitat.", "The Curia Caelestis rises.", "VOID DWELLER fleets."]):
+        source_file = tmp_path / f"source_{index}.yml"
+        source_file.write_text(f'l_english:\n key_{index}:0 "{text}"\n', encoding="utf-8")
+        files.append(str(source_file))
+
+    manager = NeologismManager()
+    assert manager.run_mining_workflow("project-1", files, "gemini", task_id="task-1") == 2
+
+    candidates = manager.load_candidates("project-1")
+    assert [candidate.original for candidate in candidates] == ["Void Dweller", "Curia Caelestis"]
+    assert candidates[0].source_files == [files[0], files[2]]
+    reported = [current for current in progress if current is not None]
+    assert reported == sorted(reported)
+    assert reported[-1] == 3
+
+
+def test_cancelled_mining_skips_queued_chunks_and_saves_nothing(tmp_path, monkeypatch):
+    monkeypatch.setattr(neologism_module, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(neologism_module, "NEOLOGISM_MINING_WORKERS", 1)
+    monkeypatch.setattr(neologism_module, "get_handler", lambda provider, model_name=None: object())
+    manager = NeologismManager()
+    calls = []
+
+    class CancellingMiner(FakeMiner):
+        def extract_terms(self, chunk, **kwargs):
+            calls.append(chunk)
+            assert manager.cancel_mining("project-1") is True
+            return super().extract_terms(chunk, **kwargs)
+
+    monkeypatch.setattr(neologism_module, "NeologismMiner", CancellingMiner)
+    source_file = tmp_path / "source.yml"
+    lines = "".join(f' key_{index}:0 "Aetherophasic Engine line {index}."\n' for index in range(200))
+    source_file.write_text("l_english:\n" + lines, encoding="utf-8")
+
+    assert manager.reserve_mining("project-1", "task-1", 1) is True
+    assert manager.run_mining_workflow("project-1", [str(source_file)], "gemini") == 0
+
+    assert len(calls) == 1
+    assert manager.get_mining_status("project-1")["status"] == "cancelled"
+    assert manager.load_candidates("project-1") == []
+    assert manager.cancel_mining("project-1") is False
+
+
+def test_rate_limited_client_paces_every_call_and_backs_off_on_429(monkeypatch):
+    from scripts.core import neologism_pipeline
+    from scripts.utils.rate_limiter import RateLimiter
+
+    sleeps = []
+    limiter = RateLimiter(rpm=60, clock=lambda: 0.0, sleep=sleeps.append)
+    limiter.configure("gemini", "flash", burst=1)
+    monkeypatch.setattr(neologism_pipeline, "rate_limiter", limiter)
+
+    class Handler:
+        provider_name = "gemini"
+        model_id = "flash"
+        responses = ["[]", RuntimeError("429 Too Many Requests")]
+
+        def generate_with_messages(self, messages, temperature=0.7):
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    client = neologism_pipeline.RateLimitedClient(Handler(), "gemini", None)
+    assert client.generate_with_messages([{"role": "user", "content": "chunk"}]) == "[]"
+    with pytest.raises(RuntimeError, match="429"):
+        client.generate_with_messages([{"role": "user", "content": "chunk"}])
+
+    metrics = limiter.for_provider("gemini", "flash").metrics()
+    assert metrics["acquired"] == 2
+    assert metrics["rate_limited"] == 1
+    assert sleeps == [pytest.approx(1.0)]
@@ -309,3 +309,58 @@ async def test_due_project_watch_records_conflict_with_active_project_write(
     assert blocked_task["created_by"]["type"] == "automation"
     assert blocked_task["result"]["metadata"]["conflicting_task_id"] == "manual-write"
     assert blocked_task["blocking"] is False
+
+
+@pytest.mark.asyncio
+async def test_project_watch_rehashes_only_files_with_new_size_or_mtime(watch_service, tmp_path, monkeypatch):
+    mod_root = tmp_path / "incremental-mod"
+    unchanged = mod_root / "localization" / "english" / "same_l_english.yml"
+    edited = mod_root / "localization" / "english" / "edited_l_english.yml"
+    write_loc(unchanged, 'l_english:\n key:0 "Same"\n')
+    write_loc(edited, 'l_english:\n key:0 "Old"\n')
+    watch = await watch_service.create_watch({"name": "Incremental Mod", "path": str(mod_root)})
+    hashed = []
+    original_sha256 = watch_service._sha256
+    monkeypatch.setattr(watch_service, "_sha256", lambda path: hashed.append(path.name) or original_sha256(path))
+
+    await watch_service.scan_watch(watch["watch_id"])
+    assert sorted(hashed) == ["edited_l_english.yml", "same_l_english.yml"]
+
+    hashed.clear()
+    write_loc(edited, 'l_english:\n key:0 "New!"\n')
+    result = await watch_service.scan_watch(watch["watch_id"])
+
+    assert hashed == ["edited_l_english.yml"]
+    assert [item["relative_path"] for item in result["modified"]] == ["localization/english/edited_l_english.yml"]
+
+
+@pytest.mark.asyncio
+async def test_due_project_watches_are_scanned_concurrently(watch_service, tmp_path, monkeypatch):
+    import asyncio
+
+    for index in range(3):
+        mod_root = tmp_path / f"due-mod-{index}"
+        mod_root.mkdir()
+        await watch_service.create_watch({
+            "name": f"Due Mod {index}",
+            "path": str(mod_root),
+            "enabled": True,
+            "scan_interval_minutes": 1,
+        })
+    active = 0
+    peak = 0
+
+    async def fake_scan(watch, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"watch_id": watch.watch_id, "status": "clean"}
+
+    monkeypatch.setattr(watch_service, "_scan_watch_task", fake_scan)
+
+    results = await watch_service.scan_due_watches()
+
+    assert len(results) == 3
+    assert peak == 3
@@ -0,0 +1,125 @@
+import asyncio
+from types import SimpleNamespace
+
+from scripts.core.anthropic_handler import AnthropicHandler
+from scripts.core.base_handler import PlannedPrompt
+from scripts.core.gemini_handler import GeminiHandler
+from scripts.core.openai_handler import OpenAIHandler
+from scripts.core.parallel_types import BatchTask, FileTask
+from scripts.core.services.initial_translation_batch_service import split_prompt_cache_warnings
+
+PREFIX = "Translate English to Simplified Chinese.\nKeep names.\n"
+
+
+def _batch_task() -> BatchTask:
+    file_task = FileTask(
+        filename="events_l_english.yml",
+        root=".",
+        original_lines=[],
+        texts_to_translate=["Hello"],
+        key_map={},
+        is_custom_loc=False,
+        target_lang={"code": "zh-CN", "name": "Simplified Chinese"},
+        source_lang={"code": "en", "name": "English"},
+        game_profile={"id": "victoria3"},
+        mod_context="",
+        provider_name="stub",
+        output_folder_name="out",
+        source_dir=".",
+        dest_dir=".",
+        client=None,
+        mod_name="Example",
+    )
+    return BatchTask(file_task=file_task, batch_index=2, start_index=0, end_index=1, texts=["Hello"])
+
+
+def _stub_handler(cls, monkeypatch, provider_name: str, client):
+    monkeypatch.setattr(cls, "initialize_client", lambda self: client)
+    monkeypatch.setattr(cls, "get_provider_config", lambda self: {"default_model": "stub-model"})
+    handler = cls(provider_name, "stub-model")
+    monkeypatch.setattr(handler, "_build_prompt", lambda task: PlannedPrompt(PREFIX + '1. "Hello"\n', PREFIX))
+    return handler
+
+
+class FakeAnthropicSession:
+    def __init__(self):
+        self.payloads = []
+
+    def post(self, url, json, timeout):
+        self.payloads.append(json)
+        usage = {"input_tokens": 12, "cache_read_input_tokens": 0, "cache_creation_input_tokens": 1500}
+        if len(self.payloads) > 1:
+            usage.update(cache_read_input_tokens=1500, cache_creation_input_tokens=0)
+        body = {"content": [{"type": "text", "text": '["你好"]'}], "usage": usage}
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: body)
+
+
+def test_anthropic_marks_stable_prefix_and_reports_cache_reads(monkeypatch):
+    session = FakeAnthropicSession()
+    handler = _stub_handler(AnthropicHandler, monkeypatch, "anthropic", session)
+    handler.base_url = "https://anthropic.invalid/v1"
+
+    first, second = _batch_task(), _batch_task()
+    assert handler.translate_batch(first).translated_texts == ["你好"]
+    handler.translate_batch(second)
+
+    content = session.payloads[0]["messages"][0]["content"]
+    assert content[0] == {"type": "text", "text": PREFIX, "cache_control": {"type": "ephemeral"}}
+    assert content[1] == {"type": "text", "text": '1. "Hello"\n'}
+    assert first.warnings[0]["cache_write_tokens"] == 1500
+    assert second.warnings == [{
+        "type": "prompt_cache",
+        "level": "info",
+        "batch_num": 3,
+        "attempt": 1,
+        "provider": "anthropic",
+        "prompt_tokens": 1512,
+        "cached_tokens": 1500,
+        "cache_write_tokens": 0,
+        "message": "Provider prompt cache served 1500 of 1512 prompt tokens.",
+    }]
+    issues, cached_tokens = split_prompt_cache_warnings(first.warnings + second.warnings + [{"type": "format"}])
+    assert issues == [{"type": "format"}] and cached_tokens == 1500
+
+
+def test_openai_compatible_usage_details_are_recorded(monkeypatch):
+    usage = SimpleNamespace(prompt_tokens=2048, prompt_tokens_details=SimpleNamespace(cached_tokens=1920))
+    response = SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content='["你好"]'))])
+    requests = []
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=lambda **kwargs: requests.append(kwargs) or response
+    )))
+    handler = _stub_handler(OpenAIHandler, monkeypatch, "openai", client)
+
+    task = handler.translate_batch(_batch_task())
+
+    assert requests[0]["messages"][1]["content"].startswith(PREFIX)
+    assert (task.warnings[0]["prompt_tokens"], task.warnings[0]["cached_tokens"]) == (2048, 1920)
+
+
+def test_gemini_async_calls_report_implicit_cache_hits(monkeypatch):
+    part = SimpleNamespace(text='["你好"]')
+    response = SimpleNamespace(
+        usage_metadata=SimpleNamespace(prompt_token_count=4096, cached_content_token_count=4000),
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))],
+    )
+
+    async def generate_content(**kwargs):
+        return response
+
+    client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+    handler = _stub_handler(GeminiHandler, monkeypatch, "gemini", client)
+    task = asyncio.run(handler.translate_batch_async(_batch_task()))
+
+    assert task.translated_texts == ["你好"]
+    assert task.warnings[0]["cached_tokens"] == 4000
+
+
+def test_uncached_responses_leave_batch_warnings_empty(monkeypatch):
+    usage = SimpleNamespace(prompt_tokens=300, prompt_tokens_details=None)
+    response = SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content='["你好"]'))])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: response)))
+    handler = _stub_handler(OpenAIHandler, monkeypatch, "openai", client)
+
+    assert handler.translate_batch(_batch_task()).warnings == []
+    assert handler._split_cacheable_prompt("plain prompt") == ("", "plain prompt")
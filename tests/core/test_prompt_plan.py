@@ -0,0 +1,73 @@
+from scripts.core import base_handler
+from scripts.core.base_handler import BaseApiHandler
+from scripts.core.parallel_types import BatchTask, FileTask
+
+
+def _file_task(mod_context: str = "Example mod") -> FileTask:
+    return FileTask(
+        filename="events_l_english.yml",
+        root=".",
+        original_lines=[],
+        texts_to_translate=[],
+        key_map={},
+        is_custom_loc=False,
+        target_lang={"code": "zh-CN", "name": "Simplified Chinese"},
+        source_lang={"code": "en", "name": "English"},
+        game_profile={"id": "victoria3", "prompt_template": "Translate {source_lang_name} to {target_lang_name}.\n"},
+        mod_context=mod_context,
+        provider_name="stub",
+        output_folder_name="out",
+        source_dir=".",
+        dest_dir=".",
+        client=object(),
+        mod_name="Example",
+    )
+
+
+def _batch(file_task: FileTask, texts, index: int = 0) -> BatchTask:
+    return BatchTask(file_task=file_task, batch_index=index, start_index=0, end_index=len(texts), texts=list(texts))
+
+
+class PrefixedHandler(BaseApiHandler):
+    def __init__(self):
+        self.config_reads = 0
+        super().__init__("stub", "stub-model")
+
+    def initialize_client(self):
+        return object()
+
+    def get_provider_config(self) -> dict:
+        self.config_reads += 1
+        return {"default_model": "stub-model", "prompt_prefix": "/no_think"}
+
+    def _call_api(self, client, prompt: str) -> str:
+        raise AssertionError("not called")
+
+
+def test_batches_reuse_one_plan_and_only_fill_dynamic_parts(monkeypatch):
+    prompt_reads = []
+    monkeypatch.setattr(base_handler.prompt_manager, "get_effective_prompt", lambda game_id: prompt_reads.append(game_id))
+    monkeypatch.setattr(base_handler.prompt_manager, "get_effective_format_prompt", lambda game_id: "")
+    monkeypatch.setattr(base_handler.prompt_manager, "get_custom_global_prompt", lambda: "Keep names.")
+    monkeypatch.setattr(base_handler.glossary_manager, "get_glossary_for_translation", lambda: None)
+    revision = [1]
+    monkeypatch.setattr(base_handler.config_manager, "revision", lambda: tuple(revision))
+    handler = PrefixedHandler()
+    file_task = _file_task()
+
+    prompts = [handler._build_prompt(_batch(file_task, [f"Text {n}", "Line\nbreak"], n)) for n in range(5)]
+
+    assert prompt_reads == ["victoria3"]
+    assert handler.config_reads == 1
+    assert prompts[0].startswith("/no_think\nTranslate English to Simplified Chinese.\nCRITICAL CONTEXT")
+    assert prompts[0].count("/no_think") == 1
+    assert "Keep names." in prompts[0]
+    assert '1. "Text 0"' in prompts[0] and '1. "Text 4"' in prompts[4]
+    assert prompts[4].endswith("- Ensure the JSON format is strictly followed.\n")
+    prefix = handler._prompt_plan(file_task).prefix
+    assert all(prompt.startswith(prefix) for prompt in prompts)
+
+    handler._build_prompt(_batch(_file_task("Another mod"), ["Text"]))
+    revision[0] = 2
+    handler._build_prompt(_batch(file_task, ["Text"]))
+    assert prompt_reads == ["victoria3"] * 3
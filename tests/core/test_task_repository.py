@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from scripts.core.db_migrations import migrate_main_database
 from scripts.core.repositories.task_repository import TaskRepository
 from scripts.shared import task_state
@@ -143,6 +145,73 @@ def test_task_page_can_exclude_child_tasks_from_rows_and_global_counts(tmp_path)
     assert complete_ledger["attention_count"] == 1
 
 
+def test_task_page_cursor_walks_time_window_without_offset(tmp_path):
+    db_path = tmp_path / "task-keyset.sqlite"
+    migrate_main_database(str(db_path))
+    repository = TaskRepository(str(db_path))
+    for index in range(7):
+        # Mixed offsets normalize to one UTC order; equal times fall back to task_id.
+        created_at = "2026-07-22T09:00:00+08:00" if index < 2 else f"2026-07-22T{index:02d}:00:00Z"
+        repository.save_task({
+            "task_id": f"task-{index}",
+            "status": "completed",
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+    repository.save_task({"task_id": "previous-day", "status": "completed", "created_at": "2026-07-21T23:59:59Z"})
+
+    seen, cursor = [], None
+    while True:
+        page = repository.query_task_page(
+            from_time="2026-07-22T00:00:00Z",
+            to_time="2026-07-23T00:00:00Z",
+            limit=3,
+            cursor=cursor,
+        )
+        assert page["total_count"] == 7
+        seen.extend(task["task_id"] for task in page["tasks"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["task-6", "task-5", "task-4", "task-3", "task-2", "task-1", "task-0"]
+    time_cursor = repository.encode_page_cursor("task_time", "2026-07-22T00:00:00.000Z", "task-0")
+    with pytest.raises(ValueError):
+        repository.query_task_page(cursor=time_cursor)
+    with pytest.raises(ValueError):
+        repository.query_task_page(cursor="not-a-cursor")
+
+
+def test_queue_counters_follow_status_archive_and_delete_changes(tmp_path):
+    db_path = tmp_path / "task-counters.sqlite"
+    migrate_main_database(str(db_path))
+    repository = TaskRepository(str(db_path))
+    repository.save_task({"task_id": "a", "status": "running", "created_at": "2026-07-22T00:00:00Z"})
+    repository.save_task({"task_id": "b", "status": "failed", "created_at": "2026-07-22T00:00:00Z"})
+    repository.save_task({"task_id": "b:1", "parent_task_id": "b", "status": "queued", "created_at": "2026-07-22T00:00:00Z"})
+
+    def counts(**kwargs):
+        page = repository.query_task_page(limit=1, **kwargs)
+        return page["total_count"], page["active_count"], page["attention_count"]
+
+    assert counts() == (3, 2, 1)
+    assert counts(include_children=False) == (2, 1, 1)
+
+    repository.save_task({"task_id": "a", "status": "completed", "created_at": "2026-07-22T00:00:00Z"})
+    repository.save_task({
+        "task_id": "b",
+        "status": "failed",
+        "created_at": "2026-07-22T00:00:00Z",
+        "archived_at": "2026-07-23T00:00:00Z",
+    })
+    assert counts() == (2, 1, 0)
+    assert counts(include_archived=True) == (3, 1, 1)
+    assert counts(statuses={"completed"}) == (1, 1, 0)
+
+    repository.prune_terminal_tasks(max_terminal_tasks=1, min_terminal_tasks=0, retention_days=1)
+    assert counts(include_archived=True) == (1, 1, 0)
+
+
 def test_task_events_default_to_user_audience_and_can_include_diagnostics(tmp_path):
     db_path = tmp_path / "task-events.sqlite"
     migrate_main_database(str(db_path))
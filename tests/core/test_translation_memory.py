@@ -0,0 +1,119 @@
+import pytest
+
+from scripts.core import translation_memory as memory_module
+from scripts.core.async_parallel_processor import AsyncParallelProcessor
+from scripts.core.parallel_processor import ParallelProcessor
+from scripts.core.parallel_types import BatchTask, FileTask
+from scripts.core.translation_memory import MemoryScope, TranslationMemory, TranslationMemoryStats
+
+
+def _file_task(filename: str, texts, target_code: str = "zh-CN", model_name: str = "gemini-pro", mod_context: str = "") -> FileTask:
+    return FileTask(
+        filename=filename,
+        root=".",
+        original_lines=[],
+        texts_to_translate=list(texts),
+        key_map={},
+        is_custom_loc=False,
+        target_lang={"code": target_code, "name": "Target"},
+        source_lang={"code": "en", "name": "English"},
+        game_profile={"id": "victoria3"},
+        mod_context=mod_context,
+        provider_name="gemini",
+        output_folder_name="out",
+        source_dir=".",
+        dest_dir=".",
+        client=object(),
+        mod_name="Example",
+        model_name=model_name,
+    )
+
+
+@pytest.fixture
+def memory(monkeypatch):
+    monkeypatch.setattr(memory_module, "glossary_fingerprint", lambda source, target: "glossary-v1")
+    store = TranslationMemory(":memory:")
+    yield store
+    store.close()
+
+
+class RecordingTranslator:
+    def __init__(self):
+        self.seen = []
+
+    def __call__(self, task: BatchTask) -> BatchTask:
+        self.seen.extend(task.texts)
+        task.translated_texts = [f"<{text}>" for text in task.texts]
+        return task
+
+
+@pytest.mark.parametrize("processor_cls", [ParallelProcessor, AsyncParallelProcessor])
+def test_stream_only_batches_memory_misses(memory, processor_cls):
+    first = RecordingTranslator()
+    processor = processor_cls(max_workers=2, chunk_size_override=2, translation_memory=memory)
+    list(processor.process_files_stream(iter([_file_task("a.yml", ["Army", "Navy"])]), first))
+    assert first.seen == ["Army", "Navy"]
+
+    second = RecordingTranslator()
+    stats = TranslationMemoryStats()
+    processor = processor_cls(max_workers=2, chunk_size_override=2, translation_memory=memory, memory_stats=stats)
+    results = list(processor.process_files_stream(
+        iter([_file_task("b.yml", ["Army", "Fleet", "Navy"]), _file_task("c.yml", ["Navy"])]),
+        second,
+    ))
+
+    assert second.seen == ["Fleet"]
+    by_name = {result[0].filename: result for result in results}
+    assert by_name["b.yml"][1] == ["<Army>", "<Fleet>", "<Navy>"]
+    assert by_name["c.yml"][1:] == (["<Navy>"], [], False)
+    assert stats.as_dict() == {"hits": 3, "misses": 1, "stored": 1, "skipped_batches": 2}
+
+
+def test_failed_files_are_not_remembered_and_parallel_path_merges_hits(memory):
+    def failing(task: BatchTask) -> BatchTask:
+        task.fell_back_to_source = True
+        task.translated_texts = task.texts
+        return task
+
+    processor = ParallelProcessor(max_workers=1, translation_memory=memory)
+    assert list(processor.process_files_stream(iter([_file_task("a.yml", ["Army"])]), failing))[0][3] is True
+    assert memory.summary()["entries"] == 0
+
+    memory.remember(MemoryScope.for_file(_file_task("a.yml", [])), ["Army"], ["军队"])
+    translator = RecordingTranslator()
+    file_results, _ = processor.process_files_parallel([_file_task("a.yml", ["Navy", "Army"])], translator)
+
+    assert translator.seen == ["Navy"]
+    assert file_results["a.yml"] == ["<Navy>", "军队"]
+
+
+def test_scope_isolates_models_and_prompt_context_and_keeps_whitespace(memory):
+    memory.remember(MemoryScope.for_file(_file_task("a.yml", [])), ["  Army ", "Navy"], ["  军队 ", "海军"])
+
+    assert memory.lookup(MemoryScope.for_file(_file_task("a.yml", [])), ["  Army ", "Army", "Navy"]) == {0: "  军队 ", 2: "海军"}
+    assert memory.lookup(MemoryScope.for_file(_file_task("a.yml", [], model_name="gemini-flash")), ["Navy"]) == {}
+    assert memory.lookup(MemoryScope.for_file(_file_task("a.yml", [], mod_context="A space mod")), ["Navy"]) == {}
+
+
+def test_lookups_do_not_write_until_hit_counts_are_flushed(memory):
+    scope = MemoryScope.for_file(_file_task("a.yml", []))
+    memory.remember(scope, ["Army"], ["军队"])
+    changes = memory.connection.total_changes
+
+    assert memory.lookup(scope, ["Army"]) == {0: "军队"}
+    assert memory.lookup(scope, ["Army"]) == {0: "军队"}
+    assert memory.connection.total_changes == changes
+    assert memory.summary() == {"entries": 1, "total_hits": 2}
+
+
+def test_scope_isolates_languages_and_glossaries_and_invalidate_clears(memory, monkeypatch):
+    memory.remember(MemoryScope.for_file(_file_task("a.yml", [])), ["Army"], ["军队"])
+
+    assert memory.lookup(MemoryScope.for_file(_file_task("a.yml", [])), ["Army", "army"]) == {0: "军队"}
+    assert memory.lookup(MemoryScope.for_file(_file_task("a.yml", [], target_code="ja")), ["Army"]) == {}
+    monkeypatch.setattr(memory_module, "glossary_fingerprint", lambda source, target: "glossary-v2")
+    assert memory.lookup(MemoryScope.for_file(_file_task("a.yml", [])), ["Army"]) == {}
+
+    assert memory.invalidate(target_lang="ja") == 0
+    assert memory.invalidate(target_lang="zh-CN", game_id="victoria3") == 1
+    assert memory.summary() == {"entries": 0, "total_hits": 0}
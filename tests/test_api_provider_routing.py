@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 from contextlib import ExitStack
@@ -9,6 +10,7 @@ import pytest
 from scripts.app_settings import API_PROVIDERS
 from scripts.core import api_handler
 from scripts.core.deepseek_handler import DeepSeekHandler
+from scripts.core.openai_handler import async_client_for, close_async_clients
 from scripts.core.openrouter_handler import OpenRouterHandler
 
 
@@ -104,6 +106,27 @@ def test_openrouter_adapter_uses_isolated_key_and_official_endpoint():
     )
 
 
+def test_openrouter_async_client_keeps_attribution_headers_until_its_loop_closes():
+    with patch("scripts.core.openrouter_handler.get_api_key", return_value="openrouter-test-key"):
+        handler = OpenRouterHandler("openrouter", model_id="deepseek/deepseek-v4-flash")
+
+    async def open_and_close():
+        async_client = async_client_for(handler.client)
+        assert async_client_for(handler.client) is async_client
+        headers = dict(async_client._custom_headers)
+        await close_async_clients()
+        return async_client, headers
+
+    async_client, headers = asyncio.run(open_and_close())
+
+    assert headers == {
+        "HTTP-Referer": "https://github.com/Drlinglong/Remis",
+        "X-OpenRouter-Title": "Remis",
+    }
+    assert str(async_client.base_url) == "https://openrouter.ai/api/v1/"
+    assert async_client.is_closed()
+
+
 def test_openrouter_chat_preserves_provider_failure():
     class FailingCompletions:
         @staticmethod
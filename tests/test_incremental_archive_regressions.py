@@ -343,3 +343,94 @@ def test_update_translations_uses_source_entry_lookup_row_directly(temp_archive_
 
     assert len(entries) == 1
     assert entries[0]["translation"] == "Updated"
+
+
+def test_translation_archiver_buffers_files_until_flush(temp_archive_db):
+    mod_id = temp_archive_db.get_or_create_mod_entry("BulkArchiveMod", "bulk-archive-project")
+    files = [
+        {
+            "filename": f"file_{index}_l_english.yml",
+            "file_path": f"localisation/english/file_{index}_l_english.yml",
+            "texts_to_translate": ["Alpha", "Beta"],
+            "key_map": [{"key_part": f"file{index}.one"}, {"key_part": f"file{index}.two"}],
+        }
+        for index in range(3)
+    ]
+    version_id = temp_archive_db.create_source_version(mod_id, files)
+
+    def translated_count():
+        return temp_archive_db.connection.execute(
+            "SELECT COUNT(*) FROM translated_entries WHERE language_code = 'zh-CN'"
+        ).fetchone()[0]
+
+    with temp_archive_db.open_translation_archiver(version_id, files, "zh-CN") as archiver:
+        for file_data in files:
+            assert archiver.add_file_results({file_data["file_path"]: ["甲", "乙"]}) == 2
+        assert archiver.pending_count == 6
+        assert translated_count() == 0
+
+    assert archiver.archived_count == 6
+    assert translated_count() == 6
+
+    archiver.add_file_results({files[0]["file_path"]: ["新甲", "新乙"]})
+    assert archiver.flush() == 2
+    assert translated_count() == 6
+
+
+def test_translation_archiver_reports_files_only_after_their_rows_commit(temp_archive_db):
+    mod_id = temp_archive_db.get_or_create_mod_entry("BulkArchiveMod", "bulk-archive-project")
+    files = [{
+        "filename": "file_l_english.yml",
+        "file_path": "localisation/english/file_l_english.yml",
+        "texts_to_translate": ["Alpha"],
+        "key_map": [{"key_part": "file.one"}],
+    }]
+    version_id = temp_archive_db.create_source_version(mod_id, files)
+    archived = []
+
+    archiver = temp_archive_db.open_translation_archiver(version_id, files, "zh-CN")
+    archiver.add_file_results({files[0]["file_path"]: ["甲"]}, on_archived=lambda: archived.append("first"))
+    assert archived == []
+    assert archiver.flush() == 1
+    assert archived == ["first"]
+
+    archiver.add_file_results({files[0]["file_path"]: ["乙"]}, on_archived=lambda: archived.append("second"))
+    temp_archive_db.connection.execute("DROP TABLE translated_entries")
+    assert archiver.flush() == 0
+    assert archived == ["first"]
+
+
+def test_crash_before_run_end_loses_only_files_past_the_checkpoint_flush(temp_archive_db, tmp_path):
+    from scripts.core.archive_bulk_writer import BulkTranslationArchiver
+    from scripts.core.checkpoint_manager import CheckpointManager
+
+    mod_id = temp_archive_db.get_or_create_mod_entry("BulkArchiveMod", "bulk-archive-project")
+    files = [
+        {
+            "filename": f"file_{index}_l_english.yml",
+            "file_path": f"localisation/english/file_{index}_l_english.yml",
+            "texts_to_translate": ["Alpha"],
+            "key_map": [{"key_part": f"file{index}.one"}],
+        }
+        for index in range(3)
+    ]
+    version_id = temp_archive_db.create_source_version(mod_id, files)
+    checkpoint = CheckpointManager(str(tmp_path))
+
+    archiver = BulkTranslationArchiver(temp_archive_db, version_id, files, "zh-CN", checkpoint_files=2, checkpoint_interval=3600)
+    for file_data in files:
+        archiver.add_file_results(
+            {file_data["file_path"]: ["甲"]},
+            on_archived=lambda name=file_data["filename"]: checkpoint.mark_file_completed(name),
+        )
+    # Crash: the run never reaches archiver.flush().
+
+    resumed = CheckpointManager(str(tmp_path))
+    archived_keys = {
+        row[0] for row in temp_archive_db.connection.execute(
+            "SELECT s.entry_key FROM translated_entries t JOIN source_entries s ON s.source_entry_id = t.source_entry_id"
+        )
+    }
+    assert resumed.completed_files == {"file_0_l_english.yml", "file_1_l_english.yml"}
+    assert archived_keys == {"file0.one", "file1.one"}
+    assert archiver.pending_count == 1
@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from scripts.core.services.initial_translation_fanout_service import (
+    LanguageProgressAggregator,
+    plan_language_fanout,
+    run_languages_concurrently,
+    translate_target_languages,
+)
+from scripts.utils.rate_limiter import rate_limiter
+
+
+def test_plan_language_fanout_splits_worker_budget_between_languages():
+    assert plan_language_fanout(8, "gemini", 3) == (3, 2)
+    assert plan_language_fanout(2, "gemini", 6) == (2, 1)
+    assert plan_language_fanout(None, "ollama", 4) == (1, 1)
+
+
+def test_language_progress_aggregator_sums_language_streams():
+    calls = []
+    aggregator = LanguageProgressAggregator(lambda **kwargs: calls.append(kwargs), ["de", "fr"], total_batches=5)
+
+    aggregator.for_language("de")(current=2, total=5, current_file="a.yml", current_batch=2, total_batches=5)
+    aggregator.for_language("fr")(current=1, total=5, current_file="b.yml", error_count=1)
+    aggregator.log(log_message="shared log line")
+
+    assert [(call["current"], call["total"], call["error_count"]) for call in calls] == [
+        (2, 10, 0),
+        (3, 10, 1),
+        (3, 10, 1),
+    ]
+    assert calls[1]["current_file"] == "[FR] b.yml"
+    assert calls[2]["log_message"] == "shared log line"
+
+
+def test_run_languages_concurrently_overlaps_languages_and_reports_failures():
+    barrier = threading.Barrier(2, timeout=5)
+    seen = []
+
+    def translate_language(target_lang, concurrency_limit, progress_callback, bridge_logs):
+        barrier.wait()
+        seen.append((target_lang["code"], concurrency_limit, bridge_logs))
+        # Both languages hold their own fair-share lane of the provider's RPM budget.
+        assert set(rate_limiter.for_provider("gemini", None)._lanes) == {"de", "fr"}
+        barrier.wait()
+        if target_lang["code"] == "fr":
+            raise RuntimeError("fr failed")
+
+    with pytest.raises(RuntimeError, match="fr failed"):
+        run_languages_concurrently(
+            [{"code": "de", "name": "German"}, {"code": "fr", "name": "French"}],
+            translate_language,
+            selected_provider="gemini",
+            concurrency_limit=4,
+            rpm_limit=None,
+            total_batches=3,
+            progress_callback=None,
+        )
+
+    assert sorted(seen) == [("de", 2, False), ("fr", 2, False)]
+    assert rate_limiter.for_provider("gemini", None)._lanes == {}
+
+
+def test_translate_target_languages_runs_sequentially_by_default():
+    calls = []
+
+    last = translate_target_languages(
+        lambda **kwargs: calls.append((kwargs["target_lang"]["code"], kwargs["concurrency_limit"])),
+        [{"code": "de"}, {"code": "fr"}],
+        selected_provider="gemini",
+        concurrency_limit=3,
+    )
+
+    assert calls == [("de", 3), ("fr", 3)]
+    assert last == {"code": "fr"}
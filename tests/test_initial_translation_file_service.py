@@ -238,3 +238,48 @@ def test_finalize_failed_file_writes_fallback_without_success_side_effects(monke
     assert checkpoint.completed == []
     assert synced_paths == []
     assert archive_calls == []
+
+
+def test_finalize_checkpoints_buffered_file_only_after_archive_flush(monkeypatch, tmp_path):
+    source_root = str(tmp_path / "source")
+    monkeypatch.setattr(file_service, "SOURCE_DIR", source_root)
+    monkeypatch.setattr(file_service, "DEST_DIR", str(tmp_path / "dest"))
+    monkeypatch.setattr(
+        file_service.file_builder,
+        "rebuild_and_write_file",
+        lambda *args: os.path.join(args[4], args[5]),
+    )
+    task = _file_task(source_root)
+    checkpoint = FakeCheckpoint()
+
+    class FakeArchiveWriter:
+        def __init__(self):
+            self.on_archived = []
+
+        def add_file_results(self, file_results, on_archived=None):
+            self.on_archived.append(on_archived)
+            return 1
+
+        def flush(self):
+            for callback in self.on_archived:
+                callback()
+
+    writer = FakeArchiveWriter()
+    file_service.finalize_translated_file(
+        task,
+        translated_texts=["你好"],
+        is_failed=False,
+        target_lang={"code": "zh-CN", "key": "l_simp_chinese"},
+        output_folder_name="zh-CN-MyMod",
+        game_profile={"source_localization_folder": "localization"},
+        proofreading_tracker=FakeTracker(),
+        checkpoint_manager=checkpoint,
+        project_id=None,
+        version_id=9,
+        all_files_content=[{"filename": "events_l_english.yml"}],
+        archive_writer=writer,
+    )
+
+    assert checkpoint.completed == []
+    writer.flush()
+    assert checkpoint.completed == ["events_l_english.yml"]
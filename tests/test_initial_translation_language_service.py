@@ -13,9 +13,10 @@ class FakeFileTask:
 
 
 class FakeProcessor:
-    def __init__(self, max_workers, chunk_size_override):
+    def __init__(self, max_workers, chunk_size_override, translation_memory=None, memory_stats=None, batch_plan_stats=None):
         self.max_workers = max_workers
         self.chunk_size_override = chunk_size_override
+        self.translation_memory = translation_memory
 
     def process_files_stream(self, file_task_generator, translation_function):
         yield (FakeFileTask(), ["translated"], [], False)
@@ -32,7 +33,8 @@ def _run_language(monkeypatch, calls, processor_cls=FakeProcessor):
     monkeypatch.setattr(language_service, "build_file_task_iterator", lambda *args, **kwargs: iter(["task"]))
     monkeypatch.setattr(language_service, "resolve_max_workers", lambda *args: 2)
     monkeypatch.setattr(language_service, "ParallelProcessor", processor_cls)
-    monkeypatch.setattr(language_service, "temporary_rpm_limit", lambda rpm: _null_context(calls, "rpm"))
+    monkeypatch.setattr(language_service, "resolve_translation_memory", lambda: None)
+    monkeypatch.setattr(language_service, "temporary_rpm_limit", lambda rpm, *scope: _null_context(calls, "rpm"))
     monkeypatch.setattr(language_service, "progress_log_bridge", lambda logger: _null_context(calls, "progress_log"))
     monkeypatch.setattr(language_service, "log_batch_warnings", lambda *args: calls.append(("warnings", args)))
     monkeypatch.setattr(language_service, "finalize_translated_file", lambda *args: calls.append(("finalize_file", args)))
@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 
 from scripts.core.post_processing_manager import PostProcessingManager
@@ -36,3 +37,82 @@ def test_post_processing_validation_uses_source_context(tmp_path):
     assert stats["files_with_issues"] == 1
     result = next(iter(manager.validation_results.values()))[0]
     assert result.code == "validation_vic3_variable_parity_mismatch"
+
+
+def _write_mod(tmp_path, file_count):
+    source_root = tmp_path / "source_mod"
+    output_root = tmp_path / "output_mod"
+    for index in range(file_count):
+        source_file = source_root / "localization" / "simp_chinese" / "nested" / f"demo{index}_l_simp_chinese.yml"
+        target_file = output_root / "localization" / "english" / f"demo{index}_l_english.yml"
+        source_file.parent.mkdir(parents=True, exist_ok=True)
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        source_file.write_text(f'l_simp_chinese:\n demo.{index}:0 "你好，$NAME$。"\n demo.ok{index}:0 "好"\n', encoding="utf-8-sig")
+        body = "Hello." if index % 2 else "Hello $NAME$.#！"
+        target_file.write_text(f'l_english:\n demo.{index}:0 "{body}"\n demo.ok{index}:0 "Good"\n', encoding="utf-8-sig")
+    return source_root, output_root
+
+
+def _run(source_root, output_root, max_workers):
+    manager = PostProcessingManager(
+        {"id": "victoria3", "name": "Victoria 3", "source_localization_folder": "localization"},
+        str(output_root),
+        source_root=str(source_root),
+        max_workers=max_workers,
+    )
+    manager.run_validation({"code": "en", "key": "l_english"}, {"code": "zh-CN", "key": "l_simp_chinese"})
+    return manager
+
+
+def test_parallel_validation_merges_the_same_results_in_scan_order(tmp_path, monkeypatch):
+    from scripts.core.services import parallel_validation_service
+
+    monkeypatch.setattr(parallel_validation_service, "PARALLEL_VALIDATION_MIN_FILES", 1)
+    source_root, output_root = _write_mod(tmp_path, 6)
+
+    parallel = _run(source_root, output_root, max_workers=2)
+    serial = _run(source_root, output_root, max_workers=1)
+
+    def rows(manager):
+        return [
+            (Path(path).name, result.line_number, result.code, result.message, result.details)
+            for path, results in manager.validation_results.items()
+            for result in results
+        ]
+
+    assert parallel.get_validation_stats() == serial.get_validation_stats()
+    assert parallel.get_validation_stats()["files_with_issues"] == 6
+    assert rows(parallel) == rows(serial)
+    # The sanitizer rewrote the odd "#！" marker in the worker process.
+    assert "#！" not in (output_root / "localization" / "english" / "demo0_l_english.yml").read_text(encoding="utf-8-sig")
+
+
+def test_parallel_validation_formats_messages_in_the_parent_language(tmp_path, monkeypatch):
+    from scripts.core.services import parallel_validation_service
+    from scripts.utils import i18n
+
+    monkeypatch.setattr(parallel_validation_service, "PARALLEL_VALIDATION_MIN_FILES", 1)
+    previous_language = i18n.get_current_language()
+    source_root, output_root = _write_mod(tmp_path, 4)
+    i18n.load_language("en_US")
+    try:
+        parallel = _run(source_root, output_root, max_workers=2)
+        serial = _run(source_root, output_root, max_workers=1)
+        worker_context = parallel_validation_service.ValidationContext("victoria3", {"code": "en"}, "zh-CN")
+    finally:
+        i18n.load_language(previous_language)
+
+    def messages(manager):
+        return [(result.code, result.message, result.details) for results in manager.validation_results.values() for result in results]
+
+    assert worker_context.ui_language == "en_US"
+    # A spawned worker starts on the default language; the initializer switches it to the parent's.
+    try:
+        parallel_validation_service._init_worker(worker_context)
+        assert i18n.get_current_language() == "en_US"
+    finally:
+        logging.disable(logging.NOTSET)
+        i18n.load_language(previous_language)
+    assert messages(parallel) == messages(serial)
+    assert messages(parallel)
+    assert not any("\u4e00" <= char <= "\u9fff" for _, message, _ in messages(parallel) for char in message)
@@ -1,3 +1,4 @@
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -340,3 +341,76 @@ async def test_save_rejects_stale_document_revision_without_writing(tmp_path):
         )
 
     assert target.read_text(encoding="utf-8-sig") == original
+
+
+class FakeArchiveManager:
+    def __init__(self):
+        self.calls = 0
+        self.connection = sqlite3.connect(":memory:")
+
+    def get_entries(self, mod_name, file_path, language):
+        self.calls += 1
+        return [{"key": f"demo.{index}:0", "translation": f"AI {index}"} for index in range(30)]
+
+
+def _contents_built(service) -> bool:
+    return any(document._contents is not None for document in service._documents.values())
+
+
+@pytest.mark.asyncio
+async def test_proofread_window_pages_rows_and_reuses_the_parsed_document(tmp_path):
+    target = tmp_path / "demo_l_english.yml"
+    lines = ["l_english:\n", " # header comment\n"] + [f' demo.{index}:0 "Line {index}"\n' for index in range(30)]
+    target.write_text("".join(lines), encoding="utf-8-sig")
+    archive = FakeArchiveManager()
+    manager = FakeProjectManager(
+        files=[{"file_id": "file-1", "file_path": str(target)}],
+        project={"name": "Demo", "source_path": str(tmp_path), "source_language": "en"},
+    )
+    service = ProofreadingService(manager, archive_manager=archive)
+
+    window = await service.get_proofread_window("project-1", "file-1", start=2, count=5)
+    assert (window["total_rows"], window["total_entries"], window["total_lines"]) == (32, 30, 32)
+    assert [row["key"] for row in window["rows"]] == [f"demo.{index}:0" for index in range(5)]
+    assert [entry["translation"] for entry in window["entries"]] == [f"Line {index}" for index in range(5)]
+    assert "ai_content" not in window and _contents_built(service) is False
+
+    by_line = await service.get_proofread_window("project-1", "file-1", start=30, count=10, by="line")
+    assert [row["line_number"] for row in by_line["rows"]] == [31, 32]
+    assert archive.calls == 1
+
+    full = await service.get_proofread_data("project-1", "file-1")
+    assert full["rows"][2:7] == window["rows"] and full["ai_content"].count("AI ") == 30
+    assert full["document_revision"] == window["document_revision"]
+
+    target.write_text("".join(lines[:-1]), encoding="utf-8-sig")
+    edited = await service.get_proofread_window("project-1", "file-1", by="line", include_content=True)
+    assert edited["total_entries"] == 29 and archive.calls == 2
+    assert edited["final_content"].count("Line ") == 29
+
+    with pytest.raises(ProofreadingDataError) as exc_info:
+        await service.get_proofread_window("project-1", "file-1", by="page")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_archive_writes_rebuild_the_cached_ai_draft(tmp_path):
+    target = tmp_path / "demo_l_english.yml"
+    target.write_text('l_english:\n demo.0:0 "Line 0"\n', encoding="utf-8-sig")
+    archive = FakeArchiveManager()
+    manager = FakeProjectManager(
+        files=[{"file_id": "file-1", "file_path": str(target)}],
+        project={"name": "Demo", "source_path": str(tmp_path), "source_language": "en"},
+    )
+    service = ProofreadingService(manager, archive_manager=archive)
+
+    first = await service.get_proofread_data("project-1", "file-1")
+    await service.get_proofread_data("project-1", "file-1")
+    assert archive.calls == 1
+
+    # e.g. the deferred bulk flush of a running translation commits the file's rows
+    archive.connection.execute("CREATE TABLE translated_entries (translated_text TEXT)")
+    archive.connection.execute("INSERT INTO translated_entries VALUES ('AI 0')")
+    second = await service.get_proofread_data("project-1", "file-1")
+    assert archive.calls == 2
+    assert second["document_revision"] == first["document_revision"]
\ No newline at end of file
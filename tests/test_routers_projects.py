@@ -762,6 +762,32 @@ def test_project_validation_status_keeps_distinct_details_for_same_key(mock_proj
     assert payload["issue_type_counts"] == {"variable_mismatch": 2}
 
 
+def test_project_validation_status_can_return_counts_only(mock_project_manager, tmp_path):
+    source_root = tmp_path / "source" / "DemoMod"
+    source_root.mkdir(parents=True)
+    (source_root / ".remis_errors.json").write_text(
+        json.dumps([
+            {"file_name": "a.yml", "key": "a.key", "error_code": "variable_mismatch", "status": "detected"},
+            {"file_name": "b.yml", "key": "b.key", "error_code": "variable_mismatch", "status": "fixed"},
+        ]),
+        encoding="utf-8",
+    )
+    mock_project_manager.get_project.return_value = {
+        "project_id": "proj-1",
+        "source_path": str(source_root),
+    }
+
+    client = TestClient(app)
+    response = client.get("/api/project/proj-1/validation-status", params={"include_issues": "false"})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["issues_count"] == 1
+    assert payload["issues"] == []
+    assert payload["issue_type_counts"] == {"variable_mismatch": 1}
+    mock_project_manager.get_project_files.assert_not_called()
+
+
 def test_project_validation_status_groups_explicit_run_metadata(mock_project_manager, tmp_path):
     source_root = tmp_path / "source" / "DemoMod"
     current_en = tmp_path / "translation" / "english-output"
@@ -162,3 +162,16 @@ def test_get_proofread_revision_returns_lightweight_revision():
     assert response.status_code == 200
     assert response.json() == {"document_revision": "revision-2"}
     mock_service.get_document_revision.assert_awaited_once_with("project-1", "file-1")
+
+
+def test_get_proofread_window_passes_query_parameters():
+    mock_service = MagicMock()
+    mock_service.get_proofread_window = AsyncMock(return_value={"rows": [], "total_rows": 0})
+
+    with patch("scripts.routers.proofreading.proofreading_service", mock_service):
+        response = client.get("/api/proofread/project-1/file-1/window?start=400&count=100&by=line&include_content=true")
+
+    assert response.status_code == 200
+    mock_service.get_proofread_window.assert_awaited_once_with(
+        "project-1", "file-1", start=400, count=100, by="line", include_content=True
+    )
@@ -36,7 +36,11 @@ def test_reset_db_endpoint_rebuilds_main_database(monkeypatch):
     fake_engine = _FakeEngine()
     fake_archive_manager = _FakeArchiveManager()
 
-    monkeypatch.setattr(system_router, "_remove_sqlite_family", removed_paths.append)
+    monkeypatch.setattr(
+        system_router,
+        "_remove_sqlite_family",
+        lambda path: removed_paths.append(path) or configured_repositories.append(("removed", path)),
+    )
     monkeypatch.setattr(db_initializer, "initialize_database", lambda: initialize_called.__setitem__("value", True))
     monkeypatch.setattr(services, "archive_manager", fake_archive_manager)
     monkeypatch.setattr(
@@ -58,8 +62,10 @@ def test_reset_db_endpoint_rebuilds_main_database(monkeypatch):
     assert fake_archive_manager._conn is None
     assert fake_engine.disposed is True
     assert not hasattr(db_manager, "_async_engine")
-    assert len(configured_repositories) == 1
-    configured_repository, configure_options = configured_repositories[0]
+    # The old ledger is detached (and its connection closed) before the files are deleted.
+    assert configured_repositories[:2] == [(None, {}), ("removed", system_router.REMIS_DB_PATH)]
+    assert len(configured_repositories) == 3
+    configured_repository, configure_options = configured_repositories[2]
     assert os.path.normcase(os.path.normpath(configured_repository.db_path)) == os.path.normcase(
         os.path.normpath(system_router.REMIS_DB_PATH)
     )
@@ -554,3 +554,106 @@ async def test_task_summary_resolves_human_project_context(monkeypatch):
     assert detail.project_context.name == "Remis Plan - Demo Mod"
     assert detail.project_context.game_id == "victoria3"
     assert detail.blocking is True
+
+
+def test_progress_updates_are_coalesced_until_status_change(tmp_path, monkeypatch):
+    db_path = tmp_path / "task-write-behind.sqlite"
+    migrate_main_database(str(db_path))
+    repository = TaskRepository(str(db_path))
+    monkeypatch.setattr(task_state, "TASK_PROGRESS_FLUSH_SECONDS", 60.0)
+    writes = []
+    original_save_task = repository.save_task
+    monkeypatch.setattr(
+        repository,
+        "save_task",
+        lambda task, **kwargs: writes.append(task["status"]) or original_save_task(task, **kwargs),
+    )
+    task_state.configure_repository(repository)
+    try:
+        task_state.create_task("busy-task", status="running", log_message="Started.")
+        metrics_before = task_state.get_write_metrics()
+        for index in range(1, 11):
+            task_state.update_progress("busy-task", current=index, total=10, log_message=f"Batch {index} done.", push=True)
+
+        assert writes == ["running"]
+        assert task_state.get_task("busy-task")["progress"]["current"] == 10
+        assert task_state.get_write_metrics()["coalesced_writes"] - metrics_before["coalesced_writes"] == 10
+
+        task_state.update_task("busy-task", status="completed", push=False)
+
+        assert writes == ["running", "completed"]
+        persisted = repository.get_task("busy-task")
+        assert persisted["progress"]["current"] == 10
+        assert persisted["log"] == ["Started."] + [f"Batch {index} done." for index in range(1, 11)]
+        assert task_state.get_write_metrics()["pending_tasks"] == 0
+        assert repository._connect() is repository._connect()
+    finally:
+        task_state.configure_repository(None)
+        repository.close()
+
+
+def test_deferred_task_update_returns_a_detached_snapshot(tmp_path, monkeypatch):
+    db_path = tmp_path / "task-write-behind-snapshot.sqlite"
+    migrate_main_database(str(db_path))
+    repository = TaskRepository(str(db_path))
+    monkeypatch.setattr(task_state, "TASK_PROGRESS_FLUSH_SECONDS", 60.0)
+    task_state.configure_repository(repository)
+    try:
+        task_state.create_task("snapshot-task", status="running", log_message="Started.")
+        metrics_before = task_state.get_write_metrics()
+        snapshot = task_state.update_task("snapshot-task", summary={"stats": {"files": 1}}, push=False)
+        assert task_state.get_write_metrics()["coalesced_writes"] - metrics_before["coalesced_writes"] == 1
+
+        snapshot["summary"]["stats"]["files"] = 99
+        snapshot["log"].append("Injected.")
+
+        live = task_state.get_task("snapshot-task")
+        assert live["summary"]["stats"] == {"files": 1}
+        assert live["log"] == ["Started."]
+    finally:
+        task_state.configure_repository(None)
+        repository.close()
+
+
+def test_replacing_the_repository_flushes_and_closes_the_old_ledger(tmp_path, monkeypatch):
+    old_path = tmp_path / "task-ledger-old.sqlite"
+    new_path = tmp_path / "task-ledger-new.sqlite"
+    migrate_main_database(str(old_path))
+    migrate_main_database(str(new_path))
+    old_repository = TaskRepository(str(old_path))
+    new_repository = TaskRepository(str(new_path))
+    monkeypatch.setattr(task_state, "TASK_PROGRESS_FLUSH_SECONDS", 60.0)
+    task_state.configure_repository(old_repository)
+    try:
+        task_state.create_task("handover-task", status="running", log_message="Started.")
+        # Coalesced progress is not copied for a caller that does not use the result.
+        assert task_state.update_progress("handover-task", current=3, total=4) is None
+
+        task_state.configure_repository(new_repository)
+
+        assert old_repository._connection is None
+        assert task_state.get_write_metrics()["pending_tasks"] == 0
+        assert TaskRepository(str(old_path)).get_task("handover-task")["progress"]["current"] == 3
+    finally:
+        task_state.configure_repository(None)
+        new_repository.close()
+
+
+def test_task_events_flush_coalesced_progress_first(tmp_path, monkeypatch):
+    db_path = tmp_path / "task-write-behind-events.sqlite"
+    migrate_main_database(str(db_path))
+    repository = TaskRepository(str(db_path))
+    monkeypatch.setattr(task_state, "TASK_PROGRESS_FLUSH_SECONDS", 60.0)
+    task_state.configure_repository(repository)
+    try:
+        task_state.create_task("chatty-task", status="running", log_message="Started.")
+        task_state.update_progress("chatty-task", current=1, total=2, log_message="Halfway.")
+        task_state.append_task_event("chatty-task", "Provider retry", level="warning")
+
+        events = task_state.get_task_events("chatty-task", include_diagnostics=True)
+
+        assert [event["message"] for event in events] == ["Started.", "Halfway.", "Provider retry"]
+        assert repository.get_task("chatty-task")["progress"]["current"] == 1
+    finally:
+        task_state.configure_repository(None)
+        repository.close()
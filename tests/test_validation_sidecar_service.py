@@ -0,0 +1,52 @@
+import json
+import os
+
+from scripts.core.services import validation_sidecar_service
+from scripts.core.services.validation_sidecar_service import ValidationSidecarCache, ValidationSidecarService
+
+
+def _write_sidecar(path, issues, mtime):
+    path.write_text(json.dumps({"issues": issues}), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_load_status_reuses_parsed_sidecars_until_one_is_rewritten(monkeypatch, tmp_path):
+    cache = ValidationSidecarCache()
+    monkeypatch.setattr(validation_sidecar_service, "validation_sidecar_cache", cache)
+    service = ValidationSidecarService()
+    sidecar = tmp_path / ".remis_errors.json"
+    issue = {"file_name": "a.yml", "key": "a.key", "error_code": "variable_mismatch", "status": "detected"}
+    _write_sidecar(sidecar, [issue], 1000)
+
+    first = service.load_status(str(tmp_path))
+    second = service.load_status(str(tmp_path), include_issues=False)
+
+    assert first["issues"] == [issue]
+    assert second["issues"] == [] and second["issue_count"] == 1
+    assert second["issue_type_counts"] == {"variable_mismatch": 1}
+    assert (cache.misses, cache.hits) == (2, 3)
+
+    _write_sidecar(sidecar, [issue, {**issue, "key": "b.key", "error_code": "missing_key"}], 1000)
+    third = service.load_status(str(tmp_path))
+
+    assert third["issue_type_counts"] == {"variable_mismatch": 1, "missing_key": 1}
+    assert third["sidecar_candidates"][0]["issue_count"] == 2
+    assert (cache.misses, cache.hits) == (4, 4)
+
+
+def test_invalidate_drops_the_sidecar_and_merges_that_read_it(tmp_path):
+    cache = ValidationSidecarCache()
+    sidecar = tmp_path / "workshop_issues.json"
+    _write_sidecar(sidecar, [], 1000)
+    reads = []
+
+    def read(path):
+        reads.append(path)
+        return len(reads)
+
+    assert cache.load(sidecar, read) == cache.load(sidecar, read) == 1
+    assert cache.merged([sidecar], lambda: "merged") == "merged"
+    cache.invalidate(sidecar)
+
+    assert cache.load(sidecar, read) == 2
+    assert cache.merged([sidecar], lambda: "rebuilt") == "rebuilt"
@@ -149,3 +149,80 @@ def test_export_writes_project_run_and_source_version_metadata(tmp_path):
     assert issue["project_id"] == "project-1"
     assert issue["run_id"] == "run-1"
     assert issue["source_version_id"] == 42
+
+
+def test_source_tree_is_indexed_and_parsed_once_across_languages(tmp_path, monkeypatch):
+    from scripts.core import loc_parser, source_file_index
+    from scripts.core.loc_parser import LocDocumentCache
+    from scripts.core.source_file_index import SourceIndexRegistry
+
+    monkeypatch.setattr(source_file_index, "source_tree_indexes", SourceIndexRegistry())
+    monkeypatch.setattr(loc_parser, "loc_document_cache", LocDocumentCache())
+    from scripts.core.services import workshop_issue_export_service as export_module
+    monkeypatch.setattr(export_module, "source_tree_indexes", source_file_index.source_tree_indexes)
+    parsed = []
+    real_entries = loc_parser.LocDocument.translatable_entries
+    monkeypatch.setattr(loc_parser.LocDocument, "translatable_entries", lambda doc: parsed.append(doc.path) or real_entries(doc))
+    walks = []
+    real_walk = source_file_index.os.walk
+    monkeypatch.setattr(source_file_index.os, "walk", lambda root: walks.append(root) or real_walk(root))
+
+    source_root = tmp_path / "source"
+    # Source files live in a different folder than the output mirrors, so lookups go through the name index.
+    for index in range(3):
+        _write_loc(source_root / "localization" / "replace" / f"s{index}_l_english.yml", f'l_english:\n demo.{index}:0 "Hello $NAME$."\n')
+
+    exporter = WorkshopIssueExportService()
+    for code, paradox in (("zh-CN", "simp_chinese"), ("fr", "french")):
+        output_root = tmp_path / f"output_{paradox}"
+        for index in range(3):
+            _write_loc(output_root / "localization" / paradox / f"s{index}_l_{paradox}.yml", f'l_{paradox}:\n demo.{index}:0 "Hello."\n')
+        result = exporter.export_for_output(
+            output_root=output_root,
+            source_root=source_root,
+            source_lang_info={"code": "en", "key": "l_english"},
+            target_lang_info={"code": code, "key": f"l_{paradox}"},
+            game_profile={"id": "victoria3"},
+            workflow="test",
+        )
+        assert {issue["source_str"] for issue in result["issues"]} == {"Hello $NAME$."}
+        assert all(issue["source_file"].startswith("localization/replace/") for issue in result["issues"])
+
+    assert len(walks) == 1
+    assert len([path for path in parsed if source_root in Path(path).parents]) == 3
+
+
+def test_source_index_picks_up_files_added_after_it_was_built(tmp_path):
+    from scripts.core.source_file_index import SourceIndexRegistry
+
+    registry = SourceIndexRegistry()
+    _write_loc(tmp_path / "localization" / "a_l_english.yml", "l_english:\n")
+    assert registry.find(tmp_path, "localization/A_L_ENGLISH.yml", scope="run-1").name == "a_l_english.yml"
+
+    _write_loc(tmp_path / "localization" / "sub" / "b_l_english.yml", "l_english:\n")
+    assert registry.find(tmp_path, "other/b_l_english.yml", scope="run-1") is None  # one walk per export
+    assert registry.find(tmp_path, "other/b_l_english.yml", scope="run-2").parent.name == "sub"
+
+
+def test_source_index_prefers_the_exact_path_over_a_stale_name_match(tmp_path):
+    from scripts.core.source_file_index import SourceIndexRegistry
+
+    registry = SourceIndexRegistry()
+    _write_loc(tmp_path / "localization" / "old" / "a_l_english.yml", "l_english:\n")
+    assert registry.find(tmp_path, "localization/replace/a_l_english.yml", scope="run-1").parent.name == "old"
+
+    _write_loc(tmp_path / "localization" / "replace" / "a_l_english.yml", "l_english:\n")
+    assert registry.find(tmp_path, "localization/replace/a_l_english.yml", scope="run-1").parent.name == "replace"
+    (tmp_path / "localization" / "old" / "a_l_english.yml").unlink()
+    assert registry.find(tmp_path, "localization/other/a_l_english.yml", scope="run-1").parent.name == "replace"
+
+
+def test_source_index_registry_keeps_only_the_most_recent_roots(tmp_path):
+    from scripts.core.source_file_index import SourceIndexRegistry
+
+    registry = SourceIndexRegistry(max_roots=2)
+    for name in ("a", "b", "a", "c"):
+        _write_loc(tmp_path / name / "x_l_english.yml", "l_english:\n")
+        registry.find(tmp_path / name, "missing/x_l_english.yml")
+
+    assert sorted(Path(root).name for root in registry._indexes) == ["a", "c"]
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import MagicMock
-from scripts.utils.glossary_validator import GlossaryValidator
+from scripts.utils.glossary_validator import GlossaryValidationIndex, GlossaryValidator
 from scripts.core.parallel_types import BatchTask, FileTask
 
 # --- Mocks and Fixtures ---
@@ -106,3 +106,42 @@ def test_glossary_validator(validator, mock_i18n, name, source_lang, target_lang
         assert len(warnings) > 0, f"Test case '{name}' should have produced a warning, but did not."
     else:
         assert len(warnings) == 0, f"Test case '{name}' produced an unexpected warning: {warnings}"
+
+
+def test_validation_index_counts_match_per_term_regex_scans(validator, mock_i18n):
+    glossary = {"fleet": "flota", "star fleet": "gwiezdna flota", "port": "port", "U.S.": "USA"}
+    index = GlossaryValidationIndex(glossary, "en", "pl")
+    mock_batch_task = BatchTask(
+        file_task=MockFileTask("test.yml", "en", "pl"),
+        batch_index=3,
+        start_index=0,
+        end_index=2,
+        texts=["The Star Fleet and a fleet reach the important port.", "U.S. fleets"],
+    )
+    mock_batch_task.translated_texts = ["Gwiezdna flota dociera do portu.", "USA floty"]
+
+    warnings = validator.validate_batch(mock_batch_task, glossary, index=index)
+
+    assert [
+        (warning["source_term"], warning["source_count"], warning["translated_count"])
+        for warning in warnings
+    ] == [("fleet", 2, 1), ("port", 1, 0)]
+    assert warnings == validator.validate_batch(mock_batch_task, glossary)
+
+
+def test_glossary_manager_reuses_validation_index_for_a_snapshot():
+    from scripts.core.glossary_manager import GlossaryManager
+
+    manager = GlossaryManager()
+    manager.in_memory_glossary = {
+        "entries": [
+            {"translations": {"en": "convoy", "pl": "konwój"}},
+            {"translations": {"en": "fleet"}},
+        ]
+    }
+
+    index = manager.get_validation_index("en", "pl")
+
+    assert index.glossary == {"convoy": "konwój"}
+    assert manager.get_validation_index("en", "pl") is index
+    assert manager.get_validation_index("en", "de") is None
@@ -1,6 +1,6 @@
 # tests/utils/test_post_process_validator.py
 import pytest
-from scripts.utils.post_process_validator import PostProcessValidator, ValidationLevel
+from scripts.utils.post_process_validator import PostProcessValidator, ValidationLevel, ValidationResult
 
 # Mock source_lang objects for testing
 SOURCE_LANG_ZH = {"code": "zh-CN", "name": "简体中文"}
@@ -209,3 +209,75 @@ def test_check_ignores_other_language_punctuation(validator, mocker):
     punc_result = next((r for r in results if "validation_residual_punctuation_found" in r.message), None)
 
     assert punc_result is None, "Should not find Chinese punctuation when source language is set to English."
+
+
+def test_validate_many_matches_per_entry_validation(validator):
+    entries = [
+        ("remis_event.1.t:0", "The $COUNTRY$ gains #bold 30# trade", 1, "The $COUNTRY$ gains #bold 30#! trade"),
+        ("remis_event.1.d:0", "A [获取名称] and $VALUE$ $VALUE$", 2, "A [GetName] and $VALUE$"),
+        ("bad key", "#custom_tag ok", 3, None),
+    ]
+
+    many = validator.validate_many("victoria3", entries, SOURCE_LANG_EN, target_lang="zh-CN", dynamic_valid_tags=["Custom_Tag"])
+    single = [
+        validator.validate_entry("victoria3", key, value, line, SOURCE_LANG_EN, source_value=source, target_lang="zh-CN", dynamic_valid_tags=["Custom_Tag"])
+        for key, value, line, source in entries
+    ]
+
+    assert len(many) == len(entries)
+    assert [[(r.code, r.message, r.details, r.key) for r in results] for results in many] == [
+        [(r.code, r.message, r.details, r.key) for r in results] for results in single
+    ]
+    assert any(r.code == "validation_invalid_key_format" for r in many[2])
+
+
+def test_messages_are_formatted_only_when_read(validator, mocker):
+    translate = mocker.patch("scripts.utils.post_process_validator.i18n.t", side_effect=lambda key, **kwargs: key)
+
+    game_validator = validator.get_validator_by_game_id("victoria3")
+    results = game_validator.validate_text("Missing variable", 4, SOURCE_LANG_EN, source_text="Has $pop$")
+    parity = next(r for r in results if r.details_code == "validation_generic_variable_parity_details")
+    assert translate.call_count == 0
+
+    # i18n returned the bare key, so the built-in bilingual fallback is used.
+    assert parity.message == "变量数量不一致 (Variable parity mismatch): $pop$"
+    assert parity.details == "原文含有 1 个，译文含有 0 个 (Expected 1, found 0)"
+    parity.message
+    assert translate.call_count == 2
+
+
+def test_result_fields_stay_plain_dataclass_fields():
+    from dataclasses import asdict, fields
+
+    result = ValidationResult(False, ValidationLevel.ERROR, "text", details="more")
+    assert [f.name for f in fields(ValidationResult)][:5] == ["is_valid", "level", "message", "code", "details"]
+    assert ValidationResult(True, ValidationLevel.INFO, "ok").details is None
+    assert asdict(result)["message"] == "text" and asdict(result)["details"] == "more"
+
+
+def test_validate_many_isolates_an_entry_that_raises(mocker):
+    from scripts.utils.post_process_validator import BaseGameValidator
+
+    game_validator = BaseGameValidator({"rules": []})
+    original = game_validator.validate_entry
+
+    def validate_entry(key, *args, **kwargs):
+        if key == "broken":
+            raise RuntimeError("boom")
+        return original(key, *args, **kwargs)
+
+    mocker.patch.object(game_validator, "validate_entry", side_effect=validate_entry)
+    results = game_validator.validate_many([("ok.1", "text", 1, None), ("broken", "text", 2, None), ("bad key", "text", 3, None)])
+
+    assert results[1] == []
+    assert any(r.code == "validation_invalid_key_format" for r in results[2])
+
+
+def test_invalid_rule_pattern_is_not_precompiled_and_fails_only_its_rule():
+    from scripts.utils.post_process_validator import BaseGameValidator
+
+    rules = {"rules": [{"name": "broken", "check_function": "banned_chars", "pattern": "([", "level": "error", "message_key": "k"}]}
+    game_validator = BaseGameValidator(rules)
+
+    assert "([" not in game_validator.patterns
+    assert game_validator.validate_many([("key", "text", 1, None)]) == [[]]
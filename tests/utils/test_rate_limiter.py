@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+
+from scripts.utils.rate_limiter import RateLimiter, retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_bucket_allows_burst_then_paces_requests(clock):
+    limiter = RateLimiter(rpm=60, clock=clock, sleep=clock.sleep)
+    limiter.configure("openai", "gpt", burst=3)
+
+    waits = [limiter.wait("openai", "gpt") for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.0, pytest.approx(1.0), pytest.approx(1.0)]
+    assert limiter.for_provider("openai", "gpt").metrics()["total_wait"] == pytest.approx(2.0)
+
+
+def test_buckets_are_independent_per_provider_and_model(clock):
+    limiter = RateLimiter(rpm=6, clock=clock, sleep=clock.sleep)
+    limiter.configure("gemini", "flash", burst=1)
+
+    assert limiter.try_acquire("gemini", "flash") is True
+    assert limiter.try_acquire("gemini", "flash") is False
+    assert limiter.try_acquire("openai", "gpt") is True
+    assert limiter.for_provider("gemini", "flash").metrics()["rejected"] == 1
+
+
+def test_tpm_budget_delays_large_prompts(clock):
+    limiter = RateLimiter(rpm=600, clock=clock, sleep=clock.sleep)
+    limiter.configure("openai", "gpt", tpm=600)
+
+    assert limiter.wait("openai", "gpt", tokens=600) == 0.0
+    assert limiter.wait("openai", "gpt", tokens=300) == pytest.approx(30.0)
+
+
+def test_rate_limited_bucket_cools_down_and_recovers(clock):
+    limiter = RateLimiter(rpm=60, clock=clock, sleep=clock.sleep)
+    bucket = limiter.configure("openai", "gpt", rpm=60, burst=1)
+
+    assert limiter.report_rate_limited("openai", "gpt", retry_after=10) == 10
+    assert bucket.metrics()["effective_rpm"] == 30
+    assert limiter.wait("openai", "gpt") == pytest.approx(12.0)
+
+    limiter.report_success("openai", "gpt")
+    assert bucket.metrics()["effective_rpm"] == 36
+    assert limiter.for_provider("gemini").metrics()["effective_rpm"] == 60
+
+
+def test_update_rpm_keeps_pinned_buckets_and_temporary_limit_restores(clock):
+    limiter = RateLimiter(rpm=40, clock=clock, sleep=clock.sleep)
+    follower = limiter.for_provider("gemini", "flash")
+
+    with limiter.temporary_limit("openai", "gpt", 12):
+        limiter.update_rpm(20)
+        assert limiter.for_provider("openai", "gpt").configured_rpm == 12
+        assert follower.configured_rpm == 20
+
+    pinned = limiter.for_provider("openai", "gpt")
+    assert pinned.configured_rpm == 20
+    assert pinned.pinned_rpm is None
+
+
+def test_fair_share_lanes_split_the_budget_between_languages(clock):
+    limiter = RateLimiter(rpm=60, clock=clock, sleep=clock.sleep)
+    limiter.configure("openai", "gpt", burst=2)
+
+    with limiter.fair_share("openai", "gpt", "de"), limiter.fair_share("openai", "gpt", "fr"):
+        # "de" queues four requests at its half of the budget (30 RPM, one in burst)...
+        assert [limiter.reserve("openai", "gpt", lane="de") for _ in range(4)] == [0.0, 2.0, 4.0, 6.0]
+        # ...and "fr" is not queued behind them.
+        assert [limiter.reserve("openai", "gpt", lane="fr") for _ in range(2)] == [0.0, 2.0]
+    # Closed lanes return their share: unlaned callers see the shared bucket again.
+    assert limiter.for_provider("openai", "gpt")._lanes == {}
+
+
+def test_retry_after_seconds_reads_exception_headers():
+    error = Exception("429 Too Many Requests")
+    error.response = SimpleNamespace(headers={"retry-after": "7"})
+
+    assert retry_after_seconds(error) == 7.0
+    assert retry_after_seconds(Exception("boom")) is None
@@ -0,0 +1,124 @@
+import json
+import threading
+
+from scripts.utils.validation_issue_store import validation_issue_stores
+from scripts.utils.validation_logger import ValidationLogger
+
+
+def _issues():
+    return [
+        {"file_name": "a_l_english.yml", "key": "key_1", "status": "open", "details": "一"},
+        {"file_name": "a_l_english.yml", "key": "key_2", "status": "open"},
+        {"file_name": "b_l_english.yml", "key": "key_1", "status": "open"},
+        {"file_name": "a_l_english.yml", "key": "key_1", "status": "open", "details": "duplicate"},
+    ]
+
+
+def test_updates_touch_every_matching_issue_and_export_the_same_json_shape(tmp_path):
+    root = str(tmp_path)
+    ValidationLogger.save_errors(root, _issues())
+
+    ValidationLogger.update_error_status(root, "a_l_english.yml", "key_1", "fixed")
+    changed = ValidationLogger.update_errors(root, [
+        ("b_l_english.yml", "key_1", {"status": "ignored"}),
+        ("missing.yml", "key_9", {"status": "fixed"}),
+    ])
+
+    expected = _issues()
+    expected[0]["status"] = expected[3]["status"] = "fixed"
+    expected[2]["status"] = "ignored"
+    log_path = tmp_path / ValidationLogger.FILENAME
+    assert changed == 1
+    assert log_path.read_text(encoding="utf-8") == json.dumps(expected, ensure_ascii=False, indent=2)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [ValidationLogger.FILENAME]
+    assert validation_issue_stores.for_path(log_path).db_path.exists()
+
+    ValidationLogger.clear_fixes(root)
+    assert ValidationLogger.load_errors(root) == [expected[1]]
+
+
+def test_batch_exports_the_sidecar_once_when_it_exits(tmp_path):
+    root = str(tmp_path)
+    ValidationLogger.save_errors(root, _issues())
+    log_path = tmp_path / ValidationLogger.FILENAME
+    before = log_path.read_text(encoding="utf-8")
+
+    with ValidationLogger.batch(root):
+        ValidationLogger.mark_attempt_result(root, "a_l_english.yml", "key_2", status="fixed")
+        ValidationLogger.mark_attempt_result(
+            root, "b_l_english.yml", "key_1", status="failed", failure_reason="parity"
+        )
+        assert log_path.read_text(encoding="utf-8") == before
+        assert [issue["status"] for issue in ValidationLogger.load_errors(root)] == ["open", "fixed", "failed", "open"]
+
+    exported = json.loads(log_path.read_text(encoding="utf-8"))
+    assert [issue["status"] for issue in exported] == ["open", "fixed", "failed", "open"]
+    assert exported[2]["failure_reason"] == "parity"
+    assert exported[1]["failure_reason"] is None
+
+
+def test_sidecar_rewritten_by_another_writer_is_reimported(tmp_path):
+    root = str(tmp_path)
+    ValidationLogger.save_errors(root, _issues())
+    replacement = [{"file_name": "c_l_english.yml", "key": "key_3", "status": "open"}, "not-an-issue"]
+    (tmp_path / ValidationLogger.FILENAME).write_text(json.dumps(replacement), encoding="utf-8")
+
+    ValidationLogger.update_error_status(root, "c_l_english.yml", "key_3", "fixed")
+
+    assert ValidationLogger.load_errors(root) == [
+        {"file_name": "c_l_english.yml", "key": "key_3", "status": "fixed"},
+        "not-an-issue",
+    ]
+    (tmp_path / ValidationLogger.FILENAME).unlink()
+    assert ValidationLogger.load_errors(root) == []
+
+
+def test_reads_never_create_the_database(tmp_path):
+    root = str(tmp_path)
+    log_path = tmp_path / ValidationLogger.FILENAME
+    log_path.write_text(json.dumps(_issues()), encoding="utf-8")
+
+    assert ValidationLogger.load_errors(root) == _issues()
+    assert not validation_issue_stores.for_path(log_path).db_path.exists()
+
+
+def test_a_batch_only_defers_exports_from_its_own_thread(tmp_path):
+    root = str(tmp_path)
+    ValidationLogger.save_errors(root, _issues())
+    log_path = tmp_path / ValidationLogger.FILENAME
+    in_batch, release = threading.Event(), threading.Event()
+
+    def fixer():
+        with ValidationLogger.batch(root):
+            ValidationLogger.update_error_status(root, "a_l_english.yml", "key_2", "fixed")
+            in_batch.set()
+            release.wait(5)
+
+    worker = threading.Thread(target=fixer)
+    worker.start()
+    try:
+        assert in_batch.wait(5)
+        ValidationLogger.update_error_status(root, "b_l_english.yml", "key_1", "ignored")
+        exported = json.loads(log_path.read_text(encoding="utf-8"))
+        assert [issue["status"] for issue in exported] == ["open", "fixed", "ignored", "open"]
+    finally:
+        release.set()
+        worker.join()
+
+
+def test_sidecar_rewritten_during_a_batch_keeps_the_unexported_updates(tmp_path):
+    root = str(tmp_path)
+    ValidationLogger.save_errors(root, _issues())
+    log_path = tmp_path / ValidationLogger.FILENAME
+
+    with ValidationLogger.batch(root):
+        ValidationLogger.update_error_status(root, "a_l_english.yml", "key_2", "fixed")
+        rewritten = _issues()
+        rewritten[2]["details"] = "rescanned"
+        log_path.write_text(json.dumps(rewritten), encoding="utf-8")
+        assert [issue["status"] for issue in ValidationLogger.load_errors(root)] == ["open", "fixed", "open", "open"]
+        ValidationLogger.update_error_status(root, "b_l_english.yml", "key_1", "ignored")
+
+    exported = json.loads(log_path.read_text(encoding="utf-8"))
+    assert [issue["status"] for issue in exported] == ["open", "fixed", "ignored", "open"]
+    assert exported[2]["details"] == "rescanned"